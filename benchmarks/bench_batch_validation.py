@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Throughput of batch validation vs. section-by-section validation.
+
+Usage:
+    python benchmarks/bench_batch_validation.py [--sections 5000] [--words 400]
+
+Prints sections per second for QualityValidator.validate_section in a loop
+and for BatchValidator.score_sections, and checks that both give the same
+scores.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.batch_validator import BatchSection, BatchValidator
+from src.core.quality_validator import QualityValidator
+
+
+def build_corpus(validator: QualityValidator, sections: int, words: int, seed: int = 7):
+    """Synthetic sections mixing scoring vocabulary with filler text and paragraph breaks."""
+    rng = random.Random(seed)
+    vocabulary = (
+        [keyword for keywords in validator.SECTION_KEYWORDS.values() for keyword in keywords] +
+        validator.LOGICAL_CONNECTORS + validator.REASONING_PHRASES + validator.STRUCTURE_MARKERS +
+        ["the", "court", "found", "that", "this", "matter", "was", "considered", "record"] * 20
+    )
+    section_types = list(validator.SECTION_KEYWORDS)
+    corpus = []
+    for _ in range(sections):
+        parts = []
+        for _ in range(words):
+            parts.append(rng.choice(vocabulary))
+            roll = rng.random()
+            if roll < 0.06:
+                parts[-1] += "."
+            elif roll < 0.07:
+                parts[-1] += ".\n\n"
+        section_type = rng.choice(section_types)
+        corpus.append(BatchSection(
+            content=" ".join(parts),
+            section_type=section_type,
+            expected_elements=validator.expected_elements_for(section_type)
+        ))
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch section validation")
+    parser.add_argument("--sections", type=int, default=5000)
+    parser.add_argument("--words", type=int, default=400)
+    args = parser.parse_args()
+
+    validator = QualityValidator()
+    batch_validator = BatchValidator(validator)
+    corpus = build_corpus(validator, args.sections, args.words)
+
+    started = time.perf_counter()
+    expected = [
+        validator.validate_section(section.content, section.section_type, section.expected_elements)
+        for section in corpus
+    ]
+    sequential = time.perf_counter() - started
+
+    started = time.perf_counter()
+    actual = batch_validator.score_sections(corpus)
+    batched = time.perf_counter() - started
+
+    if actual != expected:
+        raise SystemExit("Batch scores differ from validate_section")
+
+    print(f"{args.sections} sections of ~{args.words} words")
+    print(f"  validate_section loop: {args.sections / sequential:10.0f} sections/sec")
+    print(f"  BatchValidator:        {args.sections / batched:10.0f} sections/sec")
+    print(f"  speedup:               {sequential / batched:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark suite for validation, prompt building and report serialization.
+
+Usage:
+    python benchmarks/bench_suite.py [--quick] [--save-baseline] [--check]
+                                     [--baseline benchmarks/baselines.json]
+                                     [--tolerance 0.25] [--max-slope 1.2]
+
+Times each operation on generated sections of 100 to 50,000 words, in
+typical prose and in adversarial shapes (one endless sentence, a single
+repeated word, nothing but scoring keywords, one-line paragraphs, non-ASCII
+text), and prints throughput in words per second.
+
+Two gates make the script exit non-zero:
+
+- Scaling: for every operation and input shape, the slope of log(time)
+  against log(words) over inputs of 1,000 words and more must stay below
+  ``--max-slope``. A slope of 1 is linear; quadratic work shows up near 2.
+- Regression (``--check``): throughput must stay within ``--tolerance`` of
+  the stored baseline. Baselines are machine-specific, so record them with
+  ``--save-baseline`` on the machine the check runs on.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.agent_system import LegalIntelligenceAgent
+from src.core.quality_validator import QualityValidator
+from src.models.legal_models import AnalysisReport, LegalScenario, ReportSection
+from src.utils.complaint_extractor import ComplaintExtractor
+
+SIZES = (100, 1000, 5000, 10000, 50000)
+QUICK_SIZES = (100, 1000, 5000, 10000)
+SECTION_TYPES = (
+    "liability_assessment", "damage_calculation", "prior_art_analysis",
+    "competitive_landscape", "risk_assessment", "strategic_recommendations"
+)
+DEFAULT_BASELINE = Path(__file__).parent / "baselines.json"
+
+# Slopes are fitted over inputs at least this long; below it fixed costs dominate
+MIN_SCALING_WORDS = 1000
+
+
+def build_text(validator: QualityValidator, kind: str, words: int, seed: int = 5) -> str:
+    """Generated section text of one input shape and about ``words`` words."""
+    rng = random.Random(seed)
+    keywords = (
+        [keyword for keywords in validator.SECTION_KEYWORDS.values() for keyword in keywords] +
+        validator.LOGICAL_CONNECTORS + validator.REASONING_PHRASES + validator.STRUCTURE_MARKERS
+    )
+    filler = ["the", "court", "found", "that", "plaintiff", "defendant", "patent", "record", "damages", "$15 million"]
+
+    if kind == "repeated_word":
+        return " ".join(["infringement"] * words)
+    if kind == "one_sentence":
+        return " ".join(rng.choice(keywords + filler * 5) for _ in range(words))
+    if kind == "keywords_only":
+        parts = []
+        while len(parts) < words:
+            parts.extend(rng.choice(keywords).split())
+        return " ".join(parts[:words]) + "."
+    if kind == "one_line_paragraphs":
+        lines = []
+        count = 0
+        while count < words:
+            line = [rng.choice(filler + keywords) for _ in range(rng.randint(3, 8))]
+            lines.append(f"- {' '.join(line)}.")
+            count += len(line)
+        return "\n\n".join(lines)
+    if kind == "non_ascii":
+        vocabulary = ["défendeur", "brevet", "contrefaçon", "préjudice", "特許", "侵害", "損害", "€15", "§101", "über"]
+        parts = [rng.choice(vocabulary + filler) for _ in range(words)]
+        return ". ".join(" ".join(parts[i:i + 12]) for i in range(0, words, 12)) + "."
+
+    # typical: mixed vocabulary in sentences and paragraphs
+    parts = []
+    for _ in range(words):
+        parts.append(rng.choice(keywords + filler * 10))
+        roll = rng.random()
+        if roll < 0.06:
+            parts[-1] += "."
+        elif roll < 0.07:
+            parts[-1] += ".\n\n"
+    return " ".join(parts)
+
+
+INPUT_KINDS = ("typical", "one_sentence", "repeated_word", "keywords_only", "one_line_paragraphs", "non_ascii")
+
+
+def _section(section_type: str, content: str) -> ReportSection:
+    return ReportSection(
+        type=section_type, title=section_type.replace("_", " ").title(), content=content,
+        agent_type="business_analyst", quality_score=0.75, tokens_used=len(content) // 4, cost=0.01,
+        timestamp="2024-01-01T00:00:00"
+    )
+
+
+def _report(scenario: LegalScenario, text: str) -> AnalysisReport:
+    """A six-section report whose sections add up to the text's length."""
+    words = text.split(" ")
+    share = max(1, len(words) // len(SECTION_TYPES))
+    sections = [
+        _section(section_type, " ".join(words[index * share:(index + 1) * share]))
+        for index, section_type in enumerate(SECTION_TYPES)
+    ]
+    return AnalysisReport(
+        scenario=scenario, sections=sections, executive_summary="Summary", total_cost=0.06,
+        total_tokens=sum(section.tokens_used for section in sections), processing_time=1.0,
+        confidence_score=0.75, timestamp="2024-01-01T00:00:00"
+    )
+
+
+def build_cases() -> Dict[str, Callable[[str], Callable[[], object]]]:
+    """Operation name -> function preparing a zero-argument call on one input text."""
+    validator = QualityValidator(score_cache_size=0)
+    agent = LegalIntelligenceAgent("benchmark-project")
+    persona = agent.personas.get_persona("business_analyst")
+    expected = validator.expected_elements_for("liability_assessment")
+
+    def scenario_for(text: str) -> LegalScenario:
+        return LegalScenario(
+            case_name="Benchmark Case", complaint_text=text, case_type="IP", filing_date="2024-01-01",
+            key_issues=["Patent dispute", "Infringement dispute"]
+        )
+
+    def validate_section(text):
+        return lambda: validator.validate_section(text, "liability_assessment", expected, source_text=text[:5000])
+
+    def validate_report(text):
+        report = _report(scenario_for(text[:5000]), text)
+        return lambda: validator.validate_report(report)
+
+    # Nothing cached, so every call minimizes and indexes its complaint afresh
+    agent.prompt_assembler.max_cached_complaints = 0
+
+    def build_prompt(text):
+        scenario = scenario_for(text)
+        previous = [_section(section_type, text) for section_type in SECTION_TYPES[:3]]
+        return lambda: agent._build_prompt(persona, "risk_assessment", scenario, previous)
+
+    # Nothing cached, so every call is a full extraction pass
+    extractor = ComplaintExtractor(max_cached=0)
+
+    def extract_entities(text):
+        return lambda: extractor.extract(text)
+
+    def serialize_report(text):
+        report = _report(scenario_for(text[:5000]), text)
+        return lambda: AnalysisReport.model_validate_json(report.model_dump_json())
+
+    return {
+        "validate_section": validate_section,
+        "validate_report": validate_report,
+        "build_prompt": build_prompt,
+        "extract_entities": extract_entities,
+        "report_serialization": serialize_report
+    }
+
+
+def time_call(call: Callable[[], object], min_time: float, min_runs: int = 3) -> float:
+    """Fastest of repeated calls, in seconds; runs until min_time has elapsed."""
+    best = float("inf")
+    runs = 0
+    started = time.perf_counter()
+    while runs < min_runs or time.perf_counter() - started < min_time:
+        before = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - before)
+        runs += 1
+    return best
+
+
+def scaling_slope(points: List[Tuple[int, float]]) -> float:
+    """Slope of log(seconds) against log(words); 1 is linear."""
+    words = np.log([size for size, _ in points])
+    seconds = np.log([max(elapsed, 1e-9) for _, elapsed in points])
+    return float(np.polyfit(words, seconds, 1)[0])
+
+
+def run(sizes: Tuple[int, ...], min_time: float) -> Dict[str, Dict[str, Dict[int, float]]]:
+    """Seconds per call for every operation, input shape and size."""
+    validator = QualityValidator()
+    texts = {(kind, size): build_text(validator, kind, size) for kind in INPUT_KINDS for size in sizes}
+    results: Dict[str, Dict[str, Dict[int, float]]] = {}
+    for name, prepare in build_cases().items():
+        results[name] = {}
+        for kind in INPUT_KINDS:
+            results[name][kind] = {size: time_call(prepare(texts[(kind, size)]), min_time) for size in sizes}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validator and prompt-builder microbenchmarks")
+    parser.add_argument("--quick", action="store_true", help=f"Only sizes up to {QUICK_SIZES[-1]} words")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds to repeat each measurement for")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run's throughput as the baseline")
+    parser.add_argument("--check", action="store_true", help="Fail if throughput fell below the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed fractional throughput drop")
+    parser.add_argument("--max-slope", type=float, default=1.2, help="Largest log-log slope accepted as linear")
+    args = parser.parse_args()
+
+    sizes = QUICK_SIZES if args.quick else SIZES
+    results = run(sizes, args.min_time)
+    failures = []
+
+    baseline = {}
+    if args.check:
+        if not args.baseline.exists():
+            raise SystemExit(f"No baseline at {args.baseline}; record one with --save-baseline")
+        baseline = json.loads(args.baseline.read_text())["throughput"]
+
+    print(f"{'operation':<22}{'input':<21}" + "".join(f"{size:>10}" for size in sizes) + f"{'slope':>8}")
+    throughput: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for name, kinds in results.items():
+        throughput[name] = {}
+        for kind, timings in kinds.items():
+            rates = {str(size): size / elapsed for size, elapsed in timings.items()}
+            throughput[name][kind] = rates
+            slope = scaling_slope([(size, elapsed) for size, elapsed in timings.items() if size >= MIN_SCALING_WORDS])
+            print(
+                f"{name:<22}{kind:<21}" +
+                "".join(f"{rates[str(size)] / 1000:>9.0f}k" for size in sizes) + f"{slope:>8.2f}"
+            )
+
+            if slope > args.max_slope:
+                failures.append(f"{name}/{kind}: time grows with slope {slope:.2f} in input size")
+            for size, rate in rates.items():
+                reference = baseline.get(name, {}).get(kind, {}).get(size)
+                if reference and rate < reference * (1 - args.tolerance):
+                    failures.append(
+                        f"{name}/{kind}/{size} words: {rate:.0f} words/sec, "
+                        f"{1 - rate / reference:.0%} below baseline {reference:.0f}"
+                    )
+    print("(words per second, thousands)")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps({
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+            "throughput": throughput
+        }, indent=2))
+        print(f"Baseline saved to {args.baseline}")
+
+    if failures:
+        print("\nFAILED:")
+        for failure in failures:
+            print(f"  {failure}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -20,9 +20,13 @@ Author: LexiMind Solutions Engineering Team
 
 import os
 import sys
+import math
 import json
 import time
+import asyncio
 import logging
+import tempfile
+from dataclasses import asdict
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 from datetime import datetime
@@ -32,9 +36,9 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # FastAPI imports
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, model_validator
 
 # Add core modules to path
 sys.path.append(str(Path(__file__).parent))
@@ -42,6 +46,14 @@ sys.path.append(str(Path(__file__).parent))
 # Import core components
 from src.core.agent_system import LegalIntelligenceAgent
 from src.core.quality_validator import QualityValidator
+from src.core.batch_validator import BatchValidator
+from src.core.retry_gain import RetryGainModel
+from src.core.validation_pool import ValidationPool
+from src.core.deadline import DeadlineBudget
+from src.core.admission import AdmissionController, AdmissionRejected
+from src.core.tenant_scheduler import FairScheduler, TenantLimits, DEFAULT_TENANT
+from src.core.work_queue import create_work_queue
+from src.core.queue_worker import REPORT_TASK
 from src.prompts.personas import LegalPersonas
 from src.models.legal_models import (
     LegalScenario,
@@ -50,6 +62,11 @@ from src.models.legal_models import (
     ValidationResult
 )
 from src.utils.logger import setup_logger
+from src.utils.scenario_builder import EXTRACTOR, build_scenario, key_issues_from_terms
+from src.utils.complaint_store import ComplaintStore, ComplaintTooLarge, StoredComplaint
+from src.utils.multipart_stream import MultipartFileReader, MultipartError, multipart_boundary, MAX_HEADER_BYTES
+from src.utils.metrics_store import SharedMetricsStore
+from src.utils.checkpoint_store import SectionCheckpointStore
 
 # Initialize logging
 logger = setup_logger("legal-intelligence")
@@ -67,8 +84,12 @@ system_state = {
     "agent": None,
     "personas": None,
     "validator": None,
-    "analysis_count": 0,
-    "last_analysis": None
+    "batch_validator": None,
+    "metrics": None,
+    "admission": None,
+    "queue": None,
+    "validation_pool": None,
+    "complaints": None
 }
 
 # Configuration
@@ -76,10 +97,60 @@ CONFIG = {
     "project_id": os.getenv("PROJECT_ID", ""),
     "location": os.getenv("LOCATION", "us-central1"),
     "model": os.getenv("MODEL", "gemini-2.0-flash"),
-    "debug": os.getenv("DEBUG", "false").lower() == "true"
+    "debug": os.getenv("DEBUG", "false").lower() == "true",
+    "metrics_db_path": os.getenv(
+        "METRICS_DB_PATH",
+        str(Path(tempfile.gettempdir()) / "legal-intelligence-metrics.db")
+    ),
+    "checkpoint_dir": os.getenv(
+        "CHECKPOINT_DIR",
+        str(Path(tempfile.gettempdir()) / "legal-intelligence-checkpoints")
+    ),
+    "checkpoint_max_age_seconds": float(os.getenv("CHECKPOINT_MAX_AGE_SECONDS", "604800")),
+    "complaint_store_dir": os.getenv(
+        "COMPLAINT_STORE_DIR",
+        str(Path(tempfile.gettempdir()) / "legal-intelligence-complaints")
+    ),
+    "max_complaint_bytes": int(os.getenv("MAX_COMPLAINT_BYTES", str(20 * 1024 * 1024))),
+    "max_concurrent_model_calls": int(os.getenv("MAX_CONCURRENT_MODEL_CALLS", "8")),
+    "batch_concurrency": int(os.getenv("BATCH_CONCURRENCY", "4")),
+    "max_batch_size": int(os.getenv("MAX_BATCH_SIZE", "100")),
+    "max_validation_batch_size": int(os.getenv("MAX_VALIDATION_BATCH_SIZE", "5000")),
+    "quality_score_cache_size": int(os.getenv("QUALITY_SCORE_CACHE_SIZE", "1024")),
+    "telemetry_window": int(os.getenv("TELEMETRY_WINDOW", "1000")),
+    "retry_min_expected_gain": float(os.getenv("RETRY_MIN_EXPECTED_GAIN", "0.02")),
+    "complaint_token_budget": int(os.getenv("COMPLAINT_TOKEN_BUDGET", "500")),
+    "digest_min_tokens": int(os.getenv("DIGEST_MIN_TOKENS", "8000")),
+    "digest_chunk_tokens": int(os.getenv("DIGEST_CHUNK_TOKENS", "2000")),
+    "digest_token_budget": int(os.getenv("DIGEST_TOKEN_BUDGET", "1500")),
+    "minimize_boilerplate": os.getenv("MINIMIZE_BOILERPLATE", "true").lower() == "true",
+    "validation_workers": int(os.getenv("VALIDATION_WORKERS", "2")),
+    "background_validation_batch_size": int(os.getenv("BACKGROUND_VALIDATION_BATCH_SIZE", "16")),
+    "background_validation_batch_window": float(os.getenv("BACKGROUND_VALIDATION_BATCH_WINDOW", "0.05")),
+    "background_validation_max_pending": int(os.getenv("BACKGROUND_VALIDATION_MAX_PENDING", "256")),
+    "background_validation_shed_queue_depth": int(os.getenv("BACKGROUND_VALIDATION_SHED_QUEUE_DEPTH", "8")),
+    "streaming_validation": os.getenv("STREAMING_VALIDATION", "false").lower() == "true",
+    "disconnect_poll_interval": float(os.getenv("DISCONNECT_POLL_INTERVAL", "0.5")),
+    "admission_max_queue_depth": int(os.getenv("ADMISSION_MAX_QUEUE_DEPTH", "32")),
+    "admission_max_backlog_seconds": float(os.getenv("ADMISSION_MAX_BACKLOG_SECONDS", "120")),
+    "queue_backend": os.getenv("QUEUE_BACKEND", "sqlite"),
+    "queue_url": os.getenv(
+        "QUEUE_URL",
+        str(Path(tempfile.gettempdir()) / "legal-intelligence-queue.db")
+    ),
+    "queue_max_attempts": int(os.getenv("QUEUE_MAX_ATTEMPTS", "3")),
+    "queue_max_pending": int(os.getenv("QUEUE_MAX_PENDING", "1000")),
+    "tenant_default_max_concurrency": int(os.getenv("TENANT_DEFAULT_MAX_CONCURRENCY", "0")) or None,
+    "tenant_default_tokens_per_minute": int(os.getenv("TENANT_DEFAULT_TOKENS_PER_MINUTE", "0")) or None,
+    "tenant_limits": json.loads(os.getenv("TENANT_LIMITS", "{}")),
+    "tenant_max_tracked": int(os.getenv("TENANT_MAX_TRACKED", "1000"))
 }
 
 
+class ClientDisconnected(Exception):
+    """Raised when the HTTP client goes away before its analysis finishes."""
+
+
 class SystemStatus(BaseModel):
     """System health and status response."""
     status: str
@@ -93,10 +164,41 @@ class SystemStatus(BaseModel):
 class AnalysisRequest(BaseModel):
     """Request model for legal analysis."""
     case_name: str = Field(..., description="Name of the legal case")
-    complaint_text: str = Field(..., description="Full text of the legal complaint")
+    complaint_text: Optional[str] = Field(None, description="Full text of the legal complaint")
+    complaint_id: Optional[str] = Field(
+        None, description="Id of a complaint uploaded to POST /complaints, instead of complaint_text"
+    )
     case_type: str = Field(..., description="Type of case (IP, Contract, Corporate, etc.)")
     urgency: str = Field(default="standard", description="Urgency level")
     additional_context: Optional[str] = Field(None, description="Additional context")
+    tenant_id: str = Field(
+        default=DEFAULT_TENANT, pattern=r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$",
+        description="Client the request is scheduled and billed to for fair sharing and quotas"
+    )
+    deadline_seconds: Optional[float] = Field(
+        None, gt=0,
+        description="Time budget in seconds; the report degrades gracefully to fit it"
+    )
+
+    @model_validator(mode="after")
+    def _one_complaint_source(self):
+        if (self.complaint_text is None) == (self.complaint_id is None):
+            raise ValueError("Provide exactly one of complaint_text or complaint_id")
+        return self
+
+
+class BatchAnalysisRequest(BaseModel):
+    """Request model for bulk legal analysis."""
+    requests: List[AnalysisRequest] = Field(..., min_length=1, description="Cases to analyze")
+
+
+class BatchValidationRequest(BaseModel):
+    """Request model for bulk report validation."""
+    reports: List[AnalysisReport] = Field(..., min_length=1, description="Reports to validate")
+    min_quality_threshold: Optional[float] = Field(
+        None, ge=0.0, le=1.0,
+        description="Pass threshold to apply instead of the validator's configured one"
+    )
 
 
 @app.on_event("startup")
@@ -110,20 +212,96 @@ async def startup_event():
             logger.error("PROJECT_ID environment variable not set")
             raise ValueError("PROJECT_ID is required")
 
+        # Open the metrics store shared by all workers
+        logger.info("Opening shared metrics store...")
+        if system_state["metrics"]:
+            system_state["metrics"].close()
+        system_state["metrics"] = SharedMetricsStore(CONFIG["metrics_db_path"])
+
+        # Open the work queue that hands jobs to worker nodes
+        logger.info(f"Opening {CONFIG['queue_backend']} work queue...")
+        if system_state["queue"] and hasattr(system_state["queue"], "close"):
+            system_state["queue"].close()
+        system_state["queue"] = create_work_queue(
+            CONFIG["queue_backend"], CONFIG["queue_url"], max_attempts=CONFIG["queue_max_attempts"]
+        )
+
+        # Open the store for streamed complaint uploads
+        system_state["complaints"] = ComplaintStore(
+            CONFIG["complaint_store_dir"], max_bytes=CONFIG["max_complaint_bytes"]
+        )
+
         # Initialize personas
         logger.info("Loading agent personas...")
         system_state["personas"] = LegalPersonas()
 
         # Initialize quality validator
         logger.info("Initializing quality validator...")
-        system_state["validator"] = QualityValidator()
+        system_state["validator"] = QualityValidator(
+            metrics_store=system_state["metrics"],
+            score_cache_size=CONFIG["quality_score_cache_size"],
+            history_size=CONFIG["telemetry_window"]
+        )
+        # Phrase weights for /validate/batch are compiled once from the validator's lists
+        system_state["batch_validator"] = BatchValidator(system_state["validator"])
+
+        # Run validation on worker threads instead of the event loop
+        if system_state["validation_pool"]:
+            system_state["validation_pool"].shutdown()
+        system_state["validation_pool"] = ValidationPool(
+            system_state["validator"],
+            max_workers=CONFIG["validation_workers"],
+            batch_size=CONFIG["background_validation_batch_size"],
+            batch_window=CONFIG["background_validation_batch_window"],
+            max_pending=CONFIG["background_validation_max_pending"],
+            load_check=_background_validation_overloaded,
+            telemetry_window=CONFIG["telemetry_window"]
+        )
 
         # Initialize main agent system
         logger.info("Initializing Legal Intelligence Agent...")
+        if system_state["agent"]:
+            system_state["agent"].validation_pool.shutdown()
         system_state["agent"] = LegalIntelligenceAgent(
             project_id=CONFIG["project_id"],
             location=CONFIG["location"],
-            model_name=CONFIG["model"]
+            model_name=CONFIG["model"],
+            metrics_store=system_state["metrics"],
+            checkpoint_store=SectionCheckpointStore(
+                CONFIG["checkpoint_dir"], max_age_seconds=CONFIG["checkpoint_max_age_seconds"]
+            ),
+            max_concurrent_model_calls=CONFIG["max_concurrent_model_calls"],
+            scheduler=FairScheduler(
+                total_slots=CONFIG["max_concurrent_model_calls"],
+                default_limits=TenantLimits(
+                    max_concurrency=CONFIG["tenant_default_max_concurrency"],
+                    tokens_per_minute=CONFIG["tenant_default_tokens_per_minute"]
+                ),
+                tenant_limits={
+                    tenant_id: TenantLimits(**limits)
+                    for tenant_id, limits in CONFIG["tenant_limits"].items()
+                },
+                metrics_store=system_state["metrics"],
+                max_tenants=CONFIG["tenant_max_tracked"]
+            ),
+            streaming_validation=CONFIG["streaming_validation"],
+            telemetry_window=CONFIG["telemetry_window"],
+            retry_gain=RetryGainModel(min_expected_gain=CONFIG["retry_min_expected_gain"]),
+            validation_workers=CONFIG["validation_workers"],
+            complaint_token_budget=CONFIG["complaint_token_budget"],
+            digest_min_tokens=CONFIG["digest_min_tokens"],
+            digest_chunk_tokens=CONFIG["digest_chunk_tokens"],
+            digest_token_budget=CONFIG["digest_token_budget"],
+            minimize_boilerplate=CONFIG["minimize_boilerplate"],
+            complaint_store=system_state["complaints"]
+        )
+
+        # Initialize admission control sized to the model-call limit
+        system_state["admission"] = AdmissionController(
+            model_concurrency=CONFIG["max_concurrent_model_calls"],
+            max_queue_depth=CONFIG["admission_max_queue_depth"],
+            max_backlog_seconds=CONFIG["admission_max_backlog_seconds"],
+            metrics_store=system_state["metrics"]
         )
 
         # Verify Vertex AI connection
@@ -180,14 +358,14 @@ async def get_status():
             "model": CONFIG["model"],
             "debug_mode": CONFIG["debug"]
         },
-        analysis_count=system_state["analysis_count"],
-        last_analysis=system_state["last_analysis"],
+        analysis_count=_get_analysis_count(),
+        last_analysis=_get_last_analysis(),
         available_agents=["business_analyst", "market_researcher", "strategic_consultant"]
     )
 
 
 @app.post("/analyze")
-async def analyze_case(request: AnalysisRequest, background_tasks: BackgroundTasks):
+async def analyze_case(request: AnalysisRequest, background_tasks: BackgroundTasks, http_request: Request):
     """
     Main endpoint for legal case analysis.
 
@@ -196,32 +374,35 @@ async def analyze_case(request: AnalysisRequest, background_tasks: BackgroundTas
     2. Orchestrates multiple AI agents to analyze it
     3. Validates quality and retries if needed
     4. Returns a comprehensive strategic analysis
+
+    If the client disconnects first, generation is cancelled and no
+    background quality check is scheduled. Under overload the request is
+    shed with 429/503 and a Retry-After header, lower urgency levels first.
     """
     if not system_state["initialized"]:
         raise HTTPException(status_code=503, detail="System not initialized")
 
+    complaint = await _require_stored_complaint(request)
+    ticket = _admit_or_shed(request.urgency, request.tenant_id)
+
     try:
         logger.info(f"Starting analysis for case: {request.case_name}")
         start_time = time.time()
 
         # Create legal scenario from request
-        scenario = LegalScenario(
-            case_name=request.case_name,
-            complaint_text=request.complaint_text,
-            case_type=request.case_type,
-            filing_date=datetime.now().isoformat(),
-            parties_involved=_extract_parties(request.complaint_text),
-            key_issues=_extract_key_issues(request.complaint_text, request.case_type),
-            urgency_level=request.urgency,
-            additional_context=request.additional_context
-        )
+        scenario = _build_scenario(request, complaint)
 
         # Generate analysis report using the agent system
-        report = await system_state["agent"].generate_complete_report(scenario)
+        report = await _run_until_disconnect(
+            http_request,
+            system_state["agent"].generate_complete_report(
+                scenario, deadline=_build_deadline(request, start_time), tenant_id=request.tenant_id
+            )
+        )
 
-        # Update system state
-        system_state["analysis_count"] += 1
-        system_state["last_analysis"] = datetime.now().isoformat()
+        # Update fleet-wide metrics
+        ticket.release()
+        _record_completed_analysis()
 
         # Log success
         processing_time = time.time() - start_time
@@ -235,14 +416,237 @@ async def analyze_case(request: AnalysisRequest, background_tasks: BackgroundTas
         )
 
         return JSONResponse(
-            content=report.dict(),
+            content=_report_payload(report),
             status_code=200
         )
 
+    except ClientDisconnected:
+        logger.info(f"Client disconnected; cancelled analysis for case: {request.case_name}")
+        return Response(status_code=499)
+
     except Exception as e:
         logger.error(f"Analysis failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
+    finally:
+        ticket.release(completed=False)
+
+
+@app.post("/analyze/batch")
+async def analyze_batch(batch: BatchAnalysisRequest):
+    """
+    Analyze many cases in one call, streaming results as NDJSON.
+
+    Cases run with bounded concurrency (BATCH_CONCURRENCY) on top of the
+    agent's global model-call limit. One JSON object is written per line as
+    each case finishes, in completion order; use ``index`` to match results
+    to requests. A failing case yields a ``failed`` line and does not abort
+    the batch; a case shed by admission control yields a ``rejected`` line
+    with ``retry_after`` seconds.
+    """
+    if not system_state["initialized"]:
+        raise HTTPException(status_code=503, detail="System not initialized")
+
+    if len(batch.requests) > CONFIG["max_batch_size"]:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch too large: {len(batch.requests)} cases (max {CONFIG['max_batch_size']})"
+        )
+
+    logger.info(f"Starting batch analysis of {len(batch.requests)} cases")
+    received_at = time.time()
+    semaphore = asyncio.Semaphore(CONFIG["batch_concurrency"])
+    background_tasks = BackgroundTasks()
+
+    async def run_item(index: int, request: AnalysisRequest) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                _check_tenant_quota(request.tenant_id)
+                ticket = system_state["admission"].admit(request.urgency)
+            except AdmissionRejected as e:
+                return {
+                    "index": index,
+                    "case_name": request.case_name,
+                    "status": "rejected",
+                    "retry_after": e.retry_after,
+                    "error": e.reason
+                }
+
+            try:
+                scenario = _build_scenario(request, await _require_stored_complaint(request))
+                report = await system_state["agent"].generate_complete_report(
+                    scenario, deadline=_build_deadline(request, received_at), tenant_id=request.tenant_id
+                )
+                ticket.release()
+                _record_completed_analysis()
+                background_tasks.add_task(_background_quality_check, report, scenario)
+                return {
+                    "index": index,
+                    "case_name": request.case_name,
+                    "status": "completed",
+                    "report": _report_payload(report)
+                }
+            except Exception as e:
+                logger.error(f"Batch item {index} ({request.case_name}) failed: {str(e)}")
+                return {
+                    "index": index,
+                    "case_name": request.case_name,
+                    "status": "failed",
+                    "error": str(e)
+                }
+            finally:
+                ticket.release(completed=False)
+
+    async def stream_results():
+        tasks = [asyncio.create_task(run_item(i, r)) for i, r in enumerate(batch.requests)]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                result = await finished
+                yield json.dumps(result, default=str) + "\n"
+        finally:
+            # Stop outstanding work if the stream ends early (e.g. the client
+            # disconnected); cancellation propagates into the agent
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(
+        stream_results(),
+        media_type="application/x-ndjson",
+        background=background_tasks
+    )
+
+
+@app.post("/complaints", status_code=201)
+async def upload_complaint(request: Request):
+    """
+    Upload a complaint document for later analysis.
+
+    The body is either the document itself (``text/plain``) or a
+    ``multipart/form-data`` form whose file part holds it. It is streamed
+    into the complaint store: normalized, hashed and scanned for parties,
+    amounts, dates, patents, statutes and issue terms chunk by chunk, and
+    rejected with 413 as soon as it
+    exceeds MAX_COMPLAINT_BYTES. Pass the returned ``complaint_id`` to
+    /analyze or /jobs instead of ``complaint_text``. Uploading the same
+    document again returns the same id.
+    """
+    store = system_state["complaints"]
+    if not store:
+        raise HTTPException(status_code=503, detail="Complaint store not initialized")
+
+    content_type = request.headers.get("content-type", "")
+    media_type = content_type.split(";")[0].strip().lower()
+    if media_type == "text/plain":
+        reader, max_body = None, store.max_bytes
+    elif media_type == "multipart/form-data":
+        try:
+            reader = MultipartFileReader(multipart_boundary(content_type))
+        except MultipartError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        # Room for part headers and small form fields next to the document
+        max_body = store.max_bytes + 4 * MAX_HEADER_BYTES
+    else:
+        raise HTTPException(status_code=415, detail="Send the complaint as text/plain or multipart/form-data")
+
+    declared_length = request.headers.get("content-length", "")
+    if declared_length.isdigit() and int(declared_length) > max_body:
+        raise HTTPException(status_code=413, detail=f"Complaint exceeds the {store.max_bytes}-byte limit")
+
+    upload = await asyncio.to_thread(store.open_upload)
+    try:
+        received = 0
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > max_body:
+                raise ComplaintTooLarge(store.max_bytes)
+            data = reader.feed(chunk) if reader else chunk
+            if data:
+                await asyncio.to_thread(upload.write, data)
+        if reader:
+            reader.close()
+        if upload.received_bytes == 0:
+            raise HTTPException(status_code=400, detail="Complaint is empty")
+        complaint = await asyncio.to_thread(upload.commit)
+
+    except ComplaintTooLarge as e:
+        upload.abort()
+        raise HTTPException(status_code=413, detail=str(e))
+    except MultipartError as e:
+        upload.abort()
+        raise HTTPException(status_code=400, detail=f"Malformed multipart body: {str(e)}")
+    except BaseException:
+        upload.abort()
+        raise
+
+    return {
+        **asdict(complaint),
+        "filename": reader.filename if reader else None,
+        "deduplicated": upload.deduplicated
+    }
+
+
+@app.get("/complaints/{complaint_id}")
+async def get_complaint(complaint_id: str):
+    """Get the metadata of a stored complaint (not its text)."""
+    store = system_state["complaints"]
+    if not store:
+        raise HTTPException(status_code=503, detail="Complaint store not initialized")
+
+    complaint = await asyncio.to_thread(store.get, complaint_id)
+    if complaint is None:
+        raise HTTPException(status_code=404, detail=f"Complaint not found: {complaint_id}")
+    return asdict(complaint)
+
+
+@app.post("/jobs", status_code=202)
+async def submit_job(request: AnalysisRequest):
+    """
+    Queue an analysis for a worker node (see run_worker.py).
+
+    Returns a job id immediately; poll ``GET /jobs/{job_id}`` for the
+    result. Jobs survive API restarts, and a job whose worker crashes is
+    picked up by another worker once its lease expires.
+    """
+    if not system_state["queue"]:
+        raise HTTPException(status_code=503, detail="Work queue not initialized")
+    await _admit_job(request.tenant_id)
+
+    # Workers on other nodes cannot read this node's complaint store, so a
+    # job carries the complaint text as well as its id
+    complaint = await _require_stored_complaint(request)
+    scenario = _build_scenario(request, complaint)
+    payload = scenario.dict()
+    if complaint is not None:
+        payload["complaint_text"] = await asyncio.to_thread(
+            system_state["complaints"].load_text, complaint.complaint_id
+        )
+    job_id = await asyncio.to_thread(
+        system_state["queue"].enqueue, REPORT_TASK,
+        {"scenario": payload, "tenant_id": request.tenant_id}
+    )
+    logger.info(f"Queued job {job_id} for case: {request.case_name}")
+    return {"job_id": job_id, "status": "pending"}
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Get the status of a queued analysis, and its report once completed."""
+    if not system_state["queue"]:
+        raise HTTPException(status_code=503, detail="Work queue not initialized")
+
+    task = await asyncio.to_thread(system_state["queue"].get, job_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+    return {
+        "job_id": task.task_id,
+        "status": task.status,
+        "attempts": task.attempts,
+        "worker_id": task.worker_id,
+        "report": task.result,
+        "error": task.error
+    }
+
 
 @app.post("/validate")
 async def validate_report(report: AnalysisReport):
@@ -258,7 +662,8 @@ async def validate_report(report: AnalysisReport):
         raise HTTPException(status_code=503, detail="System not initialized")
 
     try:
-        validation_result = system_state["validator"].validate_report(report)
+        await _load_complaint_texts([report])
+        validation_result = await system_state["validation_pool"].validate_report(report)
 
         return {
             "overall_score": validation_result.overall_score,
@@ -273,6 +678,53 @@ async def validate_report(report: AnalysisReport):
         raise HTTPException(status_code=500, detail=f"Validation failed: {str(e)}")
 
 
+@app.post("/validate/batch")
+async def validate_batch(batch: BatchValidationRequest):
+    """
+    Validate many reports in one call, e.g. to re-score stored reports after tuning thresholds.
+
+    Scores equal those from ``/validate``; results are returned in request
+    order. Batch results are not added to the live quality metrics.
+    """
+    if not system_state["initialized"]:
+        raise HTTPException(status_code=503, detail="System not initialized")
+
+    if len(batch.reports) > CONFIG["max_validation_batch_size"]:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch too large: {len(batch.reports)} reports (max {CONFIG['max_validation_batch_size']})"
+        )
+
+    try:
+        await _load_complaint_texts(batch.reports)
+        started = time.perf_counter()
+        results = await asyncio.to_thread(
+            system_state["batch_validator"].validate_reports, batch.reports, batch.min_quality_threshold
+        )
+        elapsed = time.perf_counter() - started
+
+        return {
+            "results": [
+                {
+                    "index": index,
+                    "case_name": report.scenario.case_name,
+                    "overall_score": result.overall_score,
+                    "passed": result.passed,
+                    "section_scores": result.section_scores,
+                    "issues": result.issues,
+                    "recommendations": result.recommendations
+                }
+                for index, (report, result) in enumerate(zip(batch.reports, results))
+            ],
+            "sections_scored": sum(len(report.sections) for report in batch.reports),
+            "processing_time": elapsed
+        }
+
+    except Exception as e:
+        logger.error(f"Batch validation failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Batch validation failed: {str(e)}")
+
+
 @app.get("/agents")
 async def list_agents():
     """List available AI agents and their capabilities."""
@@ -299,14 +751,33 @@ async def get_metrics():
         raise HTTPException(status_code=503, detail="Agent not initialized")
 
     return {
-        "total_analyses": system_state["analysis_count"],
-        "last_analysis": system_state["last_analysis"],
+        "total_analyses": _get_analysis_count(),
+        "last_analysis": _get_last_analysis(),
+        "workers_reporting": system_state["metrics"].worker_count(),
         "token_usage": system_state["agent"].get_token_usage_stats(),
         "quality_metrics": system_state["validator"].get_quality_metrics() if system_state["validator"] else None,
+        "quality_cache": system_state["validator"].get_cache_stats() if system_state["validator"] else None,
         "performance": {
             "average_processing_time": system_state["agent"].get_avg_processing_time(),
+            "processing_time": system_state["agent"].get_processing_time_stats(),
             "success_rate": system_state["agent"].get_success_rate()
-        }
+        },
+        "cancellations": system_state["agent"].get_cancellation_stats(),
+        "streaming_validation": system_state["agent"].get_streaming_stats(),
+        "retry_gain": system_state["agent"].get_retry_stats(),
+        "prompt_composition": system_state["agent"].prompt_assembler.get_stats(),
+        "case_digest": {
+            **system_state["agent"].case_digester.get_stats(),
+            "model_calls": system_state["agent"].get_digest_call_stats()
+        },
+        "complaint_extraction": EXTRACTOR.get_stats(),
+        "validation_pool": {
+            "generation": system_state["agent"].validation_pool.get_stats(),
+            "background": system_state["validation_pool"].get_stats() if system_state["validation_pool"] else None
+        },
+        "admission": system_state["admission"].get_stats() if system_state["admission"] else None,
+        "queue": system_state["queue"].stats() if system_state["queue"] else None,
+        "tenants": system_state["agent"].scheduler.get_stats()
     }
 
 
@@ -317,9 +788,8 @@ async def reset_system():
         # Re-initialize components
         await startup_event()
 
-        # Reset counters
-        system_state["analysis_count"] = 0
-        system_state["last_analysis"] = None
+        # Reset counters for every worker
+        system_state["metrics"].reset()
 
         return {"message": "System reset successfully"}
 
@@ -330,46 +800,158 @@ async def reset_system():
 
 # Helper functions
 
-def _extract_parties(complaint_text: str) -> List[str]:
-    """Extract party names from complaint text."""
-    # Simplified extraction - in production would use NER
-    parties = []
+def _build_scenario(request: AnalysisRequest, complaint: Optional[StoredComplaint] = None) -> LegalScenario:
+    """
+    Create a legal scenario from an analysis request.
+
+    A stored complaint (see _require_stored_complaint) is referred to by id
+    and its text is not loaded: parties and issues come from what the
+    upload recorded, and the agent reads the text where prompts and
+    groundedness scoring need it.
+    """
+    if request.complaint_id is None:
+        return build_scenario(
+            case_name=request.case_name,
+            complaint_text=request.complaint_text,
+            case_type=request.case_type,
+            urgency_level=request.urgency,
+            additional_context=request.additional_context
+        )
+
+    return build_scenario(
+        case_name=request.case_name,
+        complaint_text="",
+        complaint_id=complaint.complaint_id,
+        case_type=request.case_type,
+        urgency_level=request.urgency,
+        additional_context=request.additional_context,
+        parties_involved=complaint.parties,
+        key_issues=key_issues_from_terms(complaint.issue_terms, request.case_type)
+    )
 
-    # Look for common patterns
-    lines = complaint_text.split('\n')
-    for line in lines[:10]:  # Check first 10 lines
-        if 'plaintiff' in line.lower() or 'defendant' in line.lower():
-            # Extract entity names (simplified)
-            words = line.split()
-            for i, word in enumerate(words):
-                if word.lower() in ['plaintiff', 'defendant'] and i > 0:
-                    parties.append(words[i-1])
 
-    return parties if parties else ["Party A", "Party B"]
+async def _require_stored_complaint(request: AnalysisRequest) -> Optional[StoredComplaint]:
+    """The stored complaint a request refers to, looked up off the event loop; 404 if it is unknown."""
+    if request.complaint_id is None:
+        return None
+    store = system_state["complaints"]
+    if not store:
+        raise HTTPException(status_code=503, detail="Complaint store not initialized")
+    complaint = await asyncio.to_thread(store.get, request.complaint_id)
+    if complaint is None:
+        raise HTTPException(status_code=404, detail=f"Complaint not found: {request.complaint_id}")
+    return complaint
+
+
+def _report_payload(report: AnalysisReport) -> Dict[str, Any]:
+    """A report as JSON-ready data, referring to a stored complaint by id instead of its text."""
+    return report.dict(exclude={"scenario": {"complaint_text"}} if report.scenario.complaint_id else None)
+
+
+async def _load_complaint_texts(reports: List[AnalysisReport]) -> None:
+    """Fill in the complaint text of reports that refer to a stored complaint, for groundedness scoring."""
+    store = system_state["complaints"]
+    if not store:
+        return
+    texts: Dict[str, str] = {}
+    for report in reports:
+        scenario = report.scenario
+        if scenario.complaint_id and not scenario.complaint_text:
+            if scenario.complaint_id not in texts:
+                try:
+                    texts[scenario.complaint_id] = await asyncio.to_thread(store.load_text, scenario.complaint_id)
+                except KeyError:
+                    texts[scenario.complaint_id] = ""
+            scenario.complaint_text = texts[scenario.complaint_id]
+
+
+def _check_tenant_quota(tenant_id: str) -> None:
+    """Raise AdmissionRejected (429) while a tenant has used up its token quota."""
+    retry_after = system_state["agent"].scheduler.quota_retry_after(tenant_id)
+    if retry_after is not None:
+        raise AdmissionRejected(429, retry_after, f"Token quota exhausted for tenant {tenant_id}")
+
+
+def _admit_or_shed(urgency: str, tenant_id: str = DEFAULT_TENANT):
+    """Admit a request, or raise 429/503 with a Retry-After header when overloaded or over quota."""
+    try:
+        _check_tenant_quota(tenant_id)
+        return system_state["admission"].admit(urgency)
+    except AdmissionRejected as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=e.reason,
+            headers={"Retry-After": str(e.retry_after)}
+        )
 
 
-def _extract_key_issues(complaint_text: str, case_type: str) -> List[str]:
-    """Extract key legal issues from complaint."""
-    issues = []
+async def _admit_job(tenant_id: str) -> None:
+    """Turn a job away with 429/503 and Retry-After while its tenant is over quota or the queue is full."""
+    try:
+        _check_tenant_quota(tenant_id)
+        max_pending = CONFIG["queue_max_pending"]
+        if max_pending > 0:
+            stats = await asyncio.to_thread(system_state["queue"].stats)
+            pending = stats.get("pending", 0)
+            if pending >= max_pending:
+                # Roughly one report's time frees a place in the queue
+                admission = system_state["admission"]
+                retry_after = max(1, math.ceil(admission.avg_report_seconds)) if admission else 60
+                raise AdmissionRejected(503, retry_after, f"Work queue full: {pending} jobs pending")
+    except AdmissionRejected as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=e.reason,
+            headers={"Retry-After": str(e.retry_after)}
+        )
 
-    # Case type specific issues
-    if "IP" in case_type or "intellectual" in case_type.lower():
-        ip_terms = ["patent", "trademark", "copyright", "trade secret", "infringement"]
-        for term in ip_terms:
-            if term in complaint_text.lower():
-                issues.append(f"{term.title()} dispute")
 
-    elif "contract" in case_type.lower():
-        contract_terms = ["breach", "performance", "termination", "damages"]
-        for term in contract_terms:
-            if term in complaint_text.lower():
-                issues.append(f"Contract {term}")
+def _build_deadline(request: AnalysisRequest, received_at: float) -> Optional[DeadlineBudget]:
+    """Convert a request's time budget into a deadline measured from when it arrived."""
+    if request.deadline_seconds is None:
+        return None
+    elapsed = time.time() - received_at
+    return DeadlineBudget.from_timeout(max(0.0, request.deadline_seconds - elapsed))
 
-    # Default issues if none found
-    if not issues:
-        issues = ["Primary legal dispute", "Damages assessment", "Remedy determination"]
 
-    return issues
+async def _run_until_disconnect(http_request: Request, coro) -> Any:
+    """Run a coroutine, cancelling it if the HTTP client disconnects first."""
+    task = asyncio.create_task(coro)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=CONFIG["disconnect_poll_interval"])
+            if task in done:
+                return task.result()
+            if await http_request.is_disconnected():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+                raise ClientDisconnected()
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+def _record_completed_analysis() -> None:
+    """Count a completed analysis in the fleet-wide metrics."""
+    system_state["metrics"].increment("analysis_count")
+    system_state["metrics"].set_gauge("last_analysis", datetime.now().isoformat())
+
+
+def _get_analysis_count() -> int:
+    """Get the fleet-wide number of completed analyses."""
+    if not system_state["metrics"]:
+        return 0
+    return int(system_state["metrics"].counter("analysis_count"))
+
+
+def _get_last_analysis() -> Optional[str]:
+    """Get the timestamp of the most recent analysis on any worker."""
+    if not system_state["metrics"]:
+        return None
+    return system_state["metrics"].gauge("last_analysis")
 
 
 def _extract_capabilities(persona_text: str) -> List[str]:
@@ -407,12 +989,29 @@ def _extract_focus_areas(persona_text: str) -> List[str]:
     return focus_areas if focus_areas else ["Business analysis", "Strategic insights"]
 
 
+def _background_validation_overloaded() -> bool:
+    """Whether enough reports are waiting for model slots that background checks should be shed."""
+    admission = system_state["admission"]
+    shed_depth = CONFIG["background_validation_shed_queue_depth"]
+    return admission is not None and shed_depth > 0 and admission.queue_depth >= shed_depth
+
+
 async def _background_quality_check(report: AnalysisReport, scenario: LegalScenario):
     """Run quality checks in the background."""
     try:
         logger.info(f"Running background quality check for {scenario.case_name}")
 
-        validation_result = system_state["validator"].validate_report(report)
+        # Sections carry their generation-time scores, so this is a lookup
+        # unless the content or the scoring rules changed since; only then is
+        # a stored complaint's text needed. Checks are batched on the
+        # validation pool and dropped when the server is busy.
+        validator = system_state["validator"]
+        if any(validator.reuse_breakdown(section) is None for section in report.sections):
+            await _load_complaint_texts([report])
+        validation_result = await system_state["validation_pool"].check_in_background(report)
+        if validation_result is None:
+            logger.info(f"Background quality check skipped under load for {scenario.case_name}")
+            return
 
         if not validation_result.passed:
             logger.warning(f"Quality check failed for {scenario.case_name}: Score {validation_result.overall_score:.2f}")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Legal Intelligence AI System - Batch Runner CLI
+===============================================
+Run the analysis pipeline over many complaints without the API server.
+
+Usage:
+    python run_batch.py complaints.jsonl --output reports.jsonl
+    python run_batch.py complaints/ --case-type IP --output reports.jsonl --concurrency 8
+
+Re-running the same command after an interruption skips every scenario
+already completed in the output file.
+"""
+
+import os
+import sys
+import asyncio
+import argparse
+import tempfile
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Add core modules to path
+sys.path.append(str(Path(__file__).parent))
+
+from src.core.agent_system import LegalIntelligenceAgent
+from src.core.batch_runner import BatchRunner, load_jsonl_scenarios, load_text_scenarios
+from src.utils.checkpoint_store import SectionCheckpointStore
+from src.utils.logger import setup_logger
+
+logger = setup_logger("legal-intelligence", level=os.getenv("LOG_LEVEL", "INFO"))
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Run legal analyses over a batch of complaints.")
+    parser.add_argument("input", help="JSONL file of scenarios, or a directory of .txt complaints")
+    parser.add_argument("--output", "-o", required=True, help="JSONL file that reports are appended to")
+    parser.add_argument("--concurrency", "-c", type=int, default=int(os.getenv("BATCH_CONCURRENCY", "4")),
+                        help="Number of reports generated at once (default: BATCH_CONCURRENCY or 4)")
+    parser.add_argument("--case-type", default="Other", help="Case type for text-file input (default: Other)")
+    parser.add_argument("--urgency", default="standard", help="Urgency level for text-file input")
+    return parser.parse_args(argv)
+
+
+async def main(argv=None) -> int:
+    """Run the batch and return a process exit code."""
+    args = parse_args(argv)
+
+    project_id = os.getenv("PROJECT_ID", "")
+    if not project_id:
+        logger.error("PROJECT_ID environment variable not set")
+        return 2
+
+    if os.path.isdir(args.input):
+        items = list(load_text_scenarios(args.input, args.case_type, args.urgency))
+    else:
+        items = list(load_jsonl_scenarios(args.input))
+
+    agent = LegalIntelligenceAgent(
+        project_id=project_id,
+        location=os.getenv("LOCATION", "us-central1"),
+        model_name=os.getenv("MODEL", "gemini-2.0-flash"),
+        checkpoint_store=SectionCheckpointStore(
+            os.getenv("CHECKPOINT_DIR", str(Path(tempfile.gettempdir()) / "legal-intelligence-checkpoints"))
+        ),
+        max_concurrent_model_calls=int(os.getenv("MAX_CONCURRENT_MODEL_CALLS", "8")),
+        streaming_validation=os.getenv("STREAMING_VALIDATION", "false").lower() == "true"
+    )
+    if not agent.initialize_vertex_ai():
+        logger.error("Failed to initialize Vertex AI")
+        return 1
+
+    runner = BatchRunner(agent, args.output, concurrency=args.concurrency)
+    summary = await runner.run(items)
+    logger.info(
+        f"Batch finished: {summary['completed']} completed, {summary['failed']} failed, "
+        f"{summary['skipped']} skipped of {summary['total']}"
+    )
+    return 0 if summary["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
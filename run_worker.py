@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Legal Intelligence AI System - Queue Worker CLI
+===============================================
+Process analysis jobs submitted through ``POST /jobs``.
+
+Usage:
+    python run_worker.py
+    QUEUE_BACKEND=redis QUEUE_URL=redis://queue-host:6379/0 python run_worker.py --concurrency 4
+
+Start one worker per node (or several per node); each claims jobs with a
+lease, so adding nodes adds capacity. A job whose worker dies is picked up
+by another worker once its lease expires. Jobs carry the complaint text, so
+workers need no access to the API's complaint store. Point CHECKPOINT_DIR
+at storage shared by all nodes for a reclaimed job to resume from the
+sections its previous worker finished.
+"""
+
+import os
+import sys
+import json
+import signal
+import asyncio
+import argparse
+import tempfile
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Add core modules to path
+sys.path.append(str(Path(__file__).parent))
+
+from src.core.agent_system import LegalIntelligenceAgent
+from src.core.queue_worker import QueueWorker
+from src.core.tenant_scheduler import FairScheduler, TenantLimits
+from src.core.work_queue import create_work_queue
+from src.utils.checkpoint_store import SectionCheckpointStore
+from src.utils.metrics_store import SharedMetricsStore
+from src.utils.logger import setup_logger
+
+logger = setup_logger("legal-intelligence", level=os.getenv("LOG_LEVEL", "INFO"))
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Process queued legal analysis jobs.")
+    parser.add_argument("--worker-id", default=None, help="Identifier recorded on claimed jobs (default host:pid)")
+    parser.add_argument("--concurrency", "-c", type=int, default=int(os.getenv("WORKER_CONCURRENCY", "2")),
+                        help="Jobs processed at once (default: WORKER_CONCURRENCY or 2)")
+    parser.add_argument("--lease-seconds", type=float, default=float(os.getenv("QUEUE_LEASE_SECONDS", "120")),
+                        help="Visibility timeout for a claimed job (default: QUEUE_LEASE_SECONDS or 120)")
+    parser.add_argument("--heartbeat-interval", type=float, default=None,
+                        help="Seconds between lease extensions (default: a quarter of the lease)")
+    return parser.parse_args(argv)
+
+
+async def main(argv=None) -> int:
+    """Run the worker until interrupted and return a process exit code."""
+    args = parse_args(argv)
+
+    project_id = os.getenv("PROJECT_ID", "")
+    if not project_id:
+        logger.error("PROJECT_ID environment variable not set")
+        return 2
+
+    queue = create_work_queue(
+        os.getenv("QUEUE_BACKEND", "sqlite"),
+        os.getenv("QUEUE_URL", str(Path(tempfile.gettempdir()) / "legal-intelligence-queue.db")),
+        max_attempts=int(os.getenv("QUEUE_MAX_ATTEMPTS", "3"))
+    )
+    metrics_store = SharedMetricsStore(
+        os.getenv("METRICS_DB_PATH", str(Path(tempfile.gettempdir()) / "legal-intelligence-metrics.db"))
+    )
+
+    # Jobs run under their tenant's limits, configured as for the API server
+    max_concurrent_model_calls = int(os.getenv("MAX_CONCURRENT_MODEL_CALLS", "8"))
+    scheduler = FairScheduler(
+        total_slots=max_concurrent_model_calls,
+        default_limits=TenantLimits(
+            max_concurrency=int(os.getenv("TENANT_DEFAULT_MAX_CONCURRENCY", "0")) or None,
+            tokens_per_minute=int(os.getenv("TENANT_DEFAULT_TOKENS_PER_MINUTE", "0")) or None
+        ),
+        tenant_limits={
+            tenant_id: TenantLimits(**limits)
+            for tenant_id, limits in json.loads(os.getenv("TENANT_LIMITS", "{}")).items()
+        },
+        metrics_store=metrics_store,
+        max_tenants=int(os.getenv("TENANT_MAX_TRACKED", "1000"))
+    )
+
+    agent = LegalIntelligenceAgent(
+        project_id=project_id,
+        location=os.getenv("LOCATION", "us-central1"),
+        model_name=os.getenv("MODEL", "gemini-2.0-flash"),
+        metrics_store=metrics_store,
+        checkpoint_store=SectionCheckpointStore(
+            os.getenv("CHECKPOINT_DIR", str(Path(tempfile.gettempdir()) / "legal-intelligence-checkpoints")),
+            max_age_seconds=float(os.getenv("CHECKPOINT_MAX_AGE_SECONDS", "604800"))
+        ),
+        max_concurrent_model_calls=max_concurrent_model_calls,
+        scheduler=scheduler,
+        streaming_validation=os.getenv("STREAMING_VALIDATION", "false").lower() == "true"
+    )
+    if not agent.initialize_vertex_ai():
+        logger.error("Failed to initialize Vertex AI")
+        return 1
+
+    worker = QueueWorker(
+        queue,
+        agent,
+        worker_id=args.worker_id,
+        concurrency=args.concurrency,
+        lease_seconds=args.lease_seconds,
+        heartbeat_interval=args.heartbeat_interval or args.lease_seconds / 4
+    )
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    await worker.run(stop_event)
+    metrics_store.close()
+    logger.info(f"Worker stats: {worker.get_stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
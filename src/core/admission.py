@@ -0,0 +1,165 @@
+"""
+Admission Control for Legal Intelligence AI System
+==================================================
+Decides whether a new analysis can be accepted without slowing down the ones
+already running.
+
+Reports make their model calls one after another, so at most
+``model_concurrency`` reports make progress at once; everything admitted
+beyond that is effectively queued. The controller tracks that queue depth and
+an estimate of the backlog time, and sheds excess requests with a computed
+``Retry-After``. Lower urgency levels get a smaller share of the queue, so
+they are shed first.
+"""
+
+import math
+import time
+import logging
+from typing import Dict, Any, Optional
+
+from ..utils.metrics_store import SharedMetricsStore
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is shed; carries the HTTP status and Retry-After seconds."""
+
+    def __init__(self, status_code: int, retry_after: int, reason: str):
+        super().__init__(reason)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+class AdmissionTicket:
+    """An admitted request; releases its slot when the request finishes."""
+
+    def __init__(self, controller: "AdmissionController", urgency: str):
+        self.controller = controller
+        self.urgency = urgency
+        self.admitted_at = time.monotonic()
+        self._released = False
+
+    def release(self, completed: bool = True) -> None:
+        """Free the slot; successful durations feed the report-time estimate."""
+        if self._released:
+            return
+        self._released = True
+        duration = time.monotonic() - self.admitted_at
+        self.controller._release(duration if completed else None)
+
+    def __enter__(self) -> "AdmissionTicket":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release(completed=exc_type is None)
+
+
+class AdmissionController:
+    """Queue-depth and backlog-time based admission control with urgency tiers."""
+
+    # Fraction of the queue depth and backlog budget each urgency level may use
+    URGENCY_SHARES = {
+        "critical": 1.0,
+        "high": 0.9,
+        "standard": 0.75,
+        "low": 0.5
+    }
+
+    def __init__(
+        self,
+        model_concurrency: int,
+        max_queue_depth: int = 32,
+        max_backlog_seconds: float = 120.0,
+        default_report_seconds: float = 60.0,
+        smoothing: float = 0.2,
+        metrics_store: Optional[SharedMetricsStore] = None
+    ):
+        """
+        Args:
+            model_concurrency: The agent's global model-call limit
+            max_queue_depth: Most requests allowed to wait for capacity (critical tier)
+            max_backlog_seconds: Longest estimated wait allowed for a new request (critical tier)
+            default_report_seconds: Report duration assumed until one has been observed
+            smoothing: Weight of the newest observation in the report-time average
+            metrics_store: Optional shared store for fleet-wide shed counts
+        """
+        self.model_concurrency = max(1, model_concurrency)
+        self.max_queue_depth = max_queue_depth
+        self.max_backlog_seconds = max_backlog_seconds
+        self.avg_report_seconds = default_report_seconds
+        self.smoothing = smoothing
+        self.metrics_store = metrics_store
+
+        self.active = 0
+        self.admitted_count = 0
+        self.rejected_counts: Dict[str, int] = {}
+
+    @property
+    def queue_depth(self) -> int:
+        """Admitted requests waiting for model capacity."""
+        return max(0, self.active - self.model_concurrency)
+
+    def estimated_backlog_seconds(self) -> float:
+        """Estimated wait before a newly admitted request starts making progress."""
+        return self.queue_depth * self.avg_report_seconds / self.model_concurrency
+
+    def admit(self, urgency: str = "standard") -> AdmissionTicket:
+        """Admit a request or raise AdmissionRejected with a Retry-After estimate."""
+        tier = urgency if urgency in self.URGENCY_SHARES else "standard"
+        share = self.URGENCY_SHARES[tier]
+        depth_limit = max(1, int(self.max_queue_depth * share))
+        backlog_limit = self.max_backlog_seconds * share
+
+        depth = self.queue_depth
+        backlog = self.estimated_backlog_seconds()
+        if depth >= depth_limit or backlog >= backlog_limit:
+            # Time for enough queued work to drain that this tier fits again
+            per_report = self.avg_report_seconds / self.model_concurrency
+            drain_for_depth = (depth - depth_limit + 1) * per_report
+            drain_for_backlog = backlog - backlog_limit + per_report
+            retry_after = max(1, math.ceil(max(drain_for_depth, drain_for_backlog)))
+
+            # 503 once even critical work is turned away; 429 while only lower tiers are shed
+            status_code = 503 if share >= 1.0 else 429
+            reason = (
+                f"Server busy: {depth} queued, ~{backlog:.0f}s backlog "
+                f"(limit for {tier} urgency: {depth_limit} queued, {backlog_limit:.0f}s)"
+            )
+            self.rejected_counts[tier] = self.rejected_counts.get(tier, 0) + 1
+            if self.metrics_store:
+                self.metrics_store.increment(f"admission_rejected:{tier}")
+            logger.warning(f"Shedding {tier} request: {reason}; retry after {retry_after}s")
+            raise AdmissionRejected(status_code, retry_after, reason)
+
+        self.active += 1
+        self.admitted_count += 1
+        return AdmissionTicket(self, tier)
+
+    def _release(self, duration: Optional[float]) -> None:
+        self.active = max(0, self.active - 1)
+        if duration is not None:
+            self.avg_report_seconds += self.smoothing * (duration - self.avg_report_seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Current admission state and shed counts."""
+        if self.metrics_store:
+            counters = self.metrics_store.counters()
+            rejected = {
+                name.split(":", 1)[1]: int(value)
+                for name, value in counters.items()
+                if name.startswith("admission_rejected:")
+            }
+        else:
+            rejected = dict(self.rejected_counts)
+
+        return {
+            "active": self.active,
+            "queue_depth": self.queue_depth,
+            "estimated_backlog_seconds": self.estimated_backlog_seconds(),
+            "average_report_seconds": self.avg_report_seconds,
+            "model_concurrency": self.model_concurrency,
+            "admitted": self.admitted_count,
+            "rejected": rejected
+        }
@@ -11,10 +11,12 @@ import os
 import time
 import json
 import logging
+import threading
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import asyncio
+from collections import deque
 
 # Google AI imports
 from google import genai
@@ -29,11 +31,47 @@ from ..models.legal_models import (
     TokenUsage
 )
 from ..prompts.personas import LegalPersonas
-from .quality_validator import QualityValidator
+from ..prompts.prompt_assembler import PromptAssembler
+from ..utils.metrics_store import SharedMetricsStore
+from ..utils.checkpoint_store import SectionCheckpointStore
+from ..utils.telemetry import RollingMetric
+from ..utils.text_terms import complaint_hash
+from .quality_validator import QualityScore, QualityValidator
+from .streaming_validator import IncrementalQualityScorer
+from .validation_pool import ValidationPool
+from .case_digest import CaseDigester
+from .retry_gain import RetryGainModel
+from .deadline import DeadlineBudget, DeadlineExceeded
+from .tenant_scheduler import FairScheduler, DEFAULT_TENANT
 
 logger = logging.getLogger(__name__)
 
 
+class GenerationCancelled(Exception):
+    """Raised when section generation is abandoned because the caller went away."""
+
+
+class GenerationAborted(Exception):
+    """Raised when a streamed draft is stopped because it is heading below the quality threshold."""
+
+    def __init__(self, section_type: str, projection: QualityScore, token_usage: TokenUsage, tokens_saved: int):
+        super().__init__(
+            f"Draft of {section_type} aborted at projected quality {projection.overall_score:.2f}"
+        )
+        self.section_type = section_type
+        self.projection = projection
+        self.token_usage = token_usage
+        self.tokens_saved = tokens_saved
+
+
+class StreamedResponse:
+    """A streamed generation's text and final usage, shaped like a non-streamed response."""
+
+    def __init__(self, text: str, usage_metadata: Any):
+        self.text = text
+        self.usage_metadata = usage_metadata
+
+
 class LegalIntelligenceAgent:
     """
     Main orchestrator for the Legal Intelligence AI System.
@@ -46,7 +84,26 @@ class LegalIntelligenceAgent:
     YOUR MISSION: Fix the TODOs to make this system work!
     """
 
-    def __init__(self, project_id: str, location: str = "us-central1", model_name: str = "gemini-2.0-flash"):
+    def __init__(
+        self,
+        project_id: str,
+        location: str = "us-central1",
+        model_name: str = "gemini-2.0-flash",
+        metrics_store: Optional[SharedMetricsStore] = None,
+        checkpoint_store: Optional[SectionCheckpointStore] = None,
+        max_concurrent_model_calls: int = 8,
+        scheduler: Optional[FairScheduler] = None,
+        streaming_validation: bool = False,
+        telemetry_window: int = 1000,
+        retry_gain: Optional[RetryGainModel] = None,
+        validation_workers: int = 2,
+        complaint_token_budget: int = 500,
+        digest_min_tokens: int = 8000,
+        digest_chunk_tokens: int = 2000,
+        digest_token_budget: int = 1500,
+        minimize_boilerplate: bool = True,
+        complaint_store=None
+    ):
         """Initialize the Legal Intelligence Agent system."""
         self.project_id = project_id
         self.location = location
@@ -57,13 +114,67 @@ class LegalIntelligenceAgent:
 
         # Components
         self.personas = LegalPersonas()
-        self.quality_validator = QualityValidator()
-
-        # Performance tracking
-        self.token_usage_history = []
-        self.processing_times = []
+        self.quality_validator = QualityValidator(metrics_store=metrics_store)
+        self.prompt_assembler = PromptAssembler(
+            self.personas,
+            section_queries={
+                section_type: keywords + self.quality_validator.expected_elements_for(section_type)
+                for section_type, keywords in QualityValidator.SECTION_KEYWORDS.items()
+            },
+            complaint_token_budget=complaint_token_budget,
+            minimize_boilerplate=minimize_boilerplate
+        )
+        self.validation_pool = ValidationPool(
+            self.quality_validator, max_workers=validation_workers, telemetry_window=telemetry_window
+        )
+        self.checkpoint_store = checkpoint_store
+        # Scenarios that refer to a stored complaint by id are read from here
+        self.complaint_store = complaint_store
+
+        # Deadline planning: expected duration of one attempt until history exists
+        self.default_attempt_seconds = 20.0
+        self.min_output_tokens = 256
+
+        # Global limit on in-flight model calls, shared fairly between tenants
+        self.max_concurrent_model_calls = max_concurrent_model_calls
+        self.scheduler = scheduler or FairScheduler(total_slots=max_concurrent_model_calls)
+
+        # Very long complaints are summarized chunk by chunk once, and every section quotes the digest
+        self.case_digester = CaseDigester(
+            self._summarize_chunk,
+            min_tokens=digest_min_tokens,
+            chunk_tokens=digest_chunk_tokens,
+            digest_token_budget=digest_token_budget,
+            max_parallel_chunks=max_concurrent_model_calls
+        )
+        self.digest_output_tokens = 512
+
+        # Stream sections and abandon drafts that are clearly heading below threshold
+        self.streaming_validation = streaming_validation
+        self.streaming_abort_margin = 0.1
+        self.streaming_min_progress = 0.35
+
+        # Skip quality retries that historically barely move the score
+        self.retry_gain = retry_gain or RetryGainModel()
+
+        # Performance tracking (per process; fleet-wide when metrics_store is set)
+        # Recent records are kept in fixed-size windows; totals are running sums
+        self.metrics_store = metrics_store
+        self.token_usage_history = deque(maxlen=telemetry_window)
+        self.tokens_per_request = RollingMetric(window=telemetry_window)
+        self.input_tokens_total = 0
+        self.output_tokens_total = 0
+        self.processing_times = RollingMetric(window=telemetry_window)
+        # Case-digest calls are smaller and faster than section generations,
+        # so they are tracked apart and never skew the figures above
+        self.digest_call_times = RollingMetric(window=telemetry_window)
+        self.digest_tokens_total = 0
         self.success_count = 0
         self.total_attempts = 0
+        self.cancelled_reports = 0
+        self.cancellation_tokens_saved = 0
+        self.streaming_aborts = 0
+        self.streaming_tokens_saved = 0
 
         # Configuration
         self.generation_config = types.GenerateContentConfig(
@@ -118,6 +229,13 @@ class LegalIntelligenceAgent:
                         contents=contents,
                         config=config
                     )
+
+                def generate_content_stream(self, contents, config=None):
+                    return self.client.models.generate_content_stream(
+                        model=self.model_name,
+                        contents=contents,
+                        config=config
+                    )
             
             self.model = ModelWrapper(self.client, self.model_name)
             logger.info(f"Model wrapper created: {self.model_name}")
@@ -149,7 +267,15 @@ class LegalIntelligenceAgent:
         persona: str,
         section_type: str,
         scenario: LegalScenario,
-        previous_sections: List[ReportSection] = None
+        previous_sections: List[ReportSection] = None,
+        deadline: Optional[DeadlineBudget] = None,
+        max_output_tokens: Optional[int] = None,
+        cancel_event: Optional[threading.Event] = None,
+        tenant_id: str = DEFAULT_TENANT,
+        abort_below: Optional[float] = None,
+        complaint_digest: Optional[str] = None,
+        complaint_text: Optional[str] = None,
+        complaint_minimized: bool = False
     ) -> Tuple[str, TokenUsage, float]:
         """
         CURRENT STATE: Returns dummy content, no actual AI generation
@@ -166,6 +292,19 @@ class LegalIntelligenceAgent:
             section_type: Type of section (e.g., "liability_assessment")
             scenario: The legal case to analyze
             previous_sections: Previous sections for context chaining
+            deadline: Optional request deadline; no retry is started past it
+            max_output_tokens: Optional override of the configured output limit
+            cancel_event: Optional event set when the caller has gone away;
+                no further attempt is made once it is set
+            tenant_id: Tenant the call is scheduled and charged to
+            abort_below: Quality threshold; with streaming validation enabled,
+                a draft projected clearly below it is stopped early and
+                GenerationAborted is raised so the caller can retry
+            complaint_digest: Case digest quoted instead of the complaint text
+            complaint_text: Text of the complaint, when the scenario refers
+                to a stored complaint by id instead of carrying it
+            complaint_minimized: complaint_text already has its pleading
+                boilerplate stripped
 
         Returns:
             Tuple of (content, token_usage, cost)
@@ -184,7 +323,10 @@ class LegalIntelligenceAgent:
         previous_sections = previous_sections or []
 
         # Build the comprehensive prompt
-        prompt = self._build_prompt(persona, section_type, scenario, previous_sections)
+        prompt = self._build_prompt(
+            persona, section_type, scenario, previous_sections, complaint_digest, complaint_text, complaint_minimized
+        )
+        estimated_tokens = self._estimate_call_tokens(prompt, max_output_tokens)
 
         # Implement content generation with retry logic
         max_retries = 3
@@ -192,11 +334,33 @@ class LegalIntelligenceAgent:
 
         for attempt in range(max_retries):
             try:
+                if cancel_event and cancel_event.is_set():
+                    raise GenerationCancelled(f"Generation of {section_type} cancelled")
+                if deadline and deadline.expired():
+                    raise DeadlineExceeded(f"Deadline exceeded before generating {section_type}")
+
+                # Wait for this tenant's turn at the global model-call limit
+                timeout = deadline.remaining() if deadline and deadline.bounded else None
+                if not self.scheduler.acquire(tenant_id, estimated_tokens, cancel_event=cancel_event, timeout=timeout):
+                    if cancel_event and cancel_event.is_set():
+                        raise GenerationCancelled(f"Generation of {section_type} cancelled")
+                    raise DeadlineExceeded(f"Deadline exceeded waiting to generate {section_type}")
+
                 # Generate content using the model
-                response = self.model.generate_content(
-                    contents=prompt,
-                    config=self.generation_config
-                )
+                config = self._get_generation_config(deadline, max_output_tokens)
+                try:
+                    if self.streaming_validation and abort_below is not None:
+                        response = self._generate_streaming(
+                            prompt, config, section_type, abort_below, cancel_event,
+                            source_grounded=bool(scenario.complaint_text if complaint_text is None else complaint_text)
+                        )
+                    else:
+                        response = self.model.generate_content(
+                            contents=prompt,
+                            config=config
+                        )
+                finally:
+                    self.scheduler.release(tenant_id)
 
                 # Extract text from response
                 if not response or not hasattr(response, 'text') or not response.text:
@@ -222,40 +386,81 @@ class LegalIntelligenceAgent:
 
                 # Calculate cost
                 cost = self._calculate_cost(token_usage)
+                self.scheduler.record_usage(tenant_id, total_tokens)
 
                 # Track token usage for statistics
-                self.token_usage_history.append(token_usage)
+                self._record_token_usage(token_usage)
                 self.total_attempts += 1
                 self.success_count += 1
 
                 # Track processing time
                 processing_time = time.time() - start_time
-                self.processing_times.append(processing_time)
+                self.processing_times.record(processing_time)
+
+                if self.metrics_store:
+                    self.metrics_store.increment("generation_attempts")
+                    self.metrics_store.increment("generation_successes")
+                    self.metrics_store.increment("token_usage_records")
+                    self.metrics_store.increment("input_tokens", input_tokens)
+                    self.metrics_store.increment("output_tokens", output_tokens)
+                    self.metrics_store.increment("total_tokens", total_tokens)
+                    self.metrics_store.increment("processing_time_total", processing_time)
+                    self.metrics_store.record("processing_time", processing_time)
 
                 logger.info(f"Successfully generated content for {section_type} (attempt {attempt + 1})")
                 logger.debug(f"Tokens used: {total_tokens} (input: {input_tokens}, output: {output_tokens}), Cost: ${cost:.4f}")
 
                 return content, token_usage, cost
 
+            except GenerationAborted as e:
+                # A weak draft was stopped; the caller retries it with feedback
+                self._record_streaming_abort(e, tenant_id)
+                raise
+
+            except (DeadlineExceeded, GenerationCancelled) as e:
+                # Out of time or cancelled: retrying cannot help
+                last_exception = e
+                logger.warning(f"Content generation for {section_type} stopped: {str(e)}")
+                break
+
             except Exception as e:
                 last_exception = e
                 self.total_attempts += 1
-                
+                if self.metrics_store:
+                    self.metrics_store.increment("generation_attempts")
+
+                # Exponential backoff: wait 2^attempt seconds
+                wait_time = 2 ** attempt
+                if deadline and attempt < max_retries - 1 and deadline.remaining() <= wait_time:
+                    logger.error(
+                        f"Content generation failed for {section_type} (attempt {attempt + 1}/{max_retries}): "
+                        f"{str(e)}. Not retrying: deadline too close"
+                    )
+                    break
+
                 if attempt < max_retries - 1:
-                    # Exponential backoff: wait 2^attempt seconds
-                    wait_time = 2 ** attempt
                     logger.warning(
                         f"Content generation failed for {section_type} (attempt {attempt + 1}/{max_retries}): {str(e)}. "
                         f"Retrying in {wait_time} seconds..."
                     )
-                    time.sleep(wait_time)
+                    if cancel_event:
+                        cancel_event.wait(wait_time)
+                    else:
+                        time.sleep(wait_time)
                 else:
                     logger.error(f"Content generation failed for {section_type} after {max_retries} attempts: {str(e)}")
 
         # If we get here, all retries failed
+        if isinstance(last_exception, (DeadlineExceeded, GenerationCancelled)):
+            raise last_exception
         raise RuntimeError(f"Failed to generate content for {section_type} after {max_retries} attempts: {str(last_exception)}")
 
-    async def generate_complete_report(self, scenario: LegalScenario) -> AnalysisReport:
+    async def generate_complete_report(
+        self,
+        scenario: LegalScenario,
+        deadline: Optional[DeadlineBudget] = None,
+        tenant_id: str = DEFAULT_TENANT
+    ) -> AnalysisReport:
         """
         CURRENT STATE: Generates dummy report with no real analysis
 
@@ -280,9 +485,25 @@ class LegalIntelligenceAgent:
         - Pass sections list to generate_section_content for context
         - Use self.quality_validator.validate_section() to check quality
         - Retry with enhanced prompt if quality < 0.7
+
+        When a checkpoint store is configured, each section is persisted once
+        it has been validated, and a later call for the same scenario resumes
+        from the first section without a checkpoint.
+
+        When a deadline is given, the remaining time is split across the
+        remaining sections. As it runs short, quality retries are skipped,
+        output length is reduced and the lowest-priority sections are dropped;
+        every degradation applied is listed in ``metadata["degradations"]``.
+
+        Model calls are scheduled and charged to ``tenant_id``.
+
+        A scenario that refers to a stored complaint by ``complaint_id`` is
+        not filled in: its text is read once from the complaint store and
+        used only to build prompts and score groundedness.
         """
         logger.info(f"Starting complete report generation for case: {scenario.case_name}")
         start_time = time.time()
+        scenario_hash = scenario.content_hash()
 
         # Define section generation sequence with persona assignments
         section_config = [
@@ -301,93 +522,229 @@ class LegalIntelligenceAgent:
         quality_threshold = 0.7
         max_quality_retries = 2
 
+        # Resume from checkpoints left by an earlier failed or interrupted run.
+        # Checkpoint reads and writes (with fsync) run off the event loop.
+        if self.checkpoint_store:
+            sections = await asyncio.to_thread(
+                self.checkpoint_store.load_completed_prefix,
+                scenario_hash, [section_type for section_type, _ in section_config]
+            )
+            total_cost = sum(s.cost for s in sections)
+            total_tokens = sum(s.tokens_used for s in sections)
+            if sections:
+                logger.info(
+                    f"Resuming {scenario.case_name} from checkpoint: "
+                    f"{len(sections)}/{len(section_config)} sections already complete"
+                )
+        resumed_sections = len(sections)
+
         # Generate each section with context chaining
-        for section_type, persona_type in section_config:
-            logger.info(f"Generating section: {section_type} using {persona_type} persona")
-            
-            # Get persona text
-            persona = self.personas.get_persona(persona_type)
-            
-            # Get expected elements for quality validation
-            expected_elements = self._get_expected_elements(section_type)
-            
-            # Generate content with quality validation and retry
-            content = None
-            token_usage = None
-            cost = 0.0
-            quality_score = 0.0
-            
-            for quality_attempt in range(max_quality_retries + 1):
-                try:
-                    # Generate content using asyncio.to_thread to prevent blocking
-                    content, token_usage, cost = await asyncio.to_thread(
-                        self.generate_section_content,
-                        persona=persona,
-                        section_type=section_type,
-                        scenario=scenario,
-                        previous_sections=sections
-                    )
-                    
-                    # Validate quality
-                    quality_result = self.quality_validator.validate_section(
-                        content=content,
-                        section_type=section_type,
-                        expected_elements=expected_elements
-                    )
-                    quality_score = quality_result.overall_score
-                    
-                    logger.info(f"Section {section_type} quality score: {quality_score:.2f}")
-                    
-                    # If quality meets threshold, break out of retry loop
-                    if quality_score >= quality_threshold:
-                        logger.info(f"Section {section_type} passed quality validation")
+        pending = list(section_config[resumed_sections:])
+        degradations = []
+        retries_skipped = []
+        cancel_event = threading.Event()
+        complaint_digest = None
+        digest_info = None
+        boilerplate_info = None
+        try:
+            # Strip pleading boilerplate once; sections and the digest see the
+            # minimized complaint, and quality is scored against the original
+            source_text = await self._load_complaint_text(scenario) if pending else scenario.complaint_text
+            complaint_text = source_text
+            complaint_minimized = False
+            if pending and self.prompt_assembler.minimize_boilerplate and complaint_text:
+                minimized = await asyncio.to_thread(self.prompt_assembler.minimized, complaint_text)
+                complaint_text = minimized.text
+                complaint_minimized = True
+                boilerplate_info = {
+                    "tokens_saved": minimized.tokens_saved,
+                    "removed_chars": {name: chars for name, chars in minimized.removed.items() if chars}
+                }
+
+            # Digest a very long complaint once, before the sections that quote it
+            if pending and self.case_digester.needs_digest(complaint_text):
+                complaint_digest, digest_info = await self._get_case_digest(
+                    scenario, complaint_text, deadline, tenant_id, degradations
+                )
+                if digest_info and digest_info["built"]:
+                    total_cost += digest_info["cost"]
+                    total_tokens += digest_info["tokens"]
+
+            while pending:
+                # Fit the remaining work into the request deadline
+                if deadline and deadline.bounded:
+                    pending = self._drop_sections_for_deadline(pending, deadline, degradations)
+                    if not pending:
                         break
-                    else:
-                        if quality_attempt < max_quality_retries:
+
+                section_type, persona_type = pending.pop(0)
+                logger.info(f"Generating section: {section_type} using {persona_type} persona")
+
+                # Get persona text
+                persona = self.personas.get_persona(persona_type)
+
+                # Get expected elements for quality validation
+                expected_elements = self._get_expected_elements(section_type)
+
+                # Scale quality retries and output length to this section's share of the deadline
+                section_retries = max_quality_retries
+                max_output_tokens = None
+                if deadline and deadline.bounded:
+                    section_retries, max_output_tokens = self._plan_section_budget(
+                        section_type, deadline.per_section(len(pending) + 1), max_quality_retries, degradations
+                    )
+                    if max_output_tokens is not None:
+                        persona = (
+                            f"{persona}\n\nBREVITY: Time is limited. Keep this section under "
+                            f"{int(max_output_tokens * 0.75)} words."
+                        )
+
+                # Generate content with quality validation and retry
+                content = None
+                token_usage = None
+                cost = 0.0
+                quality_score = 0.0
+                quality_result = None
+                retry_from = None
+
+                for quality_attempt in range(section_retries + 1):
+                    # A draft may only be abandoned early if there is a retry to replace it
+                    abort_below = None
+                    if (
+                        self.streaming_validation
+                        and quality_attempt < section_retries
+                        and self._can_afford_retry(deadline, len(pending))
+                    ):
+                        abort_below = quality_threshold
+                    try:
+                        # Generate content using asyncio.to_thread to prevent blocking
+                        content, token_usage, cost = await asyncio.to_thread(
+                            self.generate_section_content,
+                            persona=persona,
+                            section_type=section_type,
+                            scenario=scenario,
+                            previous_sections=sections,
+                            deadline=deadline,
+                            max_output_tokens=max_output_tokens,
+                            cancel_event=cancel_event,
+                            tenant_id=tenant_id,
+                            abort_below=abort_below,
+                            complaint_digest=complaint_digest,
+                            complaint_text=complaint_text,
+                            complaint_minimized=complaint_minimized
+                        )
+
+                        # Validate quality on a pool thread so other reports keep progressing
+                        quality_result = await self.validation_pool.validate_section(
+                            content=content,
+                            section_type=section_type,
+                            expected_elements=expected_elements,
+                            source_text=source_text
+                        )
+                        quality_score = quality_result.overall_score
+
+                        logger.info(f"Section {section_type} quality score: {quality_score:.2f}")
+                        if retry_from is not None:
+                            self.retry_gain.record(section_type, retry_from, quality_result)
+                            retry_from = None
+
+                        # If quality meets threshold, break out of retry loop
+                        if quality_score >= quality_threshold:
+                            logger.info(f"Section {section_type} passed quality validation")
+                            break
+                        elif quality_attempt < section_retries and self._can_afford_retry(deadline, len(pending)):
+                            if not self.retry_gain.should_retry(section_type, quality_result):
+                                self._record_retry_skipped(section_type, quality_result, token_usage)
+                                retries_skipped.append(section_type)
+                                break
                             logger.warning(
                                 f"Section {section_type} quality below threshold ({quality_score:.2f} < {quality_threshold}). "
-                                f"Retrying... (attempt {quality_attempt + 1}/{max_quality_retries})"
+                                f"Retrying... (attempt {quality_attempt + 1}/{section_retries})"
                             )
                             # Add quality feedback to prompt for retry
                             feedback_text = "; ".join(quality_result.feedback)
                             persona = f"{persona}\n\nIMPORTANT: Previous attempt had quality issues. Please address: {feedback_text}"
+                            retry_from = quality_result
                         else:
+                            if quality_attempt < section_retries:
+                                degradations.append(f"quality_retries_skipped:{section_type}")
                             logger.warning(
-                                f"Section {section_type} quality still below threshold after {max_quality_retries} retries. "
+                                f"Section {section_type} quality still below threshold after {quality_attempt} retries. "
                                 f"Proceeding with quality score: {quality_score:.2f}"
                             )
-                
-                except Exception as e:
-                    logger.error(f"Error generating section {section_type}: {str(e)}")
-                    if quality_attempt < max_quality_retries:
-                        logger.info(f"Retrying section {section_type}...")
+                            break
+
+                    except GenerationAborted as e:
+                        logger.warning(
+                            f"Section {section_type} draft stopped early at projected quality "
+                            f"{e.projection.overall_score:.2f}. Retrying... "
+                            f"(attempt {quality_attempt + 1}/{section_retries})"
+                        )
+                        feedback_text = "; ".join(e.projection.feedback)
+                        persona = f"{persona}\n\nIMPORTANT: Previous attempt had quality issues. Please address: {feedback_text}"
+                        retry_from = None
                         continue
-                    else:
-                        raise RuntimeError(f"Failed to generate section {section_type} after retries: {str(e)}")
-            
-            # Create ReportSection object
-            section = ReportSection(
-                type=section_type,
-                title=self._get_section_title(section_type),
-                content=content,
-                agent_type=self._get_agent_type(persona),
-                quality_score=quality_score,
-                tokens_used=token_usage.total_tokens,
-                cost=cost,
-                timestamp=datetime.now().isoformat()
-            )
-            
-            sections.append(section)
-            total_cost += cost
-            total_tokens += token_usage.total_tokens
-            
-            logger.info(f"Completed section {section_type}: {token_usage.total_tokens} tokens, ${cost:.4f} cost")
-        
+
+                    except (DeadlineExceeded, GenerationCancelled):
+                        content = None
+                        break
+
+                    except Exception as e:
+                        logger.error(f"Error generating section {section_type}: {str(e)}")
+                        if quality_attempt < section_retries:
+                            if not self._can_afford_retry(deadline, len(pending)):
+                                # No time left to retry; drop this section rather than fail the report
+                                content = None
+                                break
+                            logger.info(f"Retrying section {section_type}...")
+                            continue
+                        else:
+                            raise RuntimeError(f"Failed to generate section {section_type} after retries: {str(e)}")
+
+                if content is None:
+                    # The deadline passed mid-section; nothing more can be generated
+                    for dropped_type, _ in [(section_type, persona_type)] + pending:
+                        degradations.append(f"section_dropped:{dropped_type}")
+                    pending = []
+                    break
+
+                # Create ReportSection object
+                section = ReportSection(
+                    type=section_type,
+                    title=self._get_section_title(section_type),
+                    content=content,
+                    agent_type=self._get_agent_type(persona),
+                    quality_score=quality_score,
+                    tokens_used=token_usage.total_tokens,
+                    cost=cost,
+                    timestamp=datetime.now().isoformat(),
+                    quality_breakdown=(
+                        self.quality_validator.section_breakdown(content, quality_result)
+                        if quality_result else None
+                    )
+                )
+
+                sections.append(section)
+                total_cost += cost
+                total_tokens += token_usage.total_tokens
+
+                if self.checkpoint_store:
+                    await asyncio.to_thread(self.checkpoint_store.save_section, scenario_hash, section)
+
+                logger.info(f"Completed section {section_type}: {token_usage.total_tokens} tokens, ${cost:.4f} cost")
+        except asyncio.CancelledError:
+            # The caller went away: stop in-flight retries and skip the remaining sections
+            cancel_event.set()
+            self._record_cancellation(scenario, len(pending))
+            raise
+
         # Calculate overall confidence score (average of section quality scores)
         confidence_score = sum(s.quality_score for s in sections) / len(sections) if sections else 0.0
         
         # Generate executive summary
         executive_summary = self._generate_executive_summary(sections, scenario)
+        if degradations:
+            executive_summary += f"Degradations Applied (deadline): {', '.join(degradations)}\n"
         
         # Calculate total processing time
         processing_time = time.time() - start_time
@@ -404,10 +761,20 @@ class LegalIntelligenceAgent:
             timestamp=datetime.now().isoformat(),
             metadata={
                 "sections_generated": len(sections),
+                "sections_resumed": resumed_sections,
                 "average_quality": confidence_score,
-                "generation_time": processing_time
+                "generation_time": processing_time,
+                "degradations": degradations,
+                "retries_skipped": retries_skipped,
+                "case_digest": digest_info,
+                "boilerplate": boilerplate_info
             }
         )
+
+        # The report is complete, so its checkpoints are no longer needed
+        report_complete = len(sections) == len(section_config)
+        if self.checkpoint_store and report_complete:
+            await asyncio.to_thread(self.checkpoint_store.clear, scenario_hash)
         
         logger.info(
             f"Report generation complete: {len(sections)} sections, "
@@ -417,111 +784,214 @@ class LegalIntelligenceAgent:
         
         return report
 
+    def _get_generation_config(
+        self,
+        deadline: Optional[DeadlineBudget] = None,
+        max_output_tokens: Optional[int] = None
+    ) -> types.GenerateContentConfig:
+        """Get the generation config, bounded by the request deadline and output limit."""
+        overrides = {}
+        if max_output_tokens is not None:
+            overrides["max_output_tokens"] = max_output_tokens
+        if deadline and deadline.bounded:
+            # Don't let a single HTTP call outlive the request
+            overrides["http_options"] = types.HttpOptions(timeout=max(1000, int(deadline.remaining() * 1000)))
+        if not overrides:
+            return self.generation_config
+        return self.generation_config.model_copy(update=overrides)
+
+    def _estimate_call_tokens(self, prompt: str, max_output_tokens: Optional[int] = None) -> int:
+        """Rough token cost of a model call (~4 characters per token), used for fair scheduling."""
+        output_limit = max_output_tokens or self.generation_config.max_output_tokens
+        return len(prompt) // 4 + output_limit
+
+    def _generate_streaming(
+        self,
+        prompt: str,
+        config: types.GenerateContentConfig,
+        section_type: str,
+        abort_below: float,
+        cancel_event: Optional[threading.Event] = None,
+        source_grounded: bool = False
+    ) -> StreamedResponse:
+        """
+        Stream a section, scoring it as it arrives.
+
+        Raises GenerationAborted as soon as the draft's projected score is
+        clearly below abort_below; closing the stream stops generation.
+        ``source_grounded`` says the section will be validated against the
+        complaint, so the projection allows for overlap with it.
+        """
+        output_limit = config.max_output_tokens or self.generation_config.max_output_tokens
+        scorer = IncrementalQualityScorer(
+            self.quality_validator,
+            section_type,
+            self._get_expected_elements(section_type),
+            expected_words=int(output_limit * 0.75),
+            source_grounded=source_grounded
+        )
+
+        parts = []
+        usage_metadata = None
+        stream = self.model.generate_content_stream(contents=prompt, config=config)
+        try:
+            for chunk in stream:
+                if getattr(chunk, "usage_metadata", None):
+                    usage_metadata = chunk.usage_metadata
+                text = getattr(chunk, "text", None)
+                if not text:
+                    continue
+                parts.append(text)
+                scorer.feed(text)
+
+                if cancel_event and cancel_event.is_set():
+                    raise GenerationCancelled(f"Generation of {section_type} cancelled")
+
+                projection = scorer.should_abort(
+                    abort_below, margin=self.streaming_abort_margin, min_progress=self.streaming_min_progress
+                )
+                if projection is not None:
+                    # Usage so far; estimated from text length if the stream has not reported it
+                    input_tokens = getattr(usage_metadata, "prompt_token_count", None) or len(prompt) // 4
+                    output_tokens = (
+                        getattr(usage_metadata, "candidates_token_count", None)
+                        or sum(len(part) for part in parts) // 4
+                    )
+                    raise GenerationAborted(
+                        section_type,
+                        projection,
+                        TokenUsage(
+                            input_tokens=input_tokens,
+                            output_tokens=output_tokens,
+                            total_tokens=input_tokens + output_tokens
+                        ),
+                        tokens_saved=max(0, output_limit - output_tokens)
+                    )
+        finally:
+            close = getattr(stream, "close", None)
+            if close:
+                close()
+
+        return StreamedResponse(text="".join(parts), usage_metadata=usage_metadata)
+
     def _build_prompt(
         self,
         persona: str,
         section_type: str,
         scenario: LegalScenario,
-        previous_sections: List[ReportSection]
+        previous_sections: List[ReportSection],
+        complaint_digest: Optional[str] = None,
+        complaint_text: Optional[str] = None,
+        complaint_minimized: bool = False
     ) -> str:
         """Build a comprehensive prompt combining persona, context, and chain-of-thought instructions."""
+        return self.prompt_assembler.assemble(
+            persona, section_type, scenario, previous_sections, complaint_digest, complaint_text, complaint_minimized
+        )
 
-        # Start with the persona
-        prompt = persona + "\n\n"
+    async def _load_complaint_text(self, scenario: LegalScenario) -> str:
+        """The scenario's complaint text, read off the event loop when it refers to a stored complaint."""
+        if scenario.complaint_text or not scenario.complaint_id:
+            return scenario.complaint_text
+        if self.complaint_store is None:
+            raise ValueError(f"No complaint store configured to load complaint {scenario.complaint_id}")
+        return await asyncio.to_thread(self.complaint_store.load_text, scenario.complaint_id)
 
-        # Add chain-of-thought reasoning instructions
-        prompt += """
-REASONING INSTRUCTIONS:
-You must use step-by-step reasoning to analyze this legal case. Structure your analysis as follows:
-1. First, identify the key legal issues
-2. Second, analyze the relevant facts
-3. Third, apply legal principles
-4. Finally, provide your conclusions
+    async def _get_case_digest(
+        self,
+        scenario: LegalScenario,
+        complaint_text: str,
+        deadline: Optional[DeadlineBudget],
+        tenant_id: str,
+        degradations: List[str]
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Digest of a very long complaint, from the cache or built now.
 
-Think through each step carefully before moving to the next.
-"""
+        The digest is built from ``complaint_text`` (the complaint without
+        boilerplate) but cached under the original complaint's id or hash.
 
-        # Add context from previous sections if available
-        if previous_sections:
-            prompt += "\n\nPREVIOUS ANALYSIS:\n"
-            for section in previous_sections[-2:]:  # Include last 2 sections for context
-                prompt += f"\n{section.title}:\n"
-                prompt += f"{section.content[:500]}...\n"  # Include summary
-
-        # Add the specific task
-        prompt += f"\n\nTASK: Provide a {section_type.replace('_', ' ')} for the following legal case:\n\n"
-
-        # Add case details
-        prompt += f"Case Name: {scenario.case_name}\n"
-        prompt += f"Case Type: {scenario.case_type}\n"
-        prompt += f"Key Issues: {', '.join(scenario.key_issues)}\n"
-        prompt += f"Urgency: {scenario.urgency_level}\n\n"
-        prompt += f"Complaint Summary:\n{scenario.complaint_text[:1500]}\n\n"
-
-        # Add section-specific instructions
-        prompt += self._get_section_instructions(section_type)
-
-        return prompt
-
-    def _get_section_instructions(self, section_type: str) -> str:
-        """Get specific instructions for each section type."""
-        instructions = {
-            "liability_assessment": """
-Analyze liability by:
-- Identifying each potential claim
-- Evaluating strength of evidence
-- Assessing probability of success (use percentages)
-- Citing relevant precedents or legal principles
-""",
-            "damage_calculation": """
-Calculate potential damages by:
-- Identifying categories of damages (actual, statutory, punitive)
-- Providing specific dollar ranges
-- Explaining calculation methodology
-- Considering mitigation factors
-""",
-            "prior_art_analysis": """
-Analyze prior art and precedents by:
-- Identifying relevant existing patents/IP
-- Assessing validity challenges
-- Evaluating obviousness arguments
-- Determining freedom to operate
-""",
-            "competitive_landscape": """
-Analyze competitive implications by:
-- Identifying key competitors affected
-- Assessing market position changes
-- Evaluating licensing opportunities
-- Predicting competitor responses
-""",
-            "risk_assessment": """
-Assess risks by:
-- Identifying legal risks (probability and impact)
-- Evaluating business risks
-- Analyzing reputational risks
-- Providing risk mitigation strategies
-""",
-            "strategic_recommendations": """
-Provide strategic recommendations by:
-- Outlining 3-5 specific action items
-- Prioritizing by impact and urgency
-- Estimating resource requirements
-- Defining success metrics
-"""
+        Returns:
+            Tuple of (digest text, report metadata), or (None, None) when
+            sections should quote complaint passages instead: the digest
+            failed, or there is a deadline and no digest is cached
+        """
+        key = scenario.complaint_id or complaint_hash(scenario.complaint_text)
+        if deadline and deadline.bounded and self.case_digester.cached(key) is None:
+            degradations.append("case_digest_skipped")
+            return None, None
+        try:
+            digest, built = await self.case_digester.digest(complaint_text, key=key, tenant_id=tenant_id)
+        except Exception as e:
+            logger.warning(f"Case digest failed for {scenario.case_name}; quoting complaint passages instead: {str(e)}")
+            return None, None
+        if not digest.text:
+            return None, None
+        return digest.text, {
+            "complaint_hash": digest.complaint_hash,
+            "chunks": digest.chunks,
+            "built": built,
+            "tokens": digest.token_usage.total_tokens,
+            "cost": digest.cost,
+            "build_seconds": digest.build_seconds
         }
-        return instructions.get(section_type, "Provide comprehensive analysis for this section.")
+
+    def _summarize_chunk(
+        self,
+        prompt: str,
+        tenant_id: str = DEFAULT_TENANT,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Tuple[str, TokenUsage, float]:
+        """One map call of a case digest, scheduled and charged like section generation."""
+        if not self.initialized:
+            raise RuntimeError("Agent system not initialized. Call initialize_vertex_ai() first.")
+
+        config = self.generation_config.model_copy(
+            update={"temperature": 0.0, "max_output_tokens": self.digest_output_tokens}
+        )
+        estimated_tokens = self._estimate_call_tokens(prompt, self.digest_output_tokens)
+        max_retries = 2
+        last_exception = None
+        for attempt in range(max_retries):
+            if not self.scheduler.acquire(tenant_id, estimated_tokens, cancel_event=cancel_event):
+                raise GenerationCancelled("Case digest cancelled")
+            start_time = time.time()
+            try:
+                response = self.model.generate_content(contents=prompt, config=config)
+            except Exception as e:
+                response = None
+                last_exception = e
+            finally:
+                self.scheduler.release(tenant_id)
+            if response is None:
+                logger.warning(f"Case digest chunk failed (attempt {attempt + 1}/{max_retries}): {str(last_exception)}")
+                if attempt < max_retries - 1:
+                    time.sleep(2 ** attempt)
+                continue
+
+            usage_metadata = getattr(response, "usage_metadata", None)
+            input_tokens = getattr(usage_metadata, "prompt_token_count", 0) or 0
+            output_tokens = getattr(usage_metadata, "candidates_token_count", 0) or 0
+            token_usage = TokenUsage(
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                total_tokens=getattr(usage_metadata, "total_token_count", 0) or input_tokens + output_tokens
+            )
+            self.scheduler.record_usage(tenant_id, token_usage.total_tokens)
+            call_time = time.time() - start_time
+            self.digest_call_times.record(call_time)
+            self.digest_tokens_total += token_usage.total_tokens
+            if self.metrics_store:
+                self.metrics_store.increment("digest_calls")
+                self.metrics_store.increment("digest_tokens", token_usage.total_tokens)
+                self.metrics_store.record("digest_call_time", call_time)
+            return getattr(response, "text", None) or "", token_usage, self._calculate_cost(token_usage)
+
+        raise RuntimeError(f"Case digest chunk failed after {max_retries} attempts: {str(last_exception)}")
 
     def _get_expected_elements(self, section_type: str) -> List[str]:
-        """Get expected elements for quality validation."""
-        elements_map = {
-            "liability_assessment": ["claims", "evidence", "probability", "precedent"],
-            "damage_calculation": ["damages", "calculation", "amount", "methodology"],
-            "prior_art_analysis": ["patents", "prior art", "validity", "obviousness"],
-            "competitive_landscape": ["competitors", "market", "position", "licensing"],
-            "risk_assessment": ["risks", "probability", "impact", "mitigation"],
-            "strategic_recommendations": ["recommendations", "action", "timeline", "resources"]
-        }
-        return elements_map.get(section_type, ["analysis", "assessment", "conclusion"])
+        """Get expected elements for quality validation (shared with report re-validation)."""
+        return self.quality_validator.expected_elements_for(section_type)
 
     def _get_section_title(self, section_type: str) -> str:
         """Get formatted title for section."""
@@ -535,6 +1005,89 @@ Provide strategic recommendations by:
         }
         return titles.get(section_type, section_type.replace("_", " ").title())
 
+    def _get_section_priority(self, section_type: str) -> int:
+        """Get the priority of a section when time runs short (lower is more important)."""
+        priorities = {
+            "liability_assessment": 0,
+            "damage_calculation": 1,
+            "strategic_recommendations": 2,
+            "risk_assessment": 3,
+            "prior_art_analysis": 4,
+            "competitive_landscape": 5
+        }
+        return priorities.get(section_type, len(priorities))
+
+    def _estimate_attempt_seconds(self) -> float:
+        """
+        Expected duration of one generation attempt, from this process's recent calls.
+
+        This runs on the event loop for every section planned, so it reads the
+        in-process window rather than the shared store, and recent latency
+        tracks the model's current speed better than the lifetime mean.
+        """
+        average = self.processing_times.window_mean
+        return average if average > 0 else self.default_attempt_seconds
+
+    def _drop_sections_for_deadline(
+        self,
+        pending: List[Tuple[str, str]],
+        deadline: DeadlineBudget,
+        degradations: List[str]
+    ) -> List[Tuple[str, str]]:
+        """Drop the lowest-priority pending sections until the rest fit in the deadline."""
+        pending = list(pending)
+        if deadline.expired():
+            degradations.extend(f"section_dropped:{section_type}" for section_type, _ in pending)
+            logger.warning(f"Deadline exceeded; dropping {len(pending)} remaining sections")
+            return []
+
+        attempt_seconds = self._estimate_attempt_seconds()
+        while len(pending) > 1 and deadline.remaining() < attempt_seconds * len(pending):
+            dropped = max(pending, key=lambda item: self._get_section_priority(item[0]))
+            pending.remove(dropped)
+            degradations.append(f"section_dropped:{dropped[0]}")
+            logger.warning(
+                f"Dropping section {dropped[0]}: {deadline.remaining():.1f}s left for "
+                f"{len(pending) + 1} sections at ~{attempt_seconds:.1f}s each"
+            )
+        return pending
+
+    def _plan_section_budget(
+        self,
+        section_type: str,
+        section_budget: float,
+        max_quality_retries: int,
+        degradations: List[str]
+    ) -> Tuple[int, Optional[int]]:
+        """
+        Fit a section into its share of the deadline.
+
+        Returns:
+            Tuple of (quality retries allowed, max output tokens or None for the default)
+        """
+        attempt_seconds = self._estimate_attempt_seconds()
+
+        affordable_attempts = int(section_budget // attempt_seconds)
+        retries = min(max_quality_retries, max(0, affordable_attempts - 1))
+        if retries < max_quality_retries:
+            degradations.append(
+                f"quality_retries_reduced:{section_type}" if retries else f"quality_retries_skipped:{section_type}"
+            )
+
+        max_output_tokens = None
+        if section_budget < attempt_seconds:
+            full_length = self.generation_config.max_output_tokens
+            max_output_tokens = max(self.min_output_tokens, int(full_length * section_budget / attempt_seconds))
+            degradations.append(f"output_reduced:{section_type}")
+
+        return retries, max_output_tokens
+
+    def _can_afford_retry(self, deadline: Optional[DeadlineBudget], sections_after: int) -> bool:
+        """Check whether one more attempt still leaves time for the sections after it."""
+        if not deadline or not deadline.bounded:
+            return True
+        return deadline.remaining() >= self._estimate_attempt_seconds() * (sections_after + 1)
+
     def _get_agent_type(self, persona: str) -> str:
         """Determine agent type from persona text."""
         if "Business Analyst" in persona:
@@ -578,30 +1131,168 @@ Provide strategic recommendations by:
     # Metric tracking methods
 
     def get_token_usage_stats(self) -> Dict[str, Any]:
-        """Get token usage statistics."""
-        if not self.token_usage_history:
-            return {"error": "No usage data available"}
+        """
+        Get token usage statistics.
 
-        total_input = sum(u.input_tokens for u in self.token_usage_history)
-        total_output = sum(u.output_tokens for u in self.token_usage_history)
-        total_tokens = sum(u.total_tokens for u in self.token_usage_history)
+        Totals are fleet-wide when a metrics store is set; the recent
+        percentiles and request rate always describe this process's window.
+        Both modes return the same keys.
+        """
+        tokens = self.tokens_per_request
+        if self.metrics_store:
+            counters = self.metrics_store.counters()
+            request_count = int(counters.get("token_usage_records", 0))
+            input_tokens = int(counters.get("input_tokens", 0))
+            output_tokens = int(counters.get("output_tokens", 0))
+            total_tokens = int(counters.get("total_tokens", 0))
+        else:
+            request_count = tokens.count
+            input_tokens = self.input_tokens_total
+            output_tokens = self.output_tokens_total
+            total_tokens = int(tokens.total)
+        if not request_count:
+            return {"error": "No usage data available"}
 
+        p50, p95 = tokens.quantiles((0.5, 0.95))
         return {
-            "total_input_tokens": total_input,
-            "total_output_tokens": total_output,
+            "total_input_tokens": input_tokens,
+            "total_output_tokens": output_tokens,
             "total_tokens": total_tokens,
-            "average_per_request": total_tokens / len(self.token_usage_history) if self.token_usage_history else 0,
-            "request_count": len(self.token_usage_history)
+            "average_per_request": total_tokens / request_count,
+            "request_count": request_count,
+            "recent_p50_per_request": p50,
+            "recent_p95_per_request": p95,
+            "requests_per_minute": tokens.rate() * 60
         }
 
     def get_avg_processing_time(self) -> float:
         """Get average processing time."""
-        if not self.processing_times:
-            return 0.0
-        return sum(self.processing_times) / len(self.processing_times)
+        if self.metrics_store:
+            counters = self.metrics_store.counters()
+            count = counters.get("token_usage_records", 0)
+            return counters.get("processing_time_total", 0.0) / count if count else 0.0
+
+        return self.processing_times.mean
+
+    def get_processing_time_stats(self) -> Dict[str, float]:
+        """Get processing time percentiles and rate for this process's recent generations."""
+        return self.processing_times.snapshot()
+
+    def _record_token_usage(self, usage: TokenUsage) -> None:
+        """Add one model call's usage to the running totals and recent window."""
+        self.token_usage_history.append(usage)
+        self.tokens_per_request.record(usage.total_tokens)
+        self.input_tokens_total += usage.input_tokens
+        self.output_tokens_total += usage.output_tokens
+
+    def _record_cancellation(self, scenario: LegalScenario, sections_remaining: int) -> None:
+        """Count a cancelled report and estimate the tokens not spent on its remaining sections."""
+        stats = self.get_token_usage_stats()
+        tokens_per_section = stats.get("average_per_request") or self.generation_config.max_output_tokens
+        tokens_saved = int(tokens_per_section * sections_remaining)
+
+        self.cancelled_reports += 1
+        self.cancellation_tokens_saved += tokens_saved
+        if self.metrics_store:
+            self.metrics_store.increment("reports_cancelled")
+            self.metrics_store.increment("cancellation_tokens_saved", tokens_saved)
+
+        logger.info(
+            f"Report for {scenario.case_name} cancelled with {sections_remaining} sections remaining "
+            f"(~{tokens_saved} tokens saved)"
+        )
+
+    def _record_streaming_abort(self, aborted: GenerationAborted, tenant_id: str) -> None:
+        """Charge the tokens an aborted draft used and count the output it did not generate."""
+        usage = aborted.token_usage
+        self.scheduler.record_usage(tenant_id, usage.total_tokens)
+        self._record_token_usage(usage)
+        self.total_attempts += 1
+        self.streaming_aborts += 1
+        self.streaming_tokens_saved += aborted.tokens_saved
+        if self.metrics_store:
+            self.metrics_store.increment("generation_attempts")
+            self.metrics_store.increment("token_usage_records")
+            self.metrics_store.increment("input_tokens", usage.input_tokens)
+            self.metrics_store.increment("output_tokens", usage.output_tokens)
+            self.metrics_store.increment("total_tokens", usage.total_tokens)
+            self.metrics_store.increment("streaming_aborts")
+            self.metrics_store.increment("streaming_tokens_saved", aborted.tokens_saved)
+
+        logger.info(
+            f"{aborted} after {usage.output_tokens} output tokens (~{aborted.tokens_saved} tokens saved)"
+        )
+
+    def _record_retry_skipped(self, section_type: str, quality: QualityScore, token_usage: TokenUsage) -> None:
+        """Count a retry skipped as futile; it would have cost about as much as the draft it replaced."""
+        gain, samples = self.retry_gain.expected_gain(section_type, quality)
+        self.retry_gain.record_skip(token_usage.total_tokens)
+        if self.metrics_store:
+            self.metrics_store.increment("retries_skipped")
+            self.metrics_store.increment("retry_tokens_saved", token_usage.total_tokens)
+
+        logger.info(
+            f"Skipping quality retry for {section_type} at {quality.overall_score:.2f}: "
+            f"retries of similar drafts gained {gain:+.3f} on average over {samples} attempts"
+        )
+
+    def get_retry_stats(self) -> Dict[str, Any]:
+        """Get quality retries skipped as futile, the tokens saved and the learned gains."""
+        stats = self.retry_gain.get_stats()
+        if self.metrics_store:
+            counters = self.metrics_store.counters()
+            stats["retries_skipped"] = int(counters.get("retries_skipped", 0))
+            stats["estimated_tokens_saved"] = int(counters.get("retry_tokens_saved", 0))
+        return stats
+
+    def get_streaming_stats(self) -> Dict[str, Any]:
+        """Get counts of drafts aborted by streaming validation and the output tokens not generated."""
+        if self.metrics_store:
+            counters = self.metrics_store.counters()
+            return {
+                "enabled": self.streaming_validation,
+                "aborted_drafts": int(counters.get("streaming_aborts", 0)),
+                "estimated_tokens_saved": int(counters.get("streaming_tokens_saved", 0))
+            }
+        return {
+            "enabled": self.streaming_validation,
+            "aborted_drafts": self.streaming_aborts,
+            "estimated_tokens_saved": self.streaming_tokens_saved
+        }
+
+    def get_digest_call_stats(self) -> Dict[str, Any]:
+        """Get counts, tokens and timings of case-digest model calls."""
+        if self.metrics_store:
+            counters = self.metrics_store.counters()
+            calls, tokens = int(counters.get("digest_calls", 0)), int(counters.get("digest_tokens", 0))
+        else:
+            calls, tokens = self.digest_call_times.count, self.digest_tokens_total
+        return {
+            "calls": calls,
+            "tokens_used": tokens,
+            "call_time": self.digest_call_times.snapshot()
+        }
+
+    def get_cancellation_stats(self) -> Dict[str, Any]:
+        """Get counts of cancelled reports and the estimated tokens saved."""
+        if self.metrics_store:
+            counters = self.metrics_store.counters()
+            return {
+                "cancelled_reports": int(counters.get("reports_cancelled", 0)),
+                "estimated_tokens_saved": int(counters.get("cancellation_tokens_saved", 0))
+            }
+        return {
+            "cancelled_reports": self.cancelled_reports,
+            "estimated_tokens_saved": self.cancellation_tokens_saved
+        }
 
     def get_success_rate(self) -> float:
         """Get success rate of generations."""
+        if self.metrics_store:
+            counters = self.metrics_store.counters()
+            attempts = counters.get("generation_attempts", 0)
+            return counters.get("generation_successes", 0) / attempts if attempts else 0.0
+
         if self.total_attempts == 0:
             return 0.0
         return self.success_count / self.total_attempts
\ No newline at end of file
@@ -0,0 +1,233 @@
+"""
+Batch Runner for Legal Intelligence AI System
+=============================================
+Runs the report pipeline over many complaints outside the API server.
+
+Scenarios are read from a JSONL file (one LegalScenario-like record per line)
+or a directory of ``.txt`` complaints. Reports are appended to an output JSONL
+file as each one finishes, so an interrupted run can be restarted and will
+skip every scenario already recorded as completed.
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Iterator, Optional, Set, TextIO
+
+from ..models.legal_models import LegalScenario
+from ..utils.scenario_builder import build_scenario
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchItem:
+    """A scenario queued for batch analysis."""
+    scenario_id: str
+    scenario: LegalScenario
+
+
+def load_jsonl_scenarios(path: str) -> Iterator[BatchItem]:
+    """
+    Read scenarios from a JSONL file.
+
+    Each record needs ``case_name``, ``complaint_text`` and ``case_type``;
+    other LegalScenario fields are optional. An ``id`` field, if present,
+    identifies the scenario for resume; otherwise the content hash is used.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+                scenario = build_scenario(
+                    case_name=record["case_name"],
+                    complaint_text=record["complaint_text"],
+                    case_type=record["case_type"],
+                    urgency_level=record.get("urgency_level", record.get("urgency", "standard")),
+                    additional_context=record.get("additional_context"),
+                    filing_date=record.get("filing_date"),
+                    parties_involved=record.get("parties_involved"),
+                    key_issues=record.get("key_issues")
+                )
+            except (json.JSONDecodeError, KeyError, ValueError) as e:
+                logger.error(f"Skipping invalid record at {path}:{line_number}: {str(e)}")
+                continue
+            yield BatchItem(scenario_id=str(record.get("id") or scenario.content_hash()), scenario=scenario)
+
+
+def load_text_scenarios(directory: str, case_type: str, urgency_level: str = "standard") -> Iterator[BatchItem]:
+    """Read one scenario per ``.txt`` file in a directory, named after the file."""
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".txt"):
+            continue
+        with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+            complaint_text = f.read()
+        scenario = build_scenario(
+            case_name=os.path.splitext(name)[0],
+            complaint_text=complaint_text,
+            case_type=case_type,
+            urgency_level=urgency_level
+        )
+        yield BatchItem(scenario_id=scenario.content_hash(), scenario=scenario)
+
+
+def load_completed_ids(output_path: str) -> Set[str]:
+    """Collect ids of scenarios already completed in an output JSONL file."""
+    completed = set()
+    if not os.path.exists(output_path):
+        return completed
+
+    with open(output_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A line cut short by a crash; that scenario will be re-run
+                continue
+            if record.get("status") == "completed":
+                completed.add(record["scenario_id"])
+    return completed
+
+
+class ProgressTracker:
+    """Tracks batch progress, throughput and ETA."""
+
+    def __init__(self, total: int, skipped: int = 0, clock=time.monotonic):
+        self.total = total
+        self.skipped = skipped
+        self.completed = 0
+        self.failed = 0
+        self._clock = clock
+        self._start = clock()
+
+    @property
+    def finished(self) -> int:
+        return self.completed + self.failed
+
+    def throughput(self) -> float:
+        """Scenarios finished per minute in this run."""
+        elapsed = self._clock() - self._start
+        return self.finished / elapsed * 60 if elapsed > 0 else 0.0
+
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated seconds until the remaining scenarios finish."""
+        rate = self.throughput()
+        if rate <= 0:
+            return None
+        return (self.total - self.finished) / rate * 60
+
+    def render(self) -> str:
+        """One-line progress summary."""
+        eta = self.eta_seconds()
+        eta_text = "--" if eta is None else time.strftime("%H:%M:%S", time.gmtime(eta))
+        return (
+            f"[{self.finished}/{self.total}] completed={self.completed} failed={self.failed} "
+            f"skipped={self.skipped} | {self.throughput():.1f} cases/min | ETA {eta_text}"
+        )
+
+
+class BatchRunner:
+    """Runs generate_complete_report over many scenarios with bounded concurrency."""
+
+    def __init__(
+        self,
+        agent,
+        output_path: str,
+        concurrency: int = 4,
+        progress_stream: Optional[TextIO] = None
+    ):
+        """
+        Args:
+            agent: An initialized LegalIntelligenceAgent
+            output_path: JSONL file that reports are appended to
+            concurrency: Maximum number of reports generated at once
+            progress_stream: Where progress lines are written (default stderr)
+        """
+        self.agent = agent
+        self.output_path = output_path
+        self.concurrency = concurrency
+        self.progress_stream = progress_stream or sys.stderr
+
+    async def run(self, items: List[BatchItem]) -> Dict[str, int]:
+        """Analyze every item not already completed in the output file."""
+        completed_ids = load_completed_ids(self.output_path)
+        pending = []
+        seen = set()
+        for item in items:
+            if item.scenario_id in completed_ids or item.scenario_id in seen:
+                continue
+            seen.add(item.scenario_id)
+            pending.append(item)
+
+        progress = ProgressTracker(total=len(pending), skipped=len(items) - len(pending))
+        logger.info(f"Batch run: {len(pending)} to analyze, {progress.skipped} already completed")
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        write_lock = asyncio.Lock()
+
+        self._terminate_partial_line(self.output_path)
+        with open(self.output_path, "a", encoding="utf-8") as output:
+
+            async def run_item(item: BatchItem) -> None:
+                async with semaphore:
+                    try:
+                        report = await self.agent.generate_complete_report(item.scenario)
+                        record = {
+                            "scenario_id": item.scenario_id,
+                            "case_name": item.scenario.case_name,
+                            "status": "completed",
+                            "report": report.dict()
+                        }
+                        progress.completed += 1
+                    except Exception as e:
+                        logger.error(f"Scenario {item.scenario.case_name} failed: {str(e)}")
+                        record = {
+                            "scenario_id": item.scenario_id,
+                            "case_name": item.scenario.case_name,
+                            "status": "failed",
+                            "error": str(e)
+                        }
+                        progress.failed += 1
+
+                async with write_lock:
+                    output.write(json.dumps(record, default=str) + "\n")
+                    output.flush()
+                    os.fsync(output.fileno())
+                    self._report_progress(progress)
+
+            await asyncio.gather(*(run_item(item) for item in pending))
+
+        if self.progress_stream.isatty():
+            self.progress_stream.write("\n")
+
+        return {
+            "total": len(items),
+            "skipped": progress.skipped,
+            "completed": progress.completed,
+            "failed": progress.failed
+        }
+
+    @staticmethod
+    def _terminate_partial_line(path: str) -> None:
+        """Start on a fresh line if a previous run died mid-write."""
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return
+        with open(path, "rb+") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+    def _report_progress(self, progress: ProgressTracker) -> None:
+        line = progress.render()
+        if self.progress_stream.isatty():
+            self.progress_stream.write("\r" + line)
+        else:
+            self.progress_stream.write(line + "\n")
+        self.progress_stream.flush()
@@ -0,0 +1,269 @@
+"""
+Batch Validation for Legal Intelligence AI System
+=================================================
+Scores thousands of report sections at once, e.g. to re-score a corpus of
+stored reports after the validator's thresholds are tuned.
+
+Each section is still parsed and keyword-scanned once (that pass is linear
+in its text), but the results are packed into NumPy arrays: a section x
+phrase presence matrix, plus per-section paragraph, sentence and word
+counts. Phrase-group counts are a single matrix product, and every scoring
+tier is applied to all sections together with ``np.select``.
+
+Scores are identical to QualityValidator.validate_section: tiers are added
+in the same order as the scalar scorers, so every float operation matches.
+Overlap with a section's source complaint is measured per section (each
+complaint is indexed once) and blended in with the same arithmetic.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ..models.legal_models import AnalysisReport
+from .content_profile import ContentProfile
+from .quality_validator import QualityScore, QualityValidator, ValidationResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchSection:
+    """One section to score."""
+    content: str
+    section_type: str
+    expected_elements: List[str] = field(default_factory=list)
+    source_text: Optional[str] = None
+
+
+def _tier(values: np.ndarray, thresholds: Sequence[float], points: Sequence[float]) -> np.ndarray:
+    """Points for the first threshold each value reaches (``>=``), else 0.0."""
+    return np.select([values >= threshold for threshold in thresholds], points, default=0.0)
+
+
+class BatchValidator:
+    """Vectorized scoring with a QualityValidator's phrase lists and tiers."""
+
+    def __init__(self, validator: Optional[QualityValidator] = None):
+        self.validator = validator or QualityValidator()
+
+        # One column per fixed phrase; a group's weight is how often it lists
+        # the phrase, so a matrix product reproduces count_present() exactly
+        self._columns: Dict[str, int] = {
+            phrase: index for index, phrase in enumerate(self.validator._static_phrases)
+        }
+        groups = {
+            "connectors": self.validator.LOGICAL_CONNECTORS,
+            "structure_markers": self.validator.STRUCTURE_MARKERS,
+            "reasoning": self.validator.REASONING_PHRASES,
+            "lists": self.validator.LIST_MARKERS,
+            "conclusions": self.validator.CONCLUSION_INDICATORS
+        }
+        self._group_index = {name: index for index, name in enumerate(groups)}
+        self._group_weights = self._weights(list(groups.values()))
+
+        # Section types, plus a final row of no keywords for unknown types
+        self._section_types = {
+            section_type: index for index, section_type in enumerate(self.validator.SECTION_KEYWORDS)
+        }
+        keyword_lists = list(self.validator.SECTION_KEYWORDS.values()) + [[]]
+        self._keyword_weights = self._weights(keyword_lists)
+        self._keyword_totals = np.array([len(keywords) for keywords in keyword_lists])
+
+    def _weights(self, phrase_lists: List[List[str]]) -> np.ndarray:
+        """Phrase x list matrix of how often each list contains each phrase."""
+        weights = np.zeros((len(self._columns), len(phrase_lists)), dtype=np.int64)
+        for list_index, phrases in enumerate(phrase_lists):
+            for phrase in phrases:
+                weights[self._columns[phrase.lower()], list_index] += 1
+        return weights
+
+    def score_sections(self, sections: Sequence[BatchSection]) -> List[QualityScore]:
+        """Score sections; equal to calling validate_section on each in turn."""
+        total = len(sections)
+        if total == 0:
+            return []
+
+        presence = np.zeros((total, len(self._columns)), dtype=np.int64)
+        paragraph_counts = np.zeros(total, dtype=np.int64)
+        sentence_counts = np.zeros(total, dtype=np.int64)
+        distinct_lengths = np.zeros(total, dtype=np.int64)
+        word_counts = np.zeros(total, dtype=np.int64)
+        has_headers = np.zeros(total, dtype=bool)
+        type_rows = np.full(total, len(self._section_types), dtype=np.int64)
+        element_totals = np.zeros(total, dtype=np.int64)
+        elements_present = np.zeros(total, dtype=np.int64)
+        elements_grounded = np.zeros(total, dtype=np.int64)
+        has_source = np.zeros(total, dtype=bool)
+        source_points = np.zeros(total)
+
+        columns = self._columns
+        for row, section in enumerate(sections):
+            profile = ContentProfile.from_text(section.content)
+            hits = self.validator.scan_keywords(section.content, section.expected_elements, profile=profile)
+
+            for phrase in hits.present_phrases():
+                column = columns.get(phrase)
+                if column is not None:
+                    presence[row, column] = 1
+
+            paragraph_counts[row] = len(profile.paragraphs)
+            sentence_counts[row] = profile.sentence_count
+            distinct_lengths[row] = len(set(profile.sentence_word_counts))
+            word_counts[row] = profile.word_count
+            has_headers[row] = profile.has_headers
+            type_rows[row] = self._section_types.get(section.section_type, len(self._section_types))
+
+            source = self.validator.source_index(section.source_text)
+            if source is not None:
+                overlap = source.overlap(profile)
+                has_source[row] = True
+                source_points[row] = self.validator._source_points(overlap.similarity, overlap.sentence_coverage)
+
+            # Expected elements differ per section, so they are counted here
+            element_totals[row] = len(section.expected_elements)
+            for element in section.expected_elements:
+                if hits.present(element):
+                    elements_present[row] += 1
+                    elements_grounded[row] += 1
+                else:
+                    root = self.validator._element_root(element)
+                    if len(root) >= 4 and hits.count_prefix(root) > 0:
+                        elements_grounded[row] += 1
+
+        group_counts = presence @ self._group_weights
+        connectors = group_counts[:, self._group_index["connectors"]]
+        structure_markers = group_counts[:, self._group_index["structure_markers"]]
+        reasoning = group_counts[:, self._group_index["reasoning"]]
+        lists = group_counts[:, self._group_index["lists"]]
+        conclusions = group_counts[:, self._group_index["conclusions"]]
+        keywords_found = (presence @ self._keyword_weights)[np.arange(total), type_rows]
+        keyword_totals = self._keyword_totals[type_rows]
+
+        paragraph_points = _tier(paragraph_counts, [3, 2, 1], [0.3, 0.2, 0.1])
+
+        # Coherence
+        coherence = np.zeros(total)
+        coherence += paragraph_points
+        coherence += _tier(connectors, [5, 3, 1], [0.2, 0.15, 0.1])
+        coherence += _tier(structure_markers, [3, 2, 1], [0.2, 0.15, 0.1])
+        coherence += _tier(sentence_counts, [12, 8, 5, 3], [0.3, 0.25, 0.15, 0.1])
+        coherence = np.minimum(coherence, 1.0)
+
+        # Groundedness
+        has_keywords = keyword_totals > 0
+        keyword_coverage = keywords_found / np.where(has_keywords, keyword_totals, 1)
+        has_elements = element_totals > 0
+        element_totals_safe = np.where(has_elements, element_totals, 1)
+        element_coverage = elements_grounded / element_totals_safe
+
+        groundedness = np.zeros(total)
+        groundedness += np.where(
+            has_keywords, _tier(keyword_coverage, [0.5, 0.3, 0.2, 0.1], [0.4, 0.3, 0.2, 0.1]), 0.0
+        )
+        groundedness += _tier(reasoning, [5, 4, 3, 2, 1], [0.3, 0.25, 0.2, 0.15, 0.1])
+        groundedness += np.where(
+            has_elements,
+            np.select(
+                [element_coverage >= 1.0, element_coverage >= 0.75, element_coverage >= 0.5,
+                 element_coverage >= 0.25, element_coverage > 0],
+                [0.3, 0.25, 0.2, 0.15, 0.1],
+                default=0.0
+            ),
+            0.0
+        )
+        groundedness = np.minimum(groundedness, 1.0)
+        weight = self.validator.SOURCE_WEIGHT
+        groundedness = np.where(
+            has_source, groundedness * (1 - weight) + source_points * weight, groundedness
+        )
+
+        # Completeness
+        coverage_ratio = elements_present / element_totals_safe
+        length_score = np.minimum(word_counts / 200, 1.0)
+        completeness = np.where(
+            has_elements,
+            (coverage_ratio * 0.7) + (length_score * 0.3),
+            np.select([word_counts >= 200, word_counts >= 100, word_counts >= 50], [1.0, 0.7, 0.5], default=0.3)
+        )
+
+        # Structure
+        structure = np.zeros(total)
+        structure += paragraph_points
+        structure += np.where(lists > 0, 0.2, 0.0)
+        structure += np.where(has_headers, 0.1, 0.0)
+        structure += np.where((sentence_counts >= 3) & (distinct_lengths >= 3), 0.2, 0.0)
+        structure += np.where(conclusions > 0, 0.2, 0.0)
+        structure = np.minimum(structure, 1.0)
+
+        overall = (
+            coherence * 0.3 +
+            groundedness * 0.3 +
+            completeness * 0.25 +
+            structure * 0.15
+        )
+
+        results = []
+        for row, section in enumerate(sections):
+            feedback = []
+            if coherence[row] < 0.7:
+                feedback.append("Improve logical flow and use more transition phrases")
+            if groundedness[row] < 0.7:
+                feedback.append(f"Include more {section.section_type}-specific terminology and evidence")
+            if has_source[row] and source_points[row] < 0.5:
+                feedback.append("Tie the analysis to the specific parties, facts and figures in the complaint")
+            if completeness[row] < 0.7:
+                feedback.append(f"Address all expected elements: {', '.join(section.expected_elements)}")
+            if structure[row] < 0.7:
+                feedback.append("Improve paragraph structure and organization")
+
+            results.append(QualityScore(
+                overall_score=float(overall[row]),
+                coherence_score=float(coherence[row]),
+                groundedness_score=float(groundedness[row]),
+                completeness_score=float(completeness[row]),
+                structure_score=float(structure[row]),
+                feedback=feedback
+            ))
+        return results
+
+    def validate_reports(
+        self,
+        reports: Sequence[AnalysisReport],
+        min_quality_threshold: Optional[float] = None
+    ) -> List[ValidationResult]:
+        """
+        Validate many reports; equal to validate_report on each.
+
+        Unlike validate_report, results are not recorded in the validation
+        history or shared metrics, so re-scoring a corpus does not skew the
+        live quality figures.
+
+        Args:
+            reports: Reports to validate
+            min_quality_threshold: Pass threshold, defaults to the validator's
+        """
+        sections = [
+            BatchSection(
+                content=section.content,
+                section_type=section.type,
+                expected_elements=self.validator.expected_elements_for(section.type),
+                source_text=report.scenario.complaint_text
+            )
+            for report in reports
+            for section in report.sections
+        ]
+        qualities = self.score_sections(sections)
+        logger.info(f"Batch-scored {len(sections)} sections from {len(reports)} reports")
+
+        results = []
+        offset = 0
+        for report in reports:
+            count = len(report.sections)
+            results.append(self.validator.summarize_report(
+                report, qualities[offset:offset + count], min_quality_threshold
+            ))
+            offset += count
+        return results
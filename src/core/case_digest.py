@@ -0,0 +1,293 @@
+"""
+Case Digest for Legal Intelligence AI System
+============================================
+Map-reduce digestion of complaints too long for any single prompt.
+
+Quoting BM25 passages (see passage_retrieval) works while the relevant
+facts fit in the complaint budget. For very long complaints every section
+would still see only a few passages of a document it never reads. The
+digester instead splits the complaint into chunks of about
+``chunk_tokens`` and has the model summarize each one under fixed
+headings (the map step). The chunk calls run concurrently, through the
+agent's scheduler and so within the global and per-tenant model-call
+limits, so latency grows with the number of chunk waves, not with
+document length. The summaries are then merged heading by heading, with
+duplicates removed, into one structured digest that fits
+``digest_token_budget`` (the reduce step, which needs no model call).
+
+Digests are cached by complaint hash, so all six sections of a report, and
+later reports on the same complaint, reuse one digest. Concurrent reports
+on the same complaint share a single build.
+"""
+
+import re
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+from ..models.legal_models import TokenUsage
+from ..utils.passage_retrieval import CHARS_PER_TOKEN, chunk_text
+from ..utils.text_terms import complaint_hash
+
+logger = logging.getLogger(__name__)
+
+# Headings of the digest, in the order they are rendered
+DIGEST_HEADINGS = ("PARTIES", "CLAIMS", "KEY FACTS", "DAMAGES", "DATES", "RELIEF SOUGHT")
+
+MAP_INSTRUCTIONS = """You are reading part {index} of {count} of a legal complaint.
+List only what this part states, as short bullet lines ("- ...") under these headings:
+{headings}
+Quote names, amounts, dates, patent and statute numbers exactly. Leave out a heading
+this part says nothing about. Do not add analysis or anything not in the text.
+
+COMPLAINT PART {index} OF {count}:
+{text}
+"""
+
+_HEADING_LINE = re.compile(
+    r"^\W*(" + "|".join(re.escape(heading) for heading in DIGEST_HEADINGS) + r")\W*?:\s*(.*)$",
+    re.IGNORECASE
+)
+_BULLET = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s*")
+
+
+@dataclass
+class CaseDigest:
+    """Structured facts of a long complaint, merged from per-chunk summaries."""
+    complaint_hash: str
+    chunks: int
+    items: Dict[str, List[str]]       # heading -> facts, in document order
+    text: str                         # rendered digest quoted in prompts
+    token_usage: TokenUsage
+    cost: float
+    build_seconds: float
+    created_at: float = field(default_factory=time.time)
+
+
+def split_chunks(text: str, chunk_tokens: int) -> List[Tuple[int, int]]:
+    """(start, end) spans of consecutive passages grouped into chunks of about ``chunk_tokens``."""
+    chunk_chars = chunk_tokens * CHARS_PER_TOKEN
+    chunks: List[Tuple[int, int]] = []
+    for start, end in chunk_text(text):
+        if chunks and end - chunks[-1][0] <= chunk_chars:
+            chunks[-1] = (chunks[-1][0], end)
+        else:
+            chunks.append((start, end))
+    return chunks
+
+
+def map_prompt(text: str, index: int, count: int) -> str:
+    """Prompt asking the model to summarize one chunk under DIGEST_HEADINGS."""
+    return MAP_INSTRUCTIONS.format(
+        index=index + 1, count=count, headings="\n".join(f"{heading}:" for heading in DIGEST_HEADINGS), text=text
+    )
+
+
+def parse_summary(summary: str) -> Dict[str, List[str]]:
+    """Bullet lines of a chunk summary, grouped by heading; text before any heading is ignored."""
+    items: Dict[str, List[str]] = {heading: [] for heading in DIGEST_HEADINGS}
+    current = None
+    for line in summary.splitlines():
+        match = _HEADING_LINE.match(line.strip())
+        if match:
+            current = match.group(1).upper()
+            rest = match.group(2).strip()
+        else:
+            rest = line.strip()
+        if current is None:
+            continue
+        rest = _BULLET.sub("", rest).strip()
+        if rest and rest.lower().strip(".") not in ("none", "n/a", "not stated"):
+            items[current].append(rest)
+    return items
+
+
+def reduce_summaries(summaries: List[str], token_budget: int) -> Tuple[Dict[str, List[str]], str]:
+    """
+    Merge chunk summaries into one digest.
+
+    Facts are kept in document order with repeats dropped. When they exceed
+    the budget, each heading keeps its earliest facts, taken round-robin
+    across headings so no heading crowds out the others.
+    """
+    merged: Dict[str, List[str]] = {heading: [] for heading in DIGEST_HEADINGS}
+    seen = set()
+    for summary in summaries:
+        for heading, facts in parse_summary(summary).items():
+            for fact in facts:
+                key = (heading, " ".join(fact.lower().split()))
+                if key not in seen:
+                    seen.add(key)
+                    merged[heading].append(fact)
+
+    kept: Dict[str, List[str]] = {heading: [] for heading in DIGEST_HEADINGS}
+    budget = token_budget * CHARS_PER_TOKEN
+    used = 0
+    depth = 0
+    while any(depth < len(facts) for facts in merged.values()):
+        for heading in DIGEST_HEADINGS:
+            if depth < len(merged[heading]):
+                fact = merged[heading][depth]
+                cost = len(fact) + 3 + (len(heading) + 2 if depth == 0 else 0)
+                if used + cost <= budget:
+                    kept[heading].append(fact)
+                    used += cost
+        depth += 1
+
+    text = "\n".join(
+        f"{heading}:\n" + "\n".join(f"- {fact}" for fact in facts)
+        for heading, facts in kept.items() if facts
+    )
+    return kept, text
+
+
+class CaseDigester:
+    """Builds and caches case digests, summarizing chunks concurrently."""
+
+    def __init__(
+        self,
+        summarize: Callable[..., Tuple[str, TokenUsage, float]],
+        min_tokens: int = 8000,
+        chunk_tokens: int = 2000,
+        digest_token_budget: int = 1500,
+        max_parallel_chunks: int = 8,
+        max_cached: int = 64
+    ):
+        """
+        Args:
+            summarize: Blocking call ``summarize(prompt, **call_options)`` returning
+                (text, token usage, cost); it must respect the model-call limits
+            min_tokens: Complaints with at least this many estimated tokens are digested (0 disables)
+            chunk_tokens: Estimated tokens of complaint per map call
+            digest_token_budget: Most estimated tokens of the merged digest
+            max_parallel_chunks: Chunk calls in flight at once for one complaint
+            max_cached: Digests kept in memory
+        """
+        self.summarize = summarize
+        self.min_tokens = min_tokens
+        self.chunk_tokens = chunk_tokens
+        self.digest_token_budget = digest_token_budget
+        self.max_parallel_chunks = max(1, max_parallel_chunks)
+        self.max_cached = max_cached
+
+        self._cache: "OrderedDict[str, CaseDigest]" = OrderedDict()
+        self._building: Dict[str, asyncio.Task] = {}
+
+        self.digests_built = 0
+        self.cache_hits = 0
+        self.shared_builds = 0
+        self.failures = 0
+        self.chunks_summarized = 0
+        self.tokens_used = 0
+        self.build_seconds_total = 0.0
+
+    def needs_digest(self, complaint_text: str) -> bool:
+        """Whether a complaint is long enough to be digested."""
+        return self.min_tokens > 0 and len(complaint_text) // CHARS_PER_TOKEN >= self.min_tokens
+
+    def cached(self, key: str) -> Optional[CaseDigest]:
+        """A cached digest, or None."""
+        digest = self._cache.get(key)
+        if digest is not None:
+            self._cache.move_to_end(key)
+        return digest
+
+    async def digest(
+        self,
+        complaint_text: str,
+        key: Optional[str] = None,
+        **call_options
+    ) -> Tuple[CaseDigest, bool]:
+        """
+        Digest of a complaint, built if it is not cached.
+
+        Returns:
+            Tuple of (digest, whether this call built it); a digest taken from
+            the cache or from another caller's build was already paid for
+        """
+        key = key or complaint_hash(complaint_text)
+        digest = self.cached(key)
+        if digest is not None:
+            self.cache_hits += 1
+            return digest, False
+
+        # Join a build of the same complaint already running on this loop
+        task = self._building.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            self.shared_builds += 1
+            return await asyncio.shield(task), False
+
+        task = asyncio.create_task(self._build(key, complaint_text, call_options))
+        self._building[key] = task
+        # Shielded so a caller that goes away does not waste the chunks already summarized
+        return await asyncio.shield(task), True
+
+    async def _build(self, key: str, complaint_text: str, call_options: Dict[str, Any]) -> CaseDigest:
+        started = time.time()
+        spans = split_chunks(complaint_text, self.chunk_tokens)
+        semaphore = asyncio.Semaphore(self.max_parallel_chunks)
+
+        async def summarize_chunk(index: int, start: int, end: int) -> Tuple[str, TokenUsage, float]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.summarize, map_prompt(complaint_text[start:end], index, len(spans)), **call_options
+                )
+
+        try:
+            results = await asyncio.gather(
+                *(summarize_chunk(index, start, end) for index, (start, end) in enumerate(spans))
+            )
+        except Exception:
+            self.failures += 1
+            raise
+        finally:
+            if self._building.get(key) is asyncio.current_task():
+                del self._building[key]
+
+        items, text = reduce_summaries([summary for summary, _, _ in results], self.digest_token_budget)
+        input_tokens = sum(usage.input_tokens for _, usage, _ in results)
+        output_tokens = sum(usage.output_tokens for _, usage, _ in results)
+        digest = CaseDigest(
+            complaint_hash=key,
+            chunks=len(spans),
+            items=items,
+            text=text,
+            token_usage=TokenUsage(
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                total_tokens=sum(usage.total_tokens for _, usage, _ in results)
+            ),
+            cost=sum(cost for _, _, cost in results),
+            build_seconds=time.time() - started
+        )
+
+        self._cache[key] = digest
+        while len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+        self.digests_built += 1
+        self.chunks_summarized += digest.chunks
+        self.tokens_used += digest.token_usage.total_tokens
+        self.build_seconds_total += digest.build_seconds
+        logger.info(
+            f"Digested complaint {key} in {digest.build_seconds:.1f}s: {digest.chunks} chunks, "
+            f"{digest.token_usage.total_tokens} tokens"
+        )
+        return digest
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Digests built and reused, and what building them cost."""
+        return {
+            "min_tokens": self.min_tokens,
+            "digests_built": self.digests_built,
+            "cache_hits": self.cache_hits,
+            "shared_builds": self.shared_builds,
+            "failures": self.failures,
+            "cached": len(self._cache),
+            "chunks_summarized": self.chunks_summarized,
+            "mean_chunks": self.chunks_summarized / self.digests_built if self.digests_built else 0.0,
+            "mean_build_seconds": self.build_seconds_total / self.digests_built if self.digests_built else 0.0,
+            "tokens_used": self.tokens_used
+        }
@@ -0,0 +1,82 @@
+"""
+Content Profile for Legal Intelligence AI System
+================================================
+Parses a section's text once so every quality scorer reads the same
+paragraphs, sentences, words and lines instead of re-splitting it.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from .keyword_engine import TOKEN_PATTERN
+
+# A sentence is the text between sentence-ending punctuation marks
+SENTENCE_PATTERN = re.compile(r"[^.!?]+")
+
+# Fragments this short (stripped) are not counted as sentences
+MIN_SENTENCE_CHARS = 10
+
+
+@dataclass
+class ContentLine:
+    """A non-blank line of the content."""
+    text: str
+    is_header: bool
+
+
+@dataclass
+class ContentProfile:
+    """Parsed view of a piece of content shared by the validator's scorers."""
+    text: str
+    lowered: str
+    tokens: List[str]
+    paragraphs: List[str]
+    sentence_spans: List[Tuple[int, int]]
+    sentence_word_counts: List[int]
+    word_count: int
+    lines: List[ContentLine]
+
+    @classmethod
+    def from_text(cls, content: str) -> "ContentProfile":
+        """Parse content once."""
+        lowered = content.lower()
+
+        paragraphs = [p.strip() for p in content.split('\n\n') if p.strip()]
+
+        sentence_spans = []
+        sentence_word_counts = []
+        for match in SENTENCE_PATTERN.finditer(content):
+            sentence = match.group().strip()
+            if len(sentence) > MIN_SENTENCE_CHARS:
+                sentence_spans.append(match.span())
+                sentence_word_counts.append(len(sentence.split()))
+
+        lines = [
+            ContentLine(text=line, is_header=line.isupper() or line.startswith('#'))
+            for line in content.split('\n')
+            if line.strip()
+        ]
+
+        return cls(
+            text=content,
+            lowered=lowered,
+            tokens=TOKEN_PATTERN.findall(lowered),
+            paragraphs=paragraphs,
+            sentence_spans=sentence_spans,
+            sentence_word_counts=sentence_word_counts,
+            word_count=len(content.split()),
+            lines=lines
+        )
+
+    @property
+    def sentence_count(self) -> int:
+        return len(self.sentence_spans)
+
+    @property
+    def has_headers(self) -> bool:
+        return any(line.is_header for line in self.lines)
+
+    def sentences(self) -> List[str]:
+        """Sentence texts, stripped."""
+        return [self.text[start:end].strip() for start, end in self.sentence_spans]
@@ -0,0 +1,52 @@
+"""
+Request Deadlines for Legal Intelligence AI System
+==================================================
+Tracks how much time a caller has left so report generation can degrade
+gracefully (fewer quality retries, shorter sections, dropped low-priority
+sections) instead of running past the point where anyone is waiting.
+"""
+
+import math
+import time
+from typing import Callable, Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a request's deadline passes before work can start."""
+
+
+class DeadlineBudget:
+    """Time remaining for a request, measured on a monotonic clock."""
+
+    def __init__(self, deadline: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            deadline: Absolute deadline on ``clock``; None means unbounded
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.deadline = deadline
+        self._clock = clock
+
+    @classmethod
+    def from_timeout(cls, seconds: float, clock: Callable[[], float] = time.monotonic) -> "DeadlineBudget":
+        """Create a budget that expires ``seconds`` from now."""
+        return cls(clock() + seconds, clock=clock)
+
+    @property
+    def bounded(self) -> bool:
+        return self.deadline is not None
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (infinite when unbounded)."""
+        if self.deadline is None:
+            return math.inf
+        return max(0.0, self.deadline - self._clock())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def per_section(self, remaining_sections: int) -> float:
+        """Even share of the remaining time for each outstanding section."""
+        if remaining_sections <= 0:
+            return self.remaining()
+        return self.remaining() / remaining_sections
@@ -0,0 +1,206 @@
+"""
+Keyword Engine for Legal Intelligence AI System
+===============================================
+Counts many phrases in a text with a single tokenization pass.
+
+The text is tokenized once into words and punctuation marks, and the tokens
+(and the short n-grams the phrase set needs) are tallied with Counter, which
+runs in C. Every phrase was compiled up front into the n-gram forms it can
+take, so counting any number of phrases is a dictionary lookup each, and the
+cost is linear in the text length regardless of how many phrases there are.
+
+Matches respect word boundaries: "art" does not match "start" and "one" does
+not match "phone". The last word of a phrase may carry a common inflection
+("risk" matches "risks", "claim" matches "claimed"). Prefix phrases match any
+word that starts with their last token ("recommend" matches
+"recommendations"). Overlapping phrases ("risk", "risk factor") are all
+counted.
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# Words and individual punctuation marks, so "1." and "non-obvious" can be phrases
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+# Endings tolerated on the final word of an exact phrase
+INFLECTION_SUFFIXES = ("s", "es", "d", "ed", "ing")
+
+PhraseKey = Tuple[str, str]
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word and punctuation tokens."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def count_ngrams(tokens: Sequence[str], n: int, starts: Sequence[int] = None) -> Counter:
+    """Tally tokens (n == 1) or n-token tuples, optionally only those beginning at ``starts``."""
+    if n == 1:
+        return Counter(tokens)
+    if starts is None:
+        return Counter(zip(*(tokens[offset:] for offset in range(n))))
+    total = len(tokens)
+    return Counter(tuple(tokens[start:start + n]) for start in starts if start + n <= total)
+
+
+class KeywordHits:
+    """Occurrence counts from one KeywordMatcher scan."""
+
+    def __init__(self, counts: Dict[PhraseKey, int]):
+        self._counts = counts
+
+    def count(self, phrase: str) -> int:
+        """Occurrences of an exact phrase."""
+        return self._counts.get(("exact", phrase.lower()), 0)
+
+    def count_prefix(self, phrase: str) -> int:
+        """Occurrences of a prefix phrase."""
+        return self._counts.get(("prefix", phrase.lower()), 0)
+
+    def present(self, phrase: str) -> bool:
+        return self.count(phrase) > 0
+
+    def count_present(self, phrases: Iterable[str]) -> int:
+        """How many of the given phrases occur at least once."""
+        return sum(1 for phrase in phrases if self.count(phrase) > 0)
+
+    def present_phrases(self) -> List[str]:
+        """Exact phrases (lowercased) that occur at least once."""
+        return [phrase for (kind, phrase), count in self._counts.items() if kind == "exact" and count > 0]
+
+
+class KeywordMatcher:
+    """Compiled set of phrases that can be counted in one pass over a text."""
+
+    def __init__(self, phrases: Iterable[str] = (), prefix_phrases: Iterable[str] = ()):
+        """
+        Args:
+            phrases: Phrases matched on word boundaries
+            prefix_phrases: Phrases whose last word may be the start of a longer word
+        """
+        # Phrase length -> n-gram (a token when n == 1) -> phrase keys it completes
+        self._exact: Dict[int, Dict[object, List[PhraseKey]]] = {}
+        # Phrase length -> list of (leading tokens, final-token prefix, phrase key)
+        self._prefix: Dict[int, List[Tuple[Tuple[str, ...], str, PhraseKey]]] = {}
+        # First tokens of multi-word phrases; n-grams are only built where these occur
+        self._first_tokens = set()
+
+        for phrase in phrases:
+            tokens = tokenize(phrase)
+            if not tokens:
+                continue
+            key = ("exact", phrase.lower())
+            final = tokens[-1]
+            forms = [final] + [final + suffix for suffix in INFLECTION_SUFFIXES if final.isalpha()]
+            if len(tokens) > 1:
+                self._first_tokens.add(tokens[0])
+            table = self._exact.setdefault(len(tokens), {})
+            for form in forms:
+                gram = form if len(tokens) == 1 else tuple(tokens[:-1]) + (form,)
+                entries = table.setdefault(gram, [])
+                if key not in entries:
+                    entries.append(key)
+
+        for phrase in prefix_phrases:
+            tokens = tokenize(phrase)
+            if not tokens:
+                continue
+            if len(tokens) > 1:
+                self._first_tokens.add(tokens[0])
+            self._prefix.setdefault(len(tokens), []).append(
+                (tuple(tokens[:-1]), tokens[-1], ("prefix", phrase.lower()))
+            )
+
+    def scan(self, tokens: Sequence[str]) -> KeywordHits:
+        """Count every phrase occurrence in a token sequence (from tokenize())."""
+        counts: Dict[PhraseKey, int] = {}
+        lengths = set(self._exact) | set(self._prefix)
+        starts = None
+        if max(lengths, default=1) > 1:
+            first_tokens = self._first_tokens
+            starts = [position for position, token in enumerate(tokens) if token in first_tokens]
+
+        for n in lengths:
+            grams = count_ngrams(tokens, n, starts)
+
+            table = self._exact.get(n, {})
+            if len(table) <= len(grams):
+                for gram, keys in table.items():
+                    occurrences = grams.get(gram)
+                    if occurrences:
+                        for key in keys:
+                            counts[key] = counts.get(key, 0) + occurrences
+            else:
+                for gram, occurrences in grams.items():
+                    for key in table.get(gram, ()):
+                        counts[key] = counts.get(key, 0) + occurrences
+
+            for leading, prefix, key in self._prefix.get(n, ()):
+                for gram, occurrences in grams.items():
+                    if n == 1:
+                        matched = gram.startswith(prefix)
+                    else:
+                        matched = gram[:-1] == leading and gram[-1].startswith(prefix)
+                    if matched:
+                        counts[key] = counts.get(key, 0) + occurrences
+
+        return KeywordHits(counts)
+
+    def count_text(self, text: str) -> KeywordHits:
+        """Tokenize and scan a text."""
+        return self.scan(tokenize(text))
+
+    @property
+    def max_phrase_tokens(self) -> int:
+        """Token length of the longest phrase."""
+        return max(set(self._exact) | set(self._prefix), default=1)
+
+    def stream(self) -> "KeywordStream":
+        """Counter for a token sequence that arrives in pieces."""
+        return KeywordStream(self)
+
+
+class KeywordStream:
+    """
+    Exact phrase counts over tokens fed in pieces, e.g. from a streamed response.
+
+    Each piece is scanned together with the last few tokens of the previous
+    one, so phrases spanning pieces are found; counts already credited to
+    those carried-over tokens are subtracted. Work per piece is proportional
+    to the piece.
+    """
+
+    def __init__(self, matcher: KeywordMatcher):
+        self._matcher = matcher
+        self._counts: Dict[PhraseKey, int] = {}
+        self._carry: List[str] = []
+        self._carry_length = matcher.max_phrase_tokens - 1
+
+    def _window_counts(self, tokens: Sequence[str]) -> Dict[PhraseKey, int]:
+        """Counts of phrases ending within tokens (not within the carried-over tokens)."""
+        counts = dict(self._matcher.scan(self._carry + list(tokens))._counts)
+        if self._carry:
+            for key, count in self._matcher.scan(self._carry)._counts.items():
+                counts[key] -= count
+        return counts
+
+    def feed(self, tokens: Sequence[str]) -> None:
+        """Add the next tokens."""
+        if not tokens:
+            return
+        for key, count in self._window_counts(tokens).items():
+            if count:
+                self._counts[key] = self._counts.get(key, 0) + count
+        if self._carry_length:
+            self._carry = (self._carry + list(tokens))[-self._carry_length:]
+
+    def hits(self, pending: Sequence[str] = ()) -> KeywordHits:
+        """Counts so far, including (without consuming) tokens that may still grow."""
+        counts = dict(self._counts)
+        if pending:
+            for key, count in self._window_counts(pending).items():
+                if count:
+                    counts[key] = counts.get(key, 0) + count
+        return KeywordHits(counts)
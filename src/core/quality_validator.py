@@ -7,15 +7,43 @@ Without proper scoring, we can't tell if the AI output is any good.
 Your mission: Implement the scoring algorithms in TODOs 4 and 5.
 """
 
+import json
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import asdict, dataclass, replace
 import statistics
 
-from ..models.legal_models import AnalysisReport, ReportSection
+from ..models.legal_models import AnalysisReport, ReportSection, SectionQuality
+from ..utils.metrics_store import SharedMetricsStore
+from ..utils.telemetry import RollingMetric
+from .keyword_engine import KeywordMatcher, KeywordHits
+from .content_profile import ContentProfile
+from .source_grounding import SENTENCE_MIN_SIMILARITY, SourceIndex, build_source_index
 
 logger = logging.getLogger(__name__)
 
+# Elements each section type should cover. Generation-time validation and
+# report re-validation both score against this map.
+EXPECTED_ELEMENTS = {
+    "liability_assessment": ["claims", "evidence", "probability", "precedent"],
+    "damage_calculation": ["damages", "calculation", "amount", "methodology"],
+    "prior_art_analysis": ["patents", "prior art", "validity", "obviousness"],
+    "competitive_landscape": ["competitors", "market", "position", "licensing"],
+    "risk_assessment": ["risks", "probability", "impact", "mitigation"],
+    "strategic_recommendations": ["recommendations", "action", "timeline", "resources"]
+}
+
+DEFAULT_EXPECTED_ELEMENTS = ["analysis", "assessment", "conclusion"]
+
+
+def hash_content(content: str) -> str:
+    """SHA-256 of section content, the key under which its scores are cached."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
 
 @dataclass
 class QualityScore:
@@ -28,6 +56,33 @@ class QualityScore:
     feedback: List[str]
 
 
+@dataclass
+class SectionFeatures:
+    """
+    Everything the scoring tiers read from a section.
+
+    Counted from a full parse (QualityValidator.extract_features) or
+    accumulated while the section streams in (IncrementalQualityScorer).
+    Counts are floats when projected to a section's expected final length.
+    """
+    paragraph_count: float
+    sentence_count: float
+    distinct_sentence_lengths: float
+    word_count: float
+    has_headers: bool
+    connector_count: float
+    structure_marker_count: float
+    keyword_count: float
+    reasoning_count: float
+    has_lists: bool
+    has_conclusion: bool
+    elements_present: float   # expected elements found verbatim
+    elements_grounded: float  # found verbatim or by root, e.g. "recommend..."
+    # TF-IDF overlap with the complaint, when it was compared with one
+    source_similarity: Optional[float] = None
+    source_coverage: Optional[float] = None
+
+
 @dataclass
 class ValidationResult:
     """Validation result for a report."""
@@ -50,24 +105,290 @@ class QualityValidator:
     YOUR MISSION: Fix TODOs 4 and 5 to make validation work!
     """
 
-    def __init__(self, min_quality_threshold: float = 0.7):
-        """Initialize the quality validator."""
+    LOGICAL_CONNECTORS = [
+        'therefore', 'however', 'furthermore', 'moreover', 'consequently',
+        'additionally', 'thus', 'hence', 'accordingly', 'nevertheless',
+        'nonetheless', 'meanwhile', 'subsequently', 'alternatively',
+        'specifically', 'particularly', 'notably', 'indeed', 'in fact',
+        'for example', 'for instance', 'in addition', 'on the other hand',
+        'as a result', 'in conclusion', 'in summary', 'overall'
+    ]
+
+    STRUCTURE_MARKERS = [
+        'first', 'second', 'third', 'fourth', 'fifth',
+        'initially', 'subsequently', 'finally', 'lastly',
+        'next', 'then', 'afterward', 'previously',
+        'step 1', 'step 2', 'step 3',
+        '1.', '2.', '3.', '4.', '5.',
+        'one', 'two', 'three', 'four', 'five'
+    ]
+
+    SECTION_KEYWORDS = {
+        "liability_assessment": [
+            'liability', 'negligence', 'breach', 'duty', 'causation', 'fault',
+            'responsibility', 'obligation', 'standard of care', 'proximate cause',
+            'tort', 'wrongful', 'violation', 'infringement', 'claim', 'defendant',
+            'plaintiff', 'merit', 'evidence', 'precedent', 'case law'
+        ],
+        "damage_calculation": [
+            'damages', 'compensation', 'calculation', 'quantum', 'loss', 'injury',
+            'harm', 'economic loss', 'lost profits', 'punitive', 'actual damages',
+            'statutory damages', 'restitution', 'recovery', 'award', 'settlement',
+            'monetary', 'financial impact', 'cost', 'expense', 'revenue'
+        ],
+        "prior_art_analysis": [
+            'prior art', 'patent', 'novelty', 'obviousness', 'invention', 'claims',
+            'validity', 'infringement', 'patentability', 'non-obvious', 'prior',
+            'existing', 'publication', 'disclosure', 'freedom to operate', 'f-to',
+            'patent search', 'art', 'reference', 'prior publication'
+        ],
+        "competitive_landscape": [
+            'competitors', 'market share', 'positioning', 'competitive', 'market',
+            'industry', 'rival', 'competition', 'advantage', 'disadvantage',
+            'market position', 'market leader', 'niche', 'differentiation',
+            'competitive advantage', 'market analysis', 'competitive analysis',
+            'market dynamics', 'market trends', 'market size'
+        ],
+        "risk_assessment": [
+            'risk', 'probability', 'impact', 'mitigation', 'threat', 'vulnerability',
+            'exposure', 'likelihood', 'consequence', 'severity', 'uncertainty',
+            'hazard', 'peril', 'danger', 'challenge', 'concern', 'issue',
+            'risk management', 'risk analysis', 'risk factor', 'risk level'
+        ],
+        "strategic_recommendations": [
+            'recommendation', 'strategy', 'implementation', 'action', 'plan',
+            'approach', 'tactic', 'initiative', 'measure', 'step', 'course of action',
+            'proposal', 'suggestion', 'guidance', 'direction', 'roadmap', 'timeline',
+            'milestone', 'objective', 'goal', 'priority'
+        ]
+    }
+
+    REASONING_PHRASES = [
+        'based on', 'because', 'due to', 'as a result', 'according to',
+        'evidence shows', 'the evidence', 'research indicates', 'studies show',
+        'data suggests', 'analysis reveals', 'findings indicate', 'demonstrates',
+        'establishes', 'proves', 'supports', 'indicates', 'suggests', 'reveals',
+        'shows that', 'indicates that', 'suggests that', 'demonstrates that',
+        'according to the', 'in light of', 'given that', 'considering',
+        'taking into account', 'in view of', 'on the basis of'
+    ]
+
+    LIST_MARKERS = ['•', '-', '*', '1.', '2.', '3.']
+
+    CONCLUSION_INDICATORS = ['conclusion', 'summary', 'therefore', 'in summary', 'overall']
+
+    # Compiled keyword matchers kept per distinct expected-elements list
+    MAX_CACHED_MATCHERS = 128
+
+    # Source complaint indexes kept, keyed by complaint hash
+    MAX_CACHED_SOURCES = 64
+
+    # Share of groundedness that comes from overlap with the complaint, when given
+    SOURCE_WEIGHT = 0.3
+
+    # Bump when the scoring logic changes, so carried and cached scores are recomputed
+    SCORING_VERSION = 2
+
+    def __init__(
+        self,
+        min_quality_threshold: float = 0.7,
+        metrics_store: Optional[SharedMetricsStore] = None,
+        score_cache_size: int = 1024,
+        history_size: int = 1000
+    ):
+        """
+        Initialize the quality validator.
+
+        Args:
+            min_quality_threshold: Report score needed to pass
+            metrics_store: Shared store for fleet-wide validation metrics
+            score_cache_size: Section scores kept, keyed by content hash (0 disables)
+            history_size: Most recent validations kept in history
+        """
         self.min_quality_threshold = min_quality_threshold
-        self.validation_history = []
+        self.metrics_store = metrics_store
+        self.validation_history = deque(maxlen=history_size)
+        self.validation_scores = RollingMetric(window=history_size)
+
+        # Fingerprint of everything that determines a section's scores
+        self.rules_version = hashlib.sha256(json.dumps({
+            "scoring_version": self.SCORING_VERSION,
+            "logical_connectors": self.LOGICAL_CONNECTORS,
+            "structure_markers": self.STRUCTURE_MARKERS,
+            "section_keywords": self.SECTION_KEYWORDS,
+            "reasoning_phrases": self.REASONING_PHRASES,
+            "list_markers": self.LIST_MARKERS,
+            "conclusion_indicators": self.CONCLUSION_INDICATORS,
+            "source_weight": self.SOURCE_WEIGHT,
+            "sentence_min_similarity": SENTENCE_MIN_SIMILARITY,
+            "expected_elements": EXPECTED_ELEMENTS,
+            "default_expected_elements": DEFAULT_EXPECTED_ELEMENTS
+        }, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+        # LRU of (content hash, section type, expected elements, source hash) -> QualityScore
+        self.score_cache_size = score_cache_size
+        self._score_cache: "OrderedDict[Tuple[str, str, Tuple[str, ...], Optional[str]], QualityScore]" = OrderedDict()
+        self._source_indexes: "OrderedDict[str, Optional[SourceIndex]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._breakdowns_reused = 0
+
+        # Every fixed phrase list, compiled into one matcher per expected-elements list
+        self._static_phrases = sorted(set(
+            self.LOGICAL_CONNECTORS + self.STRUCTURE_MARKERS + self.REASONING_PHRASES +
+            self.LIST_MARKERS + self.CONCLUSION_INDICATORS +
+            [keyword for keywords in self.SECTION_KEYWORDS.values() for keyword in keywords]
+        ))
+        self._matchers: "OrderedDict[Tuple[str, ...], KeywordMatcher]" = OrderedDict()
 
     def validate_section(
         self,
         content: str,
         section_type: str,
-        expected_elements: List[str]
+        expected_elements: List[str],
+        source_text: Optional[str] = None
     ) -> QualityScore:
-        """Validate a single report section."""
+        """
+        Validate a single report section; scores of content seen before come from the cache.
 
+        When source_text (the scenario's complaint) is given, part of the
+        groundedness score measures how closely the section tracks it.
+        """
+        source_hash = hash_content(source_text) if source_text else None
+        source = self.source_index(source_text, source_hash)
+        if self.score_cache_size <= 0:
+            return self._score_section(content, section_type, expected_elements, source)
+
+        key = (hash_content(content), section_type, tuple(expected_elements), source_hash if source else None)
+        with self._cache_lock:
+            cached = self._score_cache.get(key)
+            if cached is not None:
+                self._score_cache.move_to_end(key)
+                self._cache_hits += 1
+            else:
+                self._cache_misses += 1
+        if cached is not None:
+            return replace(cached, feedback=list(cached.feedback))
+
+        quality = self._score_section(content, section_type, expected_elements, source)
+        with self._cache_lock:
+            self._score_cache[key] = quality
+            self._score_cache.move_to_end(key)
+            while len(self._score_cache) > self.score_cache_size:
+                self._score_cache.popitem(last=False)
+        return replace(quality, feedback=list(quality.feedback))
+
+    def source_index(self, source_text: Optional[str], source_hash: Optional[str] = None) -> Optional[SourceIndex]:
+        """TF-IDF index of a complaint, built once per distinct text; None if there is nothing to index."""
+        if not source_text:
+            return None
+        source_hash = source_hash or hash_content(source_text)
+        with self._cache_lock:
+            if source_hash in self._source_indexes:
+                self._source_indexes.move_to_end(source_hash)
+                return self._source_indexes[source_hash]
+
+        index = build_source_index(source_text)
+        with self._cache_lock:
+            self._source_indexes[source_hash] = index
+            while len(self._source_indexes) > self.MAX_CACHED_SOURCES:
+                self._source_indexes.popitem(last=False)
+        return index
+
+    def _score_section(
+        self,
+        content: str,
+        section_type: str,
+        expected_elements: List[str],
+        source: Optional[SourceIndex] = None
+    ) -> QualityScore:
+        """Score a section from scratch."""
+
+        # Parse the content and count every phrase the scorers need, once
+        profile = ContentProfile.from_text(content)
+        hits = self.scan_keywords(content, expected_elements, profile=profile)
+        features = self.extract_features(profile, hits, section_type, expected_elements, source)
+        return self.score_features(features, section_type, expected_elements)
+
+    def extract_features(
+        self,
+        profile: ContentProfile,
+        hits: KeywordHits,
+        section_type: str,
+        expected_elements: List[str],
+        source: Optional[SourceIndex] = None
+    ) -> SectionFeatures:
+        """Count what the scoring tiers read; hits must include the expected elements."""
+        features = self.features_from_counts(
+            hits,
+            section_type,
+            expected_elements,
+            paragraph_count=len(profile.paragraphs),
+            sentence_count=profile.sentence_count,
+            distinct_sentence_lengths=len(set(profile.sentence_word_counts)),
+            word_count=profile.word_count,
+            has_headers=profile.has_headers
+        )
+        if source is not None:
+            overlap = source.overlap(profile)
+            features.source_similarity = overlap.similarity
+            features.source_coverage = overlap.sentence_coverage
+        return features
+
+    def features_from_counts(
+        self,
+        hits: KeywordHits,
+        section_type: str,
+        expected_elements: List[str],
+        paragraph_count: int,
+        sentence_count: int,
+        distinct_sentence_lengths: int,
+        word_count: int,
+        has_headers: bool
+    ) -> SectionFeatures:
+        """Features from keyword hits plus text counts gathered elsewhere."""
+        elements_present = 0
+        elements_grounded = 0
+        for element in expected_elements:
+            if hits.present(element):
+                elements_present += 1
+                elements_grounded += 1
+            else:
+                # Partial matches: a word starting with the element's root,
+                # e.g. "recommend" matches "recommendation"
+                element_root = self._element_root(element)
+                if len(element_root) >= 4 and hits.count_prefix(element_root) > 0:
+                    elements_grounded += 1
+
+        return SectionFeatures(
+            paragraph_count=paragraph_count,
+            sentence_count=sentence_count,
+            distinct_sentence_lengths=distinct_sentence_lengths,
+            word_count=word_count,
+            has_headers=has_headers,
+            connector_count=hits.count_present(self.LOGICAL_CONNECTORS),
+            structure_marker_count=hits.count_present(self.STRUCTURE_MARKERS),
+            keyword_count=hits.count_present(self.SECTION_KEYWORDS.get(section_type, [])),
+            reasoning_count=hits.count_present(self.REASONING_PHRASES),
+            has_lists=hits.count_present(self.LIST_MARKERS) > 0,
+            has_conclusion=hits.count_present(self.CONCLUSION_INDICATORS) > 0,
+            elements_present=elements_present,
+            elements_grounded=elements_grounded
+        )
+
+    def score_features(
+        self,
+        features: SectionFeatures,
+        section_type: str,
+        expected_elements: List[str]
+    ) -> QualityScore:
+        """Apply the scoring tiers to a section's features."""
         # Calculate individual scores
-        coherence = self.calculate_coherence_score(content, section_type)
-        groundedness = self.calculate_groundedness_score(content, section_type, expected_elements)
-        completeness = self._calculate_completeness_score(content, expected_elements)
-        structure = self._calculate_structure_score(content)
+        coherence = self._coherence_points(features)
+        groundedness = self._groundedness_points(features, section_type, expected_elements)
+        completeness = self._completeness_points(features, expected_elements)
+        structure = self._structure_points(features)
 
         # Calculate overall score (weighted average)
         overall = (
@@ -83,6 +404,8 @@ class QualityValidator:
             feedback.append("Improve logical flow and use more transition phrases")
         if groundedness < 0.7:
             feedback.append(f"Include more {section_type}-specific terminology and evidence")
+        if features.source_similarity is not None and self._source_points(features.source_similarity, features.source_coverage) < 0.5:
+            feedback.append("Tie the analysis to the specific parties, facts and figures in the complaint")
         if completeness < 0.7:
             feedback.append(f"Address all expected elements: {', '.join(expected_elements)}")
         if structure < 0.7:
@@ -97,7 +420,74 @@ class QualityValidator:
             feedback=feedback
         )
 
-    def calculate_coherence_score(self, content: str, section_type: str) -> float:
+    def section_breakdown(self, content: str, quality: QualityScore) -> SectionQuality:
+        """Breakdown to carry on a ReportSection, stamped with the content hash and rules version."""
+        return SectionQuality(
+            **asdict(quality),
+            content_hash=hash_content(content),
+            rules_version=self.rules_version
+        )
+
+    def reuse_breakdown(self, section: ReportSection) -> Optional[QualityScore]:
+        """The section's carried scores, if its content and the scoring rules are unchanged."""
+        breakdown = section.quality_breakdown
+        if (
+            breakdown is None
+            or breakdown.rules_version != self.rules_version
+            or breakdown.content_hash != hash_content(section.content)
+        ):
+            return None
+        return QualityScore(
+            overall_score=breakdown.overall_score,
+            coherence_score=breakdown.coherence_score,
+            groundedness_score=breakdown.groundedness_score,
+            completeness_score=breakdown.completeness_score,
+            structure_score=breakdown.structure_score,
+            feedback=list(breakdown.feedback)
+        )
+
+    def scan_keywords(
+        self,
+        content: str,
+        expected_elements: Optional[List[str]] = None,
+        profile: Optional[ContentProfile] = None
+    ) -> KeywordHits:
+        """Count all scoring phrases, and the expected elements, in one pass over the content."""
+        matcher = self._get_matcher(expected_elements or [])
+        if profile is not None:
+            return matcher.scan(profile.tokens)
+        return matcher.count_text(content)
+
+    def _get_matcher(self, expected_elements: List[str]) -> KeywordMatcher:
+        key = tuple(expected_elements)
+        # Validation runs on pool threads; build each matcher once, under the cache lock
+        with self._cache_lock:
+            matcher = self._matchers.get(key)
+            if matcher is not None:
+                self._matchers.move_to_end(key)
+                return matcher
+            roots = [self._element_root(element) for element in expected_elements]
+            matcher = KeywordMatcher(
+                phrases=self._static_phrases + list(expected_elements),
+                prefix_phrases=[root for root in roots if len(root) >= 4]
+            )
+            self._matchers[key] = matcher
+            while len(self._matchers) > self.MAX_CACHED_MATCHERS:
+                self._matchers.popitem(last=False)
+        return matcher
+
+    @staticmethod
+    def _element_root(element: str) -> str:
+        """Root of an expected element, e.g. "recommendation" -> "recommend"."""
+        return element.lower().rstrip('ation').rstrip('ing').rstrip('s')
+
+    def calculate_coherence_score(
+        self,
+        content: str,
+        section_type: str,
+        hits: Optional[KeywordHits] = None,
+        profile: Optional[ContentProfile] = None
+    ) -> float:
         """
         Calculate coherence score for the content.
 
@@ -116,33 +506,33 @@ class QualityValidator:
         Args:
             content: The text to analyze
             section_type: Type of section (for context)
+            hits: Keyword counts from scan_keywords(), computed if not given
+            profile: Parsed content from ContentProfile.from_text(), computed if not given
 
         Returns:
             Float between 0.0 and 1.0 representing coherence
         """
+        if profile is None:
+            profile = ContentProfile.from_text(content)
+        if hits is None:
+            hits = self.scan_keywords(content, profile=profile)
+        return self._coherence_points(self.extract_features(profile, hits, section_type, []))
+
+    def _coherence_points(self, features: SectionFeatures) -> float:
+        """Coherence tiers; see calculate_coherence_score()."""
         score = 0.0
-        content_lower = content.lower()
 
         # 1. Check paragraph structure (split by '\n\n')
-        paragraphs = [p.strip() for p in content.split('\n\n') if len(p.strip()) > 0]
-        if len(paragraphs) >= 3:
+        paragraph_count = features.paragraph_count
+        if paragraph_count >= 3:
             score += 0.3
-        elif len(paragraphs) >= 2:
+        elif paragraph_count >= 2:
             score += 0.2
-        elif len(paragraphs) >= 1:
+        elif paragraph_count >= 1:
             score += 0.1
 
         # 2. Count logical connectors
-        logical_connectors = [
-            'therefore', 'however', 'furthermore', 'moreover', 'consequently',
-            'additionally', 'thus', 'hence', 'accordingly', 'nevertheless',
-            'nonetheless', 'meanwhile', 'subsequently', 'alternatively',
-            'specifically', 'particularly', 'notably', 'indeed', 'in fact',
-            'for example', 'for instance', 'in addition', 'on the other hand',
-            'as a result', 'in conclusion', 'in summary', 'overall'
-        ]
-        
-        connector_count = sum(1 for connector in logical_connectors if connector in content_lower)
+        connector_count = features.connector_count
         if connector_count >= 5:
             score += 0.2
         elif connector_count >= 3:
@@ -151,16 +541,7 @@ class QualityValidator:
             score += 0.1
 
         # 3. Check for structured thinking markers
-        structure_markers = [
-            'first', 'second', 'third', 'fourth', 'fifth',
-            'initially', 'subsequently', 'finally', 'lastly',
-            'next', 'then', 'afterward', 'previously',
-            'step 1', 'step 2', 'step 3',
-            '1.', '2.', '3.', '4.', '5.',
-            'one', 'two', 'three', 'four', 'five'
-        ]
-        
-        structure_count = sum(1 for marker in structure_markers if marker in content_lower)
+        structure_count = features.structure_marker_count
         if structure_count >= 3:
             score += 0.2
         elif structure_count >= 2:
@@ -169,11 +550,8 @@ class QualityValidator:
             score += 0.1
 
         # 4. Measure content depth (sentence count)
-        # Split by sentence-ending punctuation, filter out empty strings
-        sentences = [s.strip() for s in content.replace('!', '.').replace('?', '.').split('.') 
-                    if len(s.strip()) > 10]  # Filter out very short fragments
-        
-        sentence_count = len(sentences)
+        # Sentences split on sentence-ending punctuation, very short fragments excluded
+        sentence_count = features.sentence_count
         if sentence_count >= 12:
             score += 0.3
         elif sentence_count >= 8:
@@ -190,7 +568,10 @@ class QualityValidator:
         self,
         content: str,
         section_type: str,
-        expected_elements: List[str]
+        expected_elements: List[str],
+        hits: Optional[KeywordHits] = None,
+        profile: Optional[ContentProfile] = None,
+        source_text: Optional[str] = None
     ) -> float:
         """
         CURRENT STATE: Always returns 0.0 - no groundedness checking!
@@ -218,6 +599,9 @@ class QualityValidator:
             content: The text to analyze
             section_type: Type of section for keyword selection
             expected_elements: List of elements that should be present
+            hits: Keyword counts from scan_keywords(), computed if not given
+            profile: Parsed content from ContentProfile.from_text(), used to compute hits
+            source_text: Complaint to measure TF-IDF overlap with (SOURCE_WEIGHT of the score)
 
         Returns:
             Float between 0.0 and 1.0 representing groundedness
@@ -229,58 +613,31 @@ class QualityValidator:
         - Check coverage of expected_elements list
         - Cap the final score at 1.0
         """
+        if profile is None:
+            profile = ContentProfile.from_text(content)
+        if hits is None:
+            hits = self.scan_keywords(content, expected_elements, profile=profile)
+        features = self.extract_features(
+            profile, hits, section_type, expected_elements, self.source_index(source_text)
+        )
+        return self._groundedness_points(features, section_type, expected_elements)
+
+    def _groundedness_points(
+        self,
+        features: SectionFeatures,
+        section_type: str,
+        expected_elements: List[str]
+    ) -> float:
+        """Groundedness tiers; see calculate_groundedness_score()."""
         score = 0.0
-        content_lower = content.lower()
-
-        # 1. Define section-specific keywords dictionary
-        section_keywords = {
-            "liability_assessment": [
-                'liability', 'negligence', 'breach', 'duty', 'causation', 'fault',
-                'responsibility', 'obligation', 'standard of care', 'proximate cause',
-                'tort', 'wrongful', 'violation', 'infringement', 'claim', 'defendant',
-                'plaintiff', 'merit', 'evidence', 'precedent', 'case law'
-            ],
-            "damage_calculation": [
-                'damages', 'compensation', 'calculation', 'quantum', 'loss', 'injury',
-                'harm', 'economic loss', 'lost profits', 'punitive', 'actual damages',
-                'statutory damages', 'restitution', 'recovery', 'award', 'settlement',
-                'monetary', 'financial impact', 'cost', 'expense', 'revenue'
-            ],
-            "prior_art_analysis": [
-                'prior art', 'patent', 'novelty', 'obviousness', 'invention', 'claims',
-                'validity', 'infringement', 'patentability', 'non-obvious', 'prior',
-                'existing', 'publication', 'disclosure', 'freedom to operate', 'f-to',
-                'patent search', 'art', 'reference', 'prior publication'
-            ],
-            "competitive_landscape": [
-                'competitors', 'market share', 'positioning', 'competitive', 'market',
-                'industry', 'rival', 'competition', 'advantage', 'disadvantage',
-                'market position', 'market leader', 'niche', 'differentiation',
-                'competitive advantage', 'market analysis', 'competitive analysis',
-                'market dynamics', 'market trends', 'market size'
-            ],
-            "risk_assessment": [
-                'risk', 'probability', 'impact', 'mitigation', 'threat', 'vulnerability',
-                'exposure', 'likelihood', 'consequence', 'severity', 'uncertainty',
-                'hazard', 'peril', 'danger', 'challenge', 'concern', 'issue',
-                'risk management', 'risk analysis', 'risk factor', 'risk level'
-            ],
-            "strategic_recommendations": [
-                'recommendation', 'strategy', 'implementation', 'action', 'plan',
-                'approach', 'tactic', 'initiative', 'measure', 'step', 'course of action',
-                'proposal', 'suggestion', 'guidance', 'direction', 'roadmap', 'timeline',
-                'milestone', 'objective', 'goal', 'priority'
-            ]
-        }
-
-        # 2. Get keywords for this section_type
-        keywords = section_keywords.get(section_type, [])
-        
+
+        # 1-2. Get section-specific keywords for this section_type
+        keywords = self.SECTION_KEYWORDS.get(section_type, [])
+
         # 3. Calculate keyword coverage (up to 0.4 points)
         if keywords:
-            found_keywords = sum(1 for keyword in keywords if keyword.lower() in content_lower)
-            keyword_coverage = found_keywords / len(keywords)
-            
+            keyword_coverage = features.keyword_count / len(keywords)
+
             # Score based on coverage percentage
             if keyword_coverage >= 0.5:  # 50% or more keywords found
                 score += 0.4
@@ -293,17 +650,7 @@ class QualityValidator:
             # Less than 10% gets 0 points
 
         # 4. Check for reasoning indicators (up to 0.3 points)
-        reasoning_phrases = [
-            'based on', 'because', 'due to', 'as a result', 'according to',
-            'evidence shows', 'the evidence', 'research indicates', 'studies show',
-            'data suggests', 'analysis reveals', 'findings indicate', 'demonstrates',
-            'establishes', 'proves', 'supports', 'indicates', 'suggests', 'reveals',
-            'shows that', 'indicates that', 'suggests that', 'demonstrates that',
-            'according to the', 'in light of', 'given that', 'considering',
-            'taking into account', 'in view of', 'on the basis of'
-        ]
-        
-        reasoning_count = sum(1 for phrase in reasoning_phrases if phrase in content_lower)
+        reasoning_count = features.reasoning_count
         if reasoning_count >= 5:
             score += 0.3
         elif reasoning_count >= 4:
@@ -317,23 +664,9 @@ class QualityValidator:
 
         # 5. Check expected elements coverage (up to 0.3 points)
         if expected_elements:
-            # Check for both exact matches and partial matches (e.g., "recommend" matches "recommendation")
-            covered_elements = 0
-            for element in expected_elements:
-                element_lower = element.lower()
-                # Check for exact match
-                if element_lower in content_lower:
-                    covered_elements += 1
-                else:
-                    # Check for partial matches - if element root word appears in content
-                    # e.g., "recommend" should match "recommendation"
-                    element_root = element_lower.rstrip('ation').rstrip('ing').rstrip('s')
-                    if len(element_root) >= 4:  # Only check if root is substantial
-                        if element_root in content_lower:
-                            covered_elements += 1
-            
-            element_coverage = covered_elements / len(expected_elements)
-            
+            # Exact matches and partial matches (e.g., "recommend" matches "recommendation")
+            element_coverage = features.elements_grounded / len(expected_elements)
+
             # Score based on coverage percentage
             if element_coverage >= 1.0:  # All elements found
                 score += 0.3
@@ -348,13 +681,59 @@ class QualityValidator:
             # 0% gets 0 points
 
         # 6. Cap the final score at 1.0
-        return min(score, 1.0)
+        score = min(score, 1.0)
 
-    def _calculate_completeness_score(self, content: str, expected_elements: List[str]) -> float:
+        # 7. Blend in overlap with the complaint, when the section was compared with it
+        if features.source_similarity is not None:
+            score = score * (1 - self.SOURCE_WEIGHT) + self._source_points(features.source_similarity, features.source_coverage) * self.SOURCE_WEIGHT
+        return score
+
+    @staticmethod
+    def _source_points(similarity: float, coverage: float) -> float:
+        """Overlap with the complaint from 0.0 to 1.0: half whole-section similarity, half sentence coverage."""
+        score = 0.0
+
+        if similarity >= 0.3:
+            score += 0.5
+        elif similarity >= 0.2:
+            score += 0.4
+        elif similarity >= 0.1:
+            score += 0.25
+        elif similarity > 0:
+            score += 0.1
+
+        if coverage >= 0.5:
+            score += 0.5
+        elif coverage >= 0.3:
+            score += 0.4
+        elif coverage >= 0.15:
+            score += 0.25
+        elif coverage > 0:
+            score += 0.1
+
+        return score
+
+    def _calculate_completeness_score(
+        self,
+        content: str,
+        expected_elements: List[str],
+        hits: Optional[KeywordHits] = None,
+        profile: Optional[ContentProfile] = None
+    ) -> float:
         """Calculate how completely the content addresses requirements."""
+        if profile is None:
+            profile = ContentProfile.from_text(content)
+        if hits is None:
+            hits = self.scan_keywords(content, expected_elements, profile=profile)
+        features = self.extract_features(profile, hits, "", expected_elements)
+        return self._completeness_points(features, expected_elements)
+
+    def _completeness_points(self, features: SectionFeatures, expected_elements: List[str]) -> float:
+        """Completeness tiers; see _calculate_completeness_score()."""
+        word_count = features.word_count
+
         if not expected_elements:
             # If no specific elements expected, check general completeness
-            word_count = len(content.split())
             if word_count >= 200:
                 return 1.0
             elif word_count >= 100:
@@ -365,77 +744,121 @@ class QualityValidator:
                 return 0.3
 
         # Check coverage of expected elements
-        content_lower = content.lower()
-        covered_elements = sum(1 for element in expected_elements
-                             if element.lower() in content_lower)
-
-        coverage_ratio = covered_elements / len(expected_elements)
+        coverage_ratio = features.elements_present / len(expected_elements)
 
         # Also consider content length
-        word_count = len(content.split())
         length_score = min(word_count / 200, 1.0)  # Expect at least 200 words
 
         # Combined score
         return (coverage_ratio * 0.7) + (length_score * 0.3)
 
-    def _calculate_structure_score(self, content: str) -> float:
+    def _calculate_structure_score(
+        self,
+        content: str,
+        hits: Optional[KeywordHits] = None,
+        profile: Optional[ContentProfile] = None
+    ) -> float:
         """Calculate structural quality of the content."""
+        if profile is None:
+            profile = ContentProfile.from_text(content)
+        if hits is None:
+            hits = self.scan_keywords(content, profile=profile)
+        return self._structure_points(self.extract_features(profile, hits, "", []))
+
+    def _structure_points(self, features: SectionFeatures) -> float:
+        """Structure tiers; see _calculate_structure_score()."""
         score = 0.0
 
         # Check for paragraphs
-        paragraphs = content.split('\n\n')
-        if len(paragraphs) >= 3:
+        paragraph_count = features.paragraph_count
+        if paragraph_count >= 3:
             score += 0.3
-        elif len(paragraphs) >= 2:
+        elif paragraph_count >= 2:
             score += 0.2
-        elif len(paragraphs) >= 1:
+        elif paragraph_count >= 1:
             score += 0.1
 
         # Check for lists or bullet points
-        has_lists = any(marker in content for marker in ['•', '-', '*', '1.', '2.', '3.'])
-        if has_lists:
+        if features.has_lists:
             score += 0.2
 
         # Check for headers or emphasized text
-        has_headers = any(line.isupper() or line.startswith('#')
-                        for line in content.split('\n') if len(line.strip()) > 0)
-        if has_headers:
+        if features.has_headers:
             score += 0.1
 
         # Check sentence variety
-        sentences = [s.strip() for s in content.split('.') if len(s.strip()) > 10]
-        if len(sentences) >= 3:
-            sentence_lengths = [len(s.split()) for s in sentences]
-            if len(set(sentence_lengths)) >= 3:  # Variety in sentence length
+        if features.sentence_count >= 3:
+            if features.distinct_sentence_lengths >= 3:  # Variety in sentence length
                 score += 0.2
 
         # Check for conclusion indicators
-        conclusion_indicators = ['conclusion', 'summary', 'therefore', 'in summary', 'overall']
-        has_conclusion = any(indicator in content.lower() for indicator in conclusion_indicators)
-        if has_conclusion:
+        if features.has_conclusion:
             score += 0.2
 
         return min(score, 1.0)
 
-    def validate_report(self, report: AnalysisReport) -> ValidationResult:
-        """Validate a complete report."""
+    def validate_report(self, report: AnalysisReport, trust_breakdowns: bool = False) -> ValidationResult:
+        """
+        Validate a complete report.
+
+        Args:
+            report: Report to validate
+            trust_breakdowns: Reuse each section's carried quality_breakdown when
+                its content hash and rules version still match. Only for reports
+                generated in-process; a client-supplied breakdown is not proof
+                of anything.
+        """
+        qualities = []
+        for section in report.sections:
+            quality = self.reuse_breakdown(section) if trust_breakdowns else None
+            if quality is not None:
+                with self._cache_lock:
+                    self._breakdowns_reused += 1
+            else:
+                quality = self.validate_section(
+                    content=section.content,
+                    section_type=section.type,
+                    expected_elements=self.expected_elements_for(section.type),
+                    source_text=report.scenario.complaint_text
+                )
+            qualities.append(quality)
+        result = self.summarize_report(report, qualities)
+
+        # Store in history
+        self.validation_history.append({
+            "timestamp": report.timestamp,
+            "overall_score": result.overall_score,
+            "passed": result.passed
+        })
+        self.validation_scores.record(result.overall_score)
+        if self.metrics_store:
+            self.metrics_store.increment("validations")
+            self.metrics_store.record("validation_score", result.overall_score)
+            self.metrics_store.record("validation_passed", 1.0 if result.passed else 0.0)
+
+        return result
+
+    def summarize_report(
+        self,
+        report: AnalysisReport,
+        qualities: List[QualityScore],
+        min_quality_threshold: Optional[float] = None
+    ) -> ValidationResult:
+        """
+        Combine per-section scores (in report.sections order) into a report result.
+
+        Nothing is recorded in the validation history.
+        """
+        threshold = self.min_quality_threshold if min_quality_threshold is None else min_quality_threshold
         section_scores = {}
         all_issues = []
         all_recommendations = []
 
-        # Validate each section
-        for section in report.sections:
-            expected_elements = self._get_expected_elements_for_section(section.type)
-            quality = self.validate_section(
-                content=section.content,
-                section_type=section.type,
-                expected_elements=expected_elements
-            )
-
+        for section, quality in zip(report.sections, qualities):
             section_scores[section.type] = quality.overall_score
 
             # Collect issues and recommendations
-            if quality.overall_score < self.min_quality_threshold:
+            if quality.overall_score < threshold:
                 all_issues.append(f"{section.title}: Score {quality.overall_score:.2f} below threshold")
                 all_recommendations.extend(quality.feedback)
 
@@ -443,14 +866,7 @@ class QualityValidator:
         overall_score = statistics.mean(section_scores.values()) if section_scores else 0.0
 
         # Determine if report passes
-        passed = overall_score >= self.min_quality_threshold
-
-        # Store in history
-        self.validation_history.append({
-            "timestamp": report.timestamp,
-            "overall_score": overall_score,
-            "passed": passed
-        })
+        passed = overall_score >= threshold
 
         return ValidationResult(
             overall_score=overall_score,
@@ -460,28 +876,46 @@ class QualityValidator:
             recommendations=all_recommendations[:5]  # Top 5 recommendations
         )
 
-    def _get_expected_elements_for_section(self, section_type: str) -> List[str]:
+    def expected_elements_for(self, section_type: str) -> List[str]:
         """Get expected elements for a section type."""
-        elements_map = {
-            "liability_assessment": ["liability", "breach", "duty", "causation"],
-            "damage_calculation": ["damages", "calculation", "compensation", "quantum"],
-            "prior_art_analysis": ["prior art", "patent", "novelty", "claims"],
-            "competitive_landscape": ["competitors", "market", "positioning", "advantage"],
-            "risk_assessment": ["risk", "probability", "impact", "mitigation"],
-            "strategic_recommendations": ["recommendation", "strategy", "implementation", "timeline"]
-        }
-        return elements_map.get(section_type, ["analysis", "assessment"])
+        return list(EXPECTED_ELEMENTS.get(section_type, DEFAULT_EXPECTED_ELEMENTS))
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Score cache effectiveness."""
+        with self._cache_lock:
+            lookups = self._cache_hits + self._cache_misses
+            return {
+                "size": len(self._score_cache),
+                "max_size": self.score_cache_size,
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "hit_rate": self._cache_hits / lookups if lookups else 0.0,
+                "breakdowns_reused": self._breakdowns_reused
+            }
 
     def get_quality_metrics(self) -> Dict[str, Any]:
         """Get quality metrics from validation history."""
+        if self.metrics_store:
+            recent_scores = self.metrics_store.samples("validation_score", limit=10)
+            recent_passed = self.metrics_store.samples("validation_passed", limit=10)
+            if not recent_scores:
+                return {"error": "No validation history available"}
+            return {
+                "total_validations": int(self.metrics_store.counter("validations")),
+                "recent_average_score": statistics.mean(recent_scores),
+                "recent_pass_rate": sum(recent_passed) / len(recent_passed),
+                "threshold": self.min_quality_threshold
+            }
+
         if not self.validation_history:
             return {"error": "No validation history available"}
 
-        recent = self.validation_history[-10:]  # Last 10 validations
+        recent = list(islice(reversed(self.validation_history), 10))  # Last 10 validations
 
         return {
-            "total_validations": len(self.validation_history),
+            "total_validations": self.validation_scores.count,
             "recent_average_score": statistics.mean([v["overall_score"] for v in recent]),
             "recent_pass_rate": sum(1 for v in recent if v["passed"]) / len(recent),
+            "validations_per_minute": self.validation_scores.rate() * 60,
             "threshold": self.min_quality_threshold
         }
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""
+Queue Worker for Legal Intelligence AI System
+=============================================
+Claims report tasks from a WorkQueue and runs them through the agent.
+
+Each claimed task is heartbeated while it runs. If the heartbeat finds the
+lease has been lost (the worker stalled past the visibility timeout and
+another worker reclaimed the task), the local run is cancelled so the two
+workers don't both spend model calls on it. A reclaimed report resumes
+from the sections the previous worker finished only when workers share
+CHECKPOINT_DIR (e.g. a network volume); with node-local checkpoint
+directories it starts over on the new node.
+
+Jobs carry the complaint text, so a worker needs no access to the API
+node's complaint store.
+"""
+
+import os
+import uuid
+import socket
+import asyncio
+import logging
+from typing import Dict, Any, Optional
+
+from .work_queue import WorkQueue, QueueTask
+from .tenant_scheduler import DEFAULT_TENANT
+from ..models.legal_models import LegalScenario
+
+logger = logging.getLogger(__name__)
+
+REPORT_TASK = "report"
+
+
+class QueueWorker:
+    """Pulls tasks from a WorkQueue and processes them with bounded concurrency."""
+
+    def __init__(
+        self,
+        queue: WorkQueue,
+        agent,
+        worker_id: Optional[str] = None,
+        concurrency: int = 1,
+        lease_seconds: float = 120.0,
+        heartbeat_interval: float = 30.0,
+        poll_interval: float = 1.0
+    ):
+        """
+        Args:
+            queue: Work queue shared with the API tier and other workers
+            agent: An initialized LegalIntelligenceAgent
+            worker_id: Identifier recorded on claimed tasks (default host:pid:random)
+            concurrency: Tasks processed at once by this worker
+            lease_seconds: Visibility timeout for a claimed task
+            heartbeat_interval: Seconds between lease extensions
+            poll_interval: Seconds to wait when the queue is empty
+        """
+        self.queue = queue
+        self.agent = agent
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.concurrency = max(1, concurrency)
+        self.lease_seconds = lease_seconds
+        self.heartbeat_interval = heartbeat_interval
+        self.poll_interval = poll_interval
+
+        self.processed = 0
+        self.failed = 0
+        self.leases_lost = 0
+
+    async def run_once(self) -> bool:
+        """Claim and process one task; returns False if the queue was empty."""
+        task = await asyncio.to_thread(self.queue.claim, self.worker_id, self.lease_seconds)
+        if task is None:
+            return False
+        await self._process(task)
+        return True
+
+    async def run(self, stop_event: Optional[asyncio.Event] = None) -> None:
+        """Process tasks until ``stop_event`` is set."""
+        stop_event = stop_event or asyncio.Event()
+        logger.info(f"Worker {self.worker_id} started (concurrency={self.concurrency})")
+
+        async def loop() -> None:
+            while not stop_event.is_set():
+                if not await self.run_once():
+                    try:
+                        await asyncio.wait_for(stop_event.wait(), timeout=self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+
+        await asyncio.gather(*(loop() for _ in range(self.concurrency)))
+        logger.info(f"Worker {self.worker_id} stopped")
+
+    async def _process(self, task: QueueTask) -> None:
+        logger.info(f"Worker {self.worker_id} claimed task {task.task_id} (attempt {task.attempts})")
+        work = asyncio.create_task(self._execute(task))
+        heartbeat = asyncio.create_task(self._heartbeat(task, work))
+        try:
+            result = await work
+        except asyncio.CancelledError:
+            if not heartbeat.done():
+                raise
+            # Cancelled by the heartbeat: another worker owns the task now
+            self.leases_lost += 1
+            logger.warning(f"Worker {self.worker_id} lost the lease on task {task.task_id}; abandoning it")
+            return
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"Task {task.task_id} failed: {str(e)}")
+            await asyncio.to_thread(self.queue.fail, task.task_id, task.lease_token, str(e))
+            return
+        finally:
+            heartbeat.cancel()
+
+        if await asyncio.to_thread(self.queue.complete, task.task_id, task.lease_token, result):
+            self.processed += 1
+        else:
+            self.leases_lost += 1
+            logger.warning(f"Result for task {task.task_id} discarded: lease was reclaimed")
+
+    async def _heartbeat(self, task: QueueTask, work: asyncio.Task) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            alive = await asyncio.to_thread(
+                self.queue.heartbeat, task.task_id, task.lease_token, self.lease_seconds
+            )
+            if not alive:
+                work.cancel()
+                return
+
+    async def _execute(self, task: QueueTask) -> Dict[str, Any]:
+        if task.kind != REPORT_TASK:
+            raise ValueError(f"Unsupported task kind: {task.kind}")
+        # Jobs carry the complaint text, even for a stored complaint
+        scenario = LegalScenario(**task.payload["scenario"])
+        report = await self.agent.generate_complete_report(
+            scenario, tenant_id=task.payload.get("tenant_id", DEFAULT_TENANT)
+        )
+        # The stored complaint is referred to by id rather than copied into the result
+        return report.dict(exclude={"scenario": {"complaint_text"}} if scenario.complaint_id else None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counts for this worker process."""
+        return {
+            "worker_id": self.worker_id,
+            "processed": self.processed,
+            "failed": self.failed,
+            "leases_lost": self.leases_lost
+        }
@@ -0,0 +1,115 @@
+"""
+Retry Gain Model for Legal Intelligence AI System
+=================================================
+Learns how much a quality retry actually improves a section.
+
+A retry regenerates the whole section, so it costs as much as the first
+attempt. Some failures do not respond to retrying: a section whose natural
+format has no lists keeps a low structure score however it is prompted.
+RetryGainModel records the change in overall score each retry produces,
+keyed by section type and the draft's weakest sub-score, and advises
+skipping retries whose expected gain is too small to be worth paying for.
+
+Until a key has ``min_samples`` observations retries always go ahead, and
+one in ``explore_every`` skipped retries still runs so that an estimate
+that has become stale can recover.
+"""
+
+import threading
+from typing import Dict, Any, Tuple
+
+from ..utils.telemetry import RollingMetric
+from .quality_validator import QualityScore
+
+# Sub-scores of QualityScore, in tie-break order
+SUB_SCORES = ("coherence", "groundedness", "completeness", "structure")
+
+
+def weakest_sub_score(quality: QualityScore) -> str:
+    """Name of the lowest sub-score, the one a retry's feedback mostly targets."""
+    return min(SUB_SCORES, key=lambda name: getattr(quality, f"{name}_score"))
+
+
+class RetryGainModel:
+    """Observed score gain per retry, by section type and weakest sub-score."""
+
+    def __init__(
+        self,
+        min_expected_gain: float = 0.02,
+        min_samples: int = 5,
+        window: int = 50,
+        explore_every: int = 10
+    ):
+        """
+        Args:
+            min_expected_gain: Smallest expected overall-score gain worth a retry (0 disables skipping)
+            min_samples: Observations of a key needed before any retry is skipped
+            window: Most recent observations used per key
+            explore_every: Run one in this many retries that would be skipped
+        """
+        self.min_expected_gain = min_expected_gain
+        self.min_samples = min_samples
+        self.window = window
+        self.explore_every = explore_every
+
+        self._lock = threading.Lock()
+        self._gains: Dict[Tuple[str, str], RollingMetric] = {}
+        self._skips_since_explore: Dict[Tuple[str, str], int] = {}
+
+        self.retries_skipped = 0
+        self.tokens_saved = 0
+
+    def record(self, section_type: str, before: QualityScore, after: QualityScore) -> None:
+        """Record the outcome of retrying a draft that scored ``before``."""
+        key = (section_type, weakest_sub_score(before))
+        with self._lock:
+            gains = self._gains.get(key)
+            if gains is None:
+                gains = self._gains[key] = RollingMetric(window=self.window)
+        gains.record(after.overall_score - before.overall_score)
+
+    def expected_gain(self, section_type: str, quality: QualityScore) -> Tuple[float, int]:
+        """Mean recent gain of retries like this one, and how many were observed."""
+        gains = self._gains.get((section_type, weakest_sub_score(quality)))
+        if gains is None:
+            return 0.0, 0
+        return gains.window_mean, len(gains)
+
+    def should_retry(self, section_type: str, quality: QualityScore) -> bool:
+        """Check whether retrying a draft with this score is expected to pay off."""
+        if self.min_expected_gain <= 0:
+            return True
+        gain, samples = self.expected_gain(section_type, quality)
+        if samples < self.min_samples or gain >= self.min_expected_gain:
+            return True
+
+        key = (section_type, weakest_sub_score(quality))
+        with self._lock:
+            skips = self._skips_since_explore.get(key, 0) + 1
+            if skips >= self.explore_every:
+                self._skips_since_explore[key] = 0
+                return True
+            self._skips_since_explore[key] = skips
+        return False
+
+    def record_skip(self, tokens_saved: int) -> None:
+        """Count a skipped retry and the tokens it would have used."""
+        with self._lock:
+            self.retries_skipped += 1
+            self.tokens_saved += tokens_saved
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Skipped retries, tokens saved and the learned gain per key."""
+        with self._lock:
+            keys = sorted(self._gains.items())
+            stats = {
+                "enabled": self.min_expected_gain > 0,
+                "min_expected_gain": self.min_expected_gain,
+                "retries_skipped": self.retries_skipped,
+                "estimated_tokens_saved": self.tokens_saved
+            }
+        stats["expected_gain"] = {
+            f"{section_type}:{sub_score}": {"retries": gains.count, "mean_gain": gains.window_mean}
+            for (section_type, sub_score), gains in keys
+        }
+        return stats
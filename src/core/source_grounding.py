@@ -0,0 +1,135 @@
+"""
+Source Grounding for Legal Intelligence AI System
+=================================================
+Measures how closely a section tracks the complaint it analyses.
+
+The validator's keyword lists reward generic legal vocabulary, so a section
+can score well while ignoring the actual parties, products and facts of the
+case. SourceIndex turns the complaint into a TF-IDF vector once per
+scenario. It then compares each section with the complaint twice: as a
+whole, by cosine similarity, and sentence by sentence, as the fraction of
+sentences that measurably echo the complaint.
+
+IDF is computed over the complaint's own sentences, so terms that recur
+throughout the complaint (the parties' names) weigh less than specific facts
+mentioned once. Section terms absent from the complaint get the highest IDF
+and only lengthen the section's vector. A section's words are grouped with
+np.unique, so only its distinct words are looked up in the complaint's
+vocabulary, and every sentence is scored from per-word arrays with
+np.bincount, so the cost is linear in the section's length.
+"""
+
+from dataclasses import dataclass
+from collections import Counter
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..utils.text_terms import STOPWORDS, WORD_PATTERN, content_terms
+from .content_profile import SENTENCE_PATTERN, MIN_SENTENCE_CHARS, ContentProfile
+
+_STOPWORD_ARRAY = np.array(sorted(STOPWORDS))
+
+# A sentence counts as echoing the complaint at this cosine similarity
+SENTENCE_MIN_SIMILARITY = 0.1
+
+
+@dataclass
+class SourceOverlap:
+    """How closely a section tracks its source text."""
+    similarity: float         # cosine of the section and source TF-IDF vectors
+    sentence_coverage: float  # fraction of the section's sentences that echo the source
+
+
+class SourceIndex:
+    """TF-IDF vector of one source text, for comparing many sections with it."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+        documents = [
+            content_terms(match.group()) for match in SENTENCE_PATTERN.finditer(text)
+            if len(match.group().strip()) > MIN_SENTENCE_CHARS
+        ]
+        documents = [terms for terms in documents if terms] or [content_terms(text)]
+        document_frequency = Counter(term for terms in documents for term in set(terms))
+        term_counts = Counter(content_terms(text))
+
+        self.vocabulary: Dict[str, int] = {term: column for column, term in enumerate(term_counts)}
+        total = len(documents)
+        self.idf = np.array(
+            [np.log((1 + total) / (1 + document_frequency[term])) + 1 for term in term_counts]
+        )
+        self.unseen_idf = float(np.log(1 + total) + 1)
+
+        weights = np.array(list(term_counts.values()), dtype=float) * self.idf
+        norm = np.linalg.norm(weights)
+        self.vector = weights / norm if norm else weights
+
+        # Vocabulary sorted for vectorized lookup, with each term's IDF x weight product
+        order = np.argsort(np.array(list(term_counts), dtype=str), kind="stable")
+        self._sorted_terms = np.array(list(term_counts), dtype=str)[order]
+        self._sorted_idf = self.idf[order]
+        self._sorted_products = (self.idf * self.vector)[order]
+
+    @property
+    def empty(self) -> bool:
+        return not self.vocabulary
+
+    def overlap(self, profile: ContentProfile) -> SourceOverlap:
+        """Compare a parsed section with the source text."""
+        if self.empty or not profile.tokens:
+            return SourceOverlap(similarity=0.0, sentence_coverage=0.0)
+
+        # Words of each sentence, split as ContentProfile does; fragments too
+        # short to be sentences share a last row
+        words: List[str] = []
+        lengths: List[int] = []
+        fragment_words: List[str] = []
+        for match in SENTENCE_PATTERN.finditer(profile.lowered):
+            unit = WORD_PATTERN.findall(match.group())
+            if len(match.group().strip()) > MIN_SENTENCE_CHARS:
+                lengths.append(len(unit))
+                words.extend(unit)
+            else:
+                fragment_words.extend(unit)
+        sentence_count = len(lengths)
+        lengths.append(len(fragment_words))
+        words.extend(fragment_words)
+        if not words:
+            return SourceOverlap(similarity=0.0, sentence_coverage=0.0)
+
+        # One column per distinct word, matched against the sorted vocabulary
+        distinct, columns = np.unique(np.array(words), return_inverse=True)
+        positions = np.minimum(np.searchsorted(self._sorted_terms, distinct), len(self._sorted_terms) - 1)
+        known = self._sorted_terms[positions] == distinct
+        idf = np.where(known, self._sorted_idf[positions], self.unseen_idf)
+        stop_positions = np.minimum(np.searchsorted(_STOPWORD_ARRAY, distinct), len(_STOPWORD_ARRAY) - 1)
+        idf[_STOPWORD_ARRAY[stop_positions] == distinct] = 0.0
+        products = np.where(known, self._sorted_products[positions], 0.0)
+
+        # Dot products with the source add up per word; norms need per-row term counts
+        units = sentence_count + 1
+        token_rows = np.repeat(np.arange(units), lengths)
+        dots = np.bincount(token_rows, weights=products[columns], minlength=units)
+        keys, counts = np.unique(token_rows * len(distinct) + columns, return_counts=True)
+        squares = np.bincount(
+            keys // len(distinct), weights=(counts * idf[keys % len(distinct)]) ** 2, minlength=units
+        )
+
+        # Sentences, then the whole section
+        section_counts = np.bincount(columns, minlength=len(distinct))
+        dots = np.append(dots[:sentence_count], dots.sum())
+        norms = np.sqrt(np.append(squares[:sentence_count], np.sum((section_counts * idf) ** 2)))
+        similarities = np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+
+        coverage = float(np.mean(similarities[:-1] >= SENTENCE_MIN_SIMILARITY)) if sentence_count else 0.0
+        return SourceOverlap(similarity=float(similarities[-1]), sentence_coverage=coverage)
+
+
+def build_source_index(text: Optional[str]) -> Optional[SourceIndex]:
+    """Index of text, or None when it has nothing to compare against."""
+    if not text:
+        return None
+    index = SourceIndex(text)
+    return None if index.empty else index
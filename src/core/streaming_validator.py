@@ -0,0 +1,271 @@
+"""
+Streaming Quality Validation for Legal Intelligence AI System
+=============================================================
+Scores a section while the model is still writing it.
+
+IncrementalQualityScorer consumes streamed text chunks and keeps every count
+the validator's scoring tiers read (paragraphs, sentences and their lengths,
+words, header lines and phrase hits) up to date in time proportional to
+each chunk. features() is exactly what QualityValidator would compute for
+the text received so far.
+
+projected_score() extrapolates those counts to the section's expected final
+length. The extrapolation errs high: distinct-phrase counts grow linearly
+until they hit their list's size, a conclusion is assumed to come, and when
+the final score will include overlap with the complaint the section is
+assumed to track it fully. A draft is only abandoned when even that
+projection is clearly below the threshold, so the orchestrator can restart
+it before paying for the rest.
+"""
+
+import re
+from typing import List, Optional, Set
+
+from .content_profile import MIN_SENTENCE_CHARS
+from .keyword_engine import TOKEN_PATTERN
+from .quality_validator import QualityScore, QualityValidator, SectionFeatures
+
+# Sentence-ending punctuation; sentences are the runs between these
+TERMINATOR_PATTERN = re.compile(r"[.!?]")
+
+
+class _TextRun:
+    """A line, sentence or whole text whose statistics are updated as parts arrive."""
+
+    __slots__ = ("length", "leading", "trailing", "has_text", "words", "in_word", "first_char", "case")
+
+    def __init__(self):
+        self.length = 0
+        self.leading = 0           # whitespace before the first non-space character
+        self.trailing = 0          # whitespace after the last non-space character
+        self.has_text = False
+        self.words = 0
+        self.in_word = False       # the last part ended mid-word
+        self.first_char = ""
+        self.case = "uncased"      # "uncased", "upper" (str.isupper() holds) or "other"
+
+    def add(self, part: str) -> None:
+        if not part:
+            return
+        if not self.first_char:
+            self.first_char = part[0]
+        self.length += len(part)
+
+        right = part.rstrip()
+        if right:
+            if not self.has_text:
+                self.leading += len(part) - len(part.lstrip())
+                self.has_text = True
+            self.trailing = len(part) - len(right)
+        elif self.has_text:
+            self.trailing += len(part)
+        else:
+            self.leading += len(part)
+
+        words = len(part.split())
+        if words and self.in_word and not part[0].isspace():
+            words -= 1  # the first word continues the previous part's last word
+        self.words += words
+        self.in_word = not part[-1].isspace()
+
+        if self.case != "other":
+            if part.isupper():
+                self.case = "upper"
+            elif part.lower() != part.upper():
+                self.case = "other"
+
+    @property
+    def stripped_length(self) -> int:
+        return self.length - self.leading - self.trailing if self.has_text else 0
+
+
+class IncrementalQualityScorer:
+    """Running quality score for one section's streamed output."""
+
+    def __init__(
+        self,
+        validator: QualityValidator,
+        section_type: str,
+        expected_elements: List[str],
+        expected_words: int = 1500,
+        source_grounded: bool = False
+    ):
+        """
+        Args:
+            validator: Validator whose phrase lists and tiers are used
+            section_type: Type of section being generated
+            expected_elements: Elements the section should cover
+            expected_words: Expected final length, for projections
+            source_grounded: The final score will blend in overlap with the
+                complaint (validate_section with source_text)
+        """
+        self.validator = validator
+        self.section_type = section_type
+        self.expected_elements = list(expected_elements)
+        self.expected_words = expected_words
+        self.source_grounded = source_grounded
+
+        # Phrase hits; text after the last whitespace waits until the word is complete
+        self._keywords = validator._get_matcher(self.expected_elements).stream()
+        self._partial_word = ""
+
+        self._text = _TextRun()
+
+        # Paragraphs follow str.split('\n\n'): a "\n" left unmatched at the
+        # end of one chunk may pair with a "\n" starting the next
+        self._paragraph_count = 0
+        self._paragraph_has_text = False
+        self._newline_pending = False
+
+        self._sentence = _TextRun()
+        self._sentence_count = 0
+        self._sentence_lengths: Set[int] = set()
+
+        self._line = _TextRun()
+        self._has_headers = False
+
+        self.chunks = 0
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next streamed chunk."""
+        if not chunk:
+            return
+        self.chunks += 1
+        self._text.add(chunk)
+
+        # Phrase hits, over complete words only
+        text = self._partial_word + chunk
+        cut = len(text)
+        while cut and not text[cut - 1].isspace():
+            cut -= 1
+        if cut:
+            self._keywords.feed(TOKEN_PATTERN.findall(text[:cut].lower()))
+        self._partial_word = text[cut:]
+
+        # Paragraphs
+        pieces = (("\n" if self._newline_pending else "") + chunk).split("\n\n")
+        for index, piece in enumerate(pieces):
+            if index:
+                if self._paragraph_has_text:
+                    self._paragraph_count += 1
+                self._paragraph_has_text = False
+            if not self._paragraph_has_text and piece.strip():
+                self._paragraph_has_text = True
+        self._newline_pending = pieces[-1].endswith("\n")
+
+        # Sentences
+        pieces = TERMINATOR_PATTERN.split(chunk)
+        self._sentence.add(pieces[0])
+        for piece in pieces[1:]:
+            self._close_sentence()
+            self._sentence = _TextRun()
+            self._sentence.add(piece)
+
+        # Lines
+        pieces = chunk.split("\n")
+        self._line.add(pieces[0])
+        for piece in pieces[1:]:
+            self._has_headers = self._has_headers or self._is_header(self._line)
+            self._line = _TextRun()
+            self._line.add(piece)
+
+    def _close_sentence(self) -> None:
+        if self._sentence.stripped_length > MIN_SENTENCE_CHARS:
+            self._sentence_count += 1
+            self._sentence_lengths.add(self._sentence.words)
+
+    @staticmethod
+    def _is_header(line: _TextRun) -> bool:
+        return line.has_text and (line.case == "upper" or line.first_char == "#")
+
+    @property
+    def word_count(self) -> int:
+        return self._text.words
+
+    def features(self) -> SectionFeatures:
+        """Features of the text received so far, as if the stream ended now."""
+        hits = self._keywords.hits(TOKEN_PATTERN.findall(self._partial_word.lower()))
+
+        sentence_count = self._sentence_count
+        sentence_lengths = self._sentence_lengths
+        if self._sentence.stripped_length > MIN_SENTENCE_CHARS:
+            sentence_count += 1
+            sentence_lengths = sentence_lengths | {self._sentence.words}
+
+        return self.validator.features_from_counts(
+            hits,
+            self.section_type,
+            self.expected_elements,
+            paragraph_count=self._paragraph_count + (1 if self._paragraph_has_text else 0),
+            sentence_count=sentence_count,
+            distinct_sentence_lengths=len(sentence_lengths),
+            word_count=self._text.words,
+            has_headers=self._has_headers or self._is_header(self._line)
+        )
+
+    def score(self) -> QualityScore:
+        """Score of the text received so far."""
+        return self.validator.score_features(self.features(), self.section_type, self.expected_elements)
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the expected length received."""
+        if self.expected_words <= 0:
+            return 1.0
+        return min(self._text.words / self.expected_words, 1.0)
+
+    def projected_features(self) -> SectionFeatures:
+        """Features extrapolated to the expected final length."""
+        features = self.features()
+        if self.source_grounded:
+            # Best case: the rest of the section tracks the complaint closely
+            features.source_similarity = 1.0
+            features.source_coverage = 1.0
+        progress = self.progress
+        if progress >= 1.0 or progress <= 0.0:
+            return features
+        scale = 1.0 / progress
+        validator = self.validator
+
+        def grow(count: float, limit: int) -> float:
+            return min(count * scale, limit)
+
+        sentence_count = features.sentence_count * scale
+        return SectionFeatures(
+            paragraph_count=features.paragraph_count * scale,
+            sentence_count=sentence_count,
+            distinct_sentence_lengths=min(features.distinct_sentence_lengths * scale, sentence_count),
+            word_count=features.word_count * scale,
+            # Headers and lists open a structured section; a conclusion closes it
+            has_headers=features.has_headers,
+            has_lists=features.has_lists,
+            has_conclusion=True,
+            connector_count=grow(features.connector_count, len(validator.LOGICAL_CONNECTORS)),
+            structure_marker_count=grow(features.structure_marker_count, len(validator.STRUCTURE_MARKERS)),
+            keyword_count=grow(features.keyword_count, len(validator.SECTION_KEYWORDS.get(self.section_type, []))),
+            reasoning_count=grow(features.reasoning_count, len(validator.REASONING_PHRASES)),
+            elements_present=grow(features.elements_present, len(self.expected_elements)),
+            elements_grounded=grow(features.elements_grounded, len(self.expected_elements)),
+            source_similarity=features.source_similarity,
+            source_coverage=features.source_coverage
+        )
+
+    def projected_score(self) -> QualityScore:
+        """Score the section is heading for at its expected final length."""
+        return self.validator.score_features(self.projected_features(), self.section_type, self.expected_elements)
+
+    def should_abort(self, threshold: float, margin: float = 0.1, min_progress: float = 0.35) -> Optional[QualityScore]:
+        """
+        The projection, if the draft is clearly heading below threshold; otherwise None.
+
+        Args:
+            threshold: Quality score the section must reach
+            margin: How far below threshold the projection must be
+            min_progress: Fraction of the expected length to see before judging
+        """
+        if self.progress < min_progress:
+            return None
+        projection = self.projected_score()
+        if projection.overall_score < threshold - margin:
+            return projection
+        return None
@@ -0,0 +1,339 @@
+"""
+Tenant Scheduling for Legal Intelligence AI System
+==================================================
+Shares the model-call limit fairly between tenants (API clients).
+
+Model calls wait in a per-tenant FIFO queue and are granted slots by
+deficit round robin: each turn a tenant earns ``quantum`` tokens of credit
+and may start calls whose estimated token cost fits in its credit. A client
+submitting a large backfill therefore gets the same share of model capacity
+as any other busy tenant instead of all of it.
+
+Each tenant may also have:
+- a concurrency cap on its in-flight model calls
+- a token-rate quota (token bucket); a tenant that has spent its bucket is
+  not scheduled until it refills, and new requests are turned away with a
+  Retry-After
+
+Limits are enforced per process; with several server workers, divide the
+configured rates by the worker count.
+
+Tenant ids come from clients, so their state is bounded: at most
+``max_tenants`` are tracked, and once full the least recently seen idle
+tenant without quota debt and without configured limits is forgotten.
+Fleet-wide usage counters are kept per configured tenant; every other
+tenant is counted under ``OTHER_TENANTS``.
+"""
+
+import math
+import time
+import logging
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Callable, Deque
+
+from ..utils.metrics_store import SharedMetricsStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TENANT = "default"
+OTHER_TENANTS = "other"
+
+
+@dataclass
+class TenantLimits:
+    """Per-tenant limits; None means unlimited."""
+    max_concurrency: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+
+
+class TokenBucket:
+    """Token-rate quota. Usage is charged after the fact, so the level can go negative."""
+
+    def __init__(self, tokens_per_minute: int, clock: Callable[[], float] = time.monotonic):
+        self.capacity = float(tokens_per_minute)
+        self.rate = tokens_per_minute / 60.0
+        self.level = self.capacity
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def available(self) -> float:
+        self._refill()
+        return self.level
+
+    def charge(self, tokens: float) -> None:
+        self._refill()
+        self.level -= tokens
+
+    def seconds_until_available(self) -> float:
+        """Seconds until the bucket is positive again (0 if it already is)."""
+        level = self.available()
+        if level > 0:
+            return 0.0
+        return (-level) / self.rate if self.rate > 0 else math.inf
+
+
+@dataclass
+class _Waiter:
+    tenant_id: str
+    cost: float
+    event: threading.Event = field(default_factory=threading.Event)
+    granted: bool = False
+
+
+@dataclass
+class _TenantState:
+    limits: TenantLimits
+    bucket: Optional[TokenBucket]
+    queue: Deque[_Waiter] = field(default_factory=deque)
+    deficit: float = 0.0
+    in_turn: bool = False
+    active: int = 0
+    calls: int = 0
+    tokens_used: int = 0
+    throttled: int = 0
+    wait_seconds: float = 0.0
+
+
+class FairScheduler:
+    """Deficit-round-robin scheduling of model calls across tenants."""
+
+    def __init__(
+        self,
+        total_slots: int,
+        quantum: float = 4096,
+        default_limits: Optional[TenantLimits] = None,
+        tenant_limits: Optional[Dict[str, TenantLimits]] = None,
+        metrics_store: Optional[SharedMetricsStore] = None,
+        poll_interval: float = 0.1,
+        max_tenants: int = 1000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            total_slots: Model calls allowed in flight at once, across all tenants
+            quantum: Token credit a tenant earns per scheduling turn
+            default_limits: Limits for tenants without an explicit entry
+            tenant_limits: Limits for specific tenants
+            metrics_store: Optional shared store for fleet-wide tenant usage
+            poll_interval: How often a waiting call rechecks quotas and cancellation
+            max_tenants: Most tenants whose state is kept in memory
+            clock: Monotonic time source for quotas (injectable for tests)
+        """
+        self.total_slots = max(1, total_slots)
+        self.quantum = quantum
+        self.default_limits = default_limits or TenantLimits()
+        self.tenant_limits = tenant_limits or {}
+        self.metrics_store = metrics_store
+        self.poll_interval = poll_interval
+        self.max_tenants = max(1, max_tenants)
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._tenants: "OrderedDict[str, _TenantState]" = OrderedDict()
+        self._ring: Deque[str] = deque()
+        self._in_use = 0
+
+    def _tenant(self, tenant_id: str) -> _TenantState:
+        state = self._tenants.get(tenant_id)
+        if state is None:
+            limits = self.tenant_limits.get(tenant_id, self.default_limits)
+            bucket = TokenBucket(limits.tokens_per_minute, clock=self._clock) if limits.tokens_per_minute else None
+            state = _TenantState(limits=limits, bucket=bucket)
+            self._tenants[tenant_id] = state
+            if len(self._tenants) > self.max_tenants:
+                self._evict_idle(keep=tenant_id)
+        else:
+            self._tenants.move_to_end(tenant_id)
+        return state
+
+    def _evict_idle(self, keep: str) -> None:
+        """Forget the least recently seen tenant that can be recreated unchanged. Caller holds the lock."""
+        for tenant_id, state in self._tenants.items():
+            if tenant_id == keep or self.is_known(tenant_id) or state.queue or state.active or tenant_id in self._ring:
+                continue
+            # A tenant still paying off quota must not get a fresh bucket
+            if state.bucket is not None and state.bucket.available() < state.bucket.capacity:
+                continue
+            del self._tenants[tenant_id]
+            return
+
+    def is_known(self, tenant_id: str) -> bool:
+        """Whether the tenant has configured limits (or is the default tenant)."""
+        return tenant_id == DEFAULT_TENANT or tenant_id in self.tenant_limits
+
+    def _eligible(self, state: _TenantState) -> bool:
+        if state.limits.max_concurrency is not None and state.active >= state.limits.max_concurrency:
+            return False
+        if state.bucket is not None and state.bucket.available() <= 0:
+            return False
+        return True
+
+    def _dispatch(self) -> None:
+        """Grant free slots to waiting calls in deficit-round-robin order. Caller holds the lock."""
+        while self._in_use < self.total_slots and self._ring:
+            progressed = False
+            for _ in range(len(self._ring)):
+                if self._in_use >= self.total_slots:
+                    return
+                tenant_id = self._ring[0]
+                state = self._tenants[tenant_id]
+
+                if not state.queue:
+                    self._ring.popleft()
+                    state.deficit = 0.0
+                    state.in_turn = False
+                    continue
+                if not self._eligible(state):
+                    state.in_turn = False
+                    self._ring.rotate(-1)
+                    continue
+
+                if not state.in_turn:
+                    state.deficit += self.quantum
+                    state.in_turn = True
+                    progressed = True
+
+                waiter = state.queue[0]
+                if waiter.cost <= state.deficit:
+                    state.queue.popleft()
+                    state.deficit -= waiter.cost
+                    state.active += 1
+                    self._in_use += 1
+                    waiter.granted = True
+                    waiter.event.set()
+                    progressed = True
+                    # Tenant keeps its turn while credit lasts
+                    break
+
+                # Out of credit: end the turn and move to the back of the ring
+                state.in_turn = False
+                self._ring.rotate(-1)
+
+            if not progressed:
+                return
+
+    def acquire(
+        self,
+        tenant_id: str,
+        cost: float = 1.0,
+        cancel_event: Optional[threading.Event] = None,
+        timeout: Optional[float] = None
+    ) -> bool:
+        """
+        Wait for a model-call slot for ``tenant_id``.
+
+        Args:
+            tenant_id: Tenant making the call
+            cost: Estimated tokens the call will use
+            cancel_event: Stop waiting once this is set
+            timeout: Longest time to wait, in seconds
+
+        Returns:
+            True once a slot is held (pair with release()), False if the wait
+            was cancelled or timed out
+        """
+        waiter = _Waiter(tenant_id=tenant_id, cost=cost)
+        queued_at = time.monotonic()
+        with self._lock:
+            state = self._tenant(tenant_id)
+            state.queue.append(waiter)
+            if tenant_id not in self._ring:
+                self._ring.append(tenant_id)
+            self._dispatch()
+            if not waiter.granted and not self._eligible(state):
+                state.throttled += 1
+
+        give_up_at = queued_at + timeout if timeout is not None else None
+        while not waiter.event.is_set():
+            if cancel_event and cancel_event.is_set():
+                break
+            wait = self.poll_interval
+            if give_up_at is not None:
+                remaining = give_up_at - time.monotonic()
+                if remaining <= 0:
+                    break
+                wait = min(wait, remaining)
+            if not waiter.event.wait(wait):
+                # Quotas refill over time, so waiting tenants may have become eligible
+                with self._lock:
+                    self._dispatch()
+
+        with self._lock:
+            state.wait_seconds += time.monotonic() - queued_at
+            if waiter.granted:
+                if cancel_event and cancel_event.is_set():
+                    self._release_locked(state)
+                    return False
+                return True
+            state.queue.remove(waiter)
+            return False
+
+    def release(self, tenant_id: str) -> None:
+        """Return a slot taken by acquire()."""
+        with self._lock:
+            self._release_locked(self._tenants[tenant_id])
+
+    def _release_locked(self, state: _TenantState) -> None:
+        state.active = max(0, state.active - 1)
+        self._in_use = max(0, self._in_use - 1)
+        self._dispatch()
+
+    def record_usage(self, tenant_id: str, tokens: int) -> None:
+        """Charge a completed call's tokens to the tenant."""
+        with self._lock:
+            state = self._tenant(tenant_id)
+            state.calls += 1
+            state.tokens_used += tokens
+            if state.bucket is not None:
+                state.bucket.charge(tokens)
+        if self.metrics_store:
+            label = tenant_id if self.is_known(tenant_id) else OTHER_TENANTS
+            self.metrics_store.increment(f"tenant_calls:{label}")
+            self.metrics_store.increment(f"tenant_tokens:{label}", tokens)
+
+    def quota_retry_after(self, tenant_id: str) -> Optional[int]:
+        """Seconds until the tenant's quota allows new work, or None if it already does."""
+        with self._lock:
+            state = self._tenant(tenant_id)
+            if state.bucket is None:
+                return None
+            wait = state.bucket.seconds_until_available()
+        return max(1, math.ceil(wait)) if wait > 0 else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Slot usage and per-tenant usage."""
+        fleet = {}
+        if self.metrics_store:
+            for name, value in self.metrics_store.counters().items():
+                kind, _, tenant_id = name.partition(":")
+                if kind in ("tenant_calls", "tenant_tokens") and tenant_id:
+                    fleet.setdefault(tenant_id, {})[kind] = int(value)
+
+        with self._lock:
+            tenants = {}
+            for tenant_id in set(self._tenants) | set(fleet):
+                state = self._tenants.get(tenant_id)
+                totals = fleet.get(tenant_id, {})
+                tenants[tenant_id] = {
+                    "active_calls": state.active if state else 0,
+                    "waiting_calls": len(state.queue) if state else 0,
+                    "calls": totals.get("tenant_calls", state.calls if state else 0),
+                    "tokens_used": totals.get("tenant_tokens", state.tokens_used if state else 0),
+                    "throttled": state.throttled if state else 0,
+                    "wait_seconds": state.wait_seconds if state else 0.0,
+                    "max_concurrency": state.limits.max_concurrency if state else None,
+                    "tokens_per_minute": state.limits.tokens_per_minute if state else None,
+                    "quota_remaining": state.bucket.available() if state and state.bucket else None
+                }
+            return {
+                "total_slots": self.total_slots,
+                "slots_in_use": self._in_use,
+                "tenants": tenants
+            }
@@ -0,0 +1,236 @@
+"""
+Validation Pool for Legal Intelligence AI System
+================================================
+Runs quality validation off the event loop.
+
+Scoring a section is pure CPU work: parsing, keyword matching and comparing
+it with the complaint. Called directly from a coroutine it stalls every
+other request served by the same event loop for as long as it runs.
+ValidationPool hands that work to a small, fixed-size thread pool and
+awaits the result, so the loop keeps serving other requests meanwhile.
+
+Background quality checks are not urgent. They are collected for up to
+``batch_window`` seconds, or until ``batch_size`` are waiting, and validated
+together as one pool job. When too many are already waiting, or the caller's
+load check reports the server is saturated, new checks are dropped and
+counted instead of queued.
+
+With ``max_workers=0`` validation runs inline on the loop thread, as it did
+before. Either way the time spent is measured: ``loop_blocked`` is the time
+the loop thread itself spent validating, ``offloaded`` the time pool
+threads spent.
+"""
+
+import time
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, List, Optional, Tuple, Union
+
+from ..models.legal_models import AnalysisReport
+from ..utils.telemetry import RollingMetric
+from .quality_validator import QualityScore, QualityValidator, ValidationResult
+
+logger = logging.getLogger(__name__)
+
+
+class ValidationPool:
+    """Validates sections and reports on worker threads; micro-batches background checks."""
+
+    def __init__(
+        self,
+        validator: QualityValidator,
+        max_workers: int = 2,
+        batch_size: int = 16,
+        batch_window: float = 0.05,
+        max_pending: int = 256,
+        load_check: Optional[Callable[[], bool]] = None,
+        telemetry_window: int = 1000
+    ):
+        """
+        Args:
+            validator: Validator to run; it must be safe to call from several threads
+            max_workers: Worker threads (0 validates inline on the event loop)
+            batch_size: Most background checks validated in one pool job
+            batch_window: Seconds a background check waits for others to batch with
+            max_pending: Background checks queued or running before new ones are shed
+            load_check: Returns True while the server is too busy for background checks
+            telemetry_window: Most recent samples kept for timing statistics
+        """
+        self.validator = validator
+        self.max_workers = max_workers
+        self.batch_size = max(1, batch_size)
+        self.batch_window = batch_window
+        self.max_pending = max_pending
+        self.load_check = load_check
+        self._executor = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="validation")
+            if max_workers > 0 else None
+        )
+
+        # Background checks waiting for a batch, and the task draining them
+        self._pending: List[Tuple[AnalysisReport, asyncio.Future]] = []
+        self._batch: List[Tuple[AnalysisReport, asyncio.Future]] = []
+        self._in_flight = 0
+        self._drain_task: Optional[asyncio.Task] = None
+        self._batch_full: Optional[asyncio.Event] = None
+
+        # Timing and counters
+        self.loop_blocked = RollingMetric(window=telemetry_window)
+        self.offloaded = RollingMetric(window=telemetry_window)
+        self.queue_wait = RollingMetric(window=telemetry_window)
+        self.batch_sizes = RollingMetric(window=telemetry_window)
+        self.background_shed = 0
+
+    async def validate_section(
+        self,
+        content: str,
+        section_type: str,
+        expected_elements: List[str],
+        source_text: Optional[str] = None
+    ) -> QualityScore:
+        """QualityValidator.validate_section, off the event loop."""
+        return await self._run(
+            self.validator.validate_section, content, section_type, expected_elements, source_text
+        )
+
+    async def validate_report(self, report: AnalysisReport, trust_breakdowns: bool = False) -> ValidationResult:
+        """QualityValidator.validate_report, off the event loop."""
+        return await self._run(self.validator.validate_report, report, trust_breakdowns)
+
+    async def check_in_background(self, report: AnalysisReport) -> Optional[ValidationResult]:
+        """
+        Validate a generated report as part of a micro-batch.
+
+        Returns None when the check is shed. Sections carry their
+        generation-time scores, so breakdowns are trusted.
+        """
+        if self._should_shed():
+            self.background_shed += 1
+            logger.info(
+                f"Shedding background quality check for {report.scenario.case_name} "
+                f"({len(self._pending) + self._in_flight} pending)"
+            )
+            return None
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((report, future))
+        if len(self._pending) >= self.batch_size and self._batch_full is not None:
+            self._batch_full.set()
+
+        # The queue is drained batch by batch in a task of its own, so a
+        # cancelled caller only stops waiting for its own result
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain())
+            self._drain_task.add_done_callback(self._drain_done)
+        return await future
+
+    def _should_shed(self) -> bool:
+        if len(self._pending) + self._in_flight >= self.max_pending:
+            return True
+        if self.load_check is not None:
+            try:
+                return bool(self.load_check())
+            except Exception as e:
+                logger.warning(f"Validation load check failed: {str(e)}")
+        return False
+
+    async def _drain(self) -> None:
+        self._batch_full = asyncio.Event()
+        while self._pending:
+            if len(self._pending) < self.batch_size:
+                self._batch_full.clear()
+                try:
+                    await asyncio.wait_for(self._batch_full.wait(), self.batch_window)
+                except asyncio.TimeoutError:
+                    pass
+
+            # Checks whose callers gave up are not worth validating
+            self._pending = [entry for entry in self._pending if not entry[1].done()]
+            self._batch = self._pending[:self.batch_size]
+            del self._pending[:self.batch_size]
+            if not self._batch:
+                continue
+            self._in_flight += len(self._batch)
+            self.batch_sizes.record(len(self._batch))
+            try:
+                results = await self._run(self._validate_batch, [report for report, _ in self._batch])
+            except Exception as e:
+                results = [e] * len(self._batch)
+            finally:
+                self._in_flight -= len(self._batch)
+
+            for (_, future), result in zip(self._batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+            self._batch = []
+
+    def _drain_done(self, task: asyncio.Task) -> None:
+        """Fail checks a cancelled or crashed drain left behind, so no caller waits forever."""
+        # A drain that finished normally left nothing behind, and a newer
+        # drain may already own the queue
+        if not task.cancelled() and task.exception() is None:
+            return
+        for _, future in self._batch + self._pending:
+            if not future.done():
+                future.set_exception(RuntimeError("Background validation stopped"))
+        self._batch = []
+        self._pending.clear()
+        self._batch_full = None
+
+    def _validate_batch(self, reports: List[AnalysisReport]) -> List[Union[ValidationResult, Exception]]:
+        """Validate reports one by one; one failing report does not fail the batch."""
+        results: List[Union[ValidationResult, Exception]] = []
+        for report in reports:
+            try:
+                results.append(self.validator.validate_report(report, trust_breakdowns=True))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    async def _run(self, function: Callable, *args):
+        if self._executor is None:
+            started = time.perf_counter()
+            try:
+                return function(*args)
+            finally:
+                self.loop_blocked.record(time.perf_counter() - started)
+
+        submitted = time.perf_counter()
+
+        def timed():
+            started = time.perf_counter()
+            self.queue_wait.record(started - submitted)
+            try:
+                return function(*args)
+            finally:
+                self.offloaded.record(time.perf_counter() - started)
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, timed)
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once their current jobs finish."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Time spent validating on and off the event loop, batching and shedding."""
+        return {
+            "workers": self.max_workers,
+            "loop_blocked_seconds": self.loop_blocked.total,
+            "loop_blocked": self.loop_blocked.snapshot(),
+            "offloaded_seconds": self.offloaded.total,
+            "offloaded": self.offloaded.snapshot(),
+            "queue_wait": self.queue_wait.snapshot(),
+            "background": {
+                "queued": len(self._pending),
+                "in_flight": self._in_flight,
+                "batches": self.batch_sizes.count,
+                "mean_batch_size": self.batch_sizes.mean,
+                "shed": self.background_shed
+            }
+        }
@@ -0,0 +1,427 @@
+"""
+Durable Work Queue for Legal Intelligence AI System
+===================================================
+Hands analysis work from the API tier to worker processes on any node.
+
+Tasks are claimed with a lease: the claiming worker gets a lease token and
+must heartbeat before the lease's visibility timeout expires. If a worker
+crashes, its lease lapses and the task becomes claimable by another worker.
+Results are only accepted from the current lease holder.
+
+Two backends share one interface:
+- SQLiteWorkQueue: a single node (any number of worker processes)
+- RedisWorkQueue: many nodes sharing a Redis-compatible server
+"""
+
+import json
+import time
+import uuid
+import sqlite3
+import logging
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueueTask:
+    """A unit of work in the queue."""
+    task_id: str
+    kind: str
+    payload: Dict[str, Any]
+    status: str
+    attempts: int = 0
+    lease_token: Optional[str] = None
+    lease_expires_at: Optional[float] = None
+    worker_id: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: float = 0.0
+    updated_at: float = 0.0
+
+
+class WorkQueue(ABC):
+    """
+    Interface for lease-based work queues.
+
+    Task status moves pending -> leased -> completed, or back to pending when
+    a lease expires or a failure is retried, and to failed after
+    ``max_attempts`` claims.
+    """
+
+    def __init__(self, max_attempts: int = 3):
+        self.max_attempts = max_attempts
+
+    @abstractmethod
+    def enqueue(self, kind: str, payload: Dict[str, Any], task_id: Optional[str] = None) -> str:
+        """Add a task and return its id."""
+
+    @abstractmethod
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[QueueTask]:
+        """Lease the oldest claimable task, or return None if there is none."""
+
+    @abstractmethod
+    def heartbeat(self, task_id: str, lease_token: str, lease_seconds: float) -> bool:
+        """Extend a lease; False means the lease was lost to another worker."""
+
+    @abstractmethod
+    def complete(self, task_id: str, lease_token: str, result: Dict[str, Any]) -> bool:
+        """Store a result; rejected (False) unless the caller holds the lease."""
+
+    @abstractmethod
+    def fail(self, task_id: str, lease_token: str, error: str, retry: bool = True) -> bool:
+        """Release a task after an error, requeueing it if attempts remain."""
+
+    @abstractmethod
+    def get(self, task_id: str) -> Optional[QueueTask]:
+        """Look up a task by id."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        """Count tasks by status."""
+
+
+class SQLiteWorkQueue(WorkQueue):
+    """Work queue in a SQLite file, shared by worker processes on one node."""
+
+    def __init__(self, db_path: str, max_attempts: int = 3):
+        super().__init__(max_attempts)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=30.0, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                task_id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_token TEXT,
+                lease_expires_at REAL,
+                worker_id TEXT,
+                result TEXT,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_tasks_claim ON tasks (status, lease_expires_at, created_at);
+        """)
+
+    def _row_to_task(self, row: sqlite3.Row) -> QueueTask:
+        return QueueTask(
+            task_id=row["task_id"],
+            kind=row["kind"],
+            payload=json.loads(row["payload"]),
+            status=row["status"],
+            attempts=row["attempts"],
+            lease_token=row["lease_token"],
+            lease_expires_at=row["lease_expires_at"],
+            worker_id=row["worker_id"],
+            result=json.loads(row["result"]) if row["result"] else None,
+            error=row["error"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"]
+        )
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], task_id: Optional[str] = None) -> str:
+        task_id = task_id or uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO tasks (task_id, kind, payload, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, 'pending', ?, ?)",
+                (task_id, kind, json.dumps(payload, default=str), now, now)
+            )
+        return task_id
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[QueueTask]:
+        now = time.time()
+        with self._lock:
+            # BEGIN IMMEDIATE takes the write lock, so only one process claims at a time
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Leases that lapsed on their final attempt are given up on
+                self._conn.execute(
+                    "UPDATE tasks SET status = 'failed', error = 'lease expired on final attempt', "
+                    "lease_token = NULL, updated_at = ? "
+                    "WHERE status = 'leased' AND lease_expires_at < ? AND attempts >= ?",
+                    (now, now, self.max_attempts)
+                )
+                row = self._conn.execute(
+                    "SELECT * FROM tasks WHERE status = 'pending' "
+                    "OR (status = 'leased' AND lease_expires_at < ?) "
+                    "ORDER BY created_at LIMIT 1",
+                    (now,)
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+
+                if row["status"] == "leased":
+                    logger.warning(f"Reclaiming task {row['task_id']} from expired worker {row['worker_id']}")
+
+                token = uuid.uuid4().hex
+                self._conn.execute(
+                    "UPDATE tasks SET status = 'leased', attempts = attempts + 1, lease_token = ?, "
+                    "lease_expires_at = ?, worker_id = ?, updated_at = ? WHERE task_id = ?",
+                    (token, now + lease_seconds, worker_id, now, row["task_id"])
+                )
+                claimed = self._conn.execute(
+                    "SELECT * FROM tasks WHERE task_id = ?", (row["task_id"],)
+                ).fetchone()
+                self._conn.execute("COMMIT")
+                return self._row_to_task(claimed)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def heartbeat(self, task_id: str, lease_token: str, lease_seconds: float) -> bool:
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE tasks SET lease_expires_at = ?, updated_at = ? "
+                "WHERE task_id = ? AND lease_token = ? AND status = 'leased'",
+                (now + lease_seconds, now, task_id, lease_token)
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, task_id: str, lease_token: str, result: Dict[str, Any]) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE tasks SET status = 'completed', result = ?, lease_token = NULL, "
+                "lease_expires_at = NULL, updated_at = ? "
+                "WHERE task_id = ? AND lease_token = ? AND status = 'leased'",
+                (json.dumps(result, default=str), time.time(), task_id, lease_token)
+            )
+        return cursor.rowcount == 1
+
+    def fail(self, task_id: str, lease_token: str, error: str, retry: bool = True) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE tasks SET status = CASE WHEN ? AND attempts < ? THEN 'pending' ELSE 'failed' END, "
+                "error = ?, lease_token = NULL, lease_expires_at = NULL, updated_at = ? "
+                "WHERE task_id = ? AND lease_token = ? AND status = 'leased'",
+                (1 if retry else 0, self.max_attempts, error, time.time(), task_id, lease_token)
+            )
+        return cursor.rowcount == 1
+
+    def get(self, task_id: str) -> Optional[QueueTask]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return self._row_to_task(row) if row else None
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RedisWorkQueue(WorkQueue):
+    """
+    Work queue on a Redis-compatible server, shared by workers on many nodes.
+
+    Layout (``ns`` is the key namespace):
+    - ``ns:task:<id>``  hash with the task fields
+    - ``ns:pending``    list of claimable ids (LPUSH to enqueue, oldest at the right)
+    - ``ns:processing`` list of leased ids
+    - ``ns:leases``     sorted set of leased ids scored by lease expiry
+
+    Claim, heartbeat and release each run as one Lua script, so no crash or
+    interleaving can leave an id in ``processing`` without a lease, or let a
+    heartbeat extend a lease another worker has taken. Claiming first
+    returns expired leases to ``pending``, along with any id left in
+    ``processing`` without a lease (e.g. by a release of this queue that
+    predates the scripts). The claim script builds task keys from the
+    namespace, so on Redis Cluster put the namespace in one hash slot
+    (e.g. ``{legal-intelligence}:queue``).
+    """
+
+    # KEYS: pending, processing, leases
+    # ARGV: now, lease expiry, lease token, worker id, max attempts, task key prefix
+    # Returns the claimed id ("" if none), then the ids reclaimed from expired leases
+    CLAIM_SCRIPT = """
+local pending, processing, leases = KEYS[1], KEYS[2], KEYS[3]
+local now, prefix = tonumber(ARGV[1]), ARGV[6]
+for _, id in ipairs(redis.call('LRANGE', processing, 0, -1)) do
+    if not redis.call('ZSCORE', leases, id) then
+        redis.call('ZADD', leases, 0, id)
+    end
+end
+local result = {''}
+for _, id in ipairs(redis.call('ZRANGEBYSCORE', leases, '-inf', now)) do
+    redis.call('ZREM', leases, id)
+    redis.call('LREM', processing, 0, id)
+    local key = prefix .. id
+    if tonumber(redis.call('HGET', key, 'attempts') or '0') >= tonumber(ARGV[5]) then
+        redis.call('HSET', key, 'status', 'failed', 'error', 'lease expired on final attempt',
+            'lease_token', '', 'updated_at', ARGV[1])
+    else
+        redis.call('HSET', key, 'status', 'pending', 'lease_token', '', 'updated_at', ARGV[1])
+        redis.call('RPUSH', pending, id)
+        table.insert(result, id)
+    end
+end
+local id = redis.call('RPOPLPUSH', pending, processing)
+if id then
+    local key = prefix .. id
+    redis.call('ZADD', leases, ARGV[2], id)
+    redis.call('HINCRBY', key, 'attempts', 1)
+    redis.call('HSET', key, 'status', 'leased', 'lease_token', ARGV[3], 'lease_expires_at', ARGV[2],
+        'worker_id', ARGV[4], 'updated_at', ARGV[1])
+    result[1] = id
+end
+return result
+"""
+
+    # KEYS: task key, leases; ARGV: task id, lease token, lease expiry, now
+    HEARTBEAT_SCRIPT = """
+if redis.call('HGET', KEYS[1], 'lease_token') ~= ARGV[2] or not redis.call('ZSCORE', KEYS[2], ARGV[1]) then
+    return 0
+end
+redis.call('ZADD', KEYS[2], ARGV[3], ARGV[1])
+redis.call('HSET', KEYS[1], 'lease_expires_at', ARGV[3], 'updated_at', ARGV[4])
+return 1
+"""
+
+    # KEYS: task key, leases, processing, pending
+    # ARGV: task id, lease token, now, status, retry (1/0), max attempts, field, value
+    # A failed task with attempts left goes back to pending
+    FINISH_SCRIPT = """
+if redis.call('HGET', KEYS[1], 'lease_token') ~= ARGV[2] or redis.call('ZREM', KEYS[2], ARGV[1]) == 0 then
+    return 0
+end
+redis.call('LREM', KEYS[3], 0, ARGV[1])
+local status = ARGV[4]
+if status == 'failed' and ARGV[5] == '1'
+        and tonumber(redis.call('HGET', KEYS[1], 'attempts') or '0') < tonumber(ARGV[6]) then
+    status = 'pending'
+    redis.call('LPUSH', KEYS[4], ARGV[1])
+end
+redis.call('HSET', KEYS[1], 'status', status, 'lease_token', '', 'updated_at', ARGV[3], ARGV[7], ARGV[8])
+return 1
+"""
+
+    def __init__(self, client, namespace: str = "legal-intelligence:queue", max_attempts: int = 3):
+        """
+        Args:
+            client: A redis-py compatible client created with decode_responses=True
+            namespace: Prefix for every key this queue uses
+            max_attempts: Claims allowed before a task is marked failed
+        """
+        super().__init__(max_attempts)
+        self.client = client
+        self.namespace = namespace
+        self._pending = f"{namespace}:pending"
+        self._processing = f"{namespace}:processing"
+        self._leases = f"{namespace}:leases"
+        self._statuses = ("pending", "leased", "completed", "failed")
+        self._claim_script = client.register_script(self.CLAIM_SCRIPT)
+        self._heartbeat_script = client.register_script(self.HEARTBEAT_SCRIPT)
+        self._finish_script = client.register_script(self.FINISH_SCRIPT)
+
+    def _task_key(self, task_id: str) -> str:
+        return f"{self.namespace}:task:{task_id}"
+
+    def _hash_to_task(self, task_id: str, data: Dict[str, str]) -> QueueTask:
+        return QueueTask(
+            task_id=task_id,
+            kind=data["kind"],
+            payload=json.loads(data["payload"]),
+            status=data["status"],
+            attempts=int(data.get("attempts", 0)),
+            lease_token=data.get("lease_token") or None,
+            lease_expires_at=float(data["lease_expires_at"]) if data.get("lease_expires_at") else None,
+            worker_id=data.get("worker_id") or None,
+            result=json.loads(data["result"]) if data.get("result") else None,
+            error=data.get("error") or None,
+            created_at=float(data["created_at"]),
+            updated_at=float(data["updated_at"])
+        )
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], task_id: Optional[str] = None) -> str:
+        task_id = task_id or uuid.uuid4().hex
+        now = time.time()
+        self.client.hset(self._task_key(task_id), mapping={
+            "kind": kind,
+            "payload": json.dumps(payload, default=str),
+            "status": "pending",
+            "attempts": 0,
+            "created_at": now,
+            "updated_at": now
+        })
+        self.client.lpush(self._pending, task_id)
+        return task_id
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[QueueTask]:
+        now = time.time()
+        claimed, *reclaimed = self._claim_script(
+            keys=[self._pending, self._processing, self._leases],
+            args=[
+                now, now + lease_seconds, uuid.uuid4().hex, worker_id, self.max_attempts,
+                f"{self.namespace}:task:"
+            ]
+        )
+        for task_id in reclaimed:
+            logger.warning(f"Reclaimed task {task_id} after its lease expired")
+        if not claimed:
+            return None
+        return self._hash_to_task(claimed, self.client.hgetall(self._task_key(claimed)))
+
+    def heartbeat(self, task_id: str, lease_token: str, lease_seconds: float) -> bool:
+        now = time.time()
+        return bool(self._heartbeat_script(
+            keys=[self._task_key(task_id), self._leases],
+            args=[task_id, lease_token, now + lease_seconds, now]
+        ))
+
+    def _finish(self, task_id: str, lease_token: str, status: str, field: str, value: str, retry: bool) -> bool:
+        """Give up a held lease and record the outcome; True only for the current holder."""
+        return bool(self._finish_script(
+            keys=[self._task_key(task_id), self._leases, self._processing, self._pending],
+            args=[task_id, lease_token, time.time(), status, 1 if retry else 0, self.max_attempts, field, value]
+        ))
+
+    def complete(self, task_id: str, lease_token: str, result: Dict[str, Any]) -> bool:
+        return self._finish(task_id, lease_token, "completed", "result", json.dumps(result, default=str), False)
+
+    def fail(self, task_id: str, lease_token: str, error: str, retry: bool = True) -> bool:
+        return self._finish(task_id, lease_token, "failed", "error", error, retry)
+
+    def get(self, task_id: str) -> Optional[QueueTask]:
+        data = self.client.hgetall(self._task_key(task_id))
+        return self._hash_to_task(task_id, data) if data else None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pending": self.client.llen(self._pending),
+            "leased": self.client.zcard(self._leases)
+        }
+
+
+def create_work_queue(backend: str, location: str, max_attempts: int = 3) -> WorkQueue:
+    """
+    Build a work queue from configuration.
+
+    Args:
+        backend: "sqlite" or "redis"
+        location: SQLite file path, or Redis URL (e.g. redis://host:6379/0)
+        max_attempts: Claims allowed before a task is marked failed
+    """
+    if backend == "sqlite":
+        return SQLiteWorkQueue(location, max_attempts=max_attempts)
+    if backend == "redis":
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("QUEUE_BACKEND=redis requires the 'redis' package (pip install redis)")
+        return RedisWorkQueue(redis.Redis.from_url(location, decode_responses=True), max_attempts=max_attempts)
+    raise ValueError(f"Unknown queue backend: {backend}")
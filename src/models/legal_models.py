@@ -4,6 +4,8 @@ Data Models for Legal Intelligence AI System
 Pydantic models for request/response validation and data structures.
 """
 
+import hashlib
+import json
 from typing import List, Dict, Optional, Any
 from pydantic import BaseModel, Field
 from datetime import datetime
@@ -32,7 +34,10 @@ class CaseType(str, Enum):
 class LegalScenario(BaseModel):
     """Represents a legal case scenario for analysis."""
     case_name: str = Field(..., description="Name/identifier of the case")
-    complaint_text: str = Field(..., description="Full text of the legal complaint")
+    complaint_text: str = Field(
+        "", description="Full text of the legal complaint; empty when it is referred to by complaint_id"
+    )
+    complaint_id: Optional[str] = Field(None, description="Id of the complaint in the complaint store")
     case_type: str = Field(..., description="Type of legal case")
     filing_date: str = Field(..., description="Date of filing")
     parties_involved: List[str] = Field(default_factory=list, description="Parties in the case")
@@ -54,6 +59,21 @@ class LegalScenario(BaseModel):
             }
         }
 
+    def content_hash(self) -> str:
+        """Stable hash of the case content, ignoring per-request fields like filing_date."""
+        content = {
+            "case_name": self.case_name,
+            "complaint_text": self.complaint_text,
+            "case_type": self.case_type,
+            "urgency_level": self.urgency_level,
+            "additional_context": self.additional_context
+        }
+        if self.complaint_id:
+            # Stored complaint ids are content hashes, so the id stands in for the text
+            content["complaint_id"] = self.complaint_id
+        payload = json.dumps(content, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
 
 class TokenUsage(BaseModel):
     """Token usage tracking for cost calculation."""
@@ -62,6 +82,18 @@ class TokenUsage(BaseModel):
     total_tokens: int = Field(..., description="Total tokens used")
 
 
+class SectionQuality(BaseModel):
+    """Quality score breakdown for a section, as computed when it was validated."""
+    overall_score: float = Field(..., description="Weighted overall quality score")
+    coherence_score: float = Field(..., description="Logical flow and depth score")
+    groundedness_score: float = Field(..., description="Domain terminology and evidence score")
+    completeness_score: float = Field(..., description="Expected-element coverage score")
+    structure_score: float = Field(..., description="Paragraph and formatting score")
+    feedback: List[str] = Field(default_factory=list, description="Improvement suggestions")
+    content_hash: str = Field(..., description="SHA-256 of the content that was scored")
+    rules_version: str = Field(..., description="Version of the scoring rules that produced the scores")
+
+
 class ReportSection(BaseModel):
     """A single section of the analysis report."""
     type: str = Field(..., description="Section type identifier")
@@ -72,6 +104,9 @@ class ReportSection(BaseModel):
     tokens_used: int = Field(..., description="Tokens used for this section")
     cost: float = Field(..., description="Cost for generating this section")
     timestamp: str = Field(..., description="When this section was generated")
+    quality_breakdown: Optional[SectionQuality] = Field(
+        None, description="Full quality breakdown from generation-time validation"
+    )
 
 
 class AnalysisReport(BaseModel):
@@ -0,0 +1,387 @@
+"""
+Prompt Assembler for Legal Intelligence AI System
+=================================================
+Builds section prompts from precompiled static segments.
+
+Most of a section prompt never changes between calls: the persona, the
+reasoning instructions, the task line and the section instructions. The
+assembler renders those once per (persona, section type) when it is
+created and fills in the case details, complaint and previous sections
+per call, joining all segments in one pass. Complaints longer than the
+token budget are quoted as the passages most relevant to the section
+(see passage_retrieval), and very long ones as their case digest when the
+agent has built one (see case_digest). With ``minimize_boilerplate`` set,
+captions, line numbers, running headers, signature blocks and certificates
+of service are stripped from the complaint first (see complaint_minimizer).
+
+Every assembled prompt is also measured segment by segment (bytes and
+estimated tokens), so ``get_stats`` shows where prompt length, and input
+token spend, comes from.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
+
+from ..models.legal_models import LegalScenario, ReportSection
+from ..utils.complaint_minimizer import REMOVAL_CATEGORIES, MinimizedComplaint, minimize_complaint
+from ..utils.passage_retrieval import ComplaintIndex, retrieval_terms
+from .personas import LegalPersonas
+
+# Same estimate the agent uses for scheduling: ~4 characters per token
+CHARS_PER_TOKEN = 4
+
+# Previous sections quoted as context, and how much of each
+PREVIOUS_SECTIONS = 2
+PREVIOUS_SECTION_CHARS = 500
+
+# Longer complaints are quoted as their most relevant passages, within this budget
+COMPLAINT_TOKEN_BUDGET = 500
+MAX_CACHED_COMPLAINTS = 32
+
+REASONING_INSTRUCTIONS = """
+REASONING INSTRUCTIONS:
+You must use step-by-step reasoning to analyze this legal case. Structure your analysis as follows:
+1. First, identify the key legal issues
+2. Second, analyze the relevant facts
+3. Third, apply legal principles
+4. Finally, provide your conclusions
+
+Think through each step carefully before moving to the next.
+"""
+
+SECTION_INSTRUCTIONS = {
+    "liability_assessment": """
+Analyze liability by:
+- Identifying each potential claim
+- Evaluating strength of evidence
+- Assessing probability of success (use percentages)
+- Citing relevant precedents or legal principles
+""",
+    "damage_calculation": """
+Calculate potential damages by:
+- Identifying categories of damages (actual, statutory, punitive)
+- Providing specific dollar ranges
+- Explaining calculation methodology
+- Considering mitigation factors
+""",
+    "prior_art_analysis": """
+Analyze prior art and precedents by:
+- Identifying relevant existing patents/IP
+- Assessing validity challenges
+- Evaluating obviousness arguments
+- Determining freedom to operate
+""",
+    "competitive_landscape": """
+Analyze competitive implications by:
+- Identifying key competitors affected
+- Assessing market position changes
+- Evaluating licensing opportunities
+- Predicting competitor responses
+""",
+    "risk_assessment": """
+Assess risks by:
+- Identifying legal risks (probability and impact)
+- Evaluating business risks
+- Analyzing reputational risks
+- Providing risk mitigation strategies
+""",
+    "strategic_recommendations": """
+Provide strategic recommendations by:
+- Outlining 3-5 specific action items
+- Prioritizing by impact and urgency
+- Estimating resource requirements
+- Defining success metrics
+"""
+}
+
+DEFAULT_SECTION_INSTRUCTIONS = "Provide comprehensive analysis for this section."
+
+# Segment names, in prompt order; static ones are rendered once per persona and section type
+SEGMENTS = ("persona", "reasoning", "previous_sections", "task", "case_details", "complaint", "instructions")
+STATIC_SEGMENTS = ("persona", "reasoning", "task", "instructions")
+VARIABLE_SEGMENTS = ("previous_sections", "case_details", "complaint")
+
+
+@dataclass(frozen=True)
+class CompiledPrompt:
+    """Static segments of the prompts for one persona and section type, with their sizes."""
+    persona: str
+    reasoning: str
+    task: str
+    instructions: str
+    sizes: Tuple[Tuple[int, int], ...]  # (bytes, estimated tokens) of each of STATIC_SEGMENTS
+
+
+def _size(text: str) -> Tuple[int, int]:
+    """Bytes and estimated tokens of a segment."""
+    size = len(text) if text.isascii() else len(text.encode("utf-8"))
+    return size, len(text) // CHARS_PER_TOKEN
+
+
+def compile_prompt(persona: str, section_type: str) -> CompiledPrompt:
+    """Render the segments that do not depend on the case."""
+    reasoning = "\n\n" + REASONING_INSTRUCTIONS
+    task = f"\n\nTASK: Provide a {section_type.replace('_', ' ')} for the following legal case:\n\n"
+    instructions = SECTION_INSTRUCTIONS.get(section_type, DEFAULT_SECTION_INSTRUCTIONS)
+    return CompiledPrompt(
+        persona=persona,
+        reasoning=reasoning,
+        task=task,
+        instructions=instructions,
+        sizes=tuple(_size(text) for text in (persona, reasoning, task, instructions))
+    )
+
+
+class PromptAssembler:
+    """Joins precompiled static segments with per-case content; profiles segment sizes."""
+
+    def __init__(
+        self,
+        personas: Optional[LegalPersonas] = None,
+        section_queries: Optional[Dict[str, List[str]]] = None,
+        complaint_token_budget: int = COMPLAINT_TOKEN_BUDGET,
+        minimize_boilerplate: bool = False,
+        max_cached_complaints: int = MAX_CACHED_COMPLAINTS
+    ):
+        """
+        Args:
+            personas: Personas to precompile prompts for (all section types each)
+            section_queries: Terms each section type looks for in long complaints
+            complaint_token_budget: Most estimated tokens of complaint quoted per prompt
+            minimize_boilerplate: Strip pleading boilerplate from complaints before quoting them
+            max_cached_complaints: Complaints whose minimized text and passage index are kept
+        """
+        self.complaint_token_budget = complaint_token_budget
+        self.minimize_boilerplate = minimize_boilerplate
+        self.max_cached_complaints = max_cached_complaints
+        self._queries: Dict[str, List[str]] = {
+            section_type: retrieval_terms(" ".join(terms))
+            for section_type, terms in (section_queries or {}).items()
+        }
+        self._complaint_indexes: "OrderedDict[str, ComplaintIndex]" = OrderedDict()
+        self._index_lock = threading.Lock()
+        self.complaints_indexed = 0
+        self.complaints_excerpted = 0
+        self.digests_quoted = 0
+        self._minimized: "OrderedDict[str, MinimizedComplaint]" = OrderedDict()
+        self.complaints_minimized = 0
+        self.boilerplate_tokens_saved = 0
+        self.boilerplate_removed = {name: 0 for name in REMOVAL_CATEGORIES}
+
+        self._compiled: Dict[Tuple[str, str], CompiledPrompt] = {}
+        if personas is not None:
+            for persona in personas.personas.values():
+                for section_type in SECTION_INSTRUCTIONS:
+                    self._compiled[(persona, section_type)] = compile_prompt(persona, section_type)
+
+        # Prompts built from each set of static segment sizes, and per-call
+        # totals of the variable segments, indexed like VARIABLE_SEGMENTS
+        self._lock = threading.Lock()
+        self.prompts = 0
+        self._static_uses: Dict[Tuple[Tuple[int, int], ...], int] = {}
+        self._included = [0] * len(VARIABLE_SEGMENTS)
+        self._bytes = [0] * len(VARIABLE_SEGMENTS)
+        self._tokens = [0] * len(VARIABLE_SEGMENTS)
+        self._max_bytes = [0] * len(VARIABLE_SEGMENTS)
+
+    def compiled(self, persona: str, section_type: str) -> CompiledPrompt:
+        """Precompiled segments; personas extended with feedback are rendered on the fly."""
+        compiled = self._compiled.get((persona, section_type))
+        return compiled if compiled is not None else compile_prompt(persona, section_type)
+
+    def segments(
+        self,
+        persona: str,
+        section_type: str,
+        scenario: LegalScenario,
+        previous_sections: List[ReportSection],
+        complaint_digest: Optional[str] = None,
+        complaint_text: Optional[str] = None,
+        complaint_minimized: bool = False
+    ) -> List[Tuple[str, str]]:
+        """The prompt as (segment name, text) pairs, in SEGMENTS order."""
+        compiled = self.compiled(persona, section_type)
+        if complaint_text is None:
+            complaint_text = scenario.complaint_text
+        texts = (
+            compiled.persona,
+            compiled.reasoning,
+            _previous_sections(previous_sections),
+            compiled.task,
+            _case_details(scenario),
+            self._complaint(complaint_text, section_type, complaint_digest, complaint_minimized),
+            compiled.instructions
+        )
+        return list(zip(SEGMENTS, texts))
+
+    def assemble(
+        self,
+        persona: str,
+        section_type: str,
+        scenario: LegalScenario,
+        previous_sections: List[ReportSection],
+        complaint_digest: Optional[str] = None,
+        complaint_text: Optional[str] = None,
+        complaint_minimized: bool = False
+    ) -> str:
+        """
+        Build a section prompt and record its segment sizes; a case digest replaces the complaint.
+
+        ``complaint_text`` is quoted instead of the scenario's own, for a
+        scenario that refers to a stored complaint by id. With
+        ``complaint_minimized`` it has already had its boilerplate stripped
+        (see minimized()) and is quoted as given.
+        """
+        compiled = self.compiled(persona, section_type)
+        previous = _previous_sections(previous_sections)
+        case_details = _case_details(scenario)
+        if complaint_text is None:
+            complaint_text = scenario.complaint_text
+        complaint = self._complaint(complaint_text, section_type, complaint_digest, complaint_minimized)
+
+        self._record(compiled.sizes, (_size(previous), _size(case_details), _size(complaint)))
+        return "".join((
+            compiled.persona, compiled.reasoning, previous, compiled.task,
+            case_details, complaint, compiled.instructions
+        ))
+
+    def complaint_excerpt(self, complaint_text: str, section_type: str) -> str:
+        """The complaint, or the passages most relevant to the section when it exceeds the budget."""
+        if len(complaint_text) // CHARS_PER_TOKEN <= self.complaint_token_budget:
+            return complaint_text
+
+        query = self._queries.get(section_type) or retrieval_terms(section_type.replace("_", " "))
+        excerpt = self.complaint_index(complaint_text).excerpt(query, self.complaint_token_budget)
+        with self._index_lock:
+            self.complaints_excerpted += 1
+        return excerpt
+
+    def minimized(self, complaint_text: str) -> MinimizedComplaint:
+        """The complaint without pleading boilerplate, computed once and kept for its other sections."""
+        with self._index_lock:
+            result = self._minimized.get(complaint_text)
+            if result is not None:
+                self._minimized.move_to_end(complaint_text)
+                return result
+
+        result = minimize_complaint(complaint_text)
+        with self._index_lock:
+            self._minimized[complaint_text] = result
+            self.complaints_minimized += 1
+            self.boilerplate_tokens_saved += result.tokens_saved
+            for name, removed in result.removed.items():
+                self.boilerplate_removed[name] += removed
+            while len(self._minimized) > self.max_cached_complaints:
+                self._minimized.popitem(last=False)
+        return result
+
+    def complaint_index(self, complaint_text: str) -> ComplaintIndex:
+        """Passage index of a complaint, built once and kept for its other sections."""
+        with self._index_lock:
+            index = self._complaint_indexes.get(complaint_text)
+            if index is not None:
+                self._complaint_indexes.move_to_end(complaint_text)
+                return index
+
+        index = ComplaintIndex(complaint_text)
+        with self._index_lock:
+            self._complaint_indexes[complaint_text] = index
+            self.complaints_indexed += 1
+            while len(self._complaint_indexes) > self.max_cached_complaints:
+                self._complaint_indexes.popitem(last=False)
+        return index
+
+    def _complaint(
+        self,
+        complaint_text: str,
+        section_type: str,
+        complaint_digest: Optional[str] = None,
+        complaint_minimized: bool = False
+    ) -> str:
+        if complaint_digest:
+            with self._index_lock:
+                self.digests_quoted += 1
+            return f"Case Digest (summarized from the full complaint):\n{complaint_digest}\n\n"
+        if self.minimize_boilerplate and not complaint_minimized:
+            complaint_text = self.minimized(complaint_text).text
+        return f"Complaint Summary:\n{self.complaint_excerpt(complaint_text, section_type)}\n\n"
+
+    def _record(self, static_sizes: Tuple[Tuple[int, int], ...], variable_sizes: Tuple[Tuple[int, int], ...]) -> None:
+        with self._lock:
+            self.prompts += 1
+            self._static_uses[static_sizes] = self._static_uses.get(static_sizes, 0) + 1
+            index = 0
+            for size, tokens in variable_sizes:
+                if size:
+                    self._included[index] += 1
+                    self._bytes[index] += size
+                    self._tokens[index] += tokens
+                    if size > self._max_bytes[index]:
+                        self._max_bytes[index] = size
+                index += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Mean bytes and estimated tokens per prompt for each segment, and its share of the prompt."""
+        totals = {name: [0, 0, 0, 0] for name in SEGMENTS}
+        with self._lock:
+            prompts = self.prompts
+            for sizes, uses in self._static_uses.items():
+                for name, (size, tokens) in zip(STATIC_SEGMENTS, sizes):
+                    segment = totals[name]
+                    segment[0] += uses if size else 0
+                    segment[1] += size * uses
+                    segment[2] += tokens * uses
+                    segment[3] = max(segment[3], size)
+            for index, name in enumerate(VARIABLE_SEGMENTS):
+                totals[name] = [self._included[index], self._bytes[index], self._tokens[index], self._max_bytes[index]]
+
+        all_bytes = sum(size for _, size, _, _ in totals.values())
+        with self._index_lock:
+            retrieval = {
+                "complaint_token_budget": self.complaint_token_budget,
+                "complaints_indexed": self.complaints_indexed,
+                "prompts_with_excerpts": self.complaints_excerpted,
+                "prompts_with_digests": self.digests_quoted
+            }
+            boilerplate = {
+                "enabled": self.minimize_boilerplate,
+                "complaints_minimized": self.complaints_minimized,
+                "tokens_saved": self.boilerplate_tokens_saved,
+                "removed_chars": dict(self.boilerplate_removed)
+            }
+        return {
+            "prompts": prompts,
+            "mean_bytes": all_bytes / prompts if prompts else 0.0,
+            "complaint_retrieval": retrieval,
+            "boilerplate": boilerplate,
+            "segments": {
+                name: {
+                    "included": included,
+                    "mean_bytes": size / prompts if prompts else 0.0,
+                    "mean_tokens": tokens / prompts if prompts else 0.0,
+                    "max_bytes": largest,
+                    "share": size / all_bytes if all_bytes else 0.0
+                }
+                for name, (included, size, tokens, largest) in totals.items()
+            }
+        }
+
+
+def _previous_sections(previous_sections: List[ReportSection]) -> str:
+    if not previous_sections:
+        return ""
+    parts = ["\n\nPREVIOUS ANALYSIS:\n"]
+    for section in previous_sections[-PREVIOUS_SECTIONS:]:
+        parts.append(f"\n{section.title}:\n{section.content[:PREVIOUS_SECTION_CHARS]}...\n")
+    return "".join(parts)
+
+
+def _case_details(scenario: LegalScenario) -> str:
+    return (
+        f"Case Name: {scenario.case_name}\n"
+        f"Case Type: {scenario.case_type}\n"
+        f"Key Issues: {', '.join(scenario.key_issues)}\n"
+        f"Urgency: {scenario.urgency_level}\n\n"
+    )
@@ -0,0 +1,150 @@
+"""
+Section Checkpoint Store for Legal Intelligence AI System
+========================================================
+Durable, file-based checkpoints of completed report sections.
+
+Every section that passes quality validation is written to
+``<checkpoint_dir>/<scenario_hash>/<section_type>.json`` as soon as it is
+generated, so a retried or resumed analysis of the same scenario can skip the
+sections it already paid for.
+
+A report that never completes leaves its checkpoints behind. Scenario
+directories untouched for ``max_age_seconds`` are removed when the store
+opens and, at most once per ``sweep_interval``, as new sections are saved.
+"""
+
+import os
+import json
+import time
+import shutil
+import logging
+import tempfile
+from typing import Dict, List, Optional
+
+from ..models.legal_models import ReportSection
+
+logger = logging.getLogger(__name__)
+
+
+class SectionCheckpointStore:
+    """Persists validated report sections keyed by scenario hash."""
+
+    def __init__(
+        self,
+        checkpoint_dir: str,
+        max_age_seconds: Optional[float] = 7 * 24 * 3600,
+        sweep_interval: float = 3600.0
+    ):
+        """
+        Create the checkpoint directory if it does not exist.
+
+        Args:
+            checkpoint_dir: Directory holding one subdirectory per scenario
+            max_age_seconds: Age after which an abandoned scenario's checkpoints
+                are removed (None or 0 keeps them forever)
+            sweep_interval: Least time between sweeps for expired checkpoints
+        """
+        self.checkpoint_dir = checkpoint_dir
+        self.max_age_seconds = max_age_seconds or None
+        self.sweep_interval = sweep_interval
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        self._last_sweep = 0.0
+        self.remove_expired()
+
+    def _scenario_dir(self, scenario_hash: str) -> str:
+        return os.path.join(self.checkpoint_dir, scenario_hash)
+
+    def _section_path(self, scenario_hash: str, section_type: str) -> str:
+        return os.path.join(self._scenario_dir(scenario_hash), f"{section_type}.json")
+
+    def save_section(self, scenario_hash: str, section: ReportSection) -> None:
+        """Atomically write a completed section to disk."""
+        directory = self._scenario_dir(scenario_hash)
+        os.makedirs(directory, exist_ok=True)
+
+        # Write to a temp file and rename so a crash never leaves a partial checkpoint
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(section.model_dump_json())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._section_path(scenario_hash, section.type))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        logger.debug(f"Checkpointed section {section.type} for scenario {scenario_hash[:12]}")
+
+        if time.monotonic() - self._last_sweep >= self.sweep_interval:
+            self.remove_expired()
+
+    def load_section(self, scenario_hash: str, section_type: str) -> Optional[ReportSection]:
+        """Load a checkpointed section, or None if missing or unreadable."""
+        path = self._section_path(scenario_hash, section_type)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return ReportSection(**json.load(f))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable checkpoint {path}: {str(e)}")
+            return None
+
+    def load_completed_prefix(self, scenario_hash: str, section_types: List[str]) -> List[ReportSection]:
+        """
+        Load checkpointed sections in generation order up to the first missing one.
+
+        Later sections are chained on earlier ones, so anything after a gap
+        must be regenerated anyway.
+        """
+        sections = []
+        for section_type in section_types:
+            section = self.load_section(scenario_hash, section_type)
+            if section is None:
+                break
+            sections.append(section)
+        return sections
+
+    def list_sections(self, scenario_hash: str) -> Dict[str, str]:
+        """Map checkpointed section types to their file paths."""
+        directory = self._scenario_dir(scenario_hash)
+        if not os.path.isdir(directory):
+            return {}
+        return {
+            name[:-len(".json")]: os.path.join(directory, name)
+            for name in os.listdir(directory)
+            if name.endswith(".json")
+        }
+
+    def clear(self, scenario_hash: str) -> None:
+        """Remove all checkpoints for a scenario."""
+        shutil.rmtree(self._scenario_dir(scenario_hash), ignore_errors=True)
+
+    def remove_expired(self) -> int:
+        """Remove scenarios whose newest checkpoint is older than max_age_seconds; return how many."""
+        self._last_sweep = time.monotonic()
+        if self.max_age_seconds is None:
+            return 0
+
+        cutoff = time.time() - self.max_age_seconds
+        removed = 0
+        for entry in os.scandir(self.checkpoint_dir):
+            if not entry.is_dir():
+                continue
+            try:
+                newest = max(
+                    [entry.stat().st_mtime] + [child.stat().st_mtime for child in os.scandir(entry.path)]
+                )
+            except OSError:
+                # Removed by another process meanwhile
+                continue
+            if newest < cutoff:
+                shutil.rmtree(entry.path, ignore_errors=True)
+                removed += 1
+
+        if removed:
+            logger.info(f"Removed checkpoints of {removed} abandoned scenarios")
+        return removed
@@ -0,0 +1,362 @@
+"""
+Complaint Extractor for Legal Intelligence AI System
+====================================================
+Extracts parties, dollar amounts, dates, patent numbers, statutes and
+issue terms from a complaint in one linear pass.
+
+Every rule is compiled into a single regular expression with one named
+group per kind of entity, and the issue terms and statute names of all
+case types' gazetteers are compiled into character tries inside it. One
+``finditer`` over the text therefore finds everything, and the cost does
+not grow with the number of terms. Matches never span a blank line, so a
+complaint streamed in paragraph blocks (see ``ExtractionStream``) yields
+the same result as the whole text.
+
+Parties are found throughout the complaint, not just in its opening
+lines. A caption line such as ``TECHCORP INC., Plaintiff,`` (the role may
+be on the next line) and a role followed by a name (``defendant
+DataSystems LLC``) both count.
+
+Results are memoized by complaint hash, which equals the complaint store
+id, so repeat analyses of a complaint reuse the extraction.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from ..models.legal_models import CaseType
+from .text_terms import complaint_hash
+
+# Issue terms by case type, in the order key issues are listed
+ISSUE_GAZETTEERS: Dict[str, Tuple[str, ...]] = {
+    CaseType.INTELLECTUAL_PROPERTY.value: ("patent", "trademark", "copyright", "trade secret", "infringement"),
+    CaseType.CONTRACT.value: ("breach", "performance", "termination", "damages"),
+    CaseType.CORPORATE.value: (
+        "fiduciary duty", "shareholder", "merger", "securities fraud", "self dealing", "corporate waste"
+    ),
+    CaseType.ANTITRUST.value: (
+        "monopolization", "price fixing", "market allocation", "bid rigging", "tying", "exclusive dealing"
+    ),
+    CaseType.EMPLOYMENT.value: (
+        "discrimination", "harassment", "retaliation", "wrongful termination", "overtime", "hostile work environment"
+    ),
+    CaseType.REGULATORY.value: ("enforcement action", "civil penalty", "consent decree", "violation", "compliance"),
+}
+
+# Statute names by case type; all are looked for, whatever the case type
+STATUTE_GAZETTEERS: Dict[str, Tuple[str, ...]] = {
+    CaseType.INTELLECTUAL_PROPERTY.value: (
+        "Patent Act", "Lanham Act", "Copyright Act", "Digital Millennium Copyright Act",
+        "Defend Trade Secrets Act", "Uniform Trade Secrets Act"
+    ),
+    CaseType.CONTRACT.value: ("Uniform Commercial Code", "Statute of Frauds"),
+    CaseType.CORPORATE.value: (
+        "Securities Act", "Securities Exchange Act", "Sarbanes-Oxley Act", "Dodd-Frank Act",
+        "Delaware General Corporation Law"
+    ),
+    CaseType.ANTITRUST.value: (
+        "Sherman Act", "Clayton Act", "Robinson-Patman Act", "Federal Trade Commission Act", "Hart-Scott-Rodino Act"
+    ),
+    CaseType.EMPLOYMENT.value: (
+        "Title VII", "Americans with Disabilities Act", "Age Discrimination in Employment Act",
+        "Fair Labor Standards Act", "Family and Medical Leave Act", "National Labor Relations Act"
+    ),
+    CaseType.REGULATORY.value: (
+        "Administrative Procedure Act", "Clean Air Act", "Clean Water Act", "Foreign Corrupt Practices Act"
+    ),
+}
+
+# Most entities of each kind kept, in order of first occurrence
+MAX_ENTITIES = 100
+
+# Streamed text is scanned in blocks ending at a blank line; a block with
+# none is cut at a line break once it reaches this size
+STREAM_BLOCK_CHARS = 64 * 1024
+
+ENTITY_KINDS = ("parties", "amounts", "dates", "patents", "statutes")
+
+# Whitespace inside an entity: spaces, or one line break, but never a blank line
+_SPACE = r"(?:[ \t]+\n?|\n)[ \t]*"
+# Optional pleading line number at the start of a line
+_LINE_NUMBER = r"(?:\d{1,2}[ \t]+)?"
+
+_ROLE = r"(?i:plaintiffs?|defendants?|petitioners?|respondents?)"
+_NAME = r"[A-Z][\w&'’.-]*(?:[ \t]+(?:[A-Z0-9][\w&'’.-]*|&|of|the|de)){0,7}"
+_COMPANY_SUFFIX = r"(?:,?[ \t]+(?i:inc|llc|l\.l\.c|corp|co|ltd|lp|l\.p|llp|plc|n\.a|gmbh|ag|s\.a)\.?(?!\w))?"
+_MONTH = (
+    r"(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|June?|July?|Aug(?:ust)?"
+    r"|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)"
+)
+_SECTION_NUMBER = r"§§?[ \t]*\d[\w.:-]*(?:\([\w]+\))*"
+
+# Entity list each plain-text rule adds to
+_ENTITY_LISTS = {"statute": "statutes", "amount": "amounts", "date": "dates"}
+
+_COMPANY_ENDINGS = ("inc.", "corp.", "co.", "ltd.", "l.p.", "l.l.c.", "n.a.", "s.a.")
+_COMPANY_SUFFIX_WORDS = re.compile(r"\s+(?:inc|llc|corp|co|ltd|lp|llp|plc|na|gmbh|ag|sa)$")
+_TRAILING_WORDS = {"of", "the", "de", "&"}
+_TERM_SEPARATORS = re.compile(r"[\s-]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _trie_pattern(phrases: Iterable[str]) -> str:
+    """Regex matching any of the phrases, as a character trie; spaces and hyphens match _SPACE or a hyphen."""
+    trie: Dict[str, dict] = {}
+    for phrase in phrases:
+        node = trie
+        for char in _TERM_SEPARATORS.sub(" ", phrase.strip()):
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: Dict[str, dict]) -> str:
+        branches = []
+        for char in sorted(node, key=lambda c: (c == "", c)):
+            if char == "":
+                continue
+            head = f"(?:{_SPACE}|-)" if char == " " else re.escape(char)
+            branches.append(head + render(node[char]))
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # A phrase ending here makes the rest optional; longer phrases are preferred
+        return f"(?:{body})?" if "" in node else body
+
+    return render(trie)
+
+
+def term_key(text: str) -> str:
+    """Canonical form of a matched issue term or statute name."""
+    return _TERM_SEPARATORS.sub(" ", text.strip().lower())
+
+
+@dataclass
+class ComplaintEntities:
+    """Everything extracted from one complaint."""
+    complaint_hash: str
+    parties: List[str] = field(default_factory=list)
+    amounts: List[str] = field(default_factory=list)
+    dates: List[str] = field(default_factory=list)
+    patents: List[str] = field(default_factory=list)
+    statutes: List[str] = field(default_factory=list)
+    issue_terms: List[str] = field(default_factory=list)   # gazetteer terms that occur, sorted
+
+
+class _Collector:
+    """Entities of one complaint, deduplicated in order of first occurrence."""
+
+    def __init__(self):
+        self.entities: Dict[str, Dict[str, str]] = {kind: {} for kind in ENTITY_KINDS}
+        self.terms: Set[str] = set()
+
+    def add(self, kind: str, value: str, key: Optional[str] = None) -> None:
+        found = self.entities[kind]
+        if value and len(found) < MAX_ENTITIES:
+            found.setdefault(key or value.lower(), value)
+
+    def result(self, key: str) -> ComplaintEntities:
+        return ComplaintEntities(
+            complaint_hash=key,
+            issue_terms=sorted(self.terms),
+            **{kind: list(found.values()) for kind, found in self.entities.items()}
+        )
+
+
+class ComplaintExtractor:
+    """Compiled extraction rules and gazetteers, with results memoized by complaint hash."""
+
+    def __init__(
+        self,
+        issue_gazetteers: Optional[Dict[str, Sequence[str]]] = None,
+        statute_gazetteers: Optional[Dict[str, Sequence[str]]] = None,
+        max_cached: int = 256
+    ):
+        """
+        Args:
+            issue_gazetteers: Issue terms by case type (defaults to ISSUE_GAZETTEERS)
+            statute_gazetteers: Statute names by case type (defaults to STATUTE_GAZETTEERS)
+            max_cached: Extractions kept in memory
+        """
+        self.issue_gazetteers = {
+            case_type: tuple(terms) for case_type, terms in (issue_gazetteers or ISSUE_GAZETTEERS).items()
+        }
+        statutes = statute_gazetteers or STATUTE_GAZETTEERS
+        self.issue_terms = sorted({term_key(term) for terms in self.issue_gazetteers.values() for term in terms})
+        statute_names = sorted({name for names in statutes.values() for name in names})
+        self.max_cached = max_cached
+
+        # Canonical names of the statutes, and the issue terms each issue term contains
+        self._statute_names = {term_key(name): name for name in statute_names}
+        terms_only = re.compile(rf"(?<!\w)(?i:{_trie_pattern(self.issue_terms)})")
+        self._terms_only = terms_only
+        self._contained: Dict[str, Set[str]] = {
+            term: {term_key(match.group()) for match in terms_only.finditer(term, 1)}
+            for term in self.issue_terms
+        }
+
+        rules = [
+            # Caption: a name ending its line (or followed by the role) and then the role
+            ("caption_party", (
+                rf"^[ \t]*{_LINE_NUMBER}(?P<caption_name>{_NAME}{_COMPANY_SUFFIX})[ \t]*,?[ \t]*"
+                rf"(?:[)§|][^\n]*)?(?:\n[ \t]*{_LINE_NUMBER})?{_ROLE}(?=[ \t]*[,.;:]?[ \t]*(?:[)§|]|$))"
+            )),
+            # A role followed by a name: "defendant DataSystems LLC"
+            ("role_party", rf"{_ROLE}[ \t]+(?P<role_name>{_NAME}{_COMPANY_SUFFIX})"),
+            ("patent", (
+                rf"(?:U\.?S\.?{_SPACE})?(?i:patent){_SPACE}(?:Nos?\.?|Numbers?|#)[ \t]*(?:\n[ \t]*)?"
+                r"(?P<patent_number>(?:RE|D)[ \t]?\d{2,3},?\d{3}|\d{1,2},?\d{3},?\d{3})(?!\d)"
+            )),
+            ("statute", (
+                rf"\d+{_SPACE}U\.?[ \t]?S\.?[ \t]?C\.?(?:A\.?)?[ \t]*{_SECTION_NUMBER}"
+                rf"|\d+{_SPACE}C\.?F\.?R\.?[ \t]*(?:§§?|Part)?[ \t]*\d[\d.]*"
+                rf"|(?:(?:[A-Z][A-Za-z.]*\.|&)[ \t]+){{1,5}}(?:Code|Law|Stat\.)(?:[ \t]+Ann\.)?[ \t]*{_SECTION_NUMBER}"
+            )),
+            ("statute_name", rf"(?:{_trie_pattern(statute_names)})(?!\w)"),
+            ("amount", (
+                r"\$[ \t]?\d[\d,]*(?:\.\d+)?(?:[ \t]+(?i:million|billion|thousand)(?!\w))?"
+                r"|\d[\d,]*(?:\.\d+)?[ \t]+(?:(?i:million|billion|thousand)[ \t]+)?(?i:dollars)(?!\w)"
+            )),
+            ("date", (
+                rf"{_MONTH}\.?[ \t]+\d{{1,2}}(?:st|nd|rd|th)?,?[ \t]+\d{{4}}(?!\d)"
+                r"|\d{1,2}/\d{1,2}/(?:\d{4}|\d{2})(?!\d)"
+                r"|\d{4}-\d{2}-\d{2}(?!\d)"
+            )),
+            ("term", rf"(?i:{_trie_pattern(self.issue_terms)})\w*"),
+        ]
+        # Every rule starts at a line start or at the start of a word, number or
+        # amount; the guard rejects other positions before any rule is tried
+        self._pattern = re.compile(
+            r"(?=[A-Za-z0-9$]|^)(?<!\w)(?:" + "|".join(f"(?P<{name}>{rule})" for name, rule in rules) + ")",
+            re.MULTILINE
+        )
+
+        self._cache: "OrderedDict[str, ComplaintEntities]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.extractions = 0
+        self.cache_hits = 0
+
+    def extract(self, complaint_text: str, key: Optional[str] = None) -> ComplaintEntities:
+        """Entities of a complaint, from the cache or extracted in one pass."""
+        key = key or complaint_hash(complaint_text)
+        cached = self.cached(key)
+        if cached is not None:
+            return cached
+        collector = _Collector()
+        self._scan(complaint_text, collector)
+        return self.remember(collector.result(key))
+
+    def stream(self) -> "ExtractionStream":
+        """Extraction over a complaint that arrives in pieces."""
+        return ExtractionStream(self)
+
+    def cached(self, key: str) -> Optional[ComplaintEntities]:
+        with self._lock:
+            entities = self._cache.get(key)
+            if entities is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+            return entities
+
+    def remember(self, entities: ComplaintEntities) -> ComplaintEntities:
+        """Memoize an extraction under its complaint hash."""
+        with self._lock:
+            self._cache[entities.complaint_hash] = entities
+            self.extractions += 1
+            while len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+        return entities
+
+    def _scan(self, text: str, collector: _Collector) -> None:
+        terms = collector.terms
+        for match in self._pattern.finditer(text):
+            kind = match.lastgroup
+            if kind == "term":
+                term = term_key(self._terms_only.match(match.group()).group())
+                terms.add(term)
+                terms.update(self._contained[term])
+                continue
+
+            if kind in ("caption_party", "role_party"):
+                name = _party_name(match.group("caption_name" if kind == "caption_party" else "role_name"))
+                collector.add("parties", name, _party_key(name))
+            elif kind == "patent":
+                collector.add("patents", _patent_number(match.group("patent_number")))
+            elif kind == "statute_name":
+                collector.add("statutes", self._statute_names[term_key(match.group())])
+            else:
+                collector.add(_ENTITY_LISTS[kind], _WHITESPACE.sub(" ", match.group()))
+            # Issue terms inside other entities ("Patent No.", "Trade Secret Holdings") still count
+            for term in self._terms_only.finditer(match.group()):
+                terms.add(term_key(term.group()))
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "issue_terms": len(self.issue_terms),
+                "statute_names": len(self._statute_names),
+                "extractions": self.extractions,
+                "cache_hits": self.cache_hits,
+                "cached": len(self._cache)
+            }
+
+
+class ExtractionStream:
+    """
+    Extraction over text fed in pieces, e.g. a complaint being uploaded.
+
+    Text is scanned in blocks ending at a blank line, which no match spans,
+    so the result equals extracting the whole text at once (unless a
+    paragraph runs past STREAM_BLOCK_CHARS and has to be cut at a line break).
+    """
+
+    def __init__(self, extractor: ComplaintExtractor):
+        self._extractor = extractor
+        self._collector = _Collector()
+        self._pending = ""
+        self._searched = 0
+
+    def feed(self, text: str) -> None:
+        if not text:
+            return
+        self._pending += text
+        end = self._pending.rfind("\n\n", max(0, self._searched - 1))
+        if end >= 0:
+            self._flush(end + 2)
+        elif len(self._pending) >= STREAM_BLOCK_CHARS:
+            self._flush(self._pending.rfind("\n") + 1 or len(self._pending))
+        self._searched = len(self._pending)
+
+    def finish(self, key: str) -> ComplaintEntities:
+        """Scan what is left and memoize the result under the complaint's hash."""
+        self._flush(len(self._pending))
+        return self._extractor.remember(self._collector.result(key))
+
+    def _flush(self, end: int) -> None:
+        block, self._pending = self._pending[:end], self._pending[end:]
+        self._extractor._scan(block, self._collector)
+        self._searched = 0
+
+
+def _party_name(name: str) -> str:
+    """A matched party name without trailing punctuation or connectives."""
+    words = _WHITESPACE.sub(" ", name).strip(" ,;:").split(" ")
+    while len(words) > 1 and words[-1].lower() in _TRAILING_WORDS:
+        words.pop()
+    name = " ".join(words).rstrip(",;:")
+    if name.endswith(".") and not name.lower().endswith(_COMPANY_ENDINGS):
+        name = name.rstrip(".")
+    return name
+
+
+def _party_key(name: str) -> str:
+    """Names differing only in case, punctuation or company suffix are one party."""
+    return _COMPANY_SUFFIX_WORDS.sub("", re.sub(r"[^\w\s]", "", name.lower())).strip()
+
+
+def _patent_number(number: str) -> str:
+    """Patent number with standard thousands separators, e.g. 9,123,456 or RE45,678."""
+    prefix = number[:2].strip() if number[:2].upper() == "RE" else number[:1] if number[:1].upper() == "D" else ""
+    digits = re.sub(r"\D", "", number[len(prefix):])
+    return f"{prefix.upper()}{int(digits):,}"
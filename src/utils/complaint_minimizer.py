@@ -0,0 +1,356 @@
+"""
+Complaint Minimizer for Legal Intelligence AI System
+====================================================
+Strips pleading boilerplate from complaints before they are quoted in prompts.
+
+Filed complaints carry a lot of text that costs input tokens and tells
+the model nothing about the case. This module removes it in one
+deterministic, line-based pass:
+
+- court captions and the attorney block above them (court name, case
+  number, judge, bar numbers, addresses, ")" caption columns)
+- pleading-paper line numbers and page numbers
+- running headers and footers (short lines repeated on every page; the
+  first occurrence of a title without page or case numbers is kept)
+- the signature block (a date or "Respectfully submitted" line followed by
+  an e-signature or counsel block) and any certificate of service
+- runs of spaces and blank lines
+
+The result is always a concatenation of verbatim pieces of the original,
+so ``MinimizedComplaint`` can map any offset in the minimized text back to
+the original for citations.
+"""
+
+import re
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+# Same estimate the agent uses for scheduling: ~4 characters per token
+CHARS_PER_TOKEN = 4
+
+# Categories of removed text, as reported in ``removed``
+REMOVAL_CATEGORIES = (
+    "caption", "line_numbers", "headers_footers", "signature", "certificate_of_service", "whitespace"
+)
+
+# The caption is looked for above the first allegation, within this many lines
+CAPTION_MAX_LINES = 80
+# Lines repeated at least this often, and no longer than this, are running headers or footers
+REPEATED_LINE_MIN_COUNT = 3
+REPEATED_LINE_MAX_CHARS = 120
+# Leading numbers on this many consecutive lines, counting up, are pleading line numbers
+PLEADING_NUMBER_RUN = 3
+# Bare numbers counting up at least this many lines apart, on this many pages, are page footers
+PAGE_NUMBER_MIN_GAP = 10
+PAGE_NUMBER_MIN_PAGES = 3
+# A "Dated:" or "Respectfully submitted" line starts the signature block only
+# with a /s/ line or counsel block within this many lines of it
+SIGNATURE_CUE_LINES = 6
+
+_LINE = re.compile(r"[^\n]*\n|[^\n]+")
+_WHITESPACE_RUN = re.compile(r"[ \t\r\f\v]{2,}")
+_DIGITS = re.compile(r"\d+")
+
+_PAGE_LABEL = re.compile(r"page\s+\d{1,4}(?:\s+of\s+\d{1,4})?|-\s*\d{1,4}\s*-|\d{1,4}\s+of\s+\d{1,4}", re.IGNORECASE)
+_BARE_NUMBER = re.compile(r"\d{1,4}")
+_PLEADING_NUMBER = re.compile(r"(\d{1,2})[ \t]+(?=\S)")
+_CAPTION_BRACKETS = re.compile(r"[)§:|\s]+")
+_CAPTION_COLUMN = re.compile(r"\s+[)§|](?:\s|$)")
+_BODY_START = re.compile(
+    r"(?:1\.|I\.|INTRODUCTION\b|NATURE OF THE ACTION\b|PRELIMINARY STATEMENT\b|THE PARTIES\b|PARTIES\b)"
+)
+_COURT_NAME = re.compile(r"\b(?:COURT|DISTRICT OF|DIVISION|COUNTY OF)\b")
+_CAPTION_LINE = re.compile(
+    r"^(?:Case|Civil Action|Cause|Index)\s*(?:No\.?|Number|#)"
+    r"|^(?:Hon\.|Honorable|Judge|Magistrate)\b"
+    r"|\b(?:Bar No\.?|SBN|Telephone|Facsimile|Tel\.?:|Fax:)"
+    r"|\(\d{3}\)\s*\d{3}-\d{4}|\d{3}[-.]\d{3}[-.]\d{4}|@"
+    r"|^(?:Attorneys?|Counsel) for\b",
+    re.IGNORECASE
+)
+_SIGNATURE_START = re.compile(r"(?:Respectfully submitted|Dated?:)", re.IGNORECASE)
+_SIGNATURE_LINE = re.compile(r"(?:/s/|By:\s*/s/|s/\s)", re.IGNORECASE)
+_COUNSEL_LINE = re.compile(r"^By:|^(?:Attorneys?|Counsel) for\b|\b(?:Bar No\.?|SBN)\b", re.IGNORECASE)
+_CERTIFICATE_START = re.compile(r"CERTIFICATE OF SERVICE\s*$", re.IGNORECASE)
+_SECTION_AFTER_SIGNATURE = re.compile(
+    r"(?:EXHIBIT|VERIFICATION|CERTIFICATE OF SERVICE|DEMAND FOR JURY TRIAL|JURY DEMAND)\b", re.IGNORECASE
+)
+
+
+@dataclass
+class MinimizedComplaint:
+    """A complaint with boilerplate removed, and the map back to the original."""
+    text: str
+    original_length: int
+    removed: Dict[str, int]                              # characters removed per category
+    clean_starts: List[int] = field(repr=False)          # start of each verbatim piece in ``text``
+    original_starts: List[int] = field(repr=False)       # where that piece starts in the original
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.original_length // CHARS_PER_TOKEN - len(self.text) // CHARS_PER_TOKEN
+
+    def original_offset(self, offset: int) -> int:
+        """Position in the original complaint of a position in the minimized text."""
+        if not self.clean_starts:
+            return 0
+        piece = max(0, bisect_right(self.clean_starts, offset) - 1)
+        return self.original_starts[piece] + offset - self.clean_starts[piece]
+
+    def original_span(self, start: int, end: int) -> Tuple[int, int]:
+        """Span of the original complaint that a span of the minimized text was taken from."""
+        if end <= start:
+            position = self.original_offset(start)
+            return position, position
+        return self.original_offset(start), self.original_offset(end - 1) + 1
+
+
+def _page_numbers(
+    text: str, lines: List[Tuple[int, int]], stripped: List[str], candidates: List[int]
+) -> List[int]:
+    """Which lines holding only a number are page numbers."""
+    pages = []
+
+    def at_page_break(index: int) -> bool:
+        # The line itself, or the nearest non-blank line on either side, carries a form feed
+        if "\f" in text[lines[index][0]:lines[index][1]]:
+            return True
+        for step in (-1, 1):
+            neighbour = index + step
+            while 0 <= neighbour < len(lines) and not stripped[neighbour]:
+                if "\f" in text[lines[neighbour][0]:lines[neighbour][1]]:
+                    return True
+                neighbour += step
+            if 0 <= neighbour < len(lines) and "\f" in text[lines[neighbour][0]:lines[neighbour][1]]:
+                return True
+        return False
+
+    # Running footers: each number one more than an earlier one at least a page away
+    chains: Dict[int, List[int]] = {}          # value -> footer lines ending with that value
+    for index in candidates:
+        if at_page_break(index):
+            pages.append(index)
+            continue
+        value = int(stripped[index])
+        previous = chains.get(value - 1)
+        if previous and index - previous[-1] >= PAGE_NUMBER_MIN_GAP:
+            chains[value] = previous + [index]
+        elif value not in chains:
+            chains[value] = [index]
+    footers = set()
+    for chain in chains.values():
+        if len(chain) >= PAGE_NUMBER_MIN_PAGES:
+            footers.update(chain)
+    return pages + sorted(footers)
+
+
+def minimize_complaint(text: str) -> MinimizedComplaint:
+    """Remove captions, line and page numbers, headers and footers, signatures and extra whitespace."""
+    lines = [(match.start(), match.end()) for match in _LINE.finditer(text)]
+    stripped = [text[start:end].strip() for start, end in lines]
+    # Character range of each line to keep; None drops the line
+    keep: List[Optional[Tuple[int, int]]] = []
+    category: List[Optional[str]] = [None] * len(lines)
+    for (start, end), content in zip(lines, stripped):
+        line_end = end - 1 if text.endswith("\n", start, end) else end
+        keep.append((start, line_end) if content else None)
+
+    def drop(index: int, reason: str) -> None:
+        if keep[index] is not None:
+            keep[index] = None
+            category[index] = reason
+
+    # Page numbers: labelled ones anywhere ("Page 3 of 9", "- 3 -"); bare numbers
+    # only next to a page break or as a running footer, so table rows such as
+    # "2019" are kept
+    bare_numbers = []
+    for index, content in enumerate(stripped):
+        if content and _PAGE_LABEL.fullmatch(content):
+            drop(index, "line_numbers")
+        elif content and _BARE_NUMBER.fullmatch(content):
+            bare_numbers.append(index)
+    for index in _page_numbers(text, lines, stripped, bare_numbers):
+        drop(index, "line_numbers")
+
+    # Leading pleading line numbers: runs of lines numbered n, n+1, n+2...
+    numbers = [
+        int(content) if content.isdigit() and len(content) <= 2
+        else int(match.group(1)) if (match := _PLEADING_NUMBER.match(content)) else None
+        for content in stripped
+    ]
+    run_start = 0
+    for index in range(1, len(lines) + 1):
+        continues = (
+            index < len(lines) and numbers[index] is not None and numbers[index - 1] is not None
+            and (numbers[index] == numbers[index - 1] + 1 or (numbers[index] == 1 and numbers[index - 1] >= 20))
+        )
+        if continues:
+            continue
+        if index - run_start >= PLEADING_NUMBER_RUN:
+            for numbered in range(run_start, index):
+                if stripped[numbered].isdigit():
+                    # A numbered line with nothing else on it
+                    drop(numbered, "line_numbers")
+                elif keep[numbered] is not None:
+                    start, line_end = keep[numbered]
+                    offset = text.find(stripped[numbered], start, line_end)
+                    prefix = _PLEADING_NUMBER.match(stripped[numbered]).end()
+                    keep[numbered] = (offset + prefix, line_end)
+                    stripped[numbered] = stripped[numbered][prefix:]
+                    category[numbered] = "line_numbers"
+        run_start = index
+
+    # Caption and attorney block above the first allegation
+    body_start = next(
+        (index for index, content in enumerate(stripped[:CAPTION_MAX_LINES]) if _BODY_START.match(content)),
+        0
+    )
+    court_line = next(
+        (index for index in range(body_start) if stripped[index].isupper() and _COURT_NAME.search(stripped[index])),
+        None
+    )
+    for index in range(body_start):
+        content = stripped[index]
+        if not content or keep[index] is None or len(content) > REPEATED_LINE_MAX_CHARS:
+            continue
+        if (
+            (court_line is not None and index <= court_line)  # attorney block above the court name
+            or _CAPTION_BRACKETS.fullmatch(content)
+            or content[0] in ")§|"  # right column of a caption
+            or _CAPTION_LINE.search(content)
+            or (content.isupper() and _COURT_NAME.search(content))
+        ):
+            drop(index, "caption")
+            continue
+        # Keep the party column of a two-column caption
+        start, line_end = keep[index]
+        column = _CAPTION_COLUMN.search(text, start, line_end)
+        if column:
+            keep[index] = (start, column.start())
+            category[index] = "caption"
+
+    # Running headers and footers: short lines repeated on many pages
+    repeated = Counter(
+        _DIGITS.sub("#", content.lower())
+        for content in stripped
+        if 8 <= len(content) <= REPEATED_LINE_MAX_CHARS and content[-1] not in ".;,"
+    )
+    seen = set()
+    for index, content in enumerate(stripped):
+        if not content or len(content) < 8 or len(content) > REPEATED_LINE_MAX_CHARS:
+            continue
+        key = _DIGITS.sub("#", content.lower())
+        if repeated[key] >= REPEATED_LINE_MIN_COUNT:
+            # Lines with changing numbers (page, document, filing stamps) go entirely
+            if key in seen or "#" in key:
+                drop(index, "headers_footers")
+            seen.add(key)
+
+    # Certificate of service, then the signature block before it
+    tail_start = len(lines) * 2 // 3
+    certificate = next(
+        (index for index in range(tail_start, len(lines)) if _CERTIFICATE_START.match(stripped[index])),
+        len(lines)
+    )
+    for index in range(certificate, len(lines)):
+        if index > certificate and stripped[index].upper().startswith(("EXHIBIT", "VERIFICATION")):
+            break
+        drop(index, "certificate_of_service")
+
+    def signed(index: int) -> bool:
+        # A date line alone is not a signature block; an e-signature or counsel block must follow
+        return any(
+            _SIGNATURE_LINE.search(stripped[cue]) or _COUNSEL_LINE.search(stripped[cue])
+            for cue in range(index, min(index + SIGNATURE_CUE_LINES + 1, certificate))
+        )
+
+    signature = next(
+        (
+            index for index in range(certificate - 1, tail_start - 1, -1)
+            if _SIGNATURE_START.match(stripped[index]) and signed(index)
+        ),
+        None
+    )
+    if signature is not None:
+        # "Dated:" and "Respectfully submitted," often sit on consecutive lines
+        previous = signature - 1
+        while previous >= tail_start and (not stripped[previous] or _SIGNATURE_START.match(stripped[previous])):
+            if stripped[previous]:
+                signature = previous
+            previous -= 1
+        for index in range(signature, len(lines)):
+            if index > signature and _SECTION_AFTER_SIGNATURE.match(stripped[index]):
+                break
+            drop(index, "signature")
+    for index in range(tail_start, len(lines)):
+        if _SIGNATURE_LINE.match(stripped[index]):
+            drop(index, "signature")
+
+    # Emit kept lines as verbatim pieces, collapsing whitespace runs and blank lines
+    pieces: List[Tuple[int, int]] = []
+
+    def emit(start: int, end: int) -> None:
+        if end <= start:
+            return
+        if pieces and pieces[-1][1] == start:
+            pieces[-1] = (pieces[-1][0], end)
+        else:
+            pieces.append((start, end))
+
+    blank_pending = False
+    for index, (start, end) in enumerate(lines):
+        kept = keep[index]
+        if kept is None:
+            if not stripped[index]:
+                blank_pending = True
+            continue
+        if blank_pending and pieces:
+            # One blank line: the line break that ended the previous kept line, then this one's
+            emit(lines[index - 1][1] - 1, lines[index - 1][1])
+        blank_pending = False
+
+        # Drop indentation and whitespace before a line break; collapse other runs to one character
+        kept_start, kept_end = kept
+        line_break = text.endswith("\n", start, end)
+        while kept_start < kept_end and text[kept_start] in " \t\r\f\v":
+            kept_start += 1
+        if line_break or kept_end < end:
+            while kept_end > kept_start and text[kept_end - 1] in " \t\r\f\v":
+                kept_end -= 1
+        position = kept_start
+        for run in _WHITESPACE_RUN.finditer(text, kept_start, kept_end):
+            emit(position, run.start() + 1)
+            position = run.end()
+        emit(position, kept_end)
+        if line_break:
+            emit(end - 1, end)
+
+    if pieces == [(0, len(text))]:
+        minimized = text
+    else:
+        minimized = "".join(text[start:end] for start, end in pieces)
+
+    clean_starts: List[int] = []
+    original_starts: List[int] = []
+    position = 0
+    for start, end in pieces:
+        clean_starts.append(position)
+        original_starts.append(start)
+        position += end - start
+
+    removed = {name: 0 for name in REMOVAL_CATEGORIES}
+    for index, (start, end) in enumerate(lines):
+        if category[index] is not None:
+            kept = keep[index]
+            removed[category[index]] += (end - start) - ((kept[1] - kept[0]) if kept else 0)
+    removed["whitespace"] = max(0, len(text) - len(minimized) - sum(removed.values()))
+
+    return MinimizedComplaint(
+        text=minimized,
+        original_length=len(text),
+        removed=removed,
+        clean_starts=clean_starts,
+        original_starts=original_starts
+    )
@@ -0,0 +1,230 @@
+"""
+Complaint Store for Legal Intelligence AI System
+================================================
+Durable, file-based storage of uploaded complaint documents.
+
+Multi-megabyte filings are streamed into the store chunk by chunk rather
+than arriving as one JSON string. Each chunk is decoded, normalized
+(newlines unified, control characters removed), hashed and appended to a
+temp file. The size limit is enforced as bytes arrive, and the facts the
+scenario builder needs (parties, amounts, dates, patents, statutes and
+issue terms) are extracted on the way, paragraph block by paragraph block.
+The complete text is never held in memory during an upload and is never
+rescanned to build a scenario.
+
+Complaints are content-addressed: ``<store_dir>/<complaint_id>.txt`` holds
+the normalized text and ``<complaint_id>.json`` its metadata, and uploading
+the same document twice yields the same id.
+"""
+
+import os
+import re
+import json
+import codecs
+import hashlib
+import logging
+import tempfile
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .scenario_builder import DEFAULT_PARTIES, EXTRACTOR
+
+logger = logging.getLogger(__name__)
+
+# Control characters other than tab and newline
+_CONTROL_CHARACTERS = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]")
+
+
+class ComplaintTooLarge(Exception):
+    """Raised as soon as an upload exceeds the store's size limit."""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"Complaint exceeds the {max_bytes}-byte limit")
+        self.max_bytes = max_bytes
+
+
+@dataclass
+class StoredComplaint:
+    """Metadata of a stored complaint; the text itself stays on disk."""
+    complaint_id: str
+    size_bytes: int                  # normalized UTF-8 text
+    characters: int
+    parties: List[str]
+    issue_terms: List[str]           # gazetteer issue terms that occur in the text
+    amounts: List[str] = field(default_factory=list)
+    dates: List[str] = field(default_factory=list)
+    patents: List[str] = field(default_factory=list)
+    statutes: List[str] = field(default_factory=list)
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+
+class ComplaintUpload:
+    """One complaint being streamed into the store; commit() or abort() when done."""
+
+    def __init__(self, store: "ComplaintStore"):
+        self.store = store
+        self.received_bytes = 0
+        self.characters = 0
+        self.deduplicated = False
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._hash = hashlib.sha256()
+        self._pending_cr = False
+        self._extraction = EXTRACTOR.stream()
+        fd, self._tmp_path = tempfile.mkstemp(dir=store.store_dir, suffix=".upload")
+        self._file = os.fdopen(fd, "w", encoding="utf-8", newline="")
+        self._closed = False
+
+    def write(self, data: bytes) -> None:
+        """Append a chunk of the raw document."""
+        self.received_bytes += len(data)
+        if self.received_bytes > self.store.max_bytes:
+            self.abort()
+            raise ComplaintTooLarge(self.store.max_bytes)
+        self._append(self._decoder.decode(data))
+
+    def _append(self, text: str) -> None:
+        # Unify newlines; a CR at the end of a chunk may be half of a CRLF
+        if self._pending_cr:
+            text = "\r" + text
+        self._pending_cr = text.endswith("\r")
+        if self._pending_cr:
+            text = text[:-1]
+        text = _CONTROL_CHARACTERS.sub("", text.replace("\r\n", "\n").replace("\r", "\n"))
+        if not text:
+            return
+
+        self._file.write(text)
+        self._hash.update(text.encode("utf-8"))
+        self.characters += len(text)
+        self._extraction.feed(text)
+
+    def commit(self) -> StoredComplaint:
+        """Finish the upload and store the complaint under its content id."""
+        self._append(self._decoder.decode(b"", final=True))
+        if self._pending_cr:
+            self._pending_cr = False
+            self._append("\n")
+        self._file.close()
+        self._closed = True
+
+        # Streamed equivalent of text_terms.complaint_hash on the normalized text
+        complaint_id = self._hash.hexdigest()[:32]
+        existing = self.store.get(complaint_id)
+        if existing is not None:
+            os.remove(self._tmp_path)
+            self.deduplicated = True
+            return existing
+
+        # Memoized under the id, so analyses of the same text reuse the extraction
+        entities = self._extraction.finish(complaint_id)
+        complaint = StoredComplaint(
+            complaint_id=complaint_id,
+            size_bytes=os.path.getsize(self._tmp_path),
+            characters=self.characters,
+            parties=entities.parties or list(DEFAULT_PARTIES),
+            issue_terms=entities.issue_terms,
+            amounts=entities.amounts,
+            dates=entities.dates,
+            patents=entities.patents,
+            statutes=entities.statutes
+        )
+        os.replace(self._tmp_path, self.store.text_path(complaint_id))
+        self.store.save_metadata(complaint)
+        logger.info(f"Stored complaint {complaint_id} ({complaint.size_bytes} bytes)")
+        return complaint
+
+    def abort(self) -> None:
+        """Discard the upload."""
+        if not self._closed:
+            self._file.close()
+            self._closed = True
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def __enter__(self) -> "ComplaintUpload":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.abort()
+
+
+class ComplaintStore:
+    """Stores complaint documents on disk, keyed by a hash of their normalized text."""
+
+    def __init__(self, store_dir: str, max_bytes: int = 50 * 1024 * 1024):
+        """
+        Args:
+            store_dir: Directory for complaint text and metadata files
+            max_bytes: Largest upload accepted, in raw bytes
+        """
+        self.store_dir = store_dir
+        self.max_bytes = max_bytes
+        os.makedirs(store_dir, exist_ok=True)
+
+    def text_path(self, complaint_id: str) -> str:
+        return os.path.join(self.store_dir, f"{complaint_id}.txt")
+
+    def _metadata_path(self, complaint_id: str) -> str:
+        return os.path.join(self.store_dir, f"{complaint_id}.json")
+
+    def open_upload(self) -> ComplaintUpload:
+        """Start streaming a new complaint into the store."""
+        return ComplaintUpload(self)
+
+    def put_text(self, text: str) -> StoredComplaint:
+        """Store a complaint that is already in memory."""
+        with self.open_upload() as upload:
+            upload.write(text.encode("utf-8"))
+            return upload.commit()
+
+    def save_metadata(self, complaint: StoredComplaint) -> None:
+        """Atomically write a complaint's metadata."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.store_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(asdict(complaint), f)
+            os.replace(tmp_path, self._metadata_path(complaint.complaint_id))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def get(self, complaint_id: str) -> Optional[StoredComplaint]:
+        """Metadata of a stored complaint, or None if it is unknown."""
+        if not re.fullmatch(r"[0-9a-f]{32}", complaint_id or ""):
+            return None
+        path = self._metadata_path(complaint_id)
+        if not os.path.exists(path) or not os.path.exists(self.text_path(complaint_id)):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return StoredComplaint(**json.load(f))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable complaint metadata {path}: {str(e)}")
+            return None
+
+    def load_text(self, complaint_id: str) -> str:
+        """Text of a stored complaint; raises KeyError if it is unknown."""
+        if self.get(complaint_id) is None:
+            raise KeyError(complaint_id)
+        with open(self.text_path(complaint_id), "r", encoding="utf-8", newline="") as f:
+            return f.read()
+
+    def delete(self, complaint_id: str) -> bool:
+        """Remove a stored complaint; returns whether it existed."""
+        existed = False
+        for path in (self.text_path(complaint_id), self._metadata_path(complaint_id)):
+            if os.path.exists(path):
+                os.remove(path)
+                existed = True
+        return existed
+
+    def stats(self) -> Dict[str, int]:
+        """Number of stored complaints and their total size."""
+        sizes = [
+            os.path.getsize(os.path.join(self.store_dir, name))
+            for name in os.listdir(self.store_dir) if name.endswith(".txt")
+        ]
+        return {"complaints": len(sizes), "total_bytes": sum(sizes), "max_upload_bytes": self.max_bytes}
@@ -0,0 +1,254 @@
+"""
+Shared Metrics Store for Legal Intelligence AI System
+=====================================================
+SQLite-backed metrics shared by every worker process on a node.
+
+Under ``uvicorn --workers N`` each worker has its own memory, so in-process
+counters only ever describe one worker. This store gives every worker its own
+rows (counters, gauges and a fixed-size ring buffer of samples per metric) in a
+single SQLite file and merges them on read.
+
+Writes never touch SQLite on the request path: they are buffered in memory and
+flushed by a background thread, so recording a metric costs a dict update.
+
+Every flush also stamps the worker's last-seen time, so ``worker_count``
+counts only workers heard from within ``worker_ttl`` seconds rather than
+every process that ever wrote a row.
+"""
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+import logging
+from typing import Dict, List, Optional, Any
+
+logger = logging.getLogger(__name__)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS counters (
+    worker_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (worker_id, name)
+);
+CREATE TABLE IF NOT EXISTS gauges (
+    worker_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (worker_id, name)
+);
+CREATE TABLE IF NOT EXISTS samples (
+    worker_id TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    slot INTEGER NOT NULL,
+    value REAL NOT NULL,
+    recorded_at REAL NOT NULL,
+    PRIMARY KEY (worker_id, metric, slot)
+);
+CREATE INDEX IF NOT EXISTS idx_samples_metric_time ON samples (metric, recorded_at);
+CREATE TABLE IF NOT EXISTS workers (
+    worker_id TEXT PRIMARY KEY,
+    last_seen REAL NOT NULL
+);
+"""
+
+
+class SharedMetricsStore:
+    """
+    Fleet-wide metrics store backed by a shared SQLite file.
+
+    Each worker writes only rows tagged with its own ``worker_id``, so workers
+    never update the same row. Samples go into a per-worker ring buffer of
+    ``ring_size`` slots per metric; reads merge the buffers of all workers.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        worker_id: Optional[str] = None,
+        ring_size: int = 1000,
+        flush_interval: float = 1.0,
+        start_flusher: bool = True,
+        worker_ttl: float = 60.0
+    ):
+        """Open (or create) the store and start the background flusher."""
+        self.db_path = db_path
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.ring_size = ring_size
+        self.flush_interval = flush_interval
+        self.worker_ttl = worker_ttl
+        self._last_seen_written = 0.0
+
+        # Pending writes, swapped out wholesale on each flush
+        self._buffer_lock = threading.Lock()
+        self._pending_counters: Dict[str, float] = {}
+        self._pending_gauges: Dict[str, tuple] = {}
+        self._pending_samples: List[tuple] = []
+        self._sample_seq: Dict[str, int] = {}
+
+        # One connection per store, serialized by a lock (flusher + readers)
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=10.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        self._stop = threading.Event()
+        self._flusher = None
+        if start_flusher:
+            self._flusher = threading.Thread(
+                target=self._flush_loop,
+                name="metrics-store-flusher",
+                daemon=True
+            )
+            self._flusher.start()
+
+        logger.info(f"Shared metrics store opened at {db_path} (worker {self.worker_id})")
+
+    # Write path (in-memory only)
+
+    def increment(self, name: str, amount: float = 1) -> None:
+        """Add ``amount`` to this worker's counter ``name``."""
+        with self._buffer_lock:
+            self._pending_counters[name] = self._pending_counters.get(name, 0) + amount
+
+    def set_gauge(self, name: str, value: Any) -> None:
+        """Set this worker's gauge ``name``; reads return the most recent value fleet-wide."""
+        with self._buffer_lock:
+            self._pending_gauges[name] = (None if value is None else str(value), time.time())
+
+    def record(self, metric: str, value: float) -> None:
+        """Append a sample to this worker's ring buffer for ``metric``."""
+        with self._buffer_lock:
+            seq = self._sample_seq.get(metric, 0)
+            self._sample_seq[metric] = seq + 1
+            self._pending_samples.append((metric, seq % self.ring_size, float(value), time.time()))
+
+    # Flushing
+
+    def flush(self) -> None:
+        """Write buffered metrics for this worker to SQLite, and note that it is alive."""
+        with self._buffer_lock:
+            counters = self._pending_counters
+            gauges = self._pending_gauges
+            samples = self._pending_samples
+            self._pending_counters = {}
+            self._pending_gauges = {}
+            self._pending_samples = []
+
+        now = time.time()
+        heartbeat = now - self._last_seen_written >= self.flush_interval
+        if not (counters or gauges or samples or heartbeat):
+            return
+
+        try:
+            with self._db_lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO workers (worker_id, last_seen) VALUES (?, ?)",
+                    (self.worker_id, now)
+                )
+                self._last_seen_written = now
+                self._conn.executemany(
+                    "INSERT INTO counters (worker_id, name, value) VALUES (?, ?, ?) "
+                    "ON CONFLICT(worker_id, name) DO UPDATE SET value = value + excluded.value",
+                    [(self.worker_id, name, amount) for name, amount in counters.items()]
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO gauges (worker_id, name, value, updated_at) VALUES (?, ?, ?, ?)",
+                    [(self.worker_id, name, value, ts) for name, (value, ts) in gauges.items()]
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO samples (worker_id, metric, slot, value, recorded_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(self.worker_id, metric, slot, value, ts) for metric, slot, value, ts in samples]
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Failed to flush metrics to {self.db_path}: {str(e)}")
+
+    def _flush_loop(self) -> None:
+        """Background loop that periodically flushes buffered metrics."""
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    # Read path (merged across workers)
+
+    def counter(self, name: str) -> float:
+        """Get the fleet-wide total of counter ``name``."""
+        self.flush()
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT COALESCE(SUM(value), 0) FROM counters WHERE name = ?", (name,)
+            ).fetchone()
+        return row[0]
+
+    def counters(self) -> Dict[str, float]:
+        """Get fleet-wide totals for every counter."""
+        self.flush()
+        with self._db_lock:
+            rows = self._conn.execute(
+                "SELECT name, SUM(value) FROM counters GROUP BY name"
+            ).fetchall()
+        return {name: value for name, value in rows}
+
+    def gauge(self, name: str) -> Optional[str]:
+        """Get the most recently written value of gauge ``name`` across workers."""
+        self.flush()
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT value FROM gauges WHERE name = ? ORDER BY updated_at DESC LIMIT 1", (name,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def samples(self, metric: str, limit: Optional[int] = None) -> List[float]:
+        """Get samples for ``metric`` from all workers' ring buffers, oldest first."""
+        self.flush()
+        query = "SELECT value FROM samples WHERE metric = ? ORDER BY recorded_at DESC"
+        params: tuple = (metric,)
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (metric, limit)
+        with self._db_lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [row[0] for row in reversed(rows)]
+
+    def worker_count(self) -> int:
+        """Get the number of workers heard from within ``worker_ttl`` seconds."""
+        self.flush()
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM workers WHERE last_seen >= ?", (time.time() - self.worker_ttl,)
+            ).fetchone()
+        return row[0]
+
+    # Maintenance
+
+    def reset(self) -> None:
+        """Clear all metrics for every worker."""
+        with self._buffer_lock:
+            self._pending_counters = {}
+            self._pending_gauges = {}
+            self._pending_samples = []
+            self._sample_seq = {}
+        with self._db_lock, self._conn:
+            self._conn.execute("DELETE FROM counters")
+            self._conn.execute("DELETE FROM gauges")
+            self._conn.execute("DELETE FROM samples")
+
+    def close(self) -> None:
+        """Stop the flusher, write any buffered metrics and close the database."""
+        self._stop.set()
+        if self._flusher:
+            self._flusher.join(timeout=self.flush_interval + 1)
+        self.flush()
+        with self._db_lock:
+            # A cleanly stopped worker stops counting at once, not after worker_ttl
+            with self._conn:
+                self._conn.execute("DELETE FROM workers WHERE worker_id = ?", (self.worker_id,))
+            self._conn.close()
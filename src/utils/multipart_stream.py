@@ -0,0 +1,139 @@
+"""
+Streaming multipart/form-data reader for Legal Intelligence AI System
+====================================================================
+Extracts one file part from a multipart/form-data body as it arrives.
+
+Complaint uploads are streamed into the complaint store, so the body is
+never buffered whole: ``MultipartFileReader.feed`` takes the chunks the
+server receives and returns the bytes of the file part found so far,
+holding back only enough to recognise a boundary split across chunks.
+The file part is the first with a filename, or whose field name is one of
+``field_names``; other parts are skipped.
+"""
+
+import re
+from typing import Optional, Sequence
+
+# Longest header block accepted for a single part
+MAX_HEADER_BYTES = 16 * 1024
+
+_BOUNDARY = re.compile(r'boundary=(?:"([^"]+)"|([^;\s]+))', re.IGNORECASE)
+_DISPOSITION_PARAM = re.compile(r';\s*([\w*-]+)\s*=\s*(?:"((?:[^"\\]|\\.)*)"|([^;\s]*))')
+
+
+class MultipartError(ValueError):
+    """Raised for a malformed or incomplete multipart body."""
+
+
+def multipart_boundary(content_type: str) -> str:
+    """The boundary of a multipart Content-Type header value."""
+    match = _BOUNDARY.search(content_type or "")
+    if not match:
+        raise MultipartError("multipart Content-Type has no boundary")
+    boundary = match.group(1) or match.group(2)
+    if len(boundary) > 70:
+        raise MultipartError("multipart boundary longer than 70 characters")
+    return boundary
+
+
+class MultipartFileReader:
+    """Incremental parser returning the content of one file part of a multipart body."""
+
+    def __init__(self, boundary: str, field_names: Sequence[str] = ("complaint", "file")):
+        """
+        Args:
+            boundary: Boundary from the request's Content-Type header
+            field_names: Field names accepted for the file part when it has no filename
+        """
+        self.field_names = set(field_names)
+        self.filename: Optional[str] = None
+        self.found = False
+        self._delimiter = b"\r\n--" + boundary.encode("latin-1")
+        # The first boundary has no preceding line break; supply one
+        self._buffer = b"\r\n"
+        self._state = "preamble"
+        self._in_file = False
+
+    @property
+    def complete(self) -> bool:
+        return self._state == "done"
+
+    def feed(self, data: bytes) -> bytes:
+        """Consume a chunk of the body; returns file part content it completed."""
+        if self._state == "done":
+            return b""
+        self._buffer += data
+        output = []
+        while True:
+            if self._state in ("preamble", "body"):
+                index = self._buffer.find(self._delimiter)
+                if index < 0:
+                    # Hold back what could be the start of a split delimiter
+                    keep = len(self._delimiter) - 1
+                    if self._in_file and len(self._buffer) > keep:
+                        output.append(self._buffer[:-keep])
+                    self._buffer = self._buffer[-keep:]
+                    break
+                if self._in_file:
+                    output.append(self._buffer[:index])
+                    self._in_file = False
+                self._buffer = self._buffer[index + len(self._delimiter):]
+                self._state = "boundary"
+
+            elif self._state == "boundary":
+                if len(self._buffer) < 2:
+                    break
+                if self._buffer.startswith(b"--"):
+                    self._state = "done"
+                    self._buffer = b""
+                    break
+                end = self._buffer.find(b"\r\n")
+                if end < 0:
+                    if len(self._buffer) > MAX_HEADER_BYTES:
+                        raise MultipartError("malformed multipart boundary line")
+                    break
+                if self._buffer[:end].strip(b" \t"):
+                    raise MultipartError("malformed multipart boundary line")
+                self._buffer = self._buffer[end + 2:]
+                self._state = "headers"
+
+            elif self._state == "headers":
+                if self._buffer.startswith(b"\r\n"):
+                    headers, self._buffer = b"", self._buffer[2:]
+                else:
+                    end = self._buffer.find(b"\r\n\r\n")
+                    if end < 0:
+                        if len(self._buffer) > MAX_HEADER_BYTES:
+                            raise MultipartError("multipart part headers too large")
+                        break
+                    headers, self._buffer = self._buffer[:end], self._buffer[end + 4:]
+                self._in_file = not self.found and self._is_file_part(headers)
+                self.found = self.found or self._in_file
+                self._state = "body"
+
+        return b"".join(output)
+
+    def close(self) -> None:
+        """Check the body ended properly and contained a file part."""
+        if self._state != "done":
+            raise MultipartError("multipart body ended before its closing boundary")
+        if not self.found:
+            raise MultipartError(
+                f"multipart body has no file part (expected a filename or a field named "
+                f"{' or '.join(sorted(self.field_names))})"
+            )
+
+    def _is_file_part(self, headers: bytes) -> bool:
+        for line in headers.decode("latin-1").split("\r\n"):
+            name, _, value = line.partition(":")
+            if name.strip().lower() != "content-disposition":
+                continue
+            params = {
+                key.lower(): quoted or plain
+                for key, quoted, plain in _DISPOSITION_PARAM.findall(value)
+            }
+            if params.get("filename"):
+                self.filename = params["filename"]
+                return True
+            return params.get("name") in self.field_names
+        return False
@@ -0,0 +1,165 @@
+"""
+Passage Retrieval for Legal Intelligence AI System
+==================================================
+Finds the parts of a long complaint each section needs.
+
+Prompts used to quote the first 1,500 characters of the complaint. In a
+long complaint the facts a damages or prior-art section needs usually come
+much later. ComplaintIndex splits the complaint into passages of about
+``passage_words`` words, cut at sentence ends where possible. It indexes
+them with Okapi BM25 once per complaint. Each section then retrieves the
+passages that best match its query terms (its scoring keywords and
+expected elements) until a token budget is filled. Passages are quoted in
+document order, with ``[...]`` marking the gaps.
+
+Complaints that fit within the budget are quoted whole. The opening
+passage, which names the parties, is always included when it fits.
+"""
+
+import re
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from .text_terms import content_terms
+
+# Same estimate the agent uses for scheduling: ~4 characters per token
+CHARS_PER_TOKEN = 4
+
+PASSAGE_WORDS = 80
+GAP_MARKER = "\n[...]\n"
+
+_TOKEN_PATTERN = re.compile(r"\S+")
+
+
+def retrieval_terms(text: str) -> List[str]:
+    """Content words of text with plural endings dropped, so "claims" finds "claim"."""
+    return [
+        term[:-1] if len(term) > 3 and term.endswith("s") and not term.endswith("ss") else term
+        for term in content_terms(text)
+    ]
+
+
+def chunk_text(text: str, passage_words: int = PASSAGE_WORDS) -> List[Tuple[int, int]]:
+    """
+    Split text into passages of about ``passage_words`` words.
+
+    Returns (start, end) character spans. A passage ends at a paragraph
+    break once it has an eighth of ``passage_words`` words, so numbered
+    allegations usually stay whole, or at the first sentence end after
+    ``passage_words`` words, and never runs past twice that many.
+    """
+    spans: List[Tuple[int, int]] = []
+    start = None
+    count = 0
+    tokens = list(_TOKEN_PATTERN.finditer(text))
+    for index, token in enumerate(tokens):
+        if start is None:
+            start = token.start()
+        count += 1
+        end = token.end()
+        next_start = tokens[index + 1].start() if index + 1 < len(tokens) else len(text)
+        paragraph_break = text.count("\n", end, next_start) >= 2
+        sentence_end = token.group()[-1] in ".!?"
+        if (
+            (count >= passage_words and sentence_end)
+            or (count >= passage_words // 8 and paragraph_break)
+            or count >= 2 * passage_words
+        ):
+            spans.append((start, end))
+            start = None
+            count = 0
+    if start is not None:
+        spans.append((start, tokens[-1].end()))
+    return spans
+
+
+class BM25Index:
+    """Okapi BM25 over a fixed set of tokenized documents."""
+
+    def __init__(self, documents: Sequence[Sequence[str]], k1: float = 1.5, b: float = 0.75):
+        self.document_count = len(documents)
+        lengths = np.array([len(terms) for terms in documents], dtype=float)
+        average = lengths.mean() if self.document_count and lengths.mean() > 0 else 1.0
+        # Length normalization of each document, the denominator's constant part
+        self._norms = k1 * (1 - b + b * lengths / average)
+        self.k1 = k1
+
+        postings: Dict[str, Dict[int, int]] = {}
+        for document, terms in enumerate(documents):
+            for term in terms:
+                counts = postings.setdefault(term, {})
+                counts[document] = counts.get(document, 0) + 1
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray, float]] = {}
+        for term, counts in postings.items():
+            frequency = len(counts)
+            idf = float(np.log((self.document_count - frequency + 0.5) / (frequency + 0.5) + 1))
+            self._postings[term] = (
+                np.fromiter(counts.keys(), dtype=np.intp, count=frequency),
+                np.fromiter(counts.values(), dtype=float, count=frequency),
+                idf
+            )
+
+    def scores(self, query_terms: Iterable[str]) -> np.ndarray:
+        """BM25 score of every document for the query (each distinct term counted once)."""
+        scores = np.zeros(self.document_count)
+        for term in set(query_terms):
+            posting = self._postings.get(term)
+            if posting is None:
+                continue
+            documents, frequencies, idf = posting
+            scores[documents] += idf * frequencies * (self.k1 + 1) / (frequencies + self._norms[documents])
+        return scores
+
+
+class ComplaintIndex:
+    """A complaint split into passages and indexed for retrieval."""
+
+    def __init__(self, text: str, passage_words: int = PASSAGE_WORDS):
+        self.text = text
+        self.spans = chunk_text(text, passage_words)
+        self.tokens = [(end - start) // CHARS_PER_TOKEN for start, end in self.spans]
+        self.total_tokens = len(text) // CHARS_PER_TOKEN
+        self.bm25 = BM25Index([retrieval_terms(text[start:end]) for start, end in self.spans])
+
+    def select(self, query_terms: Sequence[str], token_budget: int, lead_passages: int = 1) -> List[int]:
+        """Indexes of the passages to quote, in document order."""
+        scores = self.bm25.scores(query_terms)
+        # Opening passages first, then best match first; unmatched passages
+        # fill any remaining budget in document order
+        ranked = list(range(min(lead_passages, len(self.spans))))
+        ranked += [int(index) for index in np.lexsort((np.arange(len(self.spans)), -scores)) if index >= lead_passages]
+
+        selected = []
+        used = 0
+        for index in ranked:
+            if used + self.tokens[index] <= token_budget:
+                selected.append(index)
+                used += self.tokens[index]
+        return sorted(selected)
+
+    def excerpt(self, query_terms: Sequence[str], token_budget: int, lead_passages: int = 1) -> str:
+        """The complaint, or its most relevant passages within the token budget."""
+        if self.total_tokens <= token_budget or not self.spans:
+            return self.text
+
+        selected = self.select(query_terms, token_budget, lead_passages)
+        if not selected:
+            # Budget smaller than any passage: fall back to the opening
+            return self.text[:token_budget * CHARS_PER_TOKEN]
+
+        # Adjacent passages are quoted as one run, with the text between them
+        runs: List[List[int]] = []
+        for index in selected:
+            if runs and index == runs[-1][-1] + 1:
+                runs[-1].append(index)
+            else:
+                runs.append([index])
+        excerpt = GAP_MARKER.join(
+            self.text[self.spans[run[0]][0]:self.spans[run[-1]][1]] for run in runs
+        )
+        if selected[0] > 0:
+            excerpt = GAP_MARKER.lstrip("\n") + excerpt
+        if selected[-1] < len(self.spans) - 1:
+            excerpt += GAP_MARKER.rstrip("\n")
+        return excerpt
@@ -0,0 +1,109 @@
+"""
+Scenario Builder for Legal Intelligence AI System
+=================================================
+Turns raw complaint text into a LegalScenario, extracting parties and key
+issues (see complaint_extractor). Shared by the API server and the
+command-line batch runner.
+"""
+
+from datetime import datetime
+from typing import Iterable, List, Optional, Set
+
+from ..models.legal_models import CaseType, LegalScenario
+from .complaint_extractor import ISSUE_GAZETTEERS, ComplaintEntities, ComplaintExtractor
+
+# How a found issue term is named as a key issue, by case type
+ISSUE_LABELS = {
+    CaseType.INTELLECTUAL_PROPERTY.value: "{title} dispute",
+    CaseType.CONTRACT.value: "Contract {term}",
+    CaseType.CORPORATE.value: "{title} claim",
+    CaseType.ANTITRUST.value: "{title} claim",
+    CaseType.EMPLOYMENT.value: "{title} claim",
+    CaseType.REGULATORY.value: "{title} issue",
+}
+
+DEFAULT_PARTIES = ["Party A", "Party B"]
+DEFAULT_ISSUES = ["Primary legal dispute", "Damages assessment", "Remedy determination"]
+
+# Shared compiled rules; extractions are memoized by complaint hash
+EXTRACTOR = ComplaintExtractor()
+
+
+def extract_entities(complaint_text: str, key: Optional[str] = None) -> ComplaintEntities:
+    """Parties, amounts, dates, patents, statutes and issue terms of a complaint, in one pass."""
+    return EXTRACTOR.extract(complaint_text, key=key)
+
+
+def extract_parties(complaint_text: str) -> List[str]:
+    """Extract party names from complaint text."""
+    return extract_entities(complaint_text).parties or list(DEFAULT_PARTIES)
+
+
+def find_issue_terms(complaint_text: str) -> Set[str]:
+    """Gazetteer issue terms that occur in the complaint."""
+    return set(extract_entities(complaint_text).issue_terms)
+
+
+def gazetteer_case_type(case_type: str) -> Optional[str]:
+    """The ISSUE_GAZETTEERS entry for a case type, or None for other case types."""
+    if "IP" in case_type or "intellectual" in case_type.lower():
+        return CaseType.INTELLECTUAL_PROPERTY.value
+    for name in ISSUE_GAZETTEERS:
+        if name.lower() in case_type.lower():
+            return name
+    return None
+
+
+def key_issues_from_terms(found_terms: Iterable[str], case_type: str) -> List[str]:
+    """Key legal issues for a case type, given the issue terms found in its complaint."""
+    found = set(found_terms)
+    issues = []
+
+    # Case type specific issues
+    gazetteer = gazetteer_case_type(case_type)
+    if gazetteer is not None:
+        label = ISSUE_LABELS[gazetteer]
+        issues = [
+            label.format(term=term, title=term.title())
+            for term in ISSUE_GAZETTEERS[gazetteer] if term in found
+        ]
+
+    # Default issues if none found
+    if not issues:
+        issues = list(DEFAULT_ISSUES)
+
+    return issues
+
+
+def extract_key_issues(complaint_text: str, case_type: str) -> List[str]:
+    """Extract key legal issues from complaint."""
+    return key_issues_from_terms(find_issue_terms(complaint_text), case_type)
+
+
+def build_scenario(
+    case_name: str,
+    complaint_text: str,
+    case_type: str,
+    urgency_level: str = "standard",
+    additional_context: Optional[str] = None,
+    filing_date: Optional[str] = None,
+    parties_involved: Optional[List[str]] = None,
+    key_issues: Optional[List[str]] = None,
+    complaint_id: Optional[str] = None
+) -> LegalScenario:
+    """Create a legal scenario, extracting parties and issues when not supplied."""
+    if not parties_involved or not key_issues:
+        entities = extract_entities(complaint_text, key=complaint_id)
+        parties_involved = parties_involved or entities.parties or list(DEFAULT_PARTIES)
+        key_issues = key_issues or key_issues_from_terms(entities.issue_terms, case_type)
+    return LegalScenario(
+        case_name=case_name,
+        complaint_text=complaint_text,
+        complaint_id=complaint_id,
+        case_type=case_type,
+        filing_date=filing_date or datetime.now().isoformat(),
+        parties_involved=parties_involved,
+        key_issues=key_issues,
+        urgency_level=urgency_level,
+        additional_context=additional_context
+    )
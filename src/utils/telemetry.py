@@ -0,0 +1,195 @@
+"""
+In-Process Telemetry for Legal Intelligence AI System
+=====================================================
+Fixed-memory rolling statistics for long-running processes.
+
+A RollingMetric keeps lifetime running totals, the most recent ``window``
+samples in a ring buffer, a log-bucketed histogram of that window for
+quantiles and per-slot event counts for a time-windowed rate. Recording a
+sample and reading a snapshot both cost the same however long the process
+has been up, and memory stays flat.
+
+Quantiles come from the histogram and are within ``relative_accuracy`` of
+the exact value (the DDSketch bucketing). The histogram tracks the window,
+not the lifetime, so evicted samples are removed from it exactly.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+
+class RollingMetric:
+    """Running totals, windowed quantiles and a recent rate for one metric."""
+
+    def __init__(
+        self,
+        window: int = 1000,
+        rate_window_seconds: float = 60.0,
+        rate_slots: int = 60,
+        relative_accuracy: float = 0.01,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            window: Most recent samples kept for windowed statistics
+            rate_window_seconds: Period the event rate is measured over
+            rate_slots: Time slots the rate period is divided into
+            relative_accuracy: Relative error bound on quantiles
+            clock: Source of timestamps, in seconds
+        """
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = window
+        self.rate_window_seconds = rate_window_seconds
+        self.relative_accuracy = relative_accuracy
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        # Lifetime totals
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+        # Recent samples, their sum and their histogram (bucket -> count)
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._window_total = 0.0
+        self._evictions = 0
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+
+        # Events per time slot; a slot is reused once its period has passed
+        self._slot_seconds = rate_window_seconds / rate_slots
+        self._slot_counts: List[int] = [0] * rate_slots
+        self._slot_ids: List[int] = [-1] * rate_slots
+
+    def _bucket(self, value: float) -> int:
+        # Non-positive values share one bucket below every positive one
+        if value <= 0:
+            return -(2 ** 31)
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _bucket_value(self, bucket: int) -> float:
+        if bucket == -(2 ** 31):
+            return 0.0
+        return 2 * self._gamma ** bucket / (self._gamma + 1)
+
+    def record(self, value: float) -> None:
+        """Add a sample."""
+        value = float(value)
+        slot_id = int(self._clock() // self._slot_seconds)
+        with self._lock:
+            self.count += 1
+            self.total += value
+            self.min = value if self.min is None else min(self.min, value)
+            self.max = value if self.max is None else max(self.max, value)
+
+            if len(self._samples) == self.window:
+                evicted = self._samples[0]
+                self._window_total -= evicted
+                self._evictions += 1
+                bucket = self._bucket(evicted)
+                self._buckets[bucket] -= 1
+                if not self._buckets[bucket]:
+                    del self._buckets[bucket]
+            self._samples.append(value)
+            self._window_total += value
+            if self._evictions >= self.window:
+                # Re-sum once per window so subtraction error cannot accumulate
+                self._window_total = math.fsum(self._samples)
+                self._evictions = 0
+            bucket = self._bucket(value)
+            self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+
+            index = slot_id % len(self._slot_counts)
+            if self._slot_ids[index] != slot_id:
+                self._slot_ids[index] = slot_id
+                self._slot_counts[index] = 0
+            self._slot_counts[index] += 1
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def recent(self) -> List[float]:
+        """Samples in the window, oldest first."""
+        with self._lock:
+            return list(self._samples)
+
+    @property
+    def mean(self) -> float:
+        """Lifetime mean."""
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def window_mean(self) -> float:
+        """Mean of the samples in the window."""
+        with self._lock:
+            return self._window_total / len(self._samples) if self._samples else 0.0
+
+    def quantiles(self, qs: Tuple[float, ...]) -> List[float]:
+        """Approximate quantiles of the window, for each q in [0, 1]."""
+        with self._lock:
+            size = len(self._samples)
+            if not size:
+                return [0.0 for _ in qs]
+            ordered = sorted(self._buckets.items())
+            low, high = self.min, self.max
+
+        results = []
+        for q in qs:
+            rank = q * (size - 1)
+            seen = 0
+            for bucket, count in ordered:
+                seen += count
+                if seen > rank:
+                    break
+            # Bucket midpoints can fall just outside the observed range
+            results.append(min(max(self._bucket_value(bucket), low), high))
+        return results
+
+    def quantile(self, q: float) -> float:
+        """Approximate q-quantile of the window."""
+        return self.quantiles((q,))[0]
+
+    def rate(self) -> float:
+        """Events per second over the last ``rate_window_seconds``."""
+        current = int(self._clock() // self._slot_seconds)
+        oldest = current - len(self._slot_counts)
+        with self._lock:
+            events = sum(
+                count for slot_id, count in zip(self._slot_ids, self._slot_counts)
+                if oldest < slot_id <= current
+            )
+        return events / self.rate_window_seconds
+
+    def snapshot(self) -> Dict[str, float]:
+        """Summary statistics for reporting."""
+        p50, p95, p99 = self.quantiles((0.5, 0.95, 0.99))
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "window_mean": self.window_mean,
+            "p50": p50,
+            "p95": p95,
+            "p99": p99,
+            "max": self.max if self.max is not None else 0.0,
+            "per_minute": self.rate() * 60
+        }
+
+    def reset(self) -> None:
+        """Forget every sample."""
+        with self._lock:
+            self.count = 0
+            self.total = 0.0
+            self.min = None
+            self.max = None
+            self._samples.clear()
+            self._window_total = 0.0
+            self._evictions = 0
+            self._buckets.clear()
+            self._slot_counts = [0] * len(self._slot_counts)
+            self._slot_ids = [-1] * len(self._slot_ids)
@@ -0,0 +1,34 @@
+"""
+Text Terms for Legal Intelligence AI System
+===========================================
+Words and content terms, as passage retrieval and source grounding count
+them, and the hash that identifies a complaint's text.
+"""
+
+import re
+import hashlib
+from typing import List
+
+# Words, as keyword_engine tokenizes them, without the punctuation tokens
+WORD_PATTERN = re.compile(r"\w+")
+
+# Function words that carry no information about the case
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being below
+between both but by can could did do does doing down during each few for from further had has have
+having he her here hers herself him himself his how i if in into is it its itself just may me might
+more most must my myself no nor not now of off on once only or other our ours ourselves out over own
+same shall she should so some such than that the their theirs them themselves then there these they
+this those through to too under until up upon very was we were what when where which while who whom
+why will with would you your yours yourself yourselves
+""".split())
+
+
+def complaint_hash(complaint_text: str) -> str:
+    """Cache key of a complaint; equals its complaint store id."""
+    return hashlib.sha256(complaint_text.encode("utf-8")).hexdigest()[:32]
+
+
+def content_terms(text: str) -> List[str]:
+    """Lowercase words of text, without stopwords."""
+    return [word for word in WORD_PATTERN.findall(text.lower()) if word not in STOPWORDS]
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for admission control and load shedding.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.testclient import TestClient
+
+import main
+from src.core.admission import AdmissionController, AdmissionRejected
+from src.core.tenant_scheduler import FairScheduler
+
+
+class TestAdmissionController(unittest.TestCase):
+    """Requests beyond capacity are shed, lowest urgency first."""
+
+    def setUp(self):
+        self.controller = AdmissionController(
+            model_concurrency=2,
+            max_queue_depth=4,
+            max_backlog_seconds=1000,
+            default_report_seconds=60
+        )
+
+    def test_capacity_is_admitted_freely(self):
+        """Requests that fit in model concurrency never queue."""
+        tickets = [self.controller.admit("low") for _ in range(2)]
+        self.assertEqual(self.controller.queue_depth, 0)
+        for ticket in tickets:
+            ticket.release()
+        self.assertEqual(self.controller.active, 0)
+
+    def test_low_urgency_shed_before_critical(self):
+        """Low urgency is rejected with 429 while critical still gets in."""
+        for _ in range(4):
+            self.controller.admit("critical")  # 2 running, 2 queued
+
+        with self.assertRaises(AdmissionRejected) as context:
+            self.controller.admit("low")
+        self.assertEqual(context.exception.status_code, 429)
+        # One queued report must drain: 60s report / 2 slots
+        self.assertEqual(context.exception.retry_after, 30)
+
+        self.controller.admit("critical")
+        self.controller.admit("critical")
+        with self.assertRaises(AdmissionRejected) as context:
+            self.controller.admit("critical")
+        self.assertEqual(context.exception.status_code, 503)
+
+    def test_backlog_time_limit(self):
+        """Requests are shed when the estimated wait exceeds the tier's budget."""
+        controller = AdmissionController(model_concurrency=1, max_queue_depth=100, max_backlog_seconds=100,
+                                         default_report_seconds=40)
+        for _ in range(3):
+            controller.admit("critical")  # 2 queued -> 80s backlog
+        with self.assertRaises(AdmissionRejected):
+            controller.admit("standard")  # standard budget is 75s
+        controller.admit("high")  # high budget is 90s
+
+    def test_release_updates_report_estimate(self):
+        """Completed requests feed the average report duration."""
+        ticket = self.controller.admit("standard")
+        ticket.admitted_at -= 160
+        ticket.release()
+        self.assertAlmostEqual(self.controller.avg_report_seconds, 80, delta=1)
+
+
+class TestAnalyzeShedding(unittest.TestCase):
+    """POST /analyze returns Retry-After when shed."""
+
+    def test_retry_after_header(self):
+        controller = AdmissionController(model_concurrency=1, max_queue_depth=1)
+        controller.admit("critical")
+        controller.admit("critical")
+        agent = Mock()
+        agent.scheduler = FairScheduler(total_slots=1)
+        state = {"initialized": True, "agent": agent, "metrics": Mock(), "admission": controller}
+        with patch.dict(main.system_state, state):
+            response = TestClient(main.app).post("/analyze", json={
+                "case_name": "Test", "complaint_text": "Text", "case_type": "IP", "urgency": "low"
+            })
+
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response.headers)
+        agent.generate_complete_report.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the bulk analysis endpoint.
+"""
+
+import sys
+import json
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, AsyncMock, patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.testclient import TestClient
+
+import main
+from src.core.admission import AdmissionController
+from src.core.tenant_scheduler import FairScheduler
+from src.models.legal_models import AnalysisReport
+
+
+def _fake_report(scenario) -> AnalysisReport:
+    return AnalysisReport(
+        scenario=scenario,
+        sections=[],
+        executive_summary="Summary",
+        total_cost=0.01,
+        total_tokens=150,
+        processing_time=0.1,
+        confidence_score=0.8,
+        timestamp="2024-01-01T00:00:00"
+    )
+
+
+class TestBatchAnalysisEndpoint(unittest.TestCase):
+    """POST /analyze/batch streams one NDJSON line per case."""
+
+    def setUp(self):
+        self.agent = Mock()
+        self.agent.scheduler = FairScheduler(total_slots=4)
+        self.state = {
+            "initialized": True,
+            "agent": self.agent,
+            "personas": None,
+            "validator": Mock(),
+            "metrics": Mock(),
+            "admission": AdmissionController(model_concurrency=4)
+        }
+        patcher = patch.dict(main.system_state, self.state)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = TestClient(main.app)
+
+    def _case(self, name: str) -> dict:
+        return {"case_name": name, "complaint_text": "Plaintiff alleges breach.", "case_type": "Contract"}
+
+    def test_batch_streams_results_and_isolates_failures(self):
+        """A failing case produces a failed line without aborting the batch."""
+        async def generate(scenario, **kwargs):
+            if scenario.case_name == "bad":
+                raise RuntimeError("model down")
+            return _fake_report(scenario)
+
+        self.agent.generate_complete_report = AsyncMock(side_effect=generate)
+
+        response = self.client.post(
+            "/analyze/batch",
+            json={"requests": [self._case("one"), self._case("bad"), self._case("three")]}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("application/x-ndjson", response.headers["content-type"])
+        lines = [json.loads(line) for line in response.text.splitlines() if line]
+        by_index = {line["index"]: line for line in lines}
+
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(by_index[0]["status"], "completed")
+        self.assertEqual(by_index[0]["report"]["total_tokens"], 150)
+        self.assertEqual(by_index[1]["status"], "failed")
+        self.assertIn("model down", by_index[1]["error"])
+        self.assertEqual(by_index[2]["status"], "completed")
+
+    def test_batch_size_limit(self):
+        """Batches over MAX_BATCH_SIZE are rejected up front."""
+        with patch.dict(main.CONFIG, {"max_batch_size": 1}):
+            response = self.client.post(
+                "/analyze/batch",
+                json={"requests": [self._case("one"), self._case("two")]}
+            )
+        self.assertEqual(response.status_code, 413)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for the resumable command-line batch runner.
+"""
+
+import io
+import os
+import sys
+import json
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, AsyncMock
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.batch_runner import BatchRunner, load_jsonl_scenarios, load_completed_ids
+from src.models.legal_models import AnalysisReport
+
+
+class TestBatchRunner(unittest.TestCase):
+    """Batch runs write incrementally and skip completed scenarios on restart."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.tmpdir.name, "cases.jsonl")
+        self.output_path = os.path.join(self.tmpdir.name, "reports.jsonl")
+        with open(self.input_path, "w") as f:
+            for i in range(3):
+                f.write(json.dumps({
+                    "id": f"case-{i}",
+                    "case_name": f"Case {i}",
+                    "complaint_text": "Plaintiff alleges breach of contract.",
+                    "case_type": "Contract"
+                }) + "\n")
+            f.write("not json\n")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _agent(self, fail_names=()):
+        async def generate(scenario):
+            if scenario.case_name in fail_names:
+                raise RuntimeError("model down")
+            return AnalysisReport(
+                scenario=scenario, sections=[], executive_summary="", total_cost=0.0,
+                total_tokens=0, processing_time=0.0, confidence_score=0.8, timestamp="now"
+            )
+        agent = Mock()
+        agent.generate_complete_report = AsyncMock(side_effect=generate)
+        return agent
+
+    def test_invalid_lines_are_skipped(self):
+        """Malformed records are logged and skipped."""
+        items = list(load_jsonl_scenarios(self.input_path))
+        self.assertEqual([item.scenario_id for item in items], ["case-0", "case-1", "case-2"])
+
+    def test_restart_skips_completed_scenarios(self):
+        """Only failed or missing scenarios are re-run after a restart."""
+        items = list(load_jsonl_scenarios(self.input_path))
+
+        first = BatchRunner(self._agent(fail_names={"Case 1"}), self.output_path, progress_stream=io.StringIO())
+        summary = asyncio.run(first.run(items))
+        self.assertEqual((summary["completed"], summary["failed"]), (2, 1))
+        self.assertEqual(load_completed_ids(self.output_path), {"case-0", "case-2"})
+
+        # Simulate a crash that left a truncated line behind
+        with open(self.output_path, "a") as f:
+            f.write('{"scenario_id": "case-1", "sta')
+
+        agent = self._agent()
+        second = BatchRunner(agent, self.output_path, progress_stream=io.StringIO())
+        summary = asyncio.run(second.run(items))
+
+        self.assertEqual(summary["skipped"], 2)
+        self.assertEqual(agent.generate_complete_report.call_count, 1)
+        self.assertEqual(load_completed_ids(self.output_path), {"case-0", "case-1", "case-2"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Tests for vectorized batch validation and the /validate/batch endpoint.
+"""
+
+import sys
+import random
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.testclient import TestClient
+
+import main
+from src.core.batch_validator import BatchSection, BatchValidator
+from src.core.quality_validator import QualityValidator
+from src.models.legal_models import AnalysisReport, LegalScenario, ReportSection
+
+
+def _random_sections(validator: QualityValidator, count: int, seed: int = 3):
+    """Sections spanning every scoring tier, including empty and unknown-type ones."""
+    rng = random.Random(seed)
+    vocabulary = (
+        [keyword for keywords in validator.SECTION_KEYWORDS.values() for keyword in keywords] +
+        validator.LOGICAL_CONNECTORS + validator.STRUCTURE_MARKERS + validator.REASONING_PHRASES +
+        validator.LIST_MARKERS + validator.CONCLUSION_INDICATORS +
+        ["the", "court", "recommendations", "risks", "SUMMARY", "# Findings", ".", "!", "?", "\n", "\n\n"]
+    )
+    section_types = list(validator.SECTION_KEYWORDS) + ["executive_summary"]
+    sections = []
+    for _ in range(count):
+        section_type = rng.choice(section_types)
+        expected = validator.expected_elements_for(section_type) if rng.random() < 0.8 else []
+        content = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 300)))
+        sections.append(BatchSection(content=content, section_type=section_type, expected_elements=expected))
+    return sections
+
+
+def _report(name: str, contents) -> AnalysisReport:
+    return AnalysisReport(
+        scenario=LegalScenario(
+            case_name=name, complaint_text="Complaint", case_type="Contract", filing_date="2024-01-01"
+        ),
+        sections=[
+            ReportSection(
+                type=section_type, title=section_type.replace("_", " ").title(), content=content,
+                agent_type="test", quality_score=0.0, tokens_used=0, cost=0.0, timestamp="2024-01-01T00:00:00"
+            )
+            for section_type, content in contents
+        ],
+        executive_summary="Summary",
+        total_cost=0.0,
+        total_tokens=0,
+        processing_time=0.0,
+        confidence_score=0.0,
+        timestamp="2024-01-01T00:00:00"
+    )
+
+
+LIABILITY_TEXT = (
+    "LIABILITY\n\nFirst, the defendant breached its duty of care because the evidence shows negligence. "
+    "Therefore the claim has merit based on precedent.\n\n"
+    "- Causation is established\n- Damages follow\n\nIn conclusion, liability is likely."
+)
+
+
+class TestBatchValidator(unittest.TestCase):
+
+    def setUp(self):
+        self.validator = QualityValidator()
+        self.batch_validator = BatchValidator(self.validator)
+
+    def test_scores_match_validate_section_exactly(self):
+        sections = _random_sections(self.validator, 500)
+        expected = [
+            self.validator.validate_section(section.content, section.section_type, section.expected_elements)
+            for section in sections
+        ]
+        self.assertEqual(self.batch_validator.score_sections(sections), expected)
+
+    def test_empty_batch(self):
+        self.assertEqual(self.batch_validator.score_sections([]), [])
+
+    def test_reports_match_validate_report_without_recording(self):
+        reports = [
+            _report("A", [("liability_assessment", LIABILITY_TEXT), ("risk_assessment", "Some risk.")]),
+            _report("B", []),
+            _report("C", [("strategic_recommendations", "We recommend a plan.\n\nTimeline follows.")])
+        ]
+        results = self.batch_validator.validate_reports(reports)
+        self.assertEqual(len(self.validator.validation_history), 0)
+
+        self.assertEqual(results, [self.validator.validate_report(report) for report in reports])
+
+    def test_threshold_override(self):
+        report = _report("A", [("liability_assessment", LIABILITY_TEXT)])
+        strict, lenient = (
+            self.batch_validator.validate_reports([report], min_quality_threshold=threshold)[0]
+            for threshold in (1.0, 0.0)
+        )
+        self.assertFalse(strict.passed)
+        self.assertEqual(len(strict.issues), 1)
+        self.assertTrue(lenient.passed)
+        self.assertEqual(lenient.issues, [])
+
+
+class TestBatchValidationEndpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.validator = QualityValidator()
+        self.batch_validator = BatchValidator(self.validator)
+        patcher = patch.dict(main.system_state, {
+            "initialized": True, "validator": self.validator, "batch_validator": self.batch_validator
+        })
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = TestClient(main.app)
+
+    def test_results_in_request_order(self):
+        reports = [
+            _report("First", [("liability_assessment", LIABILITY_TEXT)]),
+            _report("Second", [("risk_assessment", "Risk is low.")])
+        ]
+        response = self.client.post("/validate/batch", json={"reports": [r.dict() for r in reports]})
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual([r["case_name"] for r in body["results"]], ["First", "Second"])
+        self.assertEqual(body["sections_scored"], 2)
+        self.assertEqual(
+            body["results"][0]["overall_score"], self.validator.validate_report(reports[0]).overall_score
+        )
+
+    def test_batch_validator_reused_across_requests(self):
+        report = _report("A", [("liability_assessment", LIABILITY_TEXT)]).dict()
+        validate_reports = self.batch_validator.validate_reports
+        with patch("main.BatchValidator") as constructor, \
+                patch.object(self.batch_validator, "validate_reports", wraps=validate_reports) as validate:
+            for _ in range(2):
+                self.assertEqual(self.client.post("/validate/batch", json={"reports": [report]}).status_code, 200)
+        constructor.assert_not_called()
+        self.assertEqual(validate.call_count, 2)
+
+    def test_oversized_batch_rejected(self):
+        report = _report("A", []).dict()
+        with patch.dict(main.CONFIG, {"max_validation_batch_size": 1}):
+            response = self.client.post("/validate/batch", json={"reports": [report, report]})
+        self.assertEqual(response.status_code, 413)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for cancelling in-flight generation when the client disconnects.
+"""
+
+import sys
+import time
+import asyncio
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import main
+from src.core.agent_system import LegalIntelligenceAgent, GenerationCancelled
+from src.core.quality_validator import QualityScore, QualityValidator
+from src.models.legal_models import LegalScenario, TokenUsage
+
+
+class FakeHTTPRequest:
+    """Request stand-in whose client disconnects after a number of polls."""
+
+    def __init__(self, disconnect_after: int):
+        self.polls = 0
+        self.disconnect_after = disconnect_after
+
+    async def is_disconnected(self) -> bool:
+        self.polls += 1
+        return self.polls >= self.disconnect_after
+
+
+class TestCancellation(unittest.TestCase):
+    """Cancellation stops remaining sections and is counted."""
+
+    def setUp(self):
+        self.agent = LegalIntelligenceAgent("test-project")
+        self.agent.initialized = True
+        self.scenario = LegalScenario(
+            case_name="Test Case",
+            complaint_text="Plaintiff alleges patent infringement.",
+            case_type="IP",
+            filing_date="2024-01-01"
+        )
+
+    @patch.object(QualityValidator, 'validate_section')
+    @patch.object(LegalIntelligenceAgent, 'generate_section_content')
+    def test_disconnect_cancels_generation(self, mock_generate, mock_validate):
+        """A disconnect mid-report cancels the agent and signals in-flight calls."""
+        def slow_generate(*args, **kwargs):
+            time.sleep(0.05)
+            return "Content", TokenUsage(input_tokens=10, output_tokens=5, total_tokens=15), 0.01
+
+        mock_generate.side_effect = slow_generate
+        mock_validate.return_value = QualityScore(0.9, 0.9, 0.9, 0.9, 0.9, [])
+
+        async def run():
+            with patch.dict(main.CONFIG, {"disconnect_poll_interval": 0.01}):
+                await main._run_until_disconnect(
+                    FakeHTTPRequest(disconnect_after=2),
+                    self.agent.generate_complete_report(self.scenario)
+                )
+
+        with self.assertRaises(main.ClientDisconnected):
+            asyncio.run(run())
+
+        # Only the section in flight at disconnect was generated
+        self.assertEqual(mock_generate.call_count, 1)
+        self.assertTrue(mock_generate.call_args.kwargs["cancel_event"].is_set())
+
+        stats = self.agent.get_cancellation_stats()
+        self.assertEqual(stats["cancelled_reports"], 1)
+        self.assertEqual(stats["estimated_tokens_saved"], 5 * self.agent.generation_config.max_output_tokens)
+
+    def test_cancelled_event_stops_retries(self):
+        """No new model attempt starts once the cancel event is set."""
+        self.agent.model = Mock()
+        cancel_event = threading.Event()
+        cancel_event.set()
+
+        with self.assertRaises(GenerationCancelled):
+            self.agent.generate_section_content(
+                persona="Test persona",
+                section_type="liability_assessment",
+                scenario=self.scenario,
+                cancel_event=cancel_event
+            )
+        self.agent.model.generate_content.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Tests for map-reduce digestion of long complaints.
+"""
+
+import sys
+import time
+import asyncio
+import threading
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.agent_system import LegalIntelligenceAgent
+from src.core.case_digest import CaseDigester, reduce_summaries, split_chunks
+from src.core.quality_validator import QualityScore, QualityValidator
+from src.models.legal_models import LegalScenario, TokenUsage
+
+PARAGRAPH = (
+    "Defendant shipped the CloudCache product to customers in this district throughout the relevant period "
+    "and continues to do so. Each shipment practices the claimed method.\n\n"
+)
+COMPLAINT = "Plaintiff TechCorp Inc. sues defendant DataSystems LLC.\n\n" + PARAGRAPH * 400
+
+SUMMARY = """PARTIES:
+- TechCorp Inc. (plaintiff)
+- DataSystems LLC (defendant)
+CLAIMS:
+- Patent infringement
+DAMAGES: None
+"""
+
+
+def _usage() -> TokenUsage:
+    return TokenUsage(input_tokens=100, output_tokens=20, total_tokens=120)
+
+
+class TestDigestReduce(unittest.TestCase):
+
+    def test_chunks_cover_complaint_in_order(self):
+        chunks = split_chunks(COMPLAINT, chunk_tokens=500)
+        self.assertGreater(len(chunks), 5)
+        self.assertTrue(all(end - start <= 500 * 4 for start, end in chunks[1:-1]))
+        self.assertTrue(all(a[1] <= b[0] for a, b in zip(chunks, chunks[1:])))
+        self.assertEqual(COMPLAINT[chunks[0][0]:].rstrip(), COMPLAINT.rstrip())
+
+    def test_summaries_merged_without_repeats(self):
+        later = "KEY FACTS:\n- Sales of $15 million\nCLAIMS:\n- patent infringement\n- Willful infringement"
+        items, text = reduce_summaries([SUMMARY, later], token_budget=500)
+
+        self.assertEqual(items["PARTIES"], ["TechCorp Inc. (plaintiff)", "DataSystems LLC (defendant)"])
+        self.assertEqual(items["CLAIMS"], ["Patent infringement", "Willful infringement"])
+        self.assertEqual(items["DAMAGES"], [])
+        self.assertTrue(text.startswith("PARTIES:\n- TechCorp Inc. (plaintiff)"))
+        self.assertNotIn("DAMAGES", text)
+
+    def test_budget_shared_across_headings(self):
+        facts = "\n".join(f"- Fact number {i} about the accused product" for i in range(200))
+        items, text = reduce_summaries([f"KEY FACTS:\n{facts}\nRELIEF SOUGHT:\n- Injunction"], token_budget=100)
+        self.assertEqual(items["RELIEF SOUGHT"], ["Injunction"])
+        self.assertLessEqual(len(text), 100 * 4)
+
+
+class TestCaseDigester(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def _summarize(self, prompt, **kwargs):
+        with self.lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.05)
+        with self.lock:
+            self.in_flight -= 1
+        return SUMMARY, _usage(), 0.001
+
+    def test_chunks_summarized_concurrently_and_cached(self):
+        digester = CaseDigester(self._summarize, min_tokens=1000, chunk_tokens=500, max_parallel_chunks=4)
+        chunks = len(split_chunks(COMPLAINT, 500))
+
+        async def run():
+            started = time.perf_counter()
+            digest, built = await digester.digest(COMPLAINT)
+            elapsed = time.perf_counter() - started
+            again, built_again = await digester.digest(COMPLAINT)
+            return digest, built, elapsed, again, built_again
+
+        digest, built, elapsed, again, built_again = asyncio.run(run())
+
+        self.assertTrue(built)
+        self.assertEqual(digest.chunks, chunks)
+        self.assertEqual(self.calls, chunks)
+        self.assertEqual(self.peak, 4)
+        self.assertLess(elapsed, chunks * 0.05 / 2)
+        self.assertEqual(digest.token_usage.total_tokens, 120 * chunks)
+        self.assertIn("TechCorp Inc. (plaintiff)", digest.text)
+
+        self.assertIs(again, digest)
+        self.assertFalse(built_again)
+        self.assertEqual(digester.get_stats()["cache_hits"], 1)
+
+    def test_concurrent_reports_share_one_build(self):
+        digester = CaseDigester(self._summarize, min_tokens=1000, chunk_tokens=500)
+
+        async def run():
+            return await asyncio.gather(digester.digest(COMPLAINT), digester.digest(COMPLAINT))
+
+        (first, first_built), (second, second_built) = asyncio.run(run())
+        self.assertIs(first, second)
+        self.assertEqual([first_built, second_built], [True, False])
+        self.assertEqual(self.calls, first.chunks)
+
+
+class TestAgentDigest(unittest.TestCase):
+
+    @patch.object(QualityValidator, 'validate_section')
+    def test_sections_quote_digest(self, mock_validate):
+        agent = LegalIntelligenceAgent("test-project", digest_min_tokens=1000, digest_chunk_tokens=2000)
+        agent.initialized = True
+        prompts = []
+
+        def generate_content(contents, config=None):
+            prompts.append(contents)
+            text = SUMMARY if "COMPLAINT PART" in contents else "Section analysis."
+            return SimpleNamespace(
+                text=text,
+                usage_metadata=SimpleNamespace(prompt_token_count=100, candidates_token_count=20, total_token_count=120)
+            )
+
+        agent.model = Mock()
+        agent.model.generate_content.side_effect = generate_content
+        mock_validate.return_value = QualityScore(0.9, 0.9, 0.9, 0.9, 0.9, [])
+        scenario = LegalScenario(case_name="TechCorp", complaint_text=COMPLAINT, case_type="IP", filing_date="2024-01-01")
+
+        report = asyncio.run(agent.generate_complete_report(scenario))
+
+        chunks = report.metadata["case_digest"]["chunks"]
+        section_prompts = [prompt for prompt in prompts if "COMPLAINT PART" not in prompt]
+        self.assertEqual(len(prompts), chunks + 6)
+        self.assertTrue(all("DataSystems LLC (defendant)" in prompt for prompt in section_prompts))
+        self.assertFalse(any(PARAGRAPH in prompt for prompt in section_prompts))
+        self.assertEqual(report.total_tokens, 120 * (chunks + 6))
+
+        # Digest calls are counted apart from section generations
+        self.assertEqual(agent.processing_times.count, 6)
+        self.assertEqual(agent.get_token_usage_stats()["request_count"], 6)
+        self.assertEqual(agent.get_digest_call_stats()["calls"], chunks)
+        self.assertEqual(agent.get_digest_call_stats()["tokens_used"], 120 * chunks)
+
+        # A second report on the same complaint reuses the digest
+        asyncio.run(agent.generate_complete_report(scenario))
+        self.assertEqual(len(prompts), chunks + 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tests for durable section checkpointing and report resume.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.agent_system import LegalIntelligenceAgent
+from src.core.quality_validator import QualityScore, QualityValidator
+from src.models.legal_models import LegalScenario, ReportSection, TokenUsage
+from src.utils.checkpoint_store import SectionCheckpointStore
+
+
+def _make_scenario(filing_date: str = "2024-01-01") -> LegalScenario:
+    return LegalScenario(
+        case_name="Test Case",
+        complaint_text="Plaintiff alleges patent infringement.",
+        case_type="IP",
+        filing_date=filing_date,
+        urgency_level="standard"
+    )
+
+
+class TestCheckpointResume(unittest.TestCase):
+    """A failed report resumes from the first section without a checkpoint."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = SectionCheckpointStore(self.tmpdir.name)
+        self.agent = LegalIntelligenceAgent("test-project", checkpoint_store=self.store)
+        self.agent.initialized = True
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_scenario_hash_ignores_filing_date(self):
+        """The same complaint submitted twice maps to the same checkpoints."""
+        self.assertEqual(
+            _make_scenario("2024-01-01").content_hash(),
+            _make_scenario("2024-02-01").content_hash()
+        )
+
+    @patch.object(QualityValidator, 'validate_section')
+    @patch.object(LegalIntelligenceAgent, 'generate_section_content')
+    def test_resume_after_failure(self, mock_generate, mock_validate):
+        """Sections completed before a failure are not regenerated."""
+        mock_validate.return_value = QualityScore(0.9, 0.9, 0.9, 0.9, 0.9, [])
+        good = ("Section content", TokenUsage(input_tokens=10, output_tokens=5, total_tokens=15), 0.01)
+
+        # First run: the fourth section fails on every attempt
+        mock_generate.side_effect = [good, good, good] + [RuntimeError("model down")] * 3
+        with self.assertRaises(RuntimeError):
+            asyncio.run(self.agent.generate_complete_report(_make_scenario()))
+
+        scenario_hash = _make_scenario().content_hash()
+        self.assertEqual(len(self.store.list_sections(scenario_hash)), 3)
+
+        # Second run: only the remaining three sections are generated
+        mock_generate.reset_mock()
+        mock_generate.side_effect = None
+        mock_generate.return_value = good
+        report = asyncio.run(self.agent.generate_complete_report(_make_scenario("2024-03-01")))
+
+        self.assertEqual(mock_generate.call_count, 3)
+        self.assertEqual(len(report.sections), 6)
+        self.assertEqual(report.metadata["sections_resumed"], 3)
+        self.assertEqual(report.total_tokens, 6 * 15)
+
+        # Checkpoints are cleared once the report completes
+        self.assertEqual(self.store.list_sections(scenario_hash), {})
+
+    @patch.object(QualityValidator, 'validate_section')
+    @patch.object(LegalIntelligenceAgent, 'generate_section_content')
+    def test_checkpoint_io_off_event_loop(self, mock_generate, mock_validate):
+        mock_validate.return_value = QualityScore(0.9, 0.9, 0.9, 0.9, 0.9, [])
+        mock_generate.return_value = ("Section content", TokenUsage(input_tokens=10, output_tokens=5, total_tokens=15), 0.01)
+        threads = []
+        for name in ("load_completed_prefix", "save_section", "clear"):
+            original = getattr(self.store, name)
+
+            def record(*args, _original=original, **kwargs):
+                threads.append(threading.current_thread())
+                return _original(*args, **kwargs)
+
+            setattr(self.store, name, record)
+
+        asyncio.run(self.agent.generate_complete_report(_make_scenario()))
+        self.assertEqual(len(threads), 8)
+        self.assertNotIn(threading.main_thread(), threads)
+
+
+def _section(section_type: str) -> ReportSection:
+    return ReportSection(
+        type=section_type, title="Title", content="Content", agent_type="analyst",
+        quality_score=0.9, tokens_used=15, cost=0.01, timestamp="2024-01-01T00:00:00"
+    )
+
+
+class TestCheckpointExpiry(unittest.TestCase):
+    """Checkpoints of reports that never completed are eventually removed."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def _age(self, store: SectionCheckpointStore, scenario_hash: str, seconds: float) -> None:
+        then = time.time() - seconds
+        for path in list(store.list_sections(scenario_hash).values()) + [store._scenario_dir(scenario_hash)]:
+            os.utime(path, (then, then))
+
+    def test_abandoned_checkpoints_removed(self):
+        store = SectionCheckpointStore(self.tmpdir.name, max_age_seconds=3600)
+        store.save_section("abandoned", _section("liability_assessment"))
+        store.save_section("recent", _section("liability_assessment"))
+        self._age(store, "abandoned", 7200)
+        self._age(store, "recent", 60)
+
+        self.assertEqual(store.remove_expired(), 1)
+        self.assertEqual(store.list_sections("abandoned"), {})
+        self.assertIn("liability_assessment", store.list_sections("recent"))
+
+        # Reopening the store sweeps too
+        self._age(store, "recent", 7200)
+        SectionCheckpointStore(self.tmpdir.name, max_age_seconds=3600)
+        self.assertEqual(store.list_sections("recent"), {})
+
+    def test_saving_sweeps_at_most_once_per_interval(self):
+        store = SectionCheckpointStore(self.tmpdir.name, max_age_seconds=3600, sweep_interval=0)
+        store.save_section("abandoned", _section("liability_assessment"))
+        self._age(store, "abandoned", 7200)
+        store.save_section("other", _section("liability_assessment"))
+        self.assertEqual(store.list_sections("abandoned"), {})
+
+        store = SectionCheckpointStore(self.tmpdir.name, max_age_seconds=3600)
+        store.save_section("abandoned", _section("liability_assessment"))
+        self._age(store, "abandoned", 7200)
+        store.save_section("other", _section("damage_calculation"))
+        self.assertIn("liability_assessment", store.list_sections("abandoned"))
+
+    def test_expiry_disabled(self):
+        store = SectionCheckpointStore(self.tmpdir.name, max_age_seconds=0)
+        store.save_section("abandoned", _section("liability_assessment"))
+        self._age(store, "abandoned", 10 ** 8)
+        self.assertEqual(store.remove_expired(), 0)
+        self.assertIn("liability_assessment", store.list_sections("abandoned"))
+
+
+if __name__ == "__main__":
+    unittest.main()
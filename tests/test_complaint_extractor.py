@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for single-pass extraction of complaint entities and issue terms.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.complaint_extractor import ComplaintExtractor, complaint_hash
+from src.utils.complaint_store import ComplaintStore
+from src.utils.scenario_builder import EXTRACTOR, build_scenario, extract_key_issues, extract_parties
+
+COMPLAINT = """12  TECHCORP INC.,                     )
+13                 Plaintiff,          )   Case No. 3:24-cv-01234
+14       v.                            )
+15  DATASYSTEMS LLC,                   )   COMPLAINT FOR PATENT
+16                 Defendant.          )   INFRINGEMENT
+
+1. Plaintiff TechCorp Inc. brings this action for infringement of U.S. Patent No. 9123456
+and U.S. Patent No. RE45,678 under 35 U.S.C. § 271(a) and the Lanham Act.
+
+2. Defendant Acme Widgets Corp. conspired with defendant DataSystems, notifying dealers of the
+price-fixing scheme on January 15, 2024 and again on 3/4/2023, in violation of the Sherman Act.
+
+3. Plaintiff seeks damages of $15 million and 2,500 dollars under Cal. Civ. Code § 3426.1,
+and alleges wrongful
+termination of the license agreement.
+"""
+
+
+class TestComplaintExtractor(unittest.TestCase):
+
+    def setUp(self):
+        self.extractor = ComplaintExtractor()
+
+    def test_entities_extracted(self):
+        entities = self.extractor.extract(COMPLAINT)
+
+        self.assertEqual(entities.complaint_hash, complaint_hash(COMPLAINT))
+        self.assertEqual(entities.parties, ["TECHCORP INC.", "DATASYSTEMS LLC", "Acme Widgets Corp."])
+        self.assertEqual(entities.patents, ["9,123,456", "RE45,678"])
+        self.assertEqual(entities.statutes, ["35 U.S.C. § 271(a)", "Lanham Act", "Sherman Act", "Cal. Civ. Code § 3426.1"])
+        self.assertEqual(entities.amounts, ["$15 million", "2,500 dollars"])
+        self.assertEqual(entities.dates, ["January 15, 2024", "3/4/2023"])
+        # Terms split across a line break, hyphenated, inflected or inside longer terms are found;
+        # "tying" is not found inside "notifying"
+        self.assertEqual(
+            entities.issue_terms,
+            ["damages", "infringement", "patent", "price fixing", "termination", "violation", "wrongful termination"]
+        )
+
+    def test_streamed_text_matches_whole_text(self):
+        whole = self.extractor.extract(COMPLAINT * 50)
+        for size in (1, 13, 4096):
+            stream = self.extractor.stream()
+            text = COMPLAINT * 50
+            for start in range(0, len(text), size):
+                stream.feed(text[start:start + size])
+            streamed = stream.finish(whole.complaint_hash)
+            self.assertEqual(streamed, whole)
+
+    def test_results_memoized_by_complaint_hash(self):
+        first = self.extractor.extract(COMPLAINT)
+        self.assertIs(self.extractor.extract(COMPLAINT), first)
+        self.assertEqual(self.extractor.get_stats()["cache_hits"], 1)
+
+        with tempfile.TemporaryDirectory() as store_dir:
+            stored = ComplaintStore(store_dir).put_text("Plaintiff Initech LLC sues for breach of contract.\n")
+            self.assertEqual(stored.parties, ["Initech LLC"])
+            self.assertIs(
+                EXTRACTOR.extract("Plaintiff Initech LLC sues for breach of contract.\n"),
+                EXTRACTOR.cached(stored.complaint_id)
+            )
+
+
+class TestScenarioIssues(unittest.TestCase):
+
+    def test_key_issues_use_case_type_gazetteer(self):
+        self.assertEqual(
+            extract_key_issues(COMPLAINT, "IP"), ["Patent dispute", "Infringement dispute"]
+        )
+        self.assertEqual(extract_key_issues(COMPLAINT, "Contract"), ["Contract termination", "Contract damages"])
+        self.assertEqual(extract_key_issues(COMPLAINT, "Antitrust"), ["Price Fixing claim"])
+        self.assertEqual(extract_key_issues(COMPLAINT, "Employment"), ["Wrongful Termination claim"])
+        self.assertEqual(extract_key_issues("Nothing to see.", "IP")[0], "Primary legal dispute")
+
+    def test_scenario_parties_found_beyond_opening_lines(self):
+        complaint = "\n" * 20 + "Plaintiff TechCorp alleges patent infringement by defendant DataSystems."
+        self.assertEqual(extract_parties(complaint), ["TechCorp", "DataSystems"])
+        self.assertEqual(extract_parties("No parties named here."), ["Party A", "Party B"])
+
+        scenario = build_scenario("TechCorp v. DataSystems", complaint, "IP", filing_date="2024-01-01")
+        self.assertEqual(scenario.parties_involved, ["TechCorp", "DataSystems"])
+        self.assertEqual(scenario.key_issues, ["Patent dispute", "Infringement dispute"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Tests for stripping pleading boilerplate from complaints.
+"""
+
+import sys
+import asyncio
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.agent_system import LegalIntelligenceAgent
+from src.utils.complaint_minimizer import minimize_complaint
+from src.core.quality_validator import QualityScore, QualityValidator
+from src.models.legal_models import LegalScenario
+
+PAGE = (
+    "{n:<4}Case 3:24-cv-01234   Document 1   Filed 01/15/24   Page {page} of 3\n"
+    "{m:<4}COMPLAINT FOR PATENT INFRINGEMENT\n"
+)
+
+PLEADING = """1   JANE DOE (SBN 123456)
+2   jdoe@firm.com
+3   LAW FIRM LLP
+4   100 Main Street, Suite 5
+5   Telephone: (415) 555-1234
+6   Attorneys for Plaintiff
+7   TechCorp Inc.
+8
+9                      UNITED STATES DISTRICT COURT
+10                  NORTHERN DISTRICT OF CALIFORNIA
+11
+12  TECHCORP INC.,                     )
+13                 Plaintiff,          )   Case No. 3:24-cv-01234
+14       v.                            )
+15  DATASYSTEMS LLC,                   )   COMPLAINT FOR PATENT
+16                 Defendant.          )   INFRINGEMENT
+17                                     )
+18                                     )   DEMAND FOR JURY TRIAL
+19
+20  1.   Plaintiff TechCorp Inc. brings this action for infringement of U.S. Patent No. 9,123,456.
+21  2.   Defendant DataSystems LLC sells the CloudCache    product.
+22
+""" + PAGE.format(n=23, m=24, page=1) + """1   3.   Damages exceed $15 million.
+2
+""" + PAGE.format(n=3, m=4, page=2) + """5   4.   Plaintiff requests an injunction.
+6   Dated: January 15, 2024        Respectfully submitted,
+7                                  /s/ Jane Doe
+8                                  Jane Doe
+9                                  Attorneys for Plaintiff
+10
+""" + PAGE.format(n=11, m=12, page=3) + """13                     CERTIFICATE OF SERVICE
+14  I certify that on January 15, 2024 I served the foregoing on all counsel of record.
+15                                 /s/ Jane Doe
+"""
+
+
+class TestMinimizeComplaint(unittest.TestCase):
+
+    def test_boilerplate_removed_and_allegations_kept(self):
+        result = minimize_complaint(PLEADING)
+        text = result.text
+
+        for allegation in (
+            "1. Plaintiff TechCorp Inc. brings this action for infringement of U.S. Patent No. 9,123,456.",
+            "2. Defendant DataSystems LLC sells the CloudCache product.",
+            "3. Damages exceed $15 million.",
+            "4. Plaintiff requests an injunction."
+        ):
+            self.assertIn(allegation, text)
+        self.assertTrue(text.startswith("TECHCORP INC.,\nPlaintiff,\nv.\nDATASYSTEMS LLC,\nDefendant.\n"))
+        for boilerplate in ("SBN", "DISTRICT COURT", "Case No.", "Page 2 of 3", "/s/", "Respectfully", "CERTIFICATE"):
+            self.assertNotIn(boilerplate, text)
+        self.assertEqual(text.count("COMPLAINT FOR PATENT INFRINGEMENT"), 1)
+
+        self.assertGreater(result.tokens_saved, len(PLEADING) // 4 // 2)
+        for category in ("caption", "line_numbers", "headers_footers", "signature", "certificate_of_service"):
+            self.assertGreater(result.removed[category], 0, category)
+        self.assertEqual(sum(result.removed.values()), len(PLEADING) - len(text))
+
+    def test_offsets_map_back_to_original(self):
+        result = minimize_complaint(PLEADING)
+        for phrase in ("U.S. Patent No. 9,123,456", "$15 million", "an injunction"):
+            start = result.text.index(phrase)
+            original_start, original_end = result.original_span(start, start + len(phrase))
+            self.assertEqual(PLEADING[original_start:original_end], phrase)
+
+        # A span across collapsed whitespace covers the original run
+        start = result.text.index("CloudCache product")
+        original_start, original_end = result.original_span(start, start + len("CloudCache product"))
+        self.assertEqual(PLEADING[original_start:original_end], "CloudCache    product")
+
+    def test_bare_numbers_dropped_only_as_page_numbers(self):
+        """Years in a damages table stay; numbered footers and numbers at page breaks go."""
+        table = "5. Lost profits by year:\n2019\n$1,200,000\n2020\n$800,000\n2021\n$650,000\n"
+        result = minimize_complaint(table)
+        self.assertIs(result.text, table)
+
+        page = "".join(f"Paragraph {i} alleges a further fact about the accused product.\n" for i in range(12))
+        paged = "".join(page + f"{number}\n" for number in range(1, 4)) + table + "\f\n7\n"
+        minimized = minimize_complaint(paged).text
+        self.assertNotIn("\n1\n", minimized)
+        self.assertNotIn("\n3\n", minimized)
+        self.assertTrue(minimized.endswith("$650,000\n"))
+        self.assertIn("2019\n$1,200,000\n2020", minimized)
+
+    def test_dated_allegations_kept_without_signature_cues(self):
+        """A "Dated:" line in the last third is not a signature block unless a signature follows it."""
+        complaint = (
+            "/s/ John Smith signed the license agreement on behalf of Defendant.\n"
+            + "".join(f"{i}. Plaintiff alleges a further fact about the accused product.\n" for i in range(1, 8))
+            + "Dated: March 3, 2023, Defendant shipped 40,000 infringing units to California.\n"
+            "8. Plaintiff's damages exceed $2,000,000.\n"
+            "PRAYER FOR RELIEF\n"
+            "WHEREFORE, Plaintiff requests judgment against Defendant and an award of damages.\n"
+        )
+        result = minimize_complaint(complaint)
+        self.assertIs(result.text, complaint)
+        self.assertEqual(result.removed["signature"], 0)
+
+        signed = complaint + (
+            "Dated: January 15, 2024\n"
+            "Respectfully submitted,\n"
+            "/s/ Jane Doe\n"
+            "Attorneys for Plaintiff\n"
+        )
+        text = minimize_complaint(signed).text
+        self.assertEqual(text, complaint)
+
+    def test_plain_complaint_unchanged(self):
+        complaint = "Plaintiff TechCorp alleges patent infringement by defendant DataSystems. " * 20
+        result = minimize_complaint(complaint)
+        self.assertIs(result.text, complaint)
+        self.assertEqual(result.tokens_saved, 0)
+        self.assertEqual(result.original_offset(100), 100)
+
+
+class TestAgentBoilerplate(unittest.TestCase):
+
+    @patch.object(QualityValidator, 'validate_section')
+    def test_sections_quote_minimized_complaint(self, mock_validate):
+        agent = LegalIntelligenceAgent("test-project", complaint_token_budget=2000)
+        agent.initialized = True
+        prompts = []
+
+        def generate_content(contents, config=None):
+            prompts.append(contents)
+            return SimpleNamespace(
+                text="Section analysis.",
+                usage_metadata=SimpleNamespace(prompt_token_count=100, candidates_token_count=20, total_token_count=120)
+            )
+
+        agent.model = Mock()
+        agent.model.generate_content.side_effect = generate_content
+        mock_validate.return_value = QualityScore(0.9, 0.9, 0.9, 0.9, 0.9, [])
+        scenario = LegalScenario(case_name="TechCorp", complaint_text=PLEADING, case_type="IP", filing_date="2024-01-01")
+
+        assembler = agent.prompt_assembler
+        with patch.object(assembler, "minimized", wraps=assembler.minimized) as spy:
+            report = asyncio.run(agent.generate_complete_report(scenario))
+        # Minimized once per report, not again for each section's prompt
+        self.assertEqual(spy.call_count, 1)
+
+        minimized = minimize_complaint(PLEADING)
+        self.assertEqual(len(prompts), 6)
+        self.assertTrue(all(minimized.text in prompt and "SBN" not in prompt for prompt in prompts))
+        self.assertEqual(report.metadata["boilerplate"]["tokens_saved"], minimized.tokens_saved)
+        self.assertIn("caption", report.metadata["boilerplate"]["removed_chars"])
+
+        stats = agent.prompt_assembler.get_stats()["boilerplate"]
+        self.assertEqual(stats["complaints_minimized"], 1)
+        self.assertEqual(stats["tokens_saved"], minimized.tokens_saved)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Tests for streamed complaint uploads and analysis by complaint id.
+"""
+
+import os
+import sys
+import asyncio
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock, AsyncMock, patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.testclient import TestClient
+
+import main
+from src.core.admission import AdmissionController
+from src.core.agent_system import LegalIntelligenceAgent
+from src.core.quality_validator import QualityScore, QualityValidator
+from src.core.tenant_scheduler import FairScheduler
+from src.models.legal_models import AnalysisReport, LegalScenario, ReportSection
+from src.utils.complaint_store import ComplaintStore, ComplaintTooLarge
+from src.utils.multipart_stream import MultipartFileReader, MultipartError
+from src.utils.scenario_builder import extract_parties, extract_key_issues
+from src.utils.text_terms import complaint_hash
+
+COMPLAINT = (
+    "TechCorp Inc., Plaintiff,\r\nv.\r\nDataSystems LLC, Defendant.\r\n\r\n"
+    "COMPLAINT FOR PATENT INFRINGEMENT\r\n\r\n"
+    + "Defendant's CloudCache product practices every claim of the patent. " * 200
+    + "Plaintiff seeks damages and alleges misappropriation of a trade\x00 secret.\r\n"
+)
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def _fake_report(scenario) -> AnalysisReport:
+    return AnalysisReport(
+        scenario=scenario, sections=[], executive_summary="Summary", total_cost=0.01,
+        total_tokens=150, processing_time=0.1, confidence_score=0.8, timestamp="2024-01-01T00:00:00"
+    )
+
+
+class TestComplaintStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = ComplaintStore(self.tmpdir.name, max_bytes=1024 * 1024)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _upload(self, data: bytes, chunk_size: int):
+        with self.store.open_upload() as upload:
+            for chunk in _chunks(data, chunk_size):
+                upload.write(chunk)
+            return upload.commit()
+
+    def test_chunking_does_not_change_result(self):
+        """CRLFs, multi-byte characters and issue terms split across chunks are handled."""
+        data = ("Café " + COMPLAINT).encode("utf-8")
+        whole = self.store.put_text("Café " + COMPLAINT)
+        for chunk_size in (1, 3, 7, 4096):
+            self.assertEqual(self._upload(data, chunk_size), whole)
+
+        text = self.store.load_text(whole.complaint_id)
+        expected = ("Café " + COMPLAINT).replace("\r\n", "\n").replace("\x00", "")
+        self.assertEqual(text, expected)
+        self.assertEqual(whole.complaint_id, complaint_hash(text))
+        self.assertEqual(whole.parties, extract_parties(expected))
+        self.assertIn("trade secret", whole.issue_terms)
+        self.assertEqual(len(os.listdir(self.tmpdir.name)), 2)
+
+    def test_size_limit_enforced_while_streaming(self):
+        store = ComplaintStore(self.tmpdir.name, max_bytes=1000)
+        upload = store.open_upload()
+        upload.write(b"x" * 600)
+        with self.assertRaises(ComplaintTooLarge):
+            upload.write(b"x" * 600)
+        self.assertEqual(os.listdir(self.tmpdir.name), [])
+
+    def test_unknown_ids(self):
+        self.assertIsNone(self.store.get("0" * 32))
+        self.assertIsNone(self.store.get("../secrets"))
+        with self.assertRaises(KeyError):
+            self.store.load_text("0" * 32)
+
+
+class TestMultipartFileReader(unittest.TestCase):
+
+    BODY = (
+        b"--XyZ\r\nContent-Disposition: form-data; name=\"case_name\"\r\n\r\nTechCorp\r\n"
+        b"--XyZ\r\nContent-Disposition: form-data; name=\"upload\"; filename=\"complaint.txt\"\r\n"
+        b"Content-Type: text/plain\r\n\r\nLine one\r\n--XY\r\nLine two\r\n--XyZ--\r\n"
+    )
+
+    def test_file_part_extracted_from_any_chunking(self):
+        for chunk_size in (1, 2, 5, 1000):
+            reader = MultipartFileReader("XyZ")
+            content = b"".join(reader.feed(chunk) for chunk in _chunks(self.BODY, chunk_size))
+            reader.close()
+            self.assertEqual(content, b"Line one\r\n--XY\r\nLine two")
+            self.assertEqual(reader.filename, "complaint.txt")
+
+    def test_malformed_bodies_rejected(self):
+        truncated = MultipartFileReader("XyZ")
+        truncated.feed(self.BODY[:-10])
+        with self.assertRaises(MultipartError):
+            truncated.close()
+
+        no_file = MultipartFileReader("XyZ")
+        no_file.feed(b"--XyZ\r\nContent-Disposition: form-data; name=\"other\"\r\n\r\nx\r\n--XyZ--")
+        with self.assertRaises(MultipartError):
+            no_file.close()
+
+
+class TestComplaintEndpoints(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.store = ComplaintStore(self.tmpdir.name, max_bytes=64 * 1024)
+        self.agent = Mock()
+        self.agent.scheduler = FairScheduler(total_slots=4)
+        self.agent.generate_complete_report = AsyncMock(side_effect=lambda scenario, **kwargs: _fake_report(scenario))
+        self.queue = Mock()
+        self.queue.enqueue = Mock(return_value="job-1")
+        self.queue.stats = Mock(return_value={})
+        patcher = patch.dict(main.system_state, {
+            "initialized": True,
+            "agent": self.agent,
+            "complaints": self.store,
+            "queue": self.queue,
+            "validation_pool": Mock(check_in_background=AsyncMock(return_value=None)),
+            "metrics": Mock(),
+            "admission": AdmissionController(model_concurrency=4)
+        })
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = TestClient(main.app)
+
+    def test_upload_and_analyze_by_id(self):
+        response = self.client.post(
+            "/complaints", content=COMPLAINT.encode("utf-8"), headers={"Content-Type": "text/plain"}
+        )
+        self.assertEqual(response.status_code, 201)
+        complaint_id = response.json()["complaint_id"]
+        self.assertFalse(response.json()["deduplicated"])
+
+        multipart = self.client.post(
+            "/complaints", files={"complaint": ("complaint.txt", COMPLAINT.encode("utf-8"), "text/plain")}
+        )
+        self.assertEqual(multipart.json()["complaint_id"], complaint_id)
+        self.assertTrue(multipart.json()["deduplicated"])
+
+        lookups = []
+        original_get = self.store.get
+
+        def get(complaint_id):
+            lookups.append(threading.current_thread())
+            return original_get(complaint_id)
+
+        with patch.object(self.store, "get", side_effect=get):
+            response = self.client.post("/analyze", json={
+                "case_name": "TechCorp v. DataSystems", "complaint_id": complaint_id, "case_type": "IP"
+            })
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("complaint_text", response.json()["scenario"])
+        # One lookup per request, off the event loop thread
+        self.assertEqual(len(lookups), 1)
+        self.assertIsNot(lookups[0], threading.main_thread())
+
+        # The scenario refers to the complaint by id; the agent reads the text where it needs it
+        scenario = self.agent.generate_complete_report.call_args.args[0]
+        self.assertEqual(scenario.complaint_id, complaint_id)
+        self.assertEqual(scenario.complaint_text, "")
+        self.assertEqual(scenario.key_issues, extract_key_issues(self.store.load_text(complaint_id), "IP"))
+
+        # Jobs carry the text, for workers on nodes without this complaint store
+        self.client.post("/jobs", json={"case_name": "Queued", "complaint_id": complaint_id, "case_type": "IP"})
+        payload = self.queue.enqueue.call_args.args[1]
+        self.assertEqual(payload["scenario"]["complaint_id"], complaint_id)
+        self.assertEqual(payload["scenario"]["complaint_text"], self.store.load_text(complaint_id))
+
+    def test_background_check_loads_text_only_to_rescore(self):
+        stored = self.store.put_text(COMPLAINT)
+        scenario = LegalScenario(
+            case_name="TechCorp", complaint_id=stored.complaint_id, case_type="IP", filing_date="2024-01-01"
+        )
+        scored = _fake_report(scenario.copy())
+        unscored = _fake_report(scenario.copy())
+        unscored.sections = [ReportSection(
+            type="liability_assessment", title="Liability Assessment", content="Liability is probable.",
+            agent_type="business_analyst", quality_score=0.0, tokens_used=100, cost=0.01,
+            timestamp="2024-01-01T00:00:00"
+        )]
+
+        with patch.dict(main.system_state, {"validator": QualityValidator()}):
+            asyncio.run(main._background_quality_check(scored, scored.scenario))
+            asyncio.run(main._background_quality_check(unscored, unscored.scenario))
+        self.assertEqual(scored.scenario.complaint_text, "")
+        self.assertEqual(unscored.scenario.complaint_text, self.store.load_text(stored.complaint_id))
+
+    def test_rejections(self):
+        oversized = self.client.post("/complaints", content=b"x" * (65 * 1024), headers={"Content-Type": "text/plain"})
+        self.assertEqual(oversized.status_code, 413)
+        unsupported = self.client.post("/complaints", json={"complaint_text": "x"})
+        self.assertEqual(unsupported.status_code, 415)
+        self.assertEqual(self.client.get(f"/complaints/{'0' * 32}").status_code, 404)
+
+        unknown = self.client.post("/analyze", json={"case_name": "X", "complaint_id": "0" * 32, "case_type": "IP"})
+        self.assertEqual(unknown.status_code, 404)
+        both = self.client.post("/analyze", json={
+            "case_name": "X", "complaint_id": "0" * 32, "complaint_text": "text", "case_type": "IP"
+        })
+        self.assertEqual(both.status_code, 422)
+
+
+class TestAgentStoredComplaint(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.store = ComplaintStore(self.tmpdir.name)
+        self.stored = self.store.put_text(COMPLAINT)
+
+    @patch("src.core.validation_pool.ValidationPool.validate_section")
+    def test_text_loaded_once_for_prompts_and_groundedness(self, mock_validate):
+        agent = LegalIntelligenceAgent("test-project", complaint_store=self.store, complaint_token_budget=50000)
+        agent.initialized = True
+        prompts = []
+
+        def generate_content(contents, config=None):
+            prompts.append(contents)
+            return SimpleNamespace(
+                text="Section analysis.",
+                usage_metadata=SimpleNamespace(prompt_token_count=100, candidates_token_count=20, total_token_count=120)
+            )
+
+        agent.model = Mock()
+        agent.model.generate_content.side_effect = generate_content
+        mock_validate.return_value = QualityScore(0.9, 0.9, 0.9, 0.9, 0.9, [])
+        scenario = LegalScenario(
+            case_name="TechCorp", complaint_id=self.stored.complaint_id, case_type="IP", filing_date="2024-01-01"
+        )
+
+        with patch.object(self.store, "load_text", wraps=self.store.load_text) as load_text:
+            report = asyncio.run(agent.generate_complete_report(scenario))
+
+        text = self.store.load_text(self.stored.complaint_id)
+        load_text.assert_called_once_with(self.stored.complaint_id)
+        self.assertEqual(len(prompts), 6)
+        self.assertTrue(all("CloudCache product practices every claim" in prompt for prompt in prompts))
+        self.assertTrue(all(call.kwargs["source_text"] == text for call in mock_validate.call_args_list))
+        # The report, like the scenario, carries only the reference
+        self.assertEqual(report.scenario.complaint_text, "")
+        self.assertEqual(report.scenario.complaint_id, self.stored.complaint_id)
+
+    def test_job_payload_needs_no_store(self):
+        """A worker node without the API's complaint store uses the text the job carries."""
+        agent = LegalIntelligenceAgent("test-project")
+        scenario = LegalScenario(
+            case_name="X", complaint_id=self.stored.complaint_id, complaint_text=COMPLAINT,
+            case_type="IP", filing_date="2024-01-01"
+        )
+        self.assertEqual(asyncio.run(agent._load_complaint_text(scenario)), COMPLAINT)
+
+    def test_missing_store_rejected(self):
+        agent = LegalIntelligenceAgent("test-project")
+        scenario = LegalScenario(case_name="X", complaint_id="0" * 32, case_type="IP", filing_date="2024-01-01")
+        with self.assertRaises(ValueError):
+            asyncio.run(agent._load_complaint_text(scenario))
+
+
+if __name__ == "__main__":
+    unittest.main()
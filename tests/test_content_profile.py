@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared content profile used by the validator's scorers.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.content_profile import ContentProfile
+from src.core.quality_validator import QualityValidator
+
+
+class TestContentProfile(unittest.TestCase):
+
+    def setUp(self):
+        self.content = (
+            "# Liability Assessment\n\n"
+            "The defendant owed a clear duty of care! Was that duty breached by the conduct? "
+            "The evidence strongly suggests it was breached.\n\n\n\n"
+            "SUMMARY\n"
+            "Liability is likely. Ok."
+        )
+        self.profile = ContentProfile.from_text(self.content)
+
+    def test_paragraphs_skip_blank_blocks(self):
+        self.assertEqual(len(self.profile.paragraphs), 3)
+        self.assertEqual(self.profile.paragraphs[0], "# Liability Assessment")
+
+    def test_sentences_split_on_all_terminators(self):
+        self.assertEqual(self.profile.sentences(), [
+            "# Liability Assessment\n\nThe defendant owed a clear duty of care",
+            "Was that duty breached by the conduct",
+            "The evidence strongly suggests it was breached",
+            "SUMMARY\nLiability is likely"
+        ])
+        self.assertEqual(self.profile.sentence_word_counts, [11, 7, 7, 4])
+
+    def test_spans_index_original_text(self):
+        start, end = self.profile.sentence_spans[1]
+        self.assertEqual(self.content[start:end].strip(), "Was that duty breached by the conduct")
+
+    def test_lines_and_headers(self):
+        self.assertTrue(self.profile.has_headers)
+        self.assertEqual([line.text for line in self.profile.lines if line.is_header],
+                         ["# Liability Assessment", "SUMMARY"])
+
+    def test_counts(self):
+        self.assertEqual(self.profile.word_count, len(self.content.split()))
+        self.assertEqual(self.profile.lowered, self.content.lower())
+        self.assertIn("defendant", self.profile.tokens)
+
+
+class TestValidatorUsesProfile(unittest.TestCase):
+
+    def test_content_parsed_once_per_section(self):
+        validator = QualityValidator()
+        content = "First paragraph here.\n\nSecond paragraph here!"
+        with patch.object(ContentProfile, "from_text", wraps=ContentProfile.from_text) as from_text:
+            validator.validate_section(content, "risk_assessment", ["risk"])
+        self.assertEqual(from_text.call_count, 1)
+
+    def test_scorers_agree_on_sentence_count(self):
+        """Question and exclamation marks end sentences for every scorer."""
+        validator = QualityValidator()
+        content = "Is the claim strong? It is very strong indeed! The record supports it fully and clearly"
+        profile = ContentProfile.from_text(content)
+        self.assertEqual(profile.sentence_count, 3)
+        # Three sentences of different lengths earn the structure score's variety points
+        with_variety = validator._calculate_structure_score(content, profile=profile)
+        without = validator._calculate_structure_score(content.replace("?", ",").replace("!", ","))
+        self.assertAlmostEqual(with_variety - without, 0.2)
+
+
+if __name__ == "__main__":
+    unittest.main()
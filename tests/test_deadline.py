@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for deadline propagation and graceful degradation.
+"""
+
+import sys
+import asyncio
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.agent_system import LegalIntelligenceAgent
+from src.core.deadline import DeadlineBudget
+from src.core.quality_validator import QualityScore, QualityValidator
+from src.models.legal_models import LegalScenario, TokenUsage
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDeadlineDegradation(unittest.TestCase):
+    """Report generation degrades to fit the caller's deadline."""
+
+    def setUp(self):
+        self.agent = LegalIntelligenceAgent("test-project")
+        self.agent.initialized = True
+        self.agent.default_attempt_seconds = 10.0
+        self.clock = FakeClock()
+        self.scenario = LegalScenario(
+            case_name="Test Case",
+            complaint_text="Plaintiff alleges patent infringement.",
+            case_type="IP",
+            filing_date="2024-01-01"
+        )
+
+    def _generate(self, *args, **kwargs):
+        self.clock.now += 10.0
+        return "Content", TokenUsage(input_tokens=10, output_tokens=5, total_tokens=15), 0.01
+
+    @patch.object(QualityValidator, 'validate_section')
+    @patch.object(LegalIntelligenceAgent, 'generate_section_content')
+    def test_low_priority_sections_dropped(self, mock_generate, mock_validate):
+        """Sections that cannot fit are dropped lowest-priority first and reported."""
+        mock_generate.side_effect = self._generate
+        mock_validate.return_value = QualityScore(0.5, 0.5, 0.5, 0.5, 0.5, ["Improve"])
+
+        deadline = DeadlineBudget.from_timeout(35.0, clock=self.clock)
+        report = asyncio.run(self.agent.generate_complete_report(self.scenario, deadline=deadline))
+
+        self.assertEqual(
+            [s.type for s in report.sections],
+            ["liability_assessment", "damage_calculation", "strategic_recommendations"]
+        )
+        degradations = report.metadata["degradations"]
+        for dropped in ["competitive_landscape", "prior_art_analysis", "risk_assessment"]:
+            self.assertIn(f"section_dropped:{dropped}", degradations)
+        # Low scores were not retried: there was no time for a second attempt
+        self.assertEqual(mock_generate.call_count, 3)
+        self.assertIn("quality_retries_skipped:liability_assessment", degradations)
+        self.assertIn("Degradations Applied", report.executive_summary)
+
+    @patch.object(QualityValidator, 'validate_section')
+    @patch.object(LegalIntelligenceAgent, 'generate_section_content')
+    def test_output_reduced_when_share_is_short(self, mock_generate, mock_validate):
+        """A section whose time share is below one attempt gets a smaller output limit."""
+        mock_generate.side_effect = self._generate
+        mock_validate.return_value = QualityScore(0.9, 0.9, 0.9, 0.9, 0.9, [])
+
+        deadline = DeadlineBudget.from_timeout(5.0, clock=self.clock)
+        report = asyncio.run(self.agent.generate_complete_report(self.scenario, deadline=deadline))
+
+        self.assertEqual(len(report.sections), 1)
+        self.assertEqual(mock_generate.call_args.kwargs["max_output_tokens"], 1024)
+        self.assertIn("output_reduced:liability_assessment", report.metadata["degradations"])
+
+    @patch.object(QualityValidator, 'validate_section')
+    @patch.object(LegalIntelligenceAgent, 'generate_section_content')
+    def test_no_deadline_no_degradation(self, mock_generate, mock_validate):
+        """Without a deadline every section is generated as before."""
+        mock_generate.side_effect = self._generate
+        mock_validate.return_value = QualityScore(0.9, 0.9, 0.9, 0.9, 0.9, [])
+
+        report = asyncio.run(self.agent.generate_complete_report(self.scenario))
+
+        self.assertEqual(len(report.sections), 6)
+        self.assertEqual(report.metadata["degradations"], [])
+
+    def test_attempt_estimate_uses_recent_local_timings(self):
+        """Planning reads the in-process window, never the shared store."""
+        metrics_store = Mock()
+        agent = LegalIntelligenceAgent("test-project", metrics_store=metrics_store, telemetry_window=4)
+        self.assertEqual(agent._estimate_attempt_seconds(), agent.default_attempt_seconds)
+
+        for seconds in (60.0, 60.0, 2.0, 2.0, 2.0, 2.0):
+            agent.processing_times.record(seconds)
+        self.assertAlmostEqual(agent._estimate_attempt_seconds(), 2.0)
+        metrics_store.counters.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-pass keyword engine used by the quality validator.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.keyword_engine import KeywordMatcher, tokenize
+from src.core.quality_validator import QualityValidator
+
+
+class TestKeywordMatcher(unittest.TestCase):
+
+    def test_word_boundaries(self):
+        """Phrases no longer match inside longer words."""
+        hits = KeywordMatcher(["art", "one", "market"]).count_text(
+            "Start the phone call; the marketplace is someone else's."
+        )
+        self.assertEqual(hits.count("art"), 0)
+        self.assertEqual(hits.count("one"), 0)
+        self.assertEqual(hits.count("market"), 0)
+
+    def test_inflections_on_final_word(self):
+        hits = KeywordMatcher(["risk", "claim", "risk factor"]).count_text(
+            "Risks were claimed, and each risk factors in."
+        )
+        self.assertEqual(hits.count("risk"), 2)
+        self.assertEqual(hits.count("claim"), 1)
+        self.assertEqual(hits.count("risk factor"), 1)
+
+    def test_multi_word_and_punctuation_phrases(self):
+        hits = KeywordMatcher(["on the other hand", "1.", "non-obvious", "step 1"]).count_text(
+            "1. On the other\nhand, the claim is non-obvious.\n2. Step 1 follows."
+        )
+        self.assertEqual(hits.count("on the other hand"), 1)
+        self.assertEqual(hits.count("1."), 1)
+        self.assertEqual(hits.count("non-obvious"), 1)
+        self.assertEqual(hits.count("step 1"), 1)
+
+    def test_counts_every_occurrence(self):
+        hits = KeywordMatcher(["therefore", "in fact"]).count_text(
+            "Therefore, in fact, therefore. THEREFORE"
+        )
+        self.assertEqual(hits.count("therefore"), 3)
+        self.assertEqual(hits.count("in fact"), 1)
+        self.assertEqual(hits.count_present(["therefore", "in fact", "thus"]), 2)
+
+    def test_prefix_phrases(self):
+        hits = KeywordMatcher(prefix_phrases=["recommend", "prior ar"]).count_text(
+            "We recommended recommendations on prior art."
+        )
+        self.assertEqual(hits.count_prefix("recommend"), 2)
+        self.assertEqual(hits.count_prefix("prior ar"), 1)
+        self.assertEqual(hits.count("recommend"), 0)
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("Step 1. Non-obvious!"), ["step", "1", ".", "non", "-", "obvious", "!"])
+
+
+class TestValidatorKeywordScoring(unittest.TestCase):
+
+    def setUp(self):
+        self.validator = QualityValidator()
+        self.content = (
+            "LIABILITY ANALYSIS\n\n"
+            "First, the defendant breached its duty of care because the evidence shows negligence. "
+            "Therefore the plaintiff's claims have merit based on precedent.\n\n"
+            "- Causation is established\n- Damages follow\n\n"
+            "In conclusion, liability is likely given that the breach is documented."
+        )
+        self.expected = ["liability", "breach", "duty", "causation"]
+
+    def test_shared_scan_matches_standalone_scores(self):
+        """Scores from one shared scan equal scores computed independently."""
+        hits = self.validator.scan_keywords(self.content, self.expected)
+        self.assertEqual(
+            self.validator.calculate_coherence_score(self.content, "liability_assessment", hits=hits),
+            self.validator.calculate_coherence_score(self.content, "liability_assessment")
+        )
+        self.assertEqual(
+            self.validator.calculate_groundedness_score(self.content, "liability_assessment", self.expected, hits=hits),
+            self.validator.calculate_groundedness_score(self.content, "liability_assessment", self.expected)
+        )
+        self.assertEqual(
+            self.validator._calculate_completeness_score(self.content, self.expected, hits=hits),
+            self.validator._calculate_completeness_score(self.content, self.expected)
+        )
+
+    def test_matchers_compiled_once_per_element_list(self):
+        self.validator.validate_section(self.content, "liability_assessment", self.expected)
+        self.validator.validate_section(self.content, "liability_assessment", list(self.expected))
+        self.assertEqual(len(self.validator._matchers), 1)
+
+    def test_substring_false_positives_removed(self):
+        """'art' in 'start' no longer counts as prior-art vocabulary."""
+        hits = self.validator.scan_keywords("We start with a departure from the chart.")
+        self.assertEqual(hits.count_present(self.validator.SECTION_KEYWORDS["prior_art_analysis"]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared multi-worker metrics store.
+"""
+
+import os
+import sys
+import time
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.agent_system import LegalIntelligenceAgent
+from src.models.legal_models import TokenUsage
+from src.utils.metrics_store import SharedMetricsStore
+
+
+class TestSharedMetricsStore(unittest.TestCase):
+    """Metrics written by separate workers are merged on read."""
+
+    def setUp(self):
+        """Create two stores pointing at the same database file."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "metrics.db")
+        self.worker_a = SharedMetricsStore(self.db_path, worker_id="a", ring_size=3, start_flusher=False)
+        self.worker_b = SharedMetricsStore(self.db_path, worker_id="b", ring_size=3, start_flusher=False)
+
+    def tearDown(self):
+        self.worker_a.close()
+        self.worker_b.close()
+        self.tmpdir.cleanup()
+
+    def test_counters_merge_across_workers(self):
+        """Counter reads sum every worker's rows."""
+        self.worker_a.increment("analysis_count")
+        self.worker_a.increment("analysis_count")
+        self.worker_b.increment("analysis_count", 3)
+        self.worker_b.flush()
+
+        self.assertEqual(self.worker_a.counter("analysis_count"), 5)
+        self.assertEqual(self.worker_a.worker_count(), 2)
+
+    def test_worker_count_only_includes_recent_workers(self):
+        """Workers that stopped or went silent drop out of the count."""
+        worker_c = SharedMetricsStore(self.db_path, worker_id="c", start_flusher=False, worker_ttl=60)
+        self.worker_b.increment("analysis_count")
+        self.worker_b.flush()
+        self.assertEqual(worker_c.worker_count(), 2)
+
+        # "b" was last heard from long ago; "a" never wrote anything
+        with worker_c._conn:
+            worker_c._conn.execute("UPDATE workers SET last_seen = ? WHERE worker_id = 'b'", (time.time() - 120,))
+        self.assertEqual(worker_c.worker_count(), 1)
+
+        self.worker_a.flush()
+        self.assertEqual(worker_c.worker_count(), 2)
+        worker_c.close()
+        self.assertEqual(self.worker_a.worker_count(), 1)
+
+    def test_ring_buffer_is_bounded_per_worker(self):
+        """Each worker keeps at most ring_size samples per metric."""
+        for value in range(5):
+            self.worker_a.record("processing_time", value)
+        self.worker_b.record("processing_time", 10)
+        self.worker_b.flush()
+
+        samples = self.worker_a.samples("processing_time")
+        self.assertEqual(len(samples), 4)
+        self.assertEqual(sorted(samples), [2, 3, 4, 10])
+
+    def test_gauge_returns_latest_value(self):
+        """Gauges return the most recent write from any worker."""
+        self.worker_a.set_gauge("last_analysis", "2024-01-01T00:00:00")
+        self.worker_a.flush()
+        self.worker_b.set_gauge("last_analysis", "2024-01-02T00:00:00")
+        self.worker_b.flush()
+
+        self.assertEqual(self.worker_a.gauge("last_analysis"), "2024-01-02T00:00:00")
+
+    def test_reset_clears_all_workers(self):
+        """Reset removes every worker's metrics."""
+        self.worker_a.increment("analysis_count")
+        self.worker_b.increment("analysis_count")
+        self.worker_b.flush()
+        self.worker_a.reset()
+
+        self.assertEqual(self.worker_b.counter("analysis_count"), 0)
+
+    def test_agent_stats_use_fleet_counters(self):
+        """Agent statistics read the shared counters when a store is configured."""
+        agent = LegalIntelligenceAgent("test-project", metrics_store=self.worker_a)
+        self.worker_b.increment("generation_attempts", 4)
+        self.worker_b.increment("generation_successes", 3)
+        self.worker_b.increment("token_usage_records", 3)
+        self.worker_b.increment("total_tokens", 300)
+        self.worker_b.flush()
+
+        self.assertAlmostEqual(agent.get_success_rate(), 0.75)
+        self.assertEqual(agent.get_token_usage_stats()["total_tokens"], 300)
+
+    def test_token_stats_have_same_keys_in_both_modes(self):
+        local = LegalIntelligenceAgent("test-project")
+        shared = LegalIntelligenceAgent("test-project", metrics_store=self.worker_a)
+        self.assertEqual(local.get_token_usage_stats(), shared.get_token_usage_stats())
+
+        for agent in (local, shared):
+            agent._record_token_usage(TokenUsage(input_tokens=80, output_tokens=20, total_tokens=100))
+        self.worker_a.increment("token_usage_records")
+        self.worker_a.increment("total_tokens", 100)
+
+        self.assertEqual(set(local.get_token_usage_stats()), set(shared.get_token_usage_stats()))
+        self.assertEqual(shared.get_token_usage_stats()["average_per_request"], 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for BM25 retrieval of complaint passages per section.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.agent_system import LegalIntelligenceAgent
+from src.utils.passage_retrieval import BM25Index, ComplaintIndex, chunk_text, retrieval_terms
+from src.models.legal_models import LegalScenario
+from src.prompts.prompt_assembler import PromptAssembler
+
+OPENING = (
+    "Plaintiff TechCorp Inc. brings this action against defendant DataSystems LLC for infringement "
+    "of U.S. Patent No. 9,123,456.\n\n"
+)
+FILLER = (
+    "Venue is proper in this district under the applicable statutes. The parties have conducted business "
+    "in this district for many years and have appeared before this Court on other matters. Each allegation "
+    "in this paragraph is made on information and belief after a reasonable inquiry by counsel.\n\n"
+)
+DAMAGES = (
+    "As a result of the infringement, TechCorp has suffered lost profits of at least $15 million and is "
+    "entitled to damages no less than a reasonable royalty of 5% on CloudCache revenue.\n\n"
+)
+PRIOR_ART = (
+    "The '456 patent claims a novel invention that no prior art reference disclosed before its filing. "
+    "The examiner considered every publication cited and found the claims valid and non-obvious.\n\n"
+)
+COMPLAINT = OPENING + FILLER * 30 + DAMAGES + FILLER * 30 + PRIOR_ART + FILLER * 30
+
+QUERIES = {
+    "damage_calculation": ["damages", "lost profits", "royalty", "revenue"],
+    "prior_art_analysis": ["prior art", "patent", "novelty", "obviousness", "publication", "claims"]
+}
+
+
+class TestPassageRetrieval(unittest.TestCase):
+
+    def setUp(self):
+        self.index = ComplaintIndex(COMPLAINT)
+
+    def test_passages_cut_at_paragraphs_and_sentences(self):
+        spans = chunk_text(COMPLAINT)
+        self.assertEqual(COMPLAINT[spans[0][0]:spans[0][1]], OPENING.strip())
+        self.assertTrue(all(COMPLAINT[start:end].endswith(".") for start, end in spans))
+
+        text = " ".join(["word"] * 500)
+        self.assertEqual([len(text[start:end].split()) for start, end in chunk_text(text, 120)], [240, 240, 20])
+
+    def test_bm25_ranks_matching_document_first(self):
+        documents = [retrieval_terms(text) for text in (FILLER, DAMAGES, PRIOR_ART)]
+        scores = BM25Index(documents).scores(retrieval_terms("lost profits royalty"))
+        self.assertEqual(int(scores.argmax()), 1)
+        self.assertEqual(scores[0], 0.0)
+
+    def test_section_gets_its_facts_within_budget(self):
+        budget = 150
+        damages = self.index.excerpt(retrieval_terms(" ".join(QUERIES["damage_calculation"])), budget)
+        prior_art = self.index.excerpt(retrieval_terms(" ".join(QUERIES["prior_art_analysis"])), budget)
+
+        self.assertIn("$15 million", damages)
+        self.assertNotIn("examiner considered", damages)
+        self.assertIn("examiner considered", prior_art)
+        for excerpt in (damages, prior_art):
+            self.assertTrue(excerpt.startswith(OPENING.strip()))
+            self.assertIn("[...]", excerpt)
+            self.assertLessEqual(len(excerpt.replace("[...]", "")) // 4, budget + 5)
+
+    def test_short_complaint_quoted_whole(self):
+        self.assertEqual(ComplaintIndex(OPENING + DAMAGES).excerpt(["damage"], 500), OPENING + DAMAGES)
+
+
+class TestPromptRetrieval(unittest.TestCase):
+
+    def test_prompts_quote_relevant_passages(self):
+        assembler = PromptAssembler(section_queries=QUERIES, complaint_token_budget=200)
+        scenario = LegalScenario(case_name="TechCorp", complaint_text=COMPLAINT, case_type="IP", filing_date="2024-01-01")
+
+        damages = assembler.assemble("Analyst", "damage_calculation", scenario, [])
+        prior_art = assembler.assemble("Analyst", "prior_art_analysis", scenario, [])
+
+        self.assertIn("$15 million", damages)
+        self.assertIn("examiner considered", prior_art)
+        self.assertLess(len(damages), len(COMPLAINT) // 4)
+
+        retrieval = assembler.get_stats()["complaint_retrieval"]
+        self.assertEqual(retrieval["complaints_indexed"], 1)
+        self.assertEqual(retrieval["prompts_with_excerpts"], 2)
+
+    def test_agent_queries_cover_section_types(self):
+        agent = LegalIntelligenceAgent("test-project", complaint_token_budget=200)
+        scenario = LegalScenario(case_name="TechCorp", complaint_text=COMPLAINT, case_type="IP", filing_date="2024-01-01")
+        prompt = agent._build_prompt("Analyst", "damage_calculation", scenario, [])
+        self.assertIn("$15 million", prompt)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests for assembling section prompts from precompiled segments.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.agent_system import LegalIntelligenceAgent
+from src.models.legal_models import LegalScenario, ReportSection
+from src.prompts.personas import LegalPersonas
+from src.prompts.prompt_assembler import (
+    PromptAssembler, REASONING_INSTRUCTIONS, SECTION_INSTRUCTIONS, DEFAULT_SECTION_INSTRUCTIONS
+)
+
+
+def _scenario() -> LegalScenario:
+    return LegalScenario(
+        case_name="TechCorp v. DataSystems",
+        complaint_text="Plaintiff TechCorp alleges patent infringement by defendant DataSystems. " * 20,
+        case_type="IP",
+        filing_date="2024-01-01",
+        key_issues=["Patent infringement", "Damages"],
+        urgency_level="high"
+    )
+
+
+def _section(section_type: str, content: str) -> ReportSection:
+    return ReportSection(
+        type=section_type, title=section_type.replace("_", " ").title(), content=content,
+        agent_type="business_analyst", quality_score=0.8, tokens_used=100, cost=0.01,
+        timestamp="2024-01-01T00:00:00"
+    )
+
+
+def _reference_prompt(persona, section_type, scenario, previous_sections):
+    """The prompt as it was built by repeated concatenation, for a complaint within the budget."""
+    prompt = persona + "\n\n" + REASONING_INSTRUCTIONS
+    if previous_sections:
+        prompt += "\n\nPREVIOUS ANALYSIS:\n"
+        for section in previous_sections[-2:]:
+            prompt += f"\n{section.title}:\n"
+            prompt += f"{section.content[:500]}...\n"
+    prompt += f"\n\nTASK: Provide a {section_type.replace('_', ' ')} for the following legal case:\n\n"
+    prompt += f"Case Name: {scenario.case_name}\n"
+    prompt += f"Case Type: {scenario.case_type}\n"
+    prompt += f"Key Issues: {', '.join(scenario.key_issues)}\n"
+    prompt += f"Urgency: {scenario.urgency_level}\n\n"
+    prompt += f"Complaint Summary:\n{scenario.complaint_text}\n\n"
+    prompt += SECTION_INSTRUCTIONS.get(section_type, DEFAULT_SECTION_INSTRUCTIONS)
+    return prompt
+
+
+class TestPromptAssembler(unittest.TestCase):
+
+    def setUp(self):
+        self.personas = LegalPersonas()
+        self.assembler = PromptAssembler(self.personas)
+        self.persona = self.personas.get_persona("business_analyst")
+        self.previous = [
+            _section(section_type, "Analysis text. " * 60)
+            for section_type in ("liability_assessment", "damage_calculation", "prior_art_analysis")
+        ]
+
+    def test_matches_reference_prompt(self):
+        cases = [
+            (self.persona, "liability_assessment", []),
+            (self.persona, "risk_assessment", self.previous),
+            (f"{self.persona}\n\nIMPORTANT: Previous attempt had quality issues. Please address: more detail",
+             "damage_calculation", self.previous[:1]),
+            ("Unknown persona", "custom_section", self.previous)
+        ]
+        for persona, section_type, previous in cases:
+            self.assertEqual(
+                self.assembler.assemble(persona, section_type, _scenario(), previous),
+                _reference_prompt(persona, section_type, _scenario(), previous)
+            )
+
+    def test_static_segments_precompiled(self):
+        first = self.assembler.compiled(self.persona, "risk_assessment")
+        self.assertIs(first, self.assembler.compiled(self.persona, "risk_assessment"))
+        # Personas extended with retry feedback are not cached
+        extended = f"{self.persona}\n\nIMPORTANT: fix it"
+        self.assertIsNot(
+            self.assembler.compiled(extended, "risk_assessment"),
+            self.assembler.compiled(extended, "risk_assessment")
+        )
+
+    def test_segment_sizes_recorded(self):
+        self.assembler.assemble(self.persona, "liability_assessment", _scenario(), [])
+        self.assembler.assemble(self.persona, "risk_assessment", _scenario(), self.previous)
+
+        stats = self.assembler.get_stats()
+        self.assertEqual(stats["prompts"], 2)
+        segments = stats["segments"]
+        self.assertEqual(segments["previous_sections"]["included"], 1)
+        self.assertEqual(
+            segments["complaint"]["max_bytes"], len("Complaint Summary:\n\n\n") + len(_scenario().complaint_text)
+        )
+        self.assertAlmostEqual(segments["persona"]["mean_tokens"], len(self.persona) // 4)
+        self.assertAlmostEqual(sum(segment["share"] for segment in segments.values()), 1.0)
+
+    def test_agent_builds_prompts_with_assembler(self):
+        agent = LegalIntelligenceAgent("test-project")
+        prompt = agent._build_prompt(self.persona, "liability_assessment", _scenario(), self.previous)
+        self.assertEqual(prompt, _reference_prompt(self.persona, "liability_assessment", _scenario(), self.previous))
+        self.assertEqual(agent.prompt_assembler.get_stats()["prompts"], 1)
+
+    def test_complaint_caches_bounded(self):
+        for max_cached, expected in ((32, 1), (0, 2)):
+            assembler = PromptAssembler(minimize_boilerplate=True, max_cached_complaints=max_cached)
+            for section_type in ("liability_assessment", "risk_assessment"):
+                assembler.assemble(self.persona, section_type, _scenario(), [])
+            self.assertEqual(assembler.get_stats()["boilerplate"]["complaints_minimized"], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
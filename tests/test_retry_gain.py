@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for the retry gain model and skipping futile quality retries.
+"""
+
+import sys
+import asyncio
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.agent_system import LegalIntelligenceAgent
+from src.core.quality_validator import QualityScore, QualityValidator
+from src.core.retry_gain import RetryGainModel, weakest_sub_score
+from src.models.legal_models import LegalScenario, TokenUsage
+
+# Good everywhere except structure, e.g. a section with no natural list format
+WEAK_STRUCTURE = QualityScore(0.6, 0.7, 0.7, 0.7, 0.2, ["Improve organization with clear structure and conclusions"])
+WEAK_GROUNDING = QualityScore(0.6, 0.7, 0.3, 0.7, 0.7, ["Include more specific legal analysis and reasoning"])
+
+
+def _improved(quality: QualityScore, gain: float) -> QualityScore:
+    return QualityScore(quality.overall_score + gain, 0.7, 0.7, 0.7, 0.7, [])
+
+
+def _scenario() -> LegalScenario:
+    return LegalScenario(
+        case_name="Test Case", complaint_text="Complaint", case_type="Contract", filing_date="2024-01-01"
+    )
+
+
+class TestRetryGainModel(unittest.TestCase):
+
+    def setUp(self):
+        self.model = RetryGainModel(min_expected_gain=0.02, min_samples=3, explore_every=4)
+
+    def test_weakest_sub_score(self):
+        self.assertEqual(weakest_sub_score(WEAK_STRUCTURE), "structure")
+        self.assertEqual(weakest_sub_score(WEAK_GROUNDING), "groundedness")
+
+    def test_retries_until_enough_samples(self):
+        for _ in range(2):
+            self.assertTrue(self.model.should_retry("risk_assessment", WEAK_STRUCTURE))
+            self.model.record("risk_assessment", WEAK_STRUCTURE, _improved(WEAK_STRUCTURE, 0.0))
+        self.assertTrue(self.model.should_retry("risk_assessment", WEAK_STRUCTURE))
+
+        self.model.record("risk_assessment", WEAK_STRUCTURE, _improved(WEAK_STRUCTURE, 0.01))
+        self.assertFalse(self.model.should_retry("risk_assessment", WEAK_STRUCTURE))
+        gain, samples = self.model.expected_gain("risk_assessment", WEAK_STRUCTURE)
+        self.assertAlmostEqual(gain, 0.01 / 3)
+        self.assertEqual(samples, 3)
+
+    def test_keys_learned_separately(self):
+        for _ in range(3):
+            self.model.record("risk_assessment", WEAK_STRUCTURE, _improved(WEAK_STRUCTURE, 0.0))
+            self.model.record("risk_assessment", WEAK_GROUNDING, _improved(WEAK_GROUNDING, 0.15))
+        self.assertFalse(self.model.should_retry("risk_assessment", WEAK_STRUCTURE))
+        self.assertTrue(self.model.should_retry("risk_assessment", WEAK_GROUNDING))
+        self.assertTrue(self.model.should_retry("damage_calculation", WEAK_STRUCTURE))
+
+    def test_explores_occasionally(self):
+        for _ in range(3):
+            self.model.record("risk_assessment", WEAK_STRUCTURE, _improved(WEAK_STRUCTURE, 0.0))
+        decisions = [self.model.should_retry("risk_assessment", WEAK_STRUCTURE) for _ in range(8)]
+        self.assertEqual(decisions, [False, False, False, True] * 2)
+
+    def test_disabled(self):
+        model = RetryGainModel(min_expected_gain=0, min_samples=1)
+        model.record("risk_assessment", WEAK_STRUCTURE, _improved(WEAK_STRUCTURE, -0.1))
+        self.assertTrue(model.should_retry("risk_assessment", WEAK_STRUCTURE))
+        self.assertFalse(model.get_stats()["enabled"])
+
+
+class TestFutileRetriesSkipped(unittest.TestCase):
+
+    def setUp(self):
+        self.usage = TokenUsage(input_tokens=10, output_tokens=5, total_tokens=15)
+        self.agent = LegalIntelligenceAgent("test-project", retry_gain=RetryGainModel(min_samples=2))
+        self.agent.initialized = True
+
+    @patch.object(QualityValidator, "validate_section")
+    @patch.object(LegalIntelligenceAgent, "generate_section_content")
+    def test_learned_futile_retry_skipped(self, mock_generate, mock_validate):
+        mock_generate.return_value = ("Content", self.usage, 0.01)
+        mock_validate.return_value = WEAK_STRUCTURE
+        for _ in range(2):
+            self.agent.retry_gain.record("liability_assessment", WEAK_STRUCTURE, WEAK_STRUCTURE)
+
+        report = asyncio.run(self.agent.generate_complete_report(_scenario()))
+
+        section_types = [call.kwargs["section_type"] for call in mock_generate.call_args_list]
+        self.assertEqual(section_types.count("liability_assessment"), 1)
+        self.assertEqual(section_types.count("damage_calculation"), 3)
+        self.assertEqual(report.metadata["retries_skipped"], ["liability_assessment"])
+        self.assertEqual(len(report.sections), 6)
+
+        stats = self.agent.get_retry_stats()
+        self.assertEqual(stats["retries_skipped"], 1)
+        self.assertEqual(stats["estimated_tokens_saved"], 15)
+
+    @patch.object(QualityValidator, "validate_section")
+    @patch.object(LegalIntelligenceAgent, "generate_section_content")
+    def test_gains_recorded_from_retries(self, mock_generate, mock_validate):
+        mock_generate.return_value = ("Content", self.usage, 0.01)
+        mock_validate.side_effect = [WEAK_STRUCTURE, _improved(WEAK_STRUCTURE, 0.15)] + [
+            QualityScore(0.9, 0.9, 0.9, 0.9, 0.9, [])
+        ] * 5
+
+        asyncio.run(self.agent.generate_complete_report(_scenario()))
+
+        gain, samples = self.agent.retry_gain.expected_gain("liability_assessment", WEAK_STRUCTURE)
+        self.assertEqual(samples, 1)
+        self.assertAlmostEqual(gain, 0.15)
+        self.assertEqual(self.agent.get_retry_stats()["expected_gain"]["liability_assessment:structure"]["retries"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Tests for carried quality breakdowns and the content-hash score cache.
+"""
+
+import sys
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.agent_system import LegalIntelligenceAgent
+from src.core.quality_validator import QualityValidator
+from src.models.legal_models import AnalysisReport, LegalScenario, ReportSection, TokenUsage
+
+CONTENT = (
+    "RISKS\n\nThe key risks are litigation exposure and cost. Therefore mitigation matters.\n\n"
+    "- Probability is moderate\n- Impact is high because damages are large.\n\nIn summary, act early."
+)
+
+
+def _scenario() -> LegalScenario:
+    return LegalScenario(
+        case_name="Test Case", complaint_text="Complaint", case_type="IP", filing_date="2024-01-01"
+    )
+
+
+def _report(sections) -> AnalysisReport:
+    return AnalysisReport(
+        scenario=_scenario(),
+        sections=sections,
+        executive_summary="Summary",
+        total_cost=0.0,
+        total_tokens=0,
+        processing_time=0.0,
+        confidence_score=0.0,
+        timestamp="2024-01-01T00:00:00"
+    )
+
+
+def _section(content: str, breakdown=None) -> ReportSection:
+    return ReportSection(
+        type="risk_assessment", title="Risk Assessment", content=content, agent_type="test",
+        quality_score=0.0, tokens_used=0, cost=0.0, timestamp="2024-01-01T00:00:00",
+        quality_breakdown=breakdown
+    )
+
+
+class TestScoreCache(unittest.TestCase):
+
+    def setUp(self):
+        self.validator = QualityValidator(score_cache_size=2)
+        self.expected = self.validator.expected_elements_for("risk_assessment")
+
+    def test_repeat_validation_is_a_lookup(self):
+        first = self.validator.validate_section(CONTENT, "risk_assessment", self.expected)
+        with patch.object(QualityValidator, "_score_section") as score:
+            second = self.validator.validate_section(CONTENT, "risk_assessment", self.expected)
+        score.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertEqual(self.validator.get_cache_stats()["hits"], 1)
+
+    def test_cached_feedback_not_shared(self):
+        first = self.validator.validate_section("Short.", "risk_assessment", self.expected)
+        first.feedback.clear()
+        second = self.validator.validate_section("Short.", "risk_assessment", self.expected)
+        self.assertTrue(second.feedback)
+
+    def test_cache_is_bounded_lru(self):
+        for content in ["One text here.", "Two text here.", "One text here.", "Three text here."]:
+            self.validator.validate_section(content, "risk_assessment", self.expected)
+
+        stats = self.validator.get_cache_stats()
+        self.assertEqual(stats["size"], 2)
+        with patch.object(QualityValidator, "_score_section", wraps=self.validator._score_section) as score:
+            self.validator.validate_section("One text here.", "risk_assessment", self.expected)
+            self.validator.validate_section("Two text here.", "risk_assessment", self.expected)
+        self.assertEqual(score.call_count, 1)
+
+    def test_cache_disabled(self):
+        validator = QualityValidator(score_cache_size=0)
+        validator.validate_section(CONTENT, "risk_assessment", self.expected)
+        self.assertEqual(validator.get_cache_stats()["size"], 0)
+
+    def test_matcher_cache_safe_across_threads(self):
+        """Pool threads share one matcher per element list, and eviction never races."""
+        validator = QualityValidator()
+        validator.MAX_CACHED_MATCHERS = 4
+        element_lists = [[f"element {i}", "damages"] for i in range(8)] * 50
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            matchers = list(pool.map(validator._get_matcher, element_lists))
+
+        self.assertLessEqual(len(validator._matchers), 4)
+        latest = validator._get_matcher(element_lists[-1])
+        self.assertIs(validator._get_matcher(element_lists[-1]), latest)
+        self.assertEqual(len(matchers), len(element_lists))
+
+
+class TestCarriedBreakdowns(unittest.TestCase):
+
+    def setUp(self):
+        self.validator = QualityValidator()
+        quality = QualityValidator().validate_section(
+            CONTENT, "risk_assessment", self.validator.expected_elements_for("risk_assessment"),
+            source_text=_scenario().complaint_text
+        )
+        self.breakdown = self.validator.section_breakdown(CONTENT, quality)
+
+    def test_trusted_breakdown_reused(self):
+        report = _report([_section(CONTENT, self.breakdown)])
+        with patch.object(QualityValidator, "_score_section") as score:
+            result = self.validator.validate_report(report, trust_breakdowns=True)
+        score.assert_not_called()
+        self.assertEqual(result.section_scores["risk_assessment"], self.breakdown.overall_score)
+        self.assertEqual(self.validator.get_cache_stats()["breakdowns_reused"], 1)
+
+    def test_changed_content_or_rules_rescored(self):
+        edited = _report([_section(CONTENT + " Edited.", self.breakdown)])
+        stale_rules = _report([_section(CONTENT, self.breakdown.model_copy(update={"rules_version": "old"}))])
+        for report in (edited, stale_rules):
+            with patch.object(QualityValidator, "_score_section", wraps=self.validator._score_section) as score:
+                self.validator.validate_report(report, trust_breakdowns=True)
+            self.assertEqual(score.call_count, 1)
+
+    def test_client_breakdowns_not_trusted_by_default(self):
+        forged = self.breakdown.model_copy(update={"overall_score": 1.0})
+        result = self.validator.validate_report(_report([_section(CONTENT, forged)]))
+        self.assertEqual(result.section_scores["risk_assessment"], self.breakdown.overall_score)
+
+    def test_rules_version_tracks_phrase_lists(self):
+        class Stricter(QualityValidator):
+            REASONING_PHRASES = QualityValidator.REASONING_PHRASES + ["it follows that"]
+
+        self.assertEqual(QualityValidator().rules_version, self.validator.rules_version)
+        self.assertNotEqual(Stricter().rules_version, self.validator.rules_version)
+
+
+class TestGeneratedReportsCarryBreakdowns(unittest.TestCase):
+
+    @patch.object(LegalIntelligenceAgent, "generate_section_content")
+    def test_background_check_reuses_generation_scores(self, mock_generate):
+        mock_generate.return_value = (CONTENT, TokenUsage(input_tokens=10, output_tokens=5, total_tokens=15), 0.01)
+        agent = LegalIntelligenceAgent("test-project")
+        agent.initialized = True
+        report = asyncio.run(agent.generate_complete_report(_scenario()))
+
+        for section in report.sections:
+            self.assertIsNotNone(section.quality_breakdown)
+            self.assertEqual(section.quality_breakdown.overall_score, section.quality_score)
+
+        validator = QualityValidator()
+        with patch.object(QualityValidator, "_score_section") as score:
+            result = validator.validate_report(report, trust_breakdowns=True)
+        score.assert_not_called()
+        self.assertEqual(
+            result.section_scores,
+            {section.type: section.quality_score for section in report.sections}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for TF-IDF grounding of sections against the source complaint.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core import quality_validator
+from src.core.batch_validator import BatchSection, BatchValidator
+from src.core.content_profile import ContentProfile
+from src.core.quality_validator import QualityValidator
+from src.core.source_grounding import SourceIndex, build_source_index
+
+COMPLAINT = (
+    "Plaintiff TechCorp Inc. alleges that defendant DataSystems LLC infringed U.S. Patent No. 9,123,456 "
+    "covering a distributed caching method. DataSystems launched its CloudCache product in March 2023. "
+    "TechCorp seeks damages of $15 million in lost profits and an injunction. TechCorp previously licensed "
+    "the patent to StoreFast at a 5% royalty. DataSystems continued sales after receiving notice in June 2023."
+)
+
+ON_TOPIC = (
+    "LIABILITY ASSESSMENT\n\nTechCorp's infringement claim against DataSystems is strong. The CloudCache "
+    "product appears to practice the distributed caching method of the '456 patent. Because DataSystems "
+    "continued sales after notice in June 2023, willfulness is plausible. However, DataSystems will likely "
+    "challenge validity.\n\nThe prior license to StoreFast at a 5% royalty supports a royalty floor. "
+    "In conclusion, liability is likely."
+)
+
+OFF_TOPIC = (
+    "LIABILITY ASSESSMENT\n\nThe claims must be evaluated against the applicable standard of care. "
+    "Negligence requires duty, breach, causation and damages. Therefore the evidence should be weighed "
+    "carefully.\n\nPrecedent indicates courts consider the totality of circumstances. Furthermore, the "
+    "probability of success depends on the strength of the record. In conclusion, liability is uncertain."
+)
+
+
+class TestSourceIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = SourceIndex(COMPLAINT)
+
+    def test_on_topic_section_overlaps_more(self):
+        on_topic = self.index.overlap(ContentProfile.from_text(ON_TOPIC))
+        off_topic = self.index.overlap(ContentProfile.from_text(OFF_TOPIC))
+        self.assertGreater(on_topic.similarity, 0.3)
+        self.assertGreaterEqual(on_topic.sentence_coverage, 0.5)
+        self.assertLess(off_topic.similarity, 0.1)
+        self.assertEqual(off_topic.sentence_coverage, 0.0)
+
+    def test_identical_text_fully_similar(self):
+        overlap = self.index.overlap(ContentProfile.from_text(COMPLAINT))
+        self.assertAlmostEqual(overlap.similarity, 1.0)
+        self.assertEqual(overlap.sentence_coverage, 1.0)
+
+    def test_stopwords_do_not_count(self):
+        overlap = self.index.overlap(ContentProfile.from_text("It is the one that was in the case at the time."))
+        self.assertEqual(overlap.similarity, 0.0)
+
+    def test_empty_inputs(self):
+        self.assertIsNone(build_source_index(""))
+        self.assertIsNone(build_source_index("The and of."))
+        overlap = self.index.overlap(ContentProfile.from_text(""))
+        self.assertEqual((overlap.similarity, overlap.sentence_coverage), (0.0, 0.0))
+
+
+class TestSourceGroundedScores(unittest.TestCase):
+
+    def setUp(self):
+        self.validator = QualityValidator()
+        self.expected = self.validator.expected_elements_for("liability_assessment")
+
+    def test_ignoring_the_complaint_lowers_groundedness(self):
+        generic = self.validator.validate_section(OFF_TOPIC, "liability_assessment", self.expected)
+        grounded = self.validator.validate_section(
+            OFF_TOPIC, "liability_assessment", self.expected, source_text=COMPLAINT
+        )
+        self.assertLess(grounded.groundedness_score, generic.groundedness_score)
+        self.assertIn("Tie the analysis to the specific parties, facts and figures in the complaint", grounded.feedback)
+
+        on_topic = self.validator.validate_section(
+            ON_TOPIC, "liability_assessment", self.expected, source_text=COMPLAINT
+        )
+        self.assertNotIn(
+            "Tie the analysis to the specific parties, facts and figures in the complaint", on_topic.feedback
+        )
+
+    def test_complaint_indexed_once(self):
+        with patch.object(quality_validator, "build_source_index", wraps=quality_validator.build_source_index) as build:
+            for content in (ON_TOPIC, OFF_TOPIC, ON_TOPIC + " More."):
+                self.validator.validate_section(content, "liability_assessment", self.expected, source_text=COMPLAINT)
+        self.assertEqual(build.call_count, 1)
+
+    def test_cached_scores_keyed_by_source(self):
+        with_source = self.validator.validate_section(
+            OFF_TOPIC, "liability_assessment", self.expected, source_text=COMPLAINT
+        )
+        without_source = self.validator.validate_section(OFF_TOPIC, "liability_assessment", self.expected)
+        self.assertNotEqual(with_source, without_source)
+        self.assertEqual(self.validator.get_cache_stats()["hits"], 0)
+
+    def test_batch_matches_scalar_with_sources(self):
+        sections = [
+            BatchSection(content, "liability_assessment", self.expected, source_text=source)
+            for content in (ON_TOPIC, OFF_TOPIC, "")
+            for source in (COMPLAINT, None, "")
+        ]
+        expected = [
+            self.validator.validate_section(s.content, s.section_type, s.expected_elements, source_text=s.source_text)
+            for s in sections
+        ]
+        self.assertEqual(BatchValidator(self.validator).score_sections(sections), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental quality scoring of streamed sections and early abort.
+"""
+
+import sys
+import random
+import asyncio
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from google.genai import types
+
+from src.core.agent_system import GenerationAborted, LegalIntelligenceAgent
+from src.core.content_profile import ContentProfile
+from src.core.keyword_engine import KeywordMatcher, tokenize
+from src.core.quality_validator import QualityScore, QualityValidator
+from src.core.streaming_validator import IncrementalQualityScorer
+from src.models.legal_models import LegalScenario, TokenUsage
+
+STRONG_SECTION = (
+    "LIABILITY ASSESSMENT\n\n"
+    "First, the claims rest on documented evidence. Therefore the probability of success is high. "
+    "Second, precedent supports the plaintiff because the defendant breached its duty of care. "
+    "Furthermore, causation is established based on the record. However, the defense will contest fault.\n\n"
+    "- The evidence shows negligence\n- Precedent indicates liability\n\n"
+    "Third, the standard of care was violated. Moreover, the breach caused the loss. "
+    "In fact, the case law demonstrates that such conduct is wrongful. "
+) * 3 + "In conclusion, liability is likely given that the evidence is strong."
+
+WEAK_SECTION = "lorem ipsum dolor sit amet " * 60
+
+
+def _chunks(text: str, size: int):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def _scenario() -> LegalScenario:
+    return LegalScenario(
+        case_name="Test Case", complaint_text="Plaintiff alleges breach.", case_type="Contract",
+        filing_date="2024-01-01"
+    )
+
+
+class TestKeywordStream(unittest.TestCase):
+
+    def test_phrases_spanning_pieces(self):
+        matcher = KeywordMatcher(["on the other hand", "risk"])
+        stream = matcher.stream()
+        for piece in ["risks on the", "other", "hand risk"]:
+            stream.feed(tokenize(piece))
+        hits = stream.hits()
+        self.assertEqual(hits.count("on the other hand"), 1)
+        self.assertEqual(hits.count("risk"), 2)
+
+    def test_pending_tokens_not_consumed(self):
+        stream = KeywordMatcher(["risk"]).stream()
+        self.assertEqual(stream.hits(["risk"]).count("risk"), 1)
+        self.assertEqual(stream.hits().count("risk"), 0)
+
+
+class TestIncrementalQualityScorer(unittest.TestCase):
+
+    def setUp(self):
+        self.validator = QualityValidator()
+        self.expected = self.validator.expected_elements_for("liability_assessment")
+
+    def _full_features(self, text: str):
+        profile = ContentProfile.from_text(text)
+        hits = self.validator.scan_keywords(text, self.expected, profile=profile)
+        return self.validator.extract_features(profile, hits, "liability_assessment", self.expected)
+
+    def test_features_match_full_parse_at_every_chunk(self):
+        text = STRONG_SECTION + "\n\n\n# NOTES\nA short. ONE more!\n \n\nDone?"
+        rng = random.Random(11)
+        scorer = IncrementalQualityScorer(self.validator, "liability_assessment", self.expected)
+        position = 0
+        while position < len(text):
+            step = rng.randint(1, 9)
+            scorer.feed(text[position:position + step])
+            position += step
+            self.assertEqual(scorer.features(), self._full_features(text[:position]))
+
+        self.assertEqual(
+            scorer.score(),
+            self.validator._score_section(text, "liability_assessment", self.expected)
+        )
+
+    def test_weak_draft_aborted_after_min_progress(self):
+        scorer = IncrementalQualityScorer(self.validator, "liability_assessment", self.expected, expected_words=150)
+        scorer.feed(" ".join(WEAK_SECTION.split()[:30]) + " ")
+        self.assertIsNone(scorer.should_abort(0.7))  # 20% of the expected length: too early to judge
+
+        scorer.feed(" ".join(WEAK_SECTION.split()[30:60]) + " ")
+        projection = scorer.should_abort(0.7)
+        self.assertIsNotNone(projection)
+        self.assertLess(projection.overall_score, 0.6)
+        self.assertTrue(projection.feedback)
+
+    def test_strong_draft_not_aborted(self):
+        scorer = IncrementalQualityScorer(self.validator, "liability_assessment", self.expected, expected_words=400)
+        for chunk in _chunks(STRONG_SECTION, 40):
+            scorer.feed(chunk)
+            self.assertIsNone(scorer.should_abort(0.7))
+
+    def test_projection_errs_high(self):
+        """Projecting a prefix never scores below the finished section's real score."""
+        words = STRONG_SECTION.split(" ")
+        scorer = IncrementalQualityScorer(
+            self.validator, "liability_assessment", self.expected, expected_words=len(STRONG_SECTION.split())
+        )
+        scorer.feed(" ".join(words[:len(words) // 2]))
+        final = self.validator._score_section(STRONG_SECTION, "liability_assessment", self.expected)
+        self.assertGreaterEqual(scorer.projected_score().overall_score, final.overall_score)
+
+    def test_projection_errs_high_with_source(self):
+        """A section validated against the complaint it tracks scores above its unblended projection."""
+        words = WEAK_SECTION.split(" ")
+        final = self.validator.validate_section(
+            WEAK_SECTION, "liability_assessment", self.expected, source_text=WEAK_SECTION
+        )
+        for source_grounded in (False, True):
+            scorer = IncrementalQualityScorer(
+                self.validator, "liability_assessment", self.expected,
+                expected_words=len(WEAK_SECTION.split()), source_grounded=source_grounded
+            )
+            scorer.feed(" ".join(words[:len(words) // 2]))
+            projection = scorer.projected_score().overall_score
+            if source_grounded:
+                self.assertGreaterEqual(projection, final.overall_score)
+            else:
+                self.assertLess(projection, final.overall_score)
+
+
+class TestStreamingGeneration(unittest.TestCase):
+
+    def setUp(self):
+        self.agent = LegalIntelligenceAgent("test-project", streaming_validation=True)
+        self.agent.initialized = True
+        self.agent.generation_config = types.GenerateContentConfig(max_output_tokens=200)
+        self.agent.model = Mock()
+
+    def _stream(self, text: str, consumed: list):
+        usage = SimpleNamespace(prompt_token_count=100, candidates_token_count=len(text) // 4)
+        for chunk in _chunks(text, 30):
+            consumed.append(chunk)
+            yield SimpleNamespace(text=chunk, usage_metadata=None)
+        yield SimpleNamespace(text="", usage_metadata=usage)
+
+    def test_weak_draft_stopped_early(self):
+        consumed = []
+        self.agent.model.generate_content_stream.return_value = self._stream(WEAK_SECTION, consumed)
+
+        with self.assertRaises(GenerationAborted) as raised:
+            self.agent.generate_section_content(
+                persona="Analyst", section_type="liability_assessment", scenario=_scenario(), abort_below=0.7
+            )
+
+        self.assertLess(len(consumed), len(_chunks(WEAK_SECTION, 30)))
+        self.assertGreater(raised.exception.tokens_saved, 0)
+        stats = self.agent.get_streaming_stats()
+        self.assertEqual(stats["aborted_drafts"], 1)
+        self.assertEqual(stats["estimated_tokens_saved"], raised.exception.tokens_saved)
+        self.assertEqual(len(self.agent.token_usage_history), 1)
+
+    def test_complete_stream_returns_content_and_usage(self):
+        consumed = []
+        self.agent.model.generate_content_stream.return_value = self._stream(STRONG_SECTION, consumed)
+
+        content, usage, cost = self.agent.generate_section_content(
+            persona="Analyst", section_type="liability_assessment", scenario=_scenario(), abort_below=0.7
+        )
+
+        self.assertEqual(content, STRONG_SECTION)
+        self.assertEqual(usage.output_tokens, len(STRONG_SECTION) // 4)
+        self.assertGreater(cost, 0)
+        self.agent.model.generate_content.assert_not_called()
+
+    def test_draft_tracking_complaint_not_aborted(self):
+        """The abort decision allows for the overlap with the complaint that the final score includes."""
+        draft = " ".join(WEAK_SECTION.split()[:120])
+        scenario = LegalScenario(
+            case_name="Test Case", complaint_text=draft, case_type="Contract", filing_date="2024-01-01"
+        )
+        validator = self.agent.quality_validator
+        final = validator.validate_section(
+            draft, "liability_assessment", validator.expected_elements_for("liability_assessment"), source_text=draft
+        )
+        abort_below = final.overall_score - 0.01
+        self.agent.streaming_abort_margin = 0.0
+
+        self.agent.model.generate_content_stream.return_value = self._stream(draft, [])
+        content, _, _ = self.agent.generate_section_content(
+            persona="Analyst", section_type="liability_assessment", scenario=scenario, abort_below=abort_below
+        )
+        self.assertEqual(content, draft)
+
+        # Validated without the complaint, the same draft projects below the bar
+        self.agent.model.generate_content_stream.return_value = self._stream(draft, [])
+        with self.assertRaises(GenerationAborted):
+            self.agent.generate_section_content(
+                persona="Analyst", section_type="liability_assessment", scenario=scenario,
+                abort_below=abort_below, complaint_text=""
+            )
+
+    def test_streaming_off_by_default(self):
+        agent = LegalIntelligenceAgent("test-project")
+        agent.initialized = True
+        agent.model = Mock()
+        agent.model.generate_content.return_value = SimpleNamespace(
+            text="Content", usage_metadata=SimpleNamespace(
+                prompt_token_count=10, candidates_token_count=5, total_token_count=15
+            )
+        )
+        agent.generate_section_content(
+            persona="Analyst", section_type="liability_assessment", scenario=_scenario(), abort_below=0.7
+        )
+        agent.model.generate_content_stream.assert_not_called()
+
+    @patch.object(QualityValidator, "validate_section")
+    @patch.object(LegalIntelligenceAgent, "generate_section_content")
+    def test_aborted_draft_retried_and_last_attempt_runs_to_completion(self, mock_generate, mock_validate):
+        mock_validate.return_value = QualityScore(0.9, 0.9, 0.9, 0.9, 0.9, [])
+        projection = QualityScore(0.3, 0.3, 0.3, 0.3, 0.3, ["Improve logical flow"])
+        usage = TokenUsage(input_tokens=10, output_tokens=5, total_tokens=15)
+        calls = []
+
+        def generate(*args, **kwargs):
+            calls.append((kwargs["section_type"], kwargs["abort_below"]))
+            if kwargs["section_type"] == "liability_assessment" and len(calls) == 1:
+                raise GenerationAborted("liability_assessment", projection, usage, tokens_saved=100)
+            return "Content", usage, 0.01
+
+        mock_generate.side_effect = generate
+        report = asyncio.run(self.agent.generate_complete_report(_scenario()))
+
+        self.assertEqual(len(report.sections), 6)
+        self.assertEqual(calls[:2], [("liability_assessment", 0.7), ("liability_assessment", 0.7)])
+        self.assertIn("Improve logical flow", mock_generate.call_args_list[1].kwargs["persona"])
+
+        # With no retries left a draft is never abandoned
+        self.agent.streaming_validation = True
+        calls.clear()
+        with patch.object(self.agent, "_can_afford_retry", return_value=False):
+            asyncio.run(self.agent.generate_complete_report(_scenario()))
+        self.assertTrue(all(abort_below is None for _, abort_below in calls))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for fixed-memory rolling telemetry.
+"""
+
+import sys
+import random
+import unittest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from src.core.agent_system import LegalIntelligenceAgent
+from src.core.quality_validator import QualityValidator
+from src.models.legal_models import AnalysisReport, LegalScenario, ReportSection, TokenUsage
+from src.utils.telemetry import RollingMetric
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRollingMetric(unittest.TestCase):
+
+    def test_quantiles_within_relative_accuracy(self):
+        rng = random.Random(5)
+        values = [rng.lognormvariate(2, 1.5) for _ in range(5000)]
+        metric = RollingMetric(window=5000, relative_accuracy=0.01)
+        for value in values:
+            metric.record(value)
+
+        qs = (0.01, 0.25, 0.5, 0.9, 0.95, 0.99)
+        for q, estimate in zip(qs, metric.quantiles(qs)):
+            exact = float(np.quantile(values, q, method="lower"))
+            self.assertLessEqual(abs(estimate - exact), 0.011 * exact, q)
+
+    def test_window_evicts_old_samples(self):
+        metric = RollingMetric(window=100)
+        for value in range(1, 1001):
+            metric.record(value)
+
+        self.assertEqual(len(metric), 100)
+        self.assertEqual(metric.recent(), [float(v) for v in range(901, 1001)])
+        self.assertEqual(metric.count, 1000)
+        self.assertAlmostEqual(metric.mean, 500.5)
+        self.assertAlmostEqual(metric.window_mean, 950.5)
+        self.assertGreaterEqual(metric.quantile(0.0), 901)
+        self.assertEqual(sum(metric._buckets.values()), 100)
+
+    def test_zero_values(self):
+        metric = RollingMetric(window=10)
+        for value in (0, 0, 0, 5):
+            metric.record(value)
+        self.assertEqual(metric.quantile(0.5), 0.0)
+        self.assertAlmostEqual(metric.quantile(1.0), 5.0, delta=0.05)
+
+    def test_rate_is_time_windowed(self):
+        clock = FakeClock()
+        metric = RollingMetric(rate_window_seconds=60, rate_slots=60, clock=clock)
+        for _ in range(30):
+            metric.record(1)
+        self.assertAlmostEqual(metric.rate() * 60, 30)
+
+        clock.now += 30
+        for _ in range(12):
+            metric.record(1)
+        self.assertAlmostEqual(metric.rate() * 60, 42)
+
+        clock.now += 45
+        self.assertAlmostEqual(metric.rate() * 60, 12)
+        clock.now += 3600
+        self.assertEqual(metric.rate(), 0.0)
+
+    def test_empty_snapshot(self):
+        snapshot = RollingMetric().snapshot()
+        self.assertEqual(snapshot["count"], 0)
+        self.assertEqual(snapshot["p95"], 0.0)
+
+
+class TestBoundedHistories(unittest.TestCase):
+
+    def test_agent_token_stats_from_running_totals(self):
+        agent = LegalIntelligenceAgent("test-project", telemetry_window=50)
+        for i in range(500):
+            agent._record_token_usage(TokenUsage(input_tokens=i, output_tokens=1, total_tokens=i + 1))
+            agent.processing_times.record(0.5)
+
+        self.assertEqual(len(agent.token_usage_history), 50)
+        stats = agent.get_token_usage_stats()
+        self.assertEqual(stats["request_count"], 500)
+        self.assertEqual(stats["total_input_tokens"], sum(range(500)))
+        self.assertEqual(stats["total_output_tokens"], 500)
+        self.assertEqual(stats["total_tokens"], sum(range(1, 501)))
+        self.assertAlmostEqual(stats["average_per_request"], 250.5)
+        self.assertGreaterEqual(stats["recent_p50_per_request"], 451)
+        self.assertAlmostEqual(agent.get_avg_processing_time(), 0.5)
+        self.assertAlmostEqual(agent.get_processing_time_stats()["p95"], 0.5, delta=0.01)
+
+    def test_validator_history_bounded(self):
+        report = AnalysisReport(
+            scenario=LegalScenario(
+                case_name="Test Case", complaint_text="Complaint", case_type="IP", filing_date="2024-01-01"
+            ),
+            sections=[ReportSection(
+                type="risk_assessment", title="Risk Assessment", content="The risk is low.", agent_type="test",
+                quality_score=0.0, tokens_used=0, cost=0.0, timestamp="2024-01-01T00:00:00"
+            )],
+            executive_summary="Summary",
+            total_cost=0.0,
+            total_tokens=0,
+            processing_time=0.0,
+            confidence_score=0.0,
+            timestamp="2024-01-01T00:00:00"
+        )
+        validator = QualityValidator(history_size=5)
+        for _ in range(20):
+            result = validator.validate_report(report)
+
+        self.assertEqual(len(validator.validation_history), 5)
+        metrics = validator.get_quality_metrics()
+        self.assertEqual(metrics["total_validations"], 20)
+        self.assertEqual(metrics["recent_average_score"], result.overall_score)
+        self.assertEqual(metrics["recent_pass_rate"], 0.0)
+        self.assertAlmostEqual(metrics["validations_per_minute"], 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
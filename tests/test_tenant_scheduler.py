@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Tests for per-tenant fair scheduling and quotas.
+"""
+
+import sys
+import time
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.testclient import TestClient
+
+import main
+from src.core.admission import AdmissionController
+from src.core.tenant_scheduler import FairScheduler, TenantLimits, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def wait_for(condition, timeout=2.0):
+    """Poll until condition() is true."""
+    give_up_at = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > give_up_at:
+            raise AssertionError("condition not reached")
+        time.sleep(0.005)
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_refills_at_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(tokens_per_minute=600, clock=clock)
+        bucket.charge(900)
+        self.assertEqual(bucket.available(), -300)
+        self.assertAlmostEqual(bucket.seconds_until_available(), 30.0)
+
+        clock.now = 40
+        self.assertEqual(bucket.available(), 100)
+        clock.now = 1000
+        self.assertEqual(bucket.available(), 600)
+
+
+class TestFairScheduler(unittest.TestCase):
+
+    def test_round_robin_between_tenants(self):
+        """A tenant with a deep backlog does not starve a tenant with one call."""
+        scheduler = FairScheduler(total_slots=1, quantum=100, poll_interval=0.01)
+        self.assertTrue(scheduler.acquire("holder"))
+
+        order = []
+
+        def call(tenant_id):
+            if scheduler.acquire(tenant_id, cost=100, timeout=5):
+                order.append(tenant_id)
+                scheduler.release(tenant_id)
+
+        threads = []
+        for tenant_id in ["backfill"] * 5 + ["interactive"]:
+            thread = threading.Thread(target=call, args=(tenant_id,))
+            thread.start()
+            threads.append(thread)
+            waiting = len(threads)
+            wait_for(lambda: sum(t["waiting_calls"] for t in scheduler.get_stats()["tenants"].values()) == waiting)
+
+        scheduler.release("holder")
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(order, ["backfill", "interactive", "backfill", "backfill", "backfill", "backfill"])
+
+    def test_per_tenant_concurrency_cap(self):
+        scheduler = FairScheduler(
+            total_slots=4,
+            tenant_limits={"capped": TenantLimits(max_concurrency=1)},
+            poll_interval=0.01
+        )
+        self.assertTrue(scheduler.acquire("capped"))
+        self.assertFalse(scheduler.acquire("capped", timeout=0.05))
+        self.assertTrue(scheduler.acquire("other"))
+
+        scheduler.release("capped")
+        self.assertTrue(scheduler.acquire("capped", timeout=0.05))
+
+    def test_quota_throttles_until_refill(self):
+        clock = FakeClock()
+        scheduler = FairScheduler(
+            total_slots=4,
+            default_limits=TenantLimits(tokens_per_minute=60),
+            poll_interval=0.01,
+            clock=clock
+        )
+        self.assertIsNone(scheduler.quota_retry_after("tenant-a"))
+        scheduler.record_usage("tenant-a", 120)
+
+        self.assertEqual(scheduler.quota_retry_after("tenant-a"), 60)
+        self.assertFalse(scheduler.acquire("tenant-a", timeout=0.05))
+        self.assertTrue(scheduler.acquire("tenant-b", timeout=0.05))
+
+        clock.now = 61
+        self.assertTrue(scheduler.acquire("tenant-a", timeout=0.05))
+        self.assertIsNone(scheduler.quota_retry_after("tenant-a"))
+
+    def test_cancelled_wait_gives_up(self):
+        scheduler = FairScheduler(total_slots=1, poll_interval=0.01)
+        self.assertTrue(scheduler.acquire("tenant-a"))
+
+        cancel_event = threading.Event()
+        cancel_event.set()
+        self.assertFalse(scheduler.acquire("tenant-b", cancel_event=cancel_event))
+        self.assertEqual(scheduler.get_stats()["tenants"]["tenant-b"]["waiting_calls"], 0)
+
+    def test_usage_reported_per_tenant(self):
+        scheduler = FairScheduler(total_slots=2)
+        scheduler.record_usage("tenant-a", 500)
+        scheduler.record_usage("tenant-a", 250)
+        scheduler.record_usage("tenant-b", 100)
+
+        tenants = scheduler.get_stats()["tenants"]
+        self.assertEqual(tenants["tenant-a"]["calls"], 2)
+        self.assertEqual(tenants["tenant-a"]["tokens_used"], 750)
+        self.assertEqual(tenants["tenant-b"]["tokens_used"], 100)
+
+    def test_idle_unknown_tenants_evicted(self):
+        clock = FakeClock()
+        scheduler = FairScheduler(
+            total_slots=2, max_tenants=3, clock=clock,
+            default_limits=TenantLimits(tokens_per_minute=600),
+            tenant_limits={"backfill": TenantLimits(max_concurrency=1)}
+        )
+        scheduler.record_usage("backfill", 10)
+        scheduler.record_usage("owes-quota", 1200)
+        for i in range(20):
+            self.assertTrue(scheduler.acquire(f"tenant-{i}"))
+            scheduler.release(f"tenant-{i}")
+
+        tenants = scheduler.get_stats()["tenants"]
+        self.assertEqual(len(tenants), 3)
+        # Configured tenants and tenants in quota debt are never forgotten
+        self.assertIn("backfill", tenants)
+        self.assertIn("owes-quota", tenants)
+        self.assertIn("tenant-19", tenants)
+        self.assertIsNotNone(scheduler.quota_retry_after("owes-quota"))
+
+    def test_unknown_tenants_share_fleet_counters(self):
+        metrics_store = Mock()
+        metrics_store.counters.return_value = {}
+        scheduler = FairScheduler(
+            total_slots=2, metrics_store=metrics_store, tenant_limits={"backfill": TenantLimits()}
+        )
+        for tenant_id in ("backfill", "default", "tenant-a", "tenant-b"):
+            scheduler.record_usage(tenant_id, 100)
+
+        names = {call.args[0] for call in metrics_store.increment.call_args_list}
+        self.assertEqual(names, {
+            f"{kind}:{tenant_id}"
+            for kind in ("tenant_calls", "tenant_tokens")
+            for tenant_id in ("backfill", "default", "other")
+        })
+
+
+class TestTenantQuotaEndpoint(unittest.TestCase):
+    """Requests from a tenant over quota are turned away before any work starts."""
+
+    def test_over_quota_tenant_gets_retry_after(self):
+        scheduler = FairScheduler(total_slots=2, default_limits=TenantLimits(tokens_per_minute=600))
+        scheduler.record_usage("backfill", 1200)
+        agent = Mock()
+        agent.scheduler = scheduler
+        state = {
+            "initialized": True,
+            "agent": agent,
+            "metrics": Mock(),
+            "admission": AdmissionController(model_concurrency=2)
+        }
+        with patch.dict(main.system_state, state):
+            response = TestClient(main.app).post("/analyze", json={
+                "case_name": "Test", "complaint_text": "Text", "case_type": "IP", "tenant_id": "backfill"
+            })
+
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response.headers)
+        agent.generate_complete_report.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
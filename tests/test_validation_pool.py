@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Tests for running validation off the event loop.
+"""
+
+import sys
+import time
+import asyncio
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.quality_validator import QualityValidator
+from src.core.validation_pool import ValidationPool
+from src.models.legal_models import AnalysisReport, LegalScenario, ReportSection
+
+CONTENT = (
+    "LIABILITY ASSESSMENT\n\nThe defendant's product likely infringes the patent. Therefore liability "
+    "is probable. However, validity will be challenged.\n\nIn conclusion, the claim is strong."
+)
+
+
+def _report(case_name: str = "Test Case") -> AnalysisReport:
+    scenario = LegalScenario(
+        case_name=case_name, complaint_text="Complaint about a patent", case_type="IP", filing_date="2024-01-01"
+    )
+    section = ReportSection(
+        type="liability_assessment", title="Liability Assessment", content=CONTENT, agent_type="business_analyst",
+        quality_score=0.0, tokens_used=100, cost=0.01, timestamp="2024-01-01T00:00:00"
+    )
+    return AnalysisReport(
+        scenario=scenario, sections=[section], executive_summary="Summary", total_cost=0.01, total_tokens=100,
+        processing_time=1.0, confidence_score=0.8, timestamp="2024-01-01T00:00:00"
+    )
+
+
+class TestValidationPool(unittest.TestCase):
+
+    def setUp(self):
+        self.validator = QualityValidator()
+        self.expected = self.validator.expected_elements_for("liability_assessment")
+
+    def test_matches_direct_validation(self):
+        pool = ValidationPool(self.validator, max_workers=2)
+        score = asyncio.run(pool.validate_section(CONTENT, "liability_assessment", self.expected))
+        self.assertEqual(score, self.validator.validate_section(CONTENT, "liability_assessment", self.expected))
+
+        stats = pool.get_stats()
+        self.assertEqual(stats["offloaded"]["count"], 1)
+        self.assertEqual(stats["loop_blocked_seconds"], 0.0)
+        pool.shutdown()
+
+    def test_validation_runs_off_the_loop_thread(self):
+        pool = ValidationPool(self.validator, max_workers=1)
+        threads = []
+        original = self.validator.validate_section
+
+        def record_thread(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return original(*args, **kwargs)
+
+        with patch.object(self.validator, "validate_section", side_effect=record_thread):
+            asyncio.run(pool.validate_section(CONTENT, "liability_assessment", self.expected))
+        self.assertIsNot(threads[0], threading.main_thread())
+        pool.shutdown()
+
+    def test_loop_keeps_running_during_validation(self):
+        pool = ValidationPool(self.validator, max_workers=1)
+        original = self.validator.validate_section
+
+        def slow(*args, **kwargs):
+            time.sleep(0.2)
+            return original(*args, **kwargs)
+
+        async def main():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            task = asyncio.create_task(ticker())
+            await pool.validate_section(CONTENT, "liability_assessment", self.expected)
+            task.cancel()
+            return ticks
+
+        with patch.object(self.validator, "validate_section", side_effect=slow):
+            self.assertGreater(asyncio.run(main()), 5)
+        pool.shutdown()
+
+    def test_inline_mode_measures_loop_blocking(self):
+        pool = ValidationPool(self.validator, max_workers=0)
+        asyncio.run(pool.validate_report(_report()))
+        stats = pool.get_stats()
+        self.assertEqual(stats["loop_blocked"]["count"], 1)
+        self.assertGreater(stats["loop_blocked_seconds"], 0.0)
+        self.assertEqual(stats["offloaded"]["count"], 0)
+
+
+class TestBackgroundChecks(unittest.TestCase):
+
+    def setUp(self):
+        self.validator = QualityValidator()
+
+    def test_checks_micro_batched(self):
+        pool = ValidationPool(self.validator, max_workers=1, batch_size=4, batch_window=1.0)
+
+        async def main():
+            return await asyncio.gather(*[pool.check_in_background(_report(f"Case {i}")) for i in range(8)])
+
+        started = time.perf_counter()
+        results = asyncio.run(main())
+        # Full batches go without waiting out the window
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertTrue(all(result is not None for result in results))
+        self.assertEqual(len(self.validator.validation_history), 8)
+
+        background = pool.get_stats()["background"]
+        self.assertEqual(background["batches"], 2)
+        self.assertEqual(background["mean_batch_size"], 4)
+        self.assertEqual(background["queued"], 0)
+        pool.shutdown()
+
+    def test_shed_when_queue_full(self):
+        pool = ValidationPool(self.validator, max_workers=1, batch_size=10, batch_window=0.05, max_pending=3)
+
+        async def main():
+            return await asyncio.gather(*[pool.check_in_background(_report(f"Case {i}")) for i in range(5)])
+
+        results = asyncio.run(main())
+        self.assertEqual(sum(result is None for result in results), 2)
+        self.assertEqual(pool.get_stats()["background"]["shed"], 2)
+        pool.shutdown()
+
+    def test_shed_under_load(self):
+        overloaded = True
+        pool = ValidationPool(self.validator, max_workers=1, batch_window=0.0, load_check=lambda: overloaded)
+        self.assertIsNone(asyncio.run(pool.check_in_background(_report())))
+
+        overloaded = False
+        self.assertIsNotNone(asyncio.run(pool.check_in_background(_report())))
+        self.assertEqual(pool.get_stats()["background"]["shed"], 1)
+        pool.shutdown()
+
+    def test_shed_when_admission_queue_deep(self):
+        """The server's load check sheds once enough admitted reports wait for model slots."""
+        import main
+        from src.core.admission import AdmissionController
+
+        admission = AdmissionController(model_concurrency=1, max_queue_depth=100, max_backlog_seconds=10000)
+        pool = ValidationPool(
+            self.validator, max_workers=1, batch_window=0.0, load_check=main._background_validation_overloaded
+        )
+        with patch.dict(main.system_state, {"admission": admission}), \
+                patch.dict(main.CONFIG, {"background_validation_shed_queue_depth": 2}):
+            tickets = [admission.admit("critical") for _ in range(2)]
+            self.assertIsNotNone(asyncio.run(pool.check_in_background(_report())))
+
+            tickets.append(admission.admit("critical"))
+            self.assertEqual(admission.queue_depth, 2)
+            self.assertIsNone(asyncio.run(pool.check_in_background(_report())))
+
+        self.assertEqual(pool.get_stats()["background"]["shed"], 1)
+        pool.shutdown()
+
+    def test_failing_report_does_not_fail_batch(self):
+        pool = ValidationPool(self.validator, max_workers=1, batch_size=2, batch_window=1.0)
+        original = self.validator.validate_report
+
+        def fail_first(report, trust_breakdowns=False):
+            if report.scenario.case_name == "Broken":
+                raise ValueError("bad report")
+            return original(report, trust_breakdowns=trust_breakdowns)
+
+        async def main():
+            return await asyncio.gather(
+                pool.check_in_background(_report("Broken")),
+                pool.check_in_background(_report("Fine")),
+                return_exceptions=True
+            )
+
+        with patch.object(self.validator, "validate_report", side_effect=fail_first):
+            broken, fine = asyncio.run(main())
+        self.assertIsInstance(broken, ValueError)
+        self.assertGreater(fine.overall_score, 0.0)
+        pool.shutdown()
+
+    def test_cancelled_first_caller_does_not_strand_others(self):
+        pool = ValidationPool(self.validator, max_workers=1, batch_size=4, batch_window=0.05)
+
+        async def main():
+            first = asyncio.create_task(pool.check_in_background(_report("First")))
+            await asyncio.sleep(0)
+            second = asyncio.create_task(pool.check_in_background(_report("Second")))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await asyncio.wait_for(second, timeout=5.0)
+
+        result = asyncio.run(main())
+        self.assertGreater(result.overall_score, 0.0)
+        stats = pool.get_stats()["background"]
+        self.assertEqual((stats["queued"], stats["in_flight"]), (0, 0))
+        self.assertEqual(stats["batches"], 1)
+        pool.shutdown()
+
+    def test_cancelled_drain_fails_waiting_checks(self):
+        pool = ValidationPool(self.validator, max_workers=1, batch_size=4, batch_window=1.0)
+
+        async def main():
+            waiting = asyncio.create_task(pool.check_in_background(_report()))
+            await asyncio.sleep(0)
+            pool._drain_task.cancel()
+            with self.assertRaises(RuntimeError):
+                await asyncio.wait_for(waiting, timeout=5.0)
+
+        asyncio.run(main())
+        self.assertEqual(pool.get_stats()["background"]["queued"], 0)
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
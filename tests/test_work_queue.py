@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+"""
+Tests for the lease-based work queue and queue worker.
+"""
+
+import sys
+import asyncio
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.testclient import TestClient
+
+import main
+from src.core.work_queue import SQLiteWorkQueue, RedisWorkQueue
+from src.core.queue_worker import QueueWorker, REPORT_TASK
+from src.core.tenant_scheduler import FairScheduler, TenantLimits
+
+
+class InMemoryRedis:
+    """
+    Local stand-in for the subset of the Redis API the queue uses.
+
+    There is no Lua interpreter here, so each of the queue's scripts is run
+    by a Python equivalent, atomically under the same lock as every command.
+    """
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.RLock()
+        self._scripts = {
+            RedisWorkQueue.CLAIM_SCRIPT: self._claim,
+            RedisWorkQueue.HEARTBEAT_SCRIPT: self._heartbeat,
+            RedisWorkQueue.FINISH_SCRIPT: self._finish
+        }
+
+    def register_script(self, source):
+        handler = self._scripts[source]
+
+        def run(keys=(), args=()):
+            with self._lock:
+                return handler(list(keys), [str(arg) for arg in args])
+        return run
+
+    def _claim(self, keys, args):
+        pending, processing, leases = keys
+        now, prefix = float(args[0]), args[5]
+        for task_id in list(self._data.get(processing, [])):
+            if self.zscore(leases, task_id) is None:
+                self.zadd(leases, {task_id: 0})
+        result = [""]
+        for task_id in self.zrangebyscore(leases, float("-inf"), now):
+            self.zrem(leases, task_id)
+            self.lrem(processing, 0, task_id)
+            key = prefix + task_id
+            if int(self.hget(key, "attempts") or 0) >= int(args[4]):
+                self.hset(key, {
+                    "status": "failed", "error": "lease expired on final attempt", "lease_token": "",
+                    "updated_at": args[0]
+                })
+            else:
+                self.hset(key, {"status": "pending", "lease_token": "", "updated_at": args[0]})
+                self.rpush(pending, task_id)
+                result.append(task_id)
+        task_id = self.rpoplpush(pending, processing)
+        if task_id:
+            key = prefix + task_id
+            self.zadd(leases, {task_id: float(args[1])})
+            self.hincrby(key, "attempts", 1)
+            self.hset(key, {
+                "status": "leased", "lease_token": args[2], "lease_expires_at": args[1],
+                "worker_id": args[3], "updated_at": args[0]
+            })
+            result[0] = task_id
+        return result
+
+    def _heartbeat(self, keys, args):
+        key, leases = keys
+        if self.hget(key, "lease_token") != args[1] or self.zscore(leases, args[0]) is None:
+            return 0
+        self.zadd(leases, {args[0]: float(args[2])})
+        self.hset(key, {"lease_expires_at": args[2], "updated_at": args[3]})
+        return 1
+
+    def _finish(self, keys, args):
+        key, leases, processing, pending = keys
+        if self.hget(key, "lease_token") != args[1] or not self.zrem(leases, args[0]):
+            return 0
+        self.lrem(processing, 0, args[0])
+        status = args[3]
+        if status == "failed" and args[4] == "1" and int(self.hget(key, "attempts") or 0) < int(args[5]):
+            status = "pending"
+            self.lpush(pending, args[0])
+        self.hset(key, {"status": status, "lease_token": "", "updated_at": args[2], args[6]: args[7]})
+        return 1
+
+    def hset(self, name, mapping):
+        with self._lock:
+            self._data.setdefault(name, {}).update({k: str(v) for k, v in mapping.items()})
+
+    def hget(self, name, key):
+        with self._lock:
+            return self._data.get(name, {}).get(key)
+
+    def hgetall(self, name):
+        with self._lock:
+            return dict(self._data.get(name, {}))
+
+    def hincrby(self, name, key, amount=1):
+        with self._lock:
+            fields = self._data.setdefault(name, {})
+            fields[key] = str(int(fields.get(key, 0)) + amount)
+            return int(fields[key])
+
+    def lpush(self, name, value):
+        with self._lock:
+            self._data.setdefault(name, []).insert(0, value)
+
+    def rpush(self, name, value):
+        with self._lock:
+            self._data.setdefault(name, []).append(value)
+
+    def rpoplpush(self, source, destination):
+        with self._lock:
+            items = self._data.get(source)
+            if not items:
+                return None
+            value = items.pop()
+            self._data.setdefault(destination, []).insert(0, value)
+            return value
+
+    def lrem(self, name, count, value):
+        with self._lock:
+            items = self._data.get(name, [])
+            removed = items.count(value)
+            self._data[name] = [item for item in items if item != value]
+            return removed
+
+    def llen(self, name):
+        with self._lock:
+            return len(self._data.get(name, []))
+
+    def zadd(self, name, mapping, xx=False, ch=False):
+        with self._lock:
+            scores = self._data.setdefault(name, {})
+            changed = 0
+            for member, score in mapping.items():
+                if xx and member not in scores:
+                    continue
+                if scores.get(member) != score:
+                    changed += 1
+                scores[member] = score
+            return changed
+
+    def zrem(self, name, member):
+        with self._lock:
+            return 1 if self._data.get(name, {}).pop(member, None) is not None else 0
+
+    def zscore(self, name, member):
+        with self._lock:
+            return self._data.get(name, {}).get(member)
+
+    def zrangebyscore(self, name, low, high):
+        with self._lock:
+            scores = self._data.get(name, {})
+            return [m for m, s in sorted(scores.items(), key=lambda kv: kv[1]) if low <= s <= high]
+
+    def zcard(self, name):
+        with self._lock:
+            return len(self._data.get(name, {}))
+
+
+class WorkQueueContract:
+    """Behaviour every queue backend must provide."""
+
+    def make_queue(self, max_attempts=3):
+        raise NotImplementedError
+
+    def setUp(self):
+        self.queue = self.make_queue()
+
+    def test_tasks_claimed_in_order_once(self):
+        """Each task goes to exactly one worker, oldest first."""
+        first = self.queue.enqueue(REPORT_TASK, {"n": 1})
+        second = self.queue.enqueue(REPORT_TASK, {"n": 2})
+
+        a = self.queue.claim("worker-a", 60)
+        b = self.queue.claim("worker-b", 60)
+        self.assertEqual([a.task_id, b.task_id], [first, second])
+        self.assertEqual(a.payload, {"n": 1})
+        self.assertEqual(a.status, "leased")
+        self.assertEqual(a.attempts, 1)
+        self.assertIsNone(self.queue.claim("worker-c", 60))
+
+    def test_complete_requires_current_lease(self):
+        """Only the lease holder can record a result."""
+        task_id = self.queue.enqueue(REPORT_TASK, {})
+        task = self.queue.claim("worker-a", 60)
+
+        self.assertFalse(self.queue.complete(task_id, "stale-token", {"x": 1}))
+        self.assertTrue(self.queue.complete(task_id, task.lease_token, {"x": 1}))
+
+        stored = self.queue.get(task_id)
+        self.assertEqual(stored.status, "completed")
+        self.assertEqual(stored.result, {"x": 1})
+
+    def test_expired_lease_is_reclaimed(self):
+        """A crashed worker's task is picked up by another worker."""
+        task_id = self.queue.enqueue(REPORT_TASK, {})
+        crashed = self.queue.claim("worker-a", -1)
+
+        reclaimed = self.queue.claim("worker-b", 60)
+        self.assertEqual(reclaimed.task_id, task_id)
+        self.assertEqual(reclaimed.worker_id, "worker-b")
+        self.assertEqual(reclaimed.attempts, 2)
+
+        # The crashed worker can neither extend nor complete its old lease
+        self.assertFalse(self.queue.heartbeat(task_id, crashed.lease_token, 60))
+        self.assertFalse(self.queue.complete(task_id, crashed.lease_token, {}))
+        self.assertTrue(self.queue.complete(task_id, reclaimed.lease_token, {}))
+
+    def test_heartbeat_keeps_lease(self):
+        """A heartbeated task is not handed to anyone else."""
+        task_id = self.queue.enqueue(REPORT_TASK, {})
+        task = self.queue.claim("worker-a", 60)
+
+        self.assertTrue(self.queue.heartbeat(task_id, task.lease_token, 60))
+        self.assertIsNone(self.queue.claim("worker-b", 60))
+
+    def test_fail_retries_until_max_attempts(self):
+        """Failed tasks are requeued until they run out of attempts."""
+        queue = self.make_queue(max_attempts=2)
+        task_id = queue.enqueue(REPORT_TASK, {})
+
+        task = queue.claim("worker-a", 60)
+        self.assertTrue(queue.fail(task_id, task.lease_token, "boom"))
+        self.assertEqual(queue.get(task_id).status, "pending")
+
+        task = queue.claim("worker-a", 60)
+        self.assertTrue(queue.fail(task_id, task.lease_token, "boom again"))
+        stored = queue.get(task_id)
+        self.assertEqual(stored.status, "failed")
+        self.assertEqual(stored.error, "boom again")
+        self.assertIsNone(queue.claim("worker-a", 60))
+
+    def test_expired_final_attempt_is_failed(self):
+        """A task whose lease keeps expiring is eventually given up on."""
+        queue = self.make_queue(max_attempts=1)
+        task_id = queue.enqueue(REPORT_TASK, {})
+        queue.claim("worker-a", -1)
+
+        self.assertIsNone(queue.claim("worker-b", 60))
+        self.assertEqual(queue.get(task_id).status, "failed")
+
+    def test_concurrent_claims_are_distinct(self):
+        """Workers claiming at the same time never share a task."""
+        for n in range(40):
+            self.queue.enqueue(REPORT_TASK, {"n": n})
+
+        claimed = []
+        claimed_lock = threading.Lock()
+
+        def worker(name):
+            while True:
+                task = self.queue.claim(name, 60)
+                if task is None:
+                    return
+                with claimed_lock:
+                    claimed.append(task.task_id)
+
+        threads = [threading.Thread(target=worker, args=(f"worker-{i}",)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(claimed), 40)
+        self.assertEqual(len(set(claimed)), 40)
+
+
+class TestSQLiteWorkQueue(WorkQueueContract, unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.queues = []
+        super().setUp()
+
+    def tearDown(self):
+        for queue in self.queues:
+            queue.close()
+        self.tmpdir.cleanup()
+
+    def make_queue(self, max_attempts=3):
+        queue = SQLiteWorkQueue(str(Path(self.tmpdir.name) / f"queue-{len(self.queues)}.db"), max_attempts)
+        self.queues.append(queue)
+        return queue
+
+    def test_processes_share_one_file(self):
+        """Separate connections (as in separate processes) see the same tasks."""
+        path = str(Path(self.tmpdir.name) / "shared.db")
+        api = SQLiteWorkQueue(path)
+        worker = SQLiteWorkQueue(path)
+        self.queues.extend([api, worker])
+
+        task_id = api.enqueue(REPORT_TASK, {"n": 1})
+        task = worker.claim("worker-a", 60)
+        self.assertEqual(task.task_id, task_id)
+        worker.complete(task_id, task.lease_token, {"done": True})
+        self.assertEqual(api.get(task_id).status, "completed")
+
+
+class TestRedisWorkQueue(WorkQueueContract, unittest.TestCase):
+
+    def make_queue(self, max_attempts=3):
+        return RedisWorkQueue(InMemoryRedis(), max_attempts=max_attempts)
+
+    def test_id_stranded_in_processing_is_reclaimed(self):
+        """An id left in processing without a lease is requeued instead of lost."""
+        task_id = self.queue.enqueue(REPORT_TASK, {})
+        # As if a worker died between moving the id and recording its lease
+        self.queue.client.rpoplpush(self.queue._pending, self.queue._processing)
+        self.assertEqual(self.queue.stats(), {"pending": 0, "leased": 0})
+
+        task = self.queue.claim("worker-b", 60)
+        self.assertEqual(task.task_id, task_id)
+        self.assertEqual(self.queue.client.llen(self.queue._processing), 1)
+        self.assertTrue(self.queue.complete(task_id, task.lease_token, {}))
+        self.assertEqual(self.queue.client.llen(self.queue._processing), 0)
+
+    def test_stale_heartbeat_does_not_extend_new_lease(self):
+        """A heartbeat with an old token cannot extend the lease another worker now holds."""
+        task_id = self.queue.enqueue(REPORT_TASK, {})
+        stale = self.queue.claim("worker-a", -1)
+        fresh = self.queue.claim("worker-b", 5)
+        expires_at = self.queue.client.zscore(self.queue._leases, task_id)
+
+        self.assertFalse(self.queue.heartbeat(task_id, stale.lease_token, 600))
+        self.assertEqual(self.queue.client.zscore(self.queue._leases, task_id), expires_at)
+        self.assertTrue(self.queue.heartbeat(task_id, fresh.lease_token, 600))
+
+
+class TestQueueWorker(unittest.TestCase):
+    """The worker runs claimed tasks through the agent."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.queue = SQLiteWorkQueue(str(Path(self.tmpdir.name) / "queue.db"))
+        self.scenario = main._build_scenario(main.AnalysisRequest(
+            case_name="Queued Case",
+            complaint_text="Complaint text",
+            case_type="Contract"
+        ))
+
+    def tearDown(self):
+        self.queue.close()
+        self.tmpdir.cleanup()
+
+    def test_completes_task_with_report(self):
+        report = Mock()
+        report.dict.return_value = {"case_name": "Queued Case"}
+        agent = Mock()
+
+        async def generate(scenario, **kwargs):
+            return report
+
+        agent.generate_complete_report = generate
+        task_id = self.queue.enqueue(REPORT_TASK, {"scenario": self.scenario.dict()})
+
+        worker = QueueWorker(self.queue, agent, worker_id="worker-a")
+        self.assertTrue(asyncio.run(worker.run_once()))
+        self.assertFalse(asyncio.run(worker.run_once()))
+
+        stored = self.queue.get(task_id)
+        self.assertEqual(stored.status, "completed")
+        self.assertEqual(stored.result, {"case_name": "Queued Case"})
+        self.assertEqual(worker.get_stats()["processed"], 1)
+
+    def test_failure_is_requeued(self):
+        agent = Mock()
+
+        async def generate(scenario, **kwargs):
+            raise RuntimeError("model unavailable")
+
+        agent.generate_complete_report = generate
+        task_id = self.queue.enqueue(REPORT_TASK, {"scenario": self.scenario.dict()})
+
+        worker = QueueWorker(self.queue, agent, worker_id="worker-a")
+        asyncio.run(worker.run_once())
+
+        stored = self.queue.get(task_id)
+        self.assertEqual(stored.status, "pending")
+        self.assertEqual(stored.error, "model unavailable")
+
+    def test_lost_lease_abandons_work(self):
+        """Work stops when the heartbeat finds another worker took the task."""
+        agent = Mock()
+
+        async def generate(scenario, **kwargs):
+            # Our lease has already lapsed; another worker reclaims the task
+            self.assertIsNotNone(self.queue.claim("worker-b", 60))
+            await asyncio.sleep(10)
+
+        agent.generate_complete_report = generate
+        task_id = self.queue.enqueue(REPORT_TASK, {"scenario": self.scenario.dict()})
+
+        worker = QueueWorker(self.queue, agent, worker_id="worker-a", lease_seconds=-1, heartbeat_interval=0.01)
+        asyncio.run(asyncio.wait_for(worker.run_once(), timeout=5))
+
+        self.assertEqual(worker.get_stats()["leases_lost"], 1)
+        self.assertEqual(self.queue.get(task_id).worker_id, "worker-b")
+
+
+class TestJobEndpoints(unittest.TestCase):
+    """Jobs are queued by the API and read back by id."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.queue = SQLiteWorkQueue(str(Path(self.tmpdir.name) / "queue.db"))
+        self.agent = Mock()
+        self.agent.scheduler = FairScheduler(total_slots=2, tenant_limits={"backfill": TenantLimits(tokens_per_minute=600)})
+        self.state = {"queue": self.queue, "agent": self.agent, "admission": None}
+        self.client = TestClient(main.app)
+
+    def tearDown(self):
+        self.queue.close()
+        self.tmpdir.cleanup()
+
+    def _submit(self, **fields):
+        return self.client.post("/jobs", json={
+            "case_name": "Queued Case", "complaint_text": "Complaint text", "case_type": "Contract", **fields
+        })
+
+    def test_submit_and_poll(self):
+        with patch.dict(main.system_state, self.state):
+            response = self.client.post("/jobs", json={
+                "case_name": "Queued Case",
+                "complaint_text": "Complaint text",
+                "case_type": "Contract"
+            })
+            self.assertEqual(response.status_code, 202)
+            job_id = response.json()["job_id"]
+
+            task = self.queue.claim("worker-a", 60)
+            self.assertEqual(task.payload["scenario"]["case_name"], "Queued Case")
+            self.queue.complete(job_id, task.lease_token, {"case_name": "Queued Case"})
+
+            job = self.client.get(f"/jobs/{job_id}").json()
+            self.assertEqual(job["status"], "completed")
+            self.assertEqual(job["report"], {"case_name": "Queued Case"})
+
+            self.assertEqual(self.client.get("/jobs/missing").status_code, 404)
+
+    def test_over_quota_tenant_turned_away(self):
+        self.agent.scheduler.record_usage("backfill", 1200)
+        with patch.dict(main.system_state, self.state):
+            response = self._submit(tenant_id="backfill")
+            self.assertEqual(response.status_code, 429)
+            self.assertIn("Retry-After", response.headers)
+            self.assertEqual(self._submit(tenant_id="interactive").status_code, 202)
+        self.assertEqual(self.queue.stats(), {"pending": 1})
+
+    def test_full_queue_turned_away(self):
+        with patch.dict(main.system_state, self.state), patch.dict(main.CONFIG, {"queue_max_pending": 2}):
+            self.assertEqual(self._submit().status_code, 202)
+            self.assertEqual(self._submit().status_code, 202)
+            response = self._submit()
+        self.assertEqual(response.status_code, 503)
+        self.assertIn("Retry-After", response.headers)
+        self.assertEqual(self.queue.stats(), {"pending": 2})
+
+    def test_malformed_tenant_id_rejected(self):
+        with patch.dict(main.system_state, self.state):
+            for tenant_id in ("", "x" * 65, "tenant with spaces", "_other"):
+                self.assertEqual(self._submit(tenant_id=tenant_id).status_code, 422, tenant_id)
+
+
+if __name__ == "__main__":
+    unittest.main()